@@ -88,6 +88,7 @@ class ActionReadinessEngine:
         session_context: Optional[Dict] = None,
         intent: str = None,
         context_obj: Optional[SessionContext] = None,
+        extracted_fields: Optional[Dict] = None,
     ) -> ReadinessResult:
         """
         Readiness validation with optional session context.
@@ -97,6 +98,8 @@ class ActionReadinessEngine:
             session_context: Legacy dict context (backward compat)
             intent: The detected intent type
             context_obj: SessionContext object for pronoun/follow-up resolution
+            extracted_fields: Fields already extracted by the fused
+                understanding call (skips _llm_extract_fields)
         
         Session context is READ-ONLY during validation.
         It may only fill gaps when unambiguous.
@@ -104,18 +107,26 @@ class ActionReadinessEngine:
         engine = ActionReadinessEngine(session_context=session_context or self._session_context)
         engine._context_obj = context_obj  # Read-only during evaluation
         intent_candidates = [IntentCandidate(intent=intent, confidence=1.0)]
-        return engine.evaluate(user_message=user_message, intent_candidates=intent_candidates)
+        return engine.evaluate(
+            user_message=user_message,
+            intent_candidates=intent_candidates,
+            extracted_fields=extracted_fields,
+        )
 
     def evaluate(
         self,
         user_message: str,
         intent_candidates: List[IntentCandidate],
+        extracted_fields: Optional[Dict] = None,
     ) -> ReadinessResult:
         """
         PURE FUNCTION.
         No side effects.
         No IO.
         No mission creation.
+        
+        extracted_fields: action_object/source_url from the fused
+        understanding call; when None the fields are extracted here.
         """
         message = (user_message or "").strip()
         message_lower = message.lower()
@@ -214,7 +225,10 @@ class ActionReadinessEngine:
         # Try LLM extraction ONCE (primary intelligence)
         llm_fields = None
         if intent:
-            llm_fields = self._llm_extract_fields(message_lower)
+            if extracted_fields is not None:
+                llm_fields = extracted_fields
+            else:
+                llm_fields = self._llm_extract_fields(message_lower)
             logger.info(f"[LLM_EXTRACTION] Result: {llm_fields}")
         
         # Use LLM results first, regex as fallback
@@ -675,6 +689,7 @@ class ActionReadinessEngine:
         """
         try:
             from Back_End.llm_client import llm_client
+            from Back_End.llm_response_cache import is_json_object
             import json
             
             prompt = f"""Extract structured fields from this user message for a web automation task.
@@ -695,7 +710,8 @@ Examples:
 Return ONLY a valid JSON object:
 {{"action_object": "...", "source_url": "..."}}"""
 
-            response = llm_client.complete(prompt, max_tokens=150, temperature=0.2)
+            response = llm_client.complete(prompt, max_tokens=150, temperature=0.2, call_site='readiness_extraction',
+                                           validate=is_json_object)
             if not response:
                 logger.warning("[LLM_EXTRACT] No response from LLM - falling back to regex")
                 return None
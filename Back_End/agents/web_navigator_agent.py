@@ -35,6 +35,7 @@ from Back_End.mission_control.mission_contract import MissionContract
 from Back_End.mission_control.mission_registry import MissionRegistry
 from Back_End.mission_control.mission_progress_tracker import MissionProgressTracker
 from Back_End.learning.signal_priority import apply_signal_priority
+from Back_End.learning.signal_log_store import get_signal_log_store
 from Back_End.mission_control.regret_registry import log_regret
 from Back_End.mission_evaluator import MissionEvaluator
 from Back_End.explainability.decision_rationale import DecisionRationaleEmitter
@@ -250,8 +251,7 @@ class WebNavigatorAgent:
                 outputs_dir = Path(__file__).parent.parent.parent / "outputs" / "phase25"
                 outputs_dir.mkdir(parents=True, exist_ok=True)
                 signal_file = outputs_dir / "learning_signals.jsonl"
-                with open(signal_file, 'a') as f:
-                    f.write(json.dumps(signal) + '\n')
+                get_signal_log_store(signal_file).append(signal)
         except Exception as e:
             logger.warning(f"Failed to persist learning signal: {e}")
 
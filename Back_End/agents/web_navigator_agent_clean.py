@@ -12,7 +12,6 @@ Phase 1 Step 3: Selector-level learning signal instrumentation
 import time
 import logging
 import hashlib
-import json
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from datetime import datetime, timezone
@@ -28,6 +27,7 @@ from webdriver_manager.chrome import ChromeDriverManager
 from Back_End.buddys_vision_core import BuddysVisionCore
 from Back_End.buddys_arms import BuddysArms
 from Back_End.phase25_orchestrator import Phase25Orchestrator
+from Back_End.learning.signal_log_store import append_signals
 
 logger = logging.getLogger(__name__)
 
@@ -181,8 +181,7 @@ class WebNavigatorAgent:
                 outputs_dir = Path(__file__).parent.parent.parent / "outputs" / "phase25"
                 outputs_dir.mkdir(parents=True, exist_ok=True)
                 signal_file = outputs_dir / "learning_signals.jsonl"
-                with open(signal_file, 'a') as f:
-                    f.write(json.dumps(signal) + '\n')
+                append_signals(signal_file, [signal])
         except Exception as e:
             logger.warning(f"Failed to persist learning signal: {e}")
     
@@ -54,9 +54,9 @@ def list_conversation_sessions() -> list[dict]:
             "session_id": session.session_id,
             "source": session.source,
             "external_user_id": session.external_user_id,
-            "message_count": len(session.messages),
+            "message_count": session.message_count,
             "linked_goals": list(session.linked_goals),
-            "last_message_at": session.messages[-1].timestamp if session.messages else None,
+            "last_message_at": session.last_message_at,
             "title": session.title,
             "archived": session.archived,
         })
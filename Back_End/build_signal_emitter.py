@@ -11,10 +11,10 @@ from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-import json
 
 from Back_End.build_contract import BuildContract, BuildStage
 from Back_End.build_stage_evaluator import BuildStageEvaluation
+from Back_End.learning.signal_log_store import append_signals, read_signals
 
 
 @dataclass(frozen=True)
@@ -136,30 +136,14 @@ class BuildSignalEmitter:
         """Append signal to learning_signals.jsonl."""
         if stream_file is None:
             stream_file = Path("outputs/phase25/learning_signals.jsonl")
-        stream_file.parent.mkdir(parents=True, exist_ok=True)
-
         data = asdict(signal)
         if data.get("payload") is None:
             data["payload"] = {}
 
-        with stream_file.open("a", encoding="utf-8") as f:
-            json.dump(data, f)
-            f.write("\n")
+        append_signals(stream_file, [data])
 
     @staticmethod
     def get_signals_from_file(stream_file: Path) -> List[Dict[str, Any]]:
-        """Read signals from JSONL file."""
-        if not stream_file.exists():
-            return []
-        signals = []
-        with stream_file.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    signals.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-        return signals
+        """Read signals from JSONL file (including rotated segments)."""
+        return read_signals(stream_file)
 
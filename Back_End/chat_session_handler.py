@@ -38,6 +38,7 @@ from Back_End.interaction_orchestrator import orchestrate_message
 from Back_End.response_envelope import ResponseEnvelope
 from Back_End.build_review import BuildReviewRegistry
 from Back_End.economic_scenario import EconomicScenarioRegistry
+from Back_End.session_cache import SessionCache
 
 
 logger = logging.getLogger(__name__)
@@ -307,11 +308,14 @@ class ChatSessionManager:
     Manages multiple chat sessions.
     
     Tracks active sessions and provides session-level operations.
+    Handlers live in a bounded SessionCache; an evicted session gets a new
+    handler on its next message, with its message count restored from the
+    ConversationStore.
     """
     
     def __init__(self):
         """Initialize session manager."""
-        self.sessions: Dict[str, ChatSessionHandler] = {}
+        self.sessions: SessionCache[ChatSessionHandler] = SessionCache('chat_sessions')
         self.created_at = datetime.utcnow().isoformat()
         
         logger.info("[SESSION_MANAGER] Initialized")
@@ -331,8 +335,9 @@ class ChatSessionManager:
         Returns:
             ChatSessionHandler (existing or new)
         """
-        if session_id not in self.sessions:
-            self.sessions[session_id] = ChatSessionHandler(session_id, user_id)
+        handler = self.sessions.get(session_id)
+        if handler is None:
+            handler = self.sessions.put(session_id, ChatSessionHandler(session_id, user_id))
             logger.info(
                 f"[SESSION_CREATED] session_id={session_id}, "
                 f"user_id={user_id}"
@@ -342,12 +347,13 @@ class ChatSessionManager:
             try:
                 from Back_End.conversation.session_store import get_conversation_store
                 store = get_conversation_store()
-                store.get_or_create(session_id, source='chat_ui', external_user_id=user_id)
+                stored = store.get_or_create(session_id, source='chat_ui', external_user_id=user_id)
+                handler.message_count = stored.role_count('user')
                 logger.info(f"[SESSION_SYNC] Successfully synced session {session_id} to ConversationStore")
             except Exception as e:
                 logger.error(f"[SESSION_SYNC_ERROR] Failed to sync session to ConversationStore: {e}", exc_info=True)
         
-        return self.sessions[session_id]
+        return handler
     
     def handle_message(
         self,
@@ -391,15 +397,15 @@ class ChatSessionManager:
     
     def get_session_stats(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get statistics for a session."""
-        if session_id in self.sessions:
-            return self.sessions[session_id].get_session_stats()
-        return None
+        handler = self.sessions.get(session_id)
+        return handler.get_session_stats() if handler else None
     
     def get_all_stats(self) -> Dict[str, Any]:
         """Get statistics for all sessions."""
         return {
             'manager_created_at': self.created_at,
             'total_sessions': len(self.sessions),
+            'cache': self.sessions.stats(),
             'sessions': {
                 sid: handler.get_session_stats()
                 for sid, handler in self.sessions.items()
@@ -1,28 +1,44 @@
 """
 Composite Agent Executor: Handles both atomic and composite goals.
 Wraps the standard Agent to add decomposition support.
+
+Subgoals of a composite goal run as a dependency DAG: subgoals that build
+on earlier ones wait for them, the rest run concurrently on a bounded
+thread pool, each under its own deadline. Results are always reported in
+subgoal order.
 """
 
 import logging
-from typing import Dict, List, Tuple
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Set, Tuple
 from Back_End.agent import Agent as AtomicAgent
 from Back_End.goal_decomposer import goal_decomposer
 from Back_End.config import Config
 from Back_End.memory_manager import memory_manager
 from Back_End.llm_client import llm_client
 
+# Subgoal types that build on the findings of every subgoal before them
+DEPENDENT_SUBGOAL_TYPES = {'synthesis', 'strategy'}
+# Phrases marking a subgoal as using earlier results (conservative, as in
+# ParallelizationDetector)
+DEPENDENCY_KEYWORDS = ('based on', 'from step', 'from previous', 'result of', 'results of', 'findings')
+
 
 class CompositeAgentExecutor:
     """
     Executes both atomic and composite goals.
     
     - Atomic goals: Run through standard agent loop
-    - Composite goals: Decompose, execute subgoals sequentially, synthesize results
+    - Composite goals: Decompose, execute independent subgoals concurrently
+      (dependent ones after their prerequisites), synthesize results
     """
     
-    def __init__(self, goal: str, domain: str = None):
+    def __init__(self, goal: str, domain: str = None, stream_id: Optional[str] = None):
         self.goal = goal
         self.domain = domain
+        # Event stream that receives the answer incrementally (answer_delta events)
+        self.stream_id = stream_id
         self.classification = goal_decomposer.classify_goal(goal)
         self.is_composite = self.classification['is_composite']
         self.subgoals = self.classification['subgoals']
@@ -74,40 +90,11 @@ class CompositeAgentExecutor:
     
     def _execute_composite(self) -> Dict:
         """
-        Execute composite goal: decompose → run subgoals → synthesize
+        Execute composite goal: decompose → run subgoal DAG → synthesize
         """
         logging.info(f"Executing composite goal with {len(self.subgoals)} subgoals")
         
-        subgoal_results = []
-        combined_findings = []
-        
-        for subgoal_idx, subgoal in enumerate(self.subgoals):
-            logging.info(f"Subgoal {subgoal_idx + 1}/{len(self.subgoals)}: {subgoal['goal'][:60]}...")
-            
-            # Execute each subgoal through standard agent loop
-            subgoal_agent = AtomicAgent(subgoal['goal'], domain=self.domain)
-            subgoal_steps = []
-            
-            while not subgoal_agent.state.done and len(subgoal_steps) < Config.MAX_AGENT_STEPS:
-                state = subgoal_agent.step()
-                subgoal_steps.append(state)
-                if state.get('done'):
-                    break
-            
-            # Capture subgoal result
-            subgoal_result = {
-                'subgoal_index': subgoal_idx,
-                'subgoal': subgoal['goal'],
-                'subgoal_type': subgoal.get('type', 'general'),
-                'steps': len(subgoal_steps),
-                'confidence': subgoal_agent.state.confidence,
-                'effectiveness': self._compute_effectiveness(subgoal_steps),
-                'key_findings': self._extract_findings(subgoal_steps)
-            }
-            subgoal_results.append(subgoal_result)
-            combined_findings.extend(subgoal_result['key_findings'])
-            
-            logging.info(f"  ✓ Completed (confidence: {subgoal_agent.state.confidence:.2f})")
+        subgoal_results = self._run_subgoal_dag()
         
         # Synthesis step: combine all findings
         synthesis = self._synthesize_results(subgoal_results)
@@ -124,6 +111,121 @@ class CompositeAgentExecutor:
             'total_steps': sum(r['steps'] for r in subgoal_results)
         }
     
+    def _subgoal_dependencies(self) -> Dict[int, Set[int]]:
+        """
+        Map each subgoal index to the indexes it must wait for.
+        
+        An explicit 'depends_on' list wins; otherwise synthesis/strategy
+        subgoals and subgoals that refer to earlier results depend on all
+        subgoals before them, and everything else is independent.
+        """
+        dependencies = {}
+        for idx, subgoal in enumerate(self.subgoals):
+            explicit = subgoal.get('depends_on')
+            if explicit is not None:
+                dependencies[idx] = {d for d in explicit if 0 <= d < idx}
+            elif (subgoal.get('type') in DEPENDENT_SUBGOAL_TYPES
+                  or any(kw in subgoal['goal'].lower() for kw in DEPENDENCY_KEYWORDS)):
+                dependencies[idx] = set(range(idx))
+            else:
+                dependencies[idx] = set()
+        return dependencies
+    
+    def _run_subgoal_dag(self) -> List[Dict]:
+        """
+        Run subgoals as their prerequisites finish, at most
+        COMPOSITE_SUBGOAL_WORKERS at a time.
+        
+        A subgoal still running at its deadline is reported as timed out
+        and its dependents proceed without it. Returns results ordered by
+        subgoal index.
+        """
+        dependencies = self._subgoal_dependencies()
+        workers = max(1, min(Config.COMPOSITE_SUBGOAL_WORKERS, len(self.subgoals)))
+        timeout = Config.COMPOSITE_SUBGOAL_TIMEOUT_SECONDS
+        
+        results: Dict[int, Dict] = {}
+        pending = list(range(len(self.subgoals)))
+        running: Dict[Future, Tuple[int, float]] = {}
+        
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="subgoal")
+        try:
+            while pending or running:
+                # Start ready subgoals in index order; the deadline starts
+                # when a worker is free, not while queued
+                for idx in list(pending):
+                    if len(running) >= workers:
+                        break
+                    if dependencies[idx] <= results.keys():
+                        pending.remove(idx)
+                        deadline = time.monotonic() + timeout
+                        logging.info(f"Subgoal {idx + 1}/{len(self.subgoals)}: {self.subgoals[idx]['goal'][:60]}...")
+                        running[pool.submit(self._run_subgoal, idx, deadline)] = (idx, deadline)
+                
+                next_deadline = min(deadline for _, deadline in running.values())
+                done, _ = wait(
+                    list(running),
+                    timeout=max(0.0, next_deadline - time.monotonic()),
+                    return_when=FIRST_COMPLETED
+                )
+                
+                for future in done:
+                    idx, _ = running.pop(future)
+                    try:
+                        results[idx] = future.result()
+                    except Exception as e:
+                        logging.warning(f"  ✗ Subgoal {idx + 1} failed: {e}")
+                        results[idx] = self._subgoal_result(idx, [], 0.0, error=str(e))
+                
+                now = time.monotonic()
+                for future, (idx, deadline) in list(running.items()):
+                    if now >= deadline:
+                        # The worker stops at its next step boundary; its
+                        # late result is discarded
+                        running.pop(future)
+                        logging.warning(f"  ✗ Subgoal {idx + 1} timed out after {timeout:.0f}s")
+                        results[idx] = self._subgoal_result(idx, [], 0.0, timed_out=True)
+        finally:
+            pool.shutdown(wait=False)
+        
+        return [results[idx] for idx in sorted(results)]
+    
+    def _run_subgoal(self, subgoal_idx: int, deadline: float) -> Dict:
+        """Execute one subgoal through the standard agent loop"""
+        subgoal_agent = AtomicAgent(self.subgoals[subgoal_idx]['goal'], domain=self.domain)
+        subgoal_steps = []
+        timed_out = False
+        
+        while not subgoal_agent.state.done and len(subgoal_steps) < Config.MAX_AGENT_STEPS:
+            if time.monotonic() >= deadline:
+                timed_out = True
+                break
+            state = subgoal_agent.step()
+            subgoal_steps.append(state)
+            if state.get('done'):
+                break
+        
+        logging.info(f"  ✓ Completed subgoal {subgoal_idx + 1} (confidence: {subgoal_agent.state.confidence:.2f})")
+        return self._subgoal_result(subgoal_idx, subgoal_steps, subgoal_agent.state.confidence, timed_out=timed_out)
+    
+    def _subgoal_result(self, subgoal_idx: int, steps: List[Dict], confidence: float,
+                        timed_out: bool = False, error: str = None) -> Dict:
+        """Capture subgoal result"""
+        subgoal = self.subgoals[subgoal_idx]
+        result = {
+            'subgoal_index': subgoal_idx,
+            'subgoal': subgoal['goal'],
+            'subgoal_type': subgoal.get('type', 'general'),
+            'steps': len(steps),
+            'confidence': confidence,
+            'effectiveness': self._compute_effectiveness(steps),
+            'key_findings': self._extract_findings(steps),
+            'timed_out': timed_out
+        }
+        if error:
+            result['error'] = error
+        return result
+    
     def _extract_answer(self, steps: List[Dict]) -> str:
         """
         Extract final answer from step observations.
@@ -137,7 +239,9 @@ class CompositeAgentExecutor:
         
         # Try LLM-based answer synthesis if available
         if llm_client.enabled and steps:
-            llm_answer = llm_client.synthesize_answer(self.goal, steps)
+            llm_answer = llm_client.synthesize_answer(
+                self.goal, steps, stream_id=getattr(self, 'stream_id', None)
+            )
             if llm_answer:
                 logging.info("Using LLM-synthesized answer")
                 return llm_answer
@@ -400,12 +504,14 @@ class CompositeAgentExecutor:
             return "Low confidence. Recommend deeper analysis of key findings."
 
 
-def execute_goal(goal: str, domain: str = None) -> Dict:
+def execute_goal(goal: str, domain: str = None, stream_id: Optional[str] = None) -> Dict:
     """
     Execute a goal (atomic or composite).
     
     Automatically detects if goal is composite and handles accordingly.
+    With stream_id, an LLM-synthesized answer is also streamed to that
+    event stream as it is generated.
     """
-    executor = CompositeAgentExecutor(goal, domain=domain)
+    executor = CompositeAgentExecutor(goal, domain=domain, stream_id=stream_id)
     return executor.execute()
 
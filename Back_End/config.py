@@ -10,7 +10,14 @@ class Config:
         # Add more keys as needed
     }
     TIMEOUT = int(os.getenv('TOOL_TIMEOUT', '10'))  # seconds
+    TOOL_POOL_WORKERS = int(os.getenv('TOOL_POOL_WORKERS', '16'))  # shared tool execution threads
+    SLOW_TOOL_CONCURRENCY = int(os.getenv('SLOW_TOOL_CONCURRENCY', '2'))  # in-flight calls per browser/crawl tool (they keep running past their timeout)
     MAX_AGENT_STEPS = int(os.getenv('MAX_AGENT_STEPS', '8'))
+    COMPOSITE_SUBGOAL_WORKERS = int(os.getenv('COMPOSITE_SUBGOAL_WORKERS', '4'))  # concurrent subgoals per composite goal
+    COMPOSITE_SUBGOAL_TIMEOUT_SECONDS = float(os.getenv('COMPOSITE_SUBGOAL_TIMEOUT_SECONDS', '120'))
+    SEARCH_ENGINE_WORKERS = int(os.getenv('SEARCH_ENGINE_WORKERS', '6'))  # concurrent SerpAPI engine queries per multi-engine search
+    SEARCH_ENGINE_POOL_SIZE = int(os.getenv('SEARCH_ENGINE_POOL_SIZE', '10'))  # pooled keep-alive connections to SerpAPI
+    SEARCH_MULTI_ENGINE_DEADLINE_SECONDS = float(os.getenv('SEARCH_MULTI_ENGINE_DEADLINE_SECONDS', '20'))
     DEBUG = os.getenv('DEBUG', 'false').lower() == 'true'
     MOCK_MODE = os.getenv('MOCK_MODE', 'true').lower() == 'true'
     FIREBASE_ENABLED = os.getenv('FIREBASE_ENABLED', 'false').lower() == 'true'
@@ -26,6 +33,17 @@ class Config:
     # 'cloud-direct': Write directly to Firebase (original behavior)
     MISSION_STORAGE_MODE = os.getenv('MISSION_STORAGE_MODE', 'cloud-direct')
     
+    # Local-first Mission Sync
+    # Local writes wake the sync service, which waits MISSION_SYNC_DEBOUNCE_SECONDS
+    # to coalesce a burst (skipped once a full batch is waiting) and then drains
+    # the backlog in Firestore batches of up to MISSION_SYNC_BATCH_SIZE (max 500),
+    # committing up to MISSION_SYNC_CONCURRENCY batches at once as the backlog grows.
+    # With no writes it still checks every MISSION_SYNC_INTERVAL_SECONDS.
+    MISSION_SYNC_BATCH_SIZE = int(os.getenv('MISSION_SYNC_BATCH_SIZE', '500'))
+    MISSION_SYNC_CONCURRENCY = int(os.getenv('MISSION_SYNC_CONCURRENCY', '4'))
+    MISSION_SYNC_DEBOUNCE_SECONDS = float(os.getenv('MISSION_SYNC_DEBOUNCE_SECONDS', '1.0'))
+    MISSION_SYNC_INTERVAL_SECONDS = float(os.getenv('MISSION_SYNC_INTERVAL_SECONDS', '300'))
+    
     # Artifact System Feature Flag (Phase 2)
     # Controls creation of UniversalArtifact wrapper and artifact versioning
     # Zero-breaking: artifact system is entirely additive
@@ -51,5 +69,62 @@ class Config:
     # Non-blocking: cost tracking doesn't affect execution
     COST_RECONCILIATION_ENABLED = os.getenv('COST_RECONCILIATION_ENABLED', 'true').lower() == 'true'
     
+    # Tool Performance Write-Behind Cache
+    # Tool calls update in-process counters; coalesced deltas are flushed to
+    # memory in one batched write every TOOL_PERF_FLUSH_SECONDS.
+    # Clean cached records are re-read after TOOL_PERF_CACHE_TTL_SECONDS.
+    TOOL_PERF_FLUSH_SECONDS = float(os.getenv('TOOL_PERF_FLUSH_SECONDS', '30'))
+    TOOL_PERF_CACHE_TTL_SECONDS = float(os.getenv('TOOL_PERF_CACHE_TTL_SECONDS', '300'))
+    
+    # Mission Executor Concurrency
+    # MISSION_EXECUTOR_WORKERS missions run at once. A tenant never holds more
+    # than MISSION_MAX_PER_TENANT of them (0 = no cap), and each tool class in
+    # MISSION_TOOL_CLASS_LIMITS ("class=limit,...") has its own cap.
+    MISSION_EXECUTOR_WORKERS = int(os.getenv('MISSION_EXECUTOR_WORKERS', '4'))
+    MISSION_MAX_PER_TENANT = int(os.getenv('MISSION_MAX_PER_TENANT', '2'))
+    MISSION_TOOL_CLASS_LIMITS = os.getenv('MISSION_TOOL_CLASS_LIMITS', 'web_navigation=2')
+    
+    # Conversation Session Persistence
+    # Startup loads only the CONVERSATION_PRELOAD_SESSIONS most recently
+    # updated session headers; other sessions and all messages page in on use.
+    CONVERSATION_PRELOAD_SESSIONS = int(os.getenv('CONVERSATION_PRELOAD_SESSIONS', '50'))
+    # Session listings read headers from Firestore this many at a time
+    CONVERSATION_LIST_PAGE_SIZE = int(os.getenv('CONVERSATION_LIST_PAGE_SIZE', '200'))
+    
+    # In-memory Session Caches
+    # Chat sessions, session contexts and conversations are held in LRU
+    # caches bounded by count, idle time and estimated bytes (0 = no limit).
+    # Evicted conversations reload from Firestore on the next access.
+    SESSION_CACHE_MAX_ENTRIES = int(os.getenv('SESSION_CACHE_MAX_ENTRIES', '1000'))
+    SESSION_CACHE_TTL_SECONDS = float(os.getenv('SESSION_CACHE_TTL_SECONDS', '21600'))
+    SESSION_CACHE_MAX_BYTES = int(os.getenv('SESSION_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+    
+    # LLM Response Cache
+    # Deterministic completions are cached by a hash of provider, model,
+    # prompts, temperature and max_tokens: an in-memory LRU tier in front of
+    # a SQLite tier at LLM_CACHE_DB_PATH. Calls hotter than
+    # LLM_CACHE_MAX_TEMPERATURE are never cached; entries expire after their
+    # call site's TTL (LLM_CACHE_DEFAULT_TTL_SECONDS when it has none).
+    LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+    LLM_CACHE_DB_PATH = os.getenv('LLM_CACHE_DB_PATH', 'outputs/llm_response_cache.db')
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', '2000'))
+    LLM_CACHE_MAX_BYTES = int(os.getenv('LLM_CACHE_MAX_BYTES', str(16 * 1024 * 1024)))
+    LLM_CACHE_DEFAULT_TTL_SECONDS = float(os.getenv('LLM_CACHE_DEFAULT_TTL_SECONDS', '3600'))
+    LLM_CACHE_MAX_TEMPERATURE = float(os.getenv('LLM_CACHE_MAX_TEMPERATURE', '0.3'))
+    
+    # Fused Message Understanding
+    # One LLM call per chat turn returns normalization, intent classification
+    # and readiness fields together; any part missing from the response falls
+    # back to that stage's own LLM call.
+    FUSED_UNDERSTANDING_ENABLED = os.getenv('FUSED_UNDERSTANDING_ENABLED', 'true').lower() == 'true'
+    
+    # Intent Fast Path
+    # Messages whose best pattern score reaches INTENT_FAST_PATH_MIN_SCORE and
+    # leads the runner-up by INTENT_FAST_PATH_MARGIN are classified without
+    # the LLM; closer calls escalate.
+    INTENT_FAST_PATH_ENABLED = os.getenv('INTENT_FAST_PATH_ENABLED', 'true').lower() == 'true'
+    INTENT_FAST_PATH_MIN_SCORE = float(os.getenv('INTENT_FAST_PATH_MIN_SCORE', '2.5'))
+    INTENT_FAST_PATH_MARGIN = float(os.getenv('INTENT_FAST_PATH_MARGIN', '1.5'))
+    
     # Add more config as needed
 
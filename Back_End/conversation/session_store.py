@@ -1,27 +1,61 @@
 """Conversation session store shared across channels.
 
 Provides a single conversation model for chat UI and Telegram.
+
+Firestore layout:
+- conversation_sessions/{session_id}: session header (metadata, message
+  count, last message time). Sessions written before messages moved to a
+  subcollection also carry a `messages` array, which is still read.
+- conversation_sessions/{session_id}/messages/{seq}: one document per
+  message, append-only, ids zero-padded so they sort in message order.
+
+Writes are queued and committed in batches by one background thread, so
+appending a message never waits on Firestore while holding the store lock.
+
+Sessions are held in a bounded SessionCache while Firestore persistence is
+on; an evicted session is fetched again on its next access, and session
+listings page through the Firestore headers rather than the cache.
 """
 from __future__ import annotations
 
+import atexit
+import queue
 import threading
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 
+from Back_End.config import Config
+from Back_End.session_cache import SessionCache
+
 # Firebase imports for persistence
 try:
     from firebase_admin import firestore
-    from Back_End.config import Config
     FIREBASE_AVAILABLE = Config.FIREBASE_ENABLED
 except ImportError:
     FIREBASE_AVAILABLE = False
 
+MESSAGES_SUBCOLLECTION = 'messages'
+HEADER_FIELDS = [
+    'session_id', 'source', 'external_user_id', 'linked_goals', 'title', 'archived',
+    'message_count', 'last_message_at', 'role_counts', 'updated_at',
+]
+# Firestore caps a batched write at 500 operations
+BATCH_LIMIT = 500
+# Rough per-object overhead used when sizing sessions for the cache budget
+SESSION_OVERHEAD_BYTES = 512
+MESSAGE_OVERHEAD_BYTES = 256
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _session_bytes(session: "ConversationSession") -> int:
+    return SESSION_OVERHEAD_BYTES + sum(MESSAGE_OVERHEAD_BYTES + len(m.text) for m in session.messages)
+
+
 @dataclass
 class ConversationMessage:
     message_id: str
@@ -49,6 +83,42 @@ class ConversationSession:
     linked_goals: List[str] = field(default_factory=list)
     title: str = ""
     archived: bool = False
+    # False for sessions loaded from a stored header only; the stored_*
+    # summary stands in for `messages` until they are paged in
+    messages_loaded: bool = True
+    stored_message_count: int = 0
+    stored_last_message_at: Optional[str] = None
+    stored_role_counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def message_count(self) -> int:
+        return len(self.messages) if self.messages_loaded else self.stored_message_count
+
+    @property
+    def last_message_at(self) -> Optional[str]:
+        if not self.messages_loaded:
+            return self.stored_last_message_at
+        return self.messages[-1].timestamp if self.messages else None
+
+    def role_count(self, role: str) -> int:
+        if not self.messages_loaded:
+            return self.stored_role_counts.get(role, 0)
+        return sum(1 for m in self.messages if m.role == role)
+
+    def header(self) -> Dict[str, Any]:
+        """Session document fields (everything but the messages)"""
+        return {
+            "session_id": self.session_id,
+            "source": self.source,
+            "external_user_id": self.external_user_id,
+            "linked_goals": list(self.linked_goals),
+            "title": self.title,
+            "archived": self.archived,
+            "message_count": self.message_count,
+            "last_message_at": self.last_message_at,
+            "role_counts": {role: self.role_count(role) for role in ("user", "assistant")},
+            "updated_at": _now_iso(),
+        }
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -66,9 +136,14 @@ class ConversationStore:
     """Thread-safe store for conversation sessions with Firebase persistence."""
 
     def __init__(self) -> None:
-        self._sessions: Dict[str, ConversationSession] = {}
+        self._sessions: SessionCache[ConversationSession] = self._new_cache(bounded=FIREBASE_AVAILABLE)
         self._lock = threading.RLock()
-        
+        self._writes: "queue.Queue[tuple]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        # Session id -> writes queued but not yet committed
+        self._queued_writes: Counter = Counter()
+        self._queued_lock = threading.Lock()
+
         # Initialize Firebase client if available
         self._firebase_enabled = FIREBASE_AVAILABLE
         self._db = None
@@ -76,7 +151,7 @@ class ConversationStore:
             try:
                 import firebase_admin
                 from firebase_admin import credentials
-                
+
                 # Initialize firebase_admin if not already initialized
                 if not firebase_admin._apps:
                     cred_path = Config.FIREBASE_CREDENTIALS_PATH
@@ -85,121 +160,363 @@ class ConversationStore:
                         firebase_admin.initialize_app(cred)
                     else:
                         raise RuntimeError("FIREBASE_CREDENTIALS_PATH not set")
-                
+
                 self._db = firestore.client()
                 self._collection = self._db.collection('conversation_sessions')
                 self._load_from_firebase()
+                atexit.register(self.flush)
             except Exception as e:
                 print(f"Warning: Failed to initialize Firebase for sessions: {e}")
                 self._firebase_enabled = False
-    
-    def _load_from_firebase(self) -> None:
-        """Load all existing sessions from Firebase on startup."""
+                self._sessions = self._new_cache(bounded=False)
+
+    @staticmethod
+    def _new_cache(bounded: bool) -> SessionCache[ConversationSession]:
+        # Without Firestore an evicted session could not be fetched again
+        if bounded:
+            return SessionCache('conversation_sessions', sizeof=_session_bytes)
+        return SessionCache.unbounded('conversation_sessions', sizeof=_session_bytes)
+
+    def _load_from_firebase(self, limit: Optional[int] = None) -> None:
+        """Load the most recently updated session headers on startup.
+
+        Messages are not read here; they page in when a session is used.
+        Older sessions are fetched on first access.
+        """
         if not self._firebase_enabled or not self._db:
             return
-        
+
+        limit = Config.CONVERSATION_PRELOAD_SESSIONS if limit is None else limit
         try:
-            docs = self._collection.stream()
-            for doc in docs:
-                data = doc.to_dict()
-                session = ConversationSession(
-                    session_id=data['session_id'],
-                    source=data['source'],
-                    external_user_id=data.get('external_user_id'),
-                    messages=[
-                        ConversationMessage(**msg) for msg in data.get('messages', [])
-                    ],
-                    linked_goals=data.get('linked_goals', []),
-                    title=data.get('title', ''),
-                    archived=data.get('archived', False),
-                )
-                self._sessions[session.session_id] = session
+            recent = (
+                self._collection.order_by('updated_at', direction='DESCENDING')
+                .select(HEADER_FIELDS)
+                .limit(limit)
+                .stream()
+            )
+            for doc in recent:
+                session = self._session_from_doc(doc.to_dict(), with_messages=False)
+                self._sessions.put(session.session_id, session)
+
+            if len(self._sessions) < limit:
+                # Sessions written before headers carried updated_at are
+                # invisible to the ordered query; take what fits
+                for doc in self._collection.limit(limit).stream():
+                    data = doc.to_dict()
+                    if data['session_id'] not in self._sessions and 'updated_at' not in data:
+                        self._sessions.put(data['session_id'], self._session_from_doc(data, with_messages=True))
+                        if len(self._sessions) >= limit:
+                            break
             print(f"Loaded {len(self._sessions)} conversation sessions from Firebase")
         except Exception as e:
             print(f"Warning: Failed to load sessions from Firebase: {e}")
-    
+
+    @staticmethod
+    def _session_from_doc(data: Dict[str, Any], with_messages: bool) -> ConversationSession:
+        session = ConversationSession(
+            session_id=data['session_id'],
+            source=data['source'],
+            external_user_id=data.get('external_user_id'),
+            linked_goals=data.get('linked_goals', []),
+            title=data.get('title', ''),
+            archived=data.get('archived', False),
+        )
+        if with_messages:
+            session.messages = [ConversationMessage(**msg) for msg in data.get('messages', [])]
+        else:
+            session.messages_loaded = False
+            session.stored_message_count = data.get('message_count', 0)
+            session.stored_last_message_at = data.get('last_message_at')
+            session.stored_role_counts = data.get('role_counts', {})
+        return session
+
+    def _fetch_messages(self, session_id: str, legacy: Optional[List[Dict[str, Any]]]) -> List[ConversationMessage]:
+        """Legacy in-document messages followed by the messages subcollection"""
+        messages = [ConversationMessage(**msg) for msg in legacy or []]
+        docs = self._collection.document(session_id).collection(MESSAGES_SUBCOLLECTION).stream()
+        messages.extend(ConversationMessage(**doc.to_dict()) for doc in docs)
+        return messages
+
+    def _fetch_session(self, session_id: str) -> Optional[ConversationSession]:
+        """Page in a session that is not in memory (None if it does not exist)"""
+        if not self._firebase_enabled or not self._db:
+            return None
+        # A session evicted with writes still queued must not be read back
+        # without them (its next message would reuse a sequence number)
+        if self._has_queued_writes(session_id):
+            self.flush()
+        try:
+            doc = self._collection.document(session_id).get()
+            if not doc.exists:
+                return None
+            data = doc.to_dict()
+            session = self._session_from_doc(data, with_messages=False)
+            session.messages = self._fetch_messages(session_id, data.get('messages'))
+            session.messages_loaded = True
+            return session
+        except Exception as e:
+            print(f"Warning: Failed to load session {session_id} from Firebase: {e}")
+            return None
+
+    def _ensure_messages(self, session: ConversationSession) -> None:
+        """Page in messages for a session loaded from its header only"""
+        if session.messages_loaded:
+            return
+        try:
+            doc = self._collection.document(session.session_id).get()
+            legacy = doc.to_dict().get('messages') if doc.exists else None
+            messages = self._fetch_messages(session.session_id, legacy)
+        except Exception as e:
+            print(f"Warning: Failed to load messages for session {session.session_id}: {e}")
+            return
+        with self._lock:
+            if not session.messages_loaded:
+                session.messages = messages
+                session.messages_loaded = True
+                self._sessions.resize(session.session_id)
+
+    # ------------------------------------------------------------------
+    # Background writes
+    # ------------------------------------------------------------------
+
     def _save_to_firebase(self, session: ConversationSession) -> None:
-        """Save a session to Firebase (non-blocking, fire-and-forget)."""
+        """Queue a session header write (non-blocking, fire-and-forget)."""
+        self._enqueue(('header', session.session_id, session.header()))
+
+    def _enqueue(self, op: tuple) -> None:
         if not self._firebase_enabled or not self._db:
             return
-        
+        with self._queued_lock:
+            self._queued_writes[op[1]] += 1
+        self._writes.put(op)
+        if self._writer is None or not self._writer.is_alive():
+            with self._lock:
+                if self._writer is None or not self._writer.is_alive():
+                    self._writer = threading.Thread(
+                        target=self._write_loop, name="conversation-writer", daemon=True
+                    )
+                    self._writer.start()
+
+    def _has_queued_writes(self, session_id: Optional[str] = None) -> bool:
+        with self._queued_lock:
+            return bool(self._queued_writes[session_id]) if session_id else bool(self._queued_writes)
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until every write queued before this call is committed."""
+        if self._writer is None or not self._writer.is_alive():
+            return True
+        done = threading.Event()
+        self._writes.put(('flush', done))
+        return done.wait(timeout)
+
+    def _write_loop(self) -> None:
+        while True:
+            ops = [self._writes.get()]
+            # Everything queued while the previous batch was in flight goes in this one
+            while len(ops) < BATCH_LIMIT:
+                try:
+                    ops.append(self._writes.get_nowait())
+                except queue.Empty:
+                    break
+            self._apply(ops)
+
+    def _apply(self, ops: List[tuple]) -> None:
+        messages: List[tuple] = []
+        headers: Dict[str, Dict[str, Any]] = {}
+        settled = 0
+        for index, op in enumerate(ops):
+            kind = op[0]
+            if kind == 'message':
+                messages.append(op)
+            elif kind == 'header':
+                # Headers are full snapshots; the latest one wins
+                headers[op[1]] = op[2]
+            elif kind == 'delete':
+                self._commit(messages, headers)
+                messages, headers = [], {}
+                self._delete_remote(op[1])
+            elif kind == 'flush':
+                self._commit(messages, headers)
+                messages, headers = [], {}
+                self._settle(ops[settled:index])
+                settled = index + 1
+                op[1].set()
+        self._commit(messages, headers)
+        self._settle(ops[settled:])
+
+    def _settle(self, ops: List[tuple]) -> None:
+        """Stop counting committed (or failed) writes as queued"""
+        with self._queued_lock:
+            for op in ops:
+                if op[1] in self._queued_writes:
+                    self._queued_writes[op[1]] -= 1
+                    if self._queued_writes[op[1]] <= 0:
+                        del self._queued_writes[op[1]]
+
+    def _commit(self, messages: List[tuple], headers: Dict[str, Dict[str, Any]]) -> None:
+        writes = [
+            (self._collection.document(session_id).collection(MESSAGES_SUBCOLLECTION).document(f"{seq:08d}"), data, False)
+            for _, session_id, seq, data in messages
+        ]
+        writes.extend((self._collection.document(session_id), data, True) for session_id, data in headers.items())
+        for start in range(0, len(writes), BATCH_LIMIT):
+            chunk = writes[start:start + BATCH_LIMIT]
+            try:
+                batch = self._db.batch()
+                for ref, data, merge in chunk:
+                    batch.set(ref, data, merge=merge)
+                batch.commit()
+            except Exception as e:
+                print(f"Warning: Failed to save {len(chunk)} conversation writes to Firebase: {e}")
+
+    def _delete_remote(self, session_id: str) -> None:
         try:
-            self._collection.document(session.session_id).set(session.to_dict())
+            session_ref = self._collection.document(session_id)
+            refs = [doc.reference for doc in session_ref.collection(MESSAGES_SUBCOLLECTION).stream()]
+            refs.append(session_ref)
+            for start in range(0, len(refs), BATCH_LIMIT):
+                batch = self._db.batch()
+                for ref in refs[start:start + BATCH_LIMIT]:
+                    batch.delete(ref)
+                batch.commit()
         except Exception as e:
-            print(f"Warning: Failed to save session {session.session_id} to Firebase: {e}")
+            print(f"Warning: Failed to delete session {session_id} from Firebase: {e}")
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def list_sessions(self, page_size: Optional[int] = None) -> List[ConversationSession]:
+        """All sessions, most recently updated first.
 
-    def list_sessions(self) -> List[ConversationSession]:
+        With Firestore on, session headers are read page by page ordered by
+        updated_at (a cached session is returned in place of its header), so
+        sessions evicted from or never loaded into the cache are listed too.
+        """
         with self._lock:
-            return list(self._sessions.values())
+            cached = dict(self._sessions.items())
+        if not self._firebase_enabled or not self._db:
+            return list(cached.values())
+
+        if self._has_queued_writes():
+            # New sessions and header changes must be visible to the query
+            self.flush()
+        page_size = page_size or Config.CONVERSATION_LIST_PAGE_SIZE
+        sessions: List[ConversationSession] = []
+        seen = set()
+        try:
+            last = None
+            while True:
+                query = self._collection.order_by('updated_at', direction='DESCENDING').select(HEADER_FIELDS)
+                if last is not None:
+                    query = query.start_after(last)
+                docs = list(query.limit(page_size).stream())
+                for doc in docs:
+                    data = doc.to_dict()
+                    session_id = data['session_id']
+                    seen.add(session_id)
+                    sessions.append(cached.get(session_id) or self._session_from_doc(data, with_messages=False))
+                if len(docs) < page_size:
+                    break
+                last = docs[-1]
+        except Exception as e:
+            print(f"Warning: Failed to list sessions from Firebase: {e}")
+        # Cached sessions the ordered query cannot see (legacy headers without updated_at)
+        sessions.extend(session for session_id, session in cached.items() if session_id not in seen)
+        return sessions
+
+    def count_cached_sessions(self) -> int:
+        """Number of sessions held in memory.
+
+        Cheap: no writer flush and no Firestore query, so callers that only
+        need a count (health checks) use this instead of list_sessions().
+        """
+        with self._lock:
+            return len(self._sessions)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters for the in-memory session tier"""
+        return self._sessions.stats()
 
     def get_session(self, session_id: str) -> Optional[ConversationSession]:
         with self._lock:
-            return self._sessions.get(session_id)
+            session = self._sessions.get(session_id)
+        if session is None:
+            fetched = self._fetch_session(session_id)
+            if fetched is None:
+                return None
+            with self._lock:
+                session = self._sessions.setdefault(session_id, fetched)
+        self._ensure_messages(session)
+        return session
 
     def get_or_create(self, session_id: str, source: str, external_user_id: Optional[str]) -> ConversationSession:
+        existing = self.get_session(session_id)
+        if existing is not None:
+            return existing
         with self._lock:
-            if session_id in self._sessions:
-                return self._sessions[session_id]
+            existing = self._sessions.get(session_id)
+            if existing is not None:
+                return existing
             session = ConversationSession(
                 session_id=session_id,
                 source=source,
                 external_user_id=external_user_id,
             )
-            self._sessions[session_id] = session
+            self._sessions.put(session_id, session)
             self._save_to_firebase(session)
             return session
 
     def append_message(self, session_id: str, role: str, text: str, source: str) -> ConversationMessage:
+        # Ensure session exists (fetching it again if it was evicted)
+        session = self.get_session(session_id)
+        if session is None:
+            raise ValueError(f"Session {session_id} not found. Use get_or_create() first.")
         with self._lock:
-            # Ensure session exists
-            if session_id not in self._sessions:
-                raise ValueError(f"Session {session_id} not found. Use get_or_create() first.")
-            
-            session = self._sessions[session_id]
+            seq = len(session.messages) + 1
             message = ConversationMessage(
-                message_id=f"msg_{len(session.messages) + 1}",
+                message_id=f"msg_{seq}",
                 role=role,
                 text=text,
                 timestamp=_now_iso(),
                 source=source,
             )
             session.messages.append(message)
+            self._sessions.resize(session_id)
+            # Append-only: write the new message and the updated header, never the history
+            self._enqueue(('message', session_id, seq, message.to_dict()))
             self._save_to_firebase(session)
             return message
 
     def link_goal(self, session_id: str, goal_id: str) -> None:
+        session = self.get_session(session_id)
+        if session is None:
+            raise KeyError(session_id)
         with self._lock:
-            session = self._sessions[session_id]
             if goal_id not in session.linked_goals:
                 session.linked_goals.append(goal_id)
                 self._save_to_firebase(session)
-    
+
     def update_session(self, session_id: str, title: Optional[str] = None, archived: Optional[bool] = None) -> bool:
         """Update session metadata (title, archived status)."""
+        session = self.get_session(session_id)
+        if session is None:
+            return False
         with self._lock:
-            session = self._sessions.get(session_id)
-            if not session:
-                return False
             if title is not None:
                 session.title = title
             if archived is not None:
                 session.archived = archived
             self._save_to_firebase(session)
             return True
-    
+
     def delete_session(self, session_id: str) -> bool:
-        """Delete a session from memory and Firebase."""
+        """Delete a session (and its messages) from memory and Firebase."""
+        if self.get_session(session_id) is None:
+            return False
         with self._lock:
-            if session_id not in self._sessions:
-                return False
-            del self._sessions[session_id]
-            
-            # Delete from Firebase
-            if self._firebase_enabled and self._db:
-                try:
-                    self._collection.document(session_id).delete()
-                except Exception as e:
-                    print(f"Warning: Failed to delete session {session_id} from Firebase: {e}")
+            self._sessions.pop(session_id)
+            self._enqueue(('delete', session_id))
             return True
 
 
@@ -211,4 +528,3 @@ def get_conversation_store() -> ConversationStore:
     if _store is None:
         _store = ConversationStore()
     return _store
-
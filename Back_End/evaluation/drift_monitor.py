@@ -11,8 +11,8 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
-import json
 
+from Back_End.learning.signal_log_store import append_signals, read_signals
 from Back_End.learning.signal_priority import apply_signal_priority
 
 
@@ -74,19 +74,7 @@ class DriftMonitor:
         return warnings
 
     def _read_signals(self) -> List[Dict[str, Any]]:
-        if not self.signals_file.exists():
-            return []
-        records: List[Dict[str, Any]] = []
-        with open(self.signals_file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    records.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-        return records
+        return read_signals(self.signals_file)
 
     def _build_metric_series(self, signals: List[Dict[str, Any]]) -> List[MetricSeries]:
         selector_values: List[Tuple[str, float, str]] = []
@@ -177,6 +165,5 @@ class DriftMonitor:
         return None
 
     def _emit_signal(self, signal: Dict[str, Any]) -> None:
-        with open(self.signals_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(signal) + "\n")
+        append_signals(self.signals_file, [signal])
 
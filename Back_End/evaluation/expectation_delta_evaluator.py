@@ -9,9 +9,9 @@ from __future__ import annotations
 
 from typing import Dict, Any, Optional, Literal
 from datetime import datetime, timezone
-import json
 from pathlib import Path
 
+from Back_End.learning.signal_log_store import append_signals
 from Back_End.learning.signal_priority import apply_signal_priority
 
 
@@ -209,6 +209,5 @@ class ExpectationDeltaEvaluator:
     
     def _emit_signal(self, signal: Dict[str, Any]) -> None:
         """Write signal to learning_signals.jsonl."""
-        with open(self.signals_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(signal) + "\n")
+        append_signals(self.signals_file, [signal])
 
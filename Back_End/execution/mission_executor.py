@@ -9,52 +9,140 @@ Flow:
 5. Emit signal to learning_signals.jsonl
 
 NO retries, NO looping, ONE execution per mission.
+Up to MISSION_EXECUTOR_WORKERS missions run concurrently, subject to
+per-tenant and per-tool-class caps.
 """
 
 import asyncio
 import logging
 import json
+import threading
+import time
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
-from collections import deque
+from typing import Optional, Dict, Any, Tuple
+from collections import Counter, deque
+
+from Back_End.config import Config
+from Back_End.learning.signal_log_store import append_signals
+from Back_End.quantile_sketch import QuantileSketch
 
 logger = logging.getLogger(__name__)
 
+# Objective types that drive a browser share the web_navigation tool class
+TOOL_CLASS_BY_OBJECTIVE = {
+    'navigate': 'web_navigation',
+    'extract': 'web_navigation',
+    'search': 'search',
+}
+DEFAULT_TENANT = 'default'
+DEFAULT_TOOL_CLASS = 'general'
+
+
+def parse_tool_class_limits(spec: str) -> Dict[str, int]:
+    """Parse "web_navigation=2,search=4" into {class: limit}"""
+    limits = {}
+    for part in (spec or '').split(','):
+        name, _, value = part.partition('=')
+        if name.strip() and value.strip():
+            try:
+                limits[name.strip()] = int(value)
+            except ValueError:
+                logger.warning(f"[EXECUTOR] Ignoring invalid tool class limit: {part!r}")
+    return limits
+
 
 class ExecutionQueue:
-    """Simple in-memory queue for missions."""
+    """
+    In-memory mission queue backed by an asyncio.Queue.
+
+    enqueue() is synchronous and safe to call from any thread; workers
+    await get() and wake as soon as a mission is queued instead of polling.
+    A mission id stays "queued" (and duplicate enqueues are ignored) until
+    the executor dispatches it with mark_dispatched().
+    """
     
     def __init__(self):
-        self._queue = deque()
-        self._queued = set()  # Track mission_ids currently in queue
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._queued = set()  # mission_ids queued or dequeued but not yet dispatched
+        self._lock = threading.Lock()  # guards _queued and the _queue/_loop binding
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
     
     def enqueue(self, mission_data: Dict[str, Any]) -> None:
         """Enqueue a mission for execution."""
         mission_id = mission_data.get('mission_id')
-        if mission_id and mission_id not in self._queued:
-            self._queue.append(mission_data)
+        if not mission_id:
+            return
+        item = (time.monotonic(), mission_data)
+        with self._lock:
+            if mission_id in self._queued:
+                return
             self._queued.add(mission_id)
-            logger.info(f"[EXECUTOR] Queued mission: {mission_id}")
+            loop = self._loop
+            if loop is not None and loop.is_running() and not self._on_loop(loop):
+                loop.call_soon_threadsafe(self._put, item)
+            else:
+                self._queue.put_nowait(item)
+        logger.info(f"[EXECUTOR] Queued mission: {mission_id}")
     
     def dequeue(self) -> Optional[Dict[str, Any]]:
         """Dequeue next mission. Returns None if queue empty."""
         try:
-            mission_data = self._queue.popleft()
-            mission_id = mission_data.get('mission_id')
-            if mission_id and mission_id in self._queued:
-                self._queued.discard(mission_id)
-            return mission_data
-        except IndexError:
+            _, mission_data = self._queue.get_nowait()
+        except asyncio.QueueEmpty:
             return None
+        self.mark_dispatched(mission_data)
+        return mission_data
+    
+    async def get(self) -> Tuple[Dict[str, Any], float]:
+        """
+        Wait for the next mission. Returns (mission_data, enqueued_at monotonic time).
+        
+        The mission stays counted as queued until mark_dispatched().
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._bind(loop)
+        enqueued_at, mission_data = await self._queue.get()
+        return mission_data, enqueued_at
     
     def is_empty(self) -> bool:
         """Check if queue is empty."""
-        return len(self._queue) == 0
+        return self.size() == 0
     
     def size(self) -> int:
-        """Return queue size."""
-        return len(self._queue)
+        """Return the number of missions not yet dispatched."""
+        with self._lock:
+            return len(self._queued)
+    
+    def mark_dispatched(self, mission_data: Dict[str, Any]) -> None:
+        """Stop tracking a mission once it has started (it may be enqueued again)."""
+        with self._lock:
+            self._queued.discard(mission_data.get('mission_id'))
+    
+    def _put(self, item: Tuple[float, Dict[str, Any]]) -> None:
+        # Runs on the bound loop; resolves _queue at call time in case of a rebind
+        with self._lock:
+            self._queue.put_nowait(item)
+    
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Move queued items onto a queue owned by loop (asyncio queues are bound to one loop)"""
+        with self._lock:
+            queue: asyncio.Queue = asyncio.Queue()
+            while True:
+                try:
+                    queue.put_nowait(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            self._queue = queue
+            self._loop = loop
+    
+    @staticmethod
+    def _on_loop(loop: asyncio.AbstractEventLoop) -> bool:
+        try:
+            return asyncio.get_running_loop() is loop
+        except RuntimeError:
+            return False
 
 
 # Global execution queue (singleton)
@@ -62,16 +150,40 @@ execution_queue = ExecutionQueue()
 
 
 class MissionExecutor:
-    """Executes queued missions."""
+    """
+    Executes queued missions on a fixed number of concurrent workers.
+
+    A mission is admitted only while its tenant and tool class are under
+    their caps; missions that would exceed a cap wait (in arrival order)
+    without blocking other tenants' missions behind them.
+    """
     
     def __init__(
         self,
         missions_file: str = 'outputs/phase25/missions.jsonl',
-        signals_file: str = 'outputs/phase25/learning_signals.jsonl'
+        signals_file: str = 'outputs/phase25/learning_signals.jsonl',
+        max_workers: Optional[int] = None,
+        max_per_tenant: Optional[int] = None,
+        tool_class_limits: Optional[Dict[str, int]] = None
     ):
         self.missions_file = Path(missions_file)
         self.signals_file = Path(signals_file)
         self.running = False
+        self.max_workers = max(1, max_workers or Config.MISSION_EXECUTOR_WORKERS)
+        self.max_per_tenant = Config.MISSION_MAX_PER_TENANT if max_per_tenant is None else max_per_tenant
+        self.tool_class_limits = (
+            parse_tool_class_limits(Config.MISSION_TOOL_CLASS_LIMITS)
+            if tool_class_limits is None else dict(tool_class_limits)
+        )
+        
+        self._pending = deque()  # (mission_data, enqueued_at) dequeued but waiting for a cap
+        self._running_by_tenant = Counter()
+        self._running_by_tool_class = Counter()
+        self._stop_event: Optional[asyncio.Event] = None
+        self._queue_wait_ms = QuantileSketch()
+        self._run_time_ms = QuantileSketch()
+        self._completed = 0
+        self._failed = 0
         
         # Ensure output directories exist
         self.missions_file.parent.mkdir(parents=True, exist_ok=True)
@@ -233,44 +345,159 @@ class MissionExecutor:
                 signal['error'] = error
             
             # Append to learning_signals.jsonl
-            with open(self.signals_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(signal) + '\n')
+            append_signals(self.signals_file, [signal])
             
             logger.info(f"[EXECUTOR] Emitted signal: {mission_id} execution {status}")
         
         except Exception as e:
             logger.error(f"[EXECUTOR] Error emitting signal: {e}", exc_info=True)
     
+    @staticmethod
+    def _tenant_of(mission_data: Dict[str, Any]) -> str:
+        return mission_data.get('tenant_id') or DEFAULT_TENANT
+    
+    @staticmethod
+    def _tool_class_of(mission_data: Dict[str, Any]) -> str:
+        if mission_data.get('tool_class'):
+            return mission_data['tool_class']
+        objective_type = (mission_data.get('objective') or {}).get('type')
+        return TOOL_CLASS_BY_OBJECTIVE.get(objective_type, DEFAULT_TOOL_CLASS)
+    
+    def _has_capacity(self, tenant: str, tool_class: str) -> bool:
+        if self.max_per_tenant and self._running_by_tenant[tenant] >= self.max_per_tenant:
+            return False
+        limit = self.tool_class_limits.get(tool_class)
+        return not limit or self._running_by_tool_class[tool_class] < limit
+    
+    def _dispatch(self, in_flight: set) -> None:
+        """Start pending missions, oldest first, while workers and caps allow"""
+        for item in list(self._pending):
+            if len(in_flight) >= self.max_workers:
+                return
+            mission_data, enqueued_at = item
+            tenant = self._tenant_of(mission_data)
+            tool_class = self._tool_class_of(mission_data)
+            if not self._has_capacity(tenant, tool_class):
+                continue
+            self._pending.remove(item)
+            execution_queue.mark_dispatched(mission_data)
+            self._running_by_tenant[tenant] += 1
+            self._running_by_tool_class[tool_class] += 1
+            task = asyncio.ensure_future(
+                self._run_admitted(mission_data, enqueued_at, tenant, tool_class)
+            )
+            task.add_done_callback(self._retrieve_failure)
+            in_flight.add(task)
+    
+    def _retrieve_failure(self, task: asyncio.Future) -> None:
+        """Log a mission task that raised instead of returning a result"""
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self._failed += 1
+            logger.error(f"[EXECUTOR] Mission task failed: {error}", exc_info=error)
+    
+    async def _run_admitted(self, mission_data: Dict[str, Any], enqueued_at: float,
+                            tenant: str, tool_class: str) -> Dict[str, Any]:
+        started = time.monotonic()
+        self._queue_wait_ms.add((started - enqueued_at) * 1000)
+        try:
+            result = await self.execute_mission(mission_data)
+        finally:
+            self._run_time_ms.add((time.monotonic() - started) * 1000)
+            self._running_by_tenant[tenant] -= 1
+            self._running_by_tool_class[tool_class] -= 1
+        if result.get('status') == 'completed':
+            self._completed += 1
+        else:
+            self._failed += 1
+        return result
+    
     async def run_executor_loop(self) -> None:
         """
         Main executor loop.
         
-        Continuously dequeues and executes missions.
-        Non-blocking: yields control periodically.
+        Waits for queued missions (no polling) and runs up to max_workers
+        of them concurrently. stop() lets running missions finish;
+        cancelling the loop cancels them.
         """
         self.running = True
-        logger.info("[EXECUTOR] Executor loop started")
+        self._stop_event = asyncio.Event()
+        logger.info(f"[EXECUTOR] Executor loop started ({self.max_workers} workers)")
+        
+        in_flight: set = set()
+        getter: Optional[asyncio.Future] = None
+        stop_waiter = asyncio.ensure_future(self._stop_event.wait())
         
         try:
             while self.running:
-                # Check for queued missions
-                if not execution_queue.is_empty():
-                    mission_data = execution_queue.dequeue()
-                    if mission_data:
-                        await self.execute_mission(mission_data)
+                self._dispatch(in_flight)
                 
-                # Yield control every loop iteration
-                await asyncio.sleep(0.1)
+                # Only pull new missions while a worker is free
+                if getter is None and len(in_flight) < self.max_workers:
+                    getter = asyncio.ensure_future(execution_queue.get())
+                waiters = in_flight | {stop_waiter}
+                if getter is not None:
+                    waiters.add(getter)
+                
+                done, _ = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+                if getter is not None and getter in done:
+                    self._pending.append(getter.result())
+                    getter = None
+                in_flight -= done
         
+        except asyncio.CancelledError:
+            for task in in_flight:
+                task.cancel()
+            raise
         except Exception as e:
             logger.error(f"[EXECUTOR] Executor loop error: {e}", exc_info=True)
         finally:
+            stop_waiter.cancel()
+            if getter is not None:
+                getter.cancel()
+                if getter.done() and not getter.cancelled():
+                    # Dequeued just before stopping: run it next time
+                    self._pending.appendleft(getter.result())
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
             self.running = False
             logger.info("[EXECUTOR] Executor loop stopped")
     
     def stop(self) -> None:
         """Stop the executor loop."""
         self.running = False
+        if self._stop_event is not None:
+            self._stop_event.set()
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Worker utilisation, queue depth and queue-wait / run-time percentiles"""
+        def summary(sketch: QuantileSketch) -> Dict[str, float]:
+            return {
+                'count': int(sketch.count),
+                'mean': sketch.mean,
+                'p50': sketch.quantile(0.50),
+                'p95': sketch.quantile(0.95),
+                'p99': sketch.quantile(0.99),
+            }
+        
+        return {
+            'workers': self.max_workers,
+            'running': sum(self._running_by_tenant.values()),
+            'queued': execution_queue.size(),
+            'waiting_for_capacity': len(self._pending),
+            'completed': self._completed,
+            'failed': self._failed,
+            'running_by_tenant': {k: v for k, v in self._running_by_tenant.items() if v},
+            'running_by_tool_class': {k: v for k, v in self._running_by_tool_class.items() if v},
+            'limits': {
+                'per_tenant': self.max_per_tenant,
+                'tool_classes': dict(self.tool_class_limits),
+            },
+            'queue_wait_ms': summary(self._queue_wait_ms),
+            'run_time_ms': summary(self._run_time_ms),
+        }
 
 
 # Global executor (singleton)
@@ -0,0 +1,193 @@
+"""
+Intent Fast Path: deterministic first tier of intent classification
+
+Most chat traffic ("status?", "extract prices from shop.com", "thanks")
+is unambiguous and does not need an LLM round trip. The keyword and
+pattern rules that used to be scattered across the orchestrator's smart
+fallback, conversation.intent_classifier and ChatIntentRouter are
+gathered here as weighted features, compiled into ONE regex alternation
+(a named group per feature) and scored in a single pass over the message.
+
+A message is decided here when its best intent scores at least
+INTENT_FAST_PATH_MIN_SCORE and leads the runner-up by at least
+INTENT_FAST_PATH_MARGIN; otherwise route() returns None and the caller
+escalates to the LLM. Negations and retractions ("don't open ...", "stop",
+"cancel that") score as NEGATION, which always escalates: the action
+vocabulary would otherwise read them as the very command they retract.
+Hits and escalations are counted so the thresholds can be tuned against
+the hit ratio.
+
+CONSTRAINTS:
+- Pure function of the message text: no I/O, no LLM, no session state
+- Features are listed most specific first: at a given position the
+  earliest alternative wins, so a phrase consumes its own words
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from Back_End.config import Config
+
+
+# Same action vocabulary as _smart_fallback_classification and ChatIntentRouter
+_ACTION_VERBS = (
+    r"navigate|visit|go\s+to|open|browse|extract|scrape|crawl|fetch|get|grab|collect|download|pull|"
+    r"retrieve|gather|search|find|look\s+up|lookup|look\s+for|calculate|compute|run|execute"
+)
+# Operand of a spoken calculation: a whole number, not a piece of a date
+# (2024-01-05), phone number (555-123-4567), version or identifier
+_OPERAND_START = r"(?<![\w.\-/:])\d+(?:\.\d+)?"
+_OPERAND_END = r"\d+(?:\.\d+)?(?![\w.\-/:])"
+# An unspaced hyphen joins digits (dates, phones, ranges) rather than subtracting them
+_OPERATOR = r"(?:\s+-\s+|\s*(?:[+*/x^]|plus|minus|times|divided\s+by)\s*)"
+_DOMAIN = r"(?:https?://\S+|www\.\S+|[a-z0-9-]+(?:\.[a-z0-9-]+)*\.(?:com|org|net|io|ai|dev|gov|edu|co|us|uk)\b(?:/\S*)?)"
+
+# Scored like an intent, but a message containing it is never decided here
+NEGATION = "negation"
+
+# (intent, weight, pattern)
+INTENT_FEATURES: List[Tuple[str, float, str]] = [
+    # Negated or retracted commands ("don't open google.com", "stop", "cancel that")
+    (NEGATION, 1.0, r"\b(?:don['\u2019]?t|do\s+not|never(?:\s*mind)?|no\s+longer|stop|cancel|abort|halt)\b"),
+
+    # Whole-message acknowledgments and greetings
+    ("acknowledgment", 6.0, r"^\s*(?:hi|hello|hey|thanks|thank\s+you|ok|okay|yes|no|sure|fine|good)\s*[.!]*\s*$"),
+    ("acknowledgment", 6.0, r"^\s*(?:got\s+it|understood|copy\s+that|roger|ack|acknowledged)\s*[.!]*\s*$"),
+
+    # Status (conversation.intent_classifier status patterns)
+    ("status", 4.0, r"\bare\s+you\s+(?:online|available|ready|working)\b"),
+    ("status", 4.0, r"\bwhat\s+(?:are\s+)?you\s+(?:doing|working\s+on)\b"),
+    ("status", 4.0, r"\bhow(?:'s|\s+is|\s+are)\s+(?:my|the|our)\s+(?:\w+\s+)?(?:missions?|tasks?|jobs?|runs?)\b"),
+    ("status", 3.0, r"\b(?:(?:what(?:'s|\s+is)|how(?:'s|\s+is))\s+(?:the\s+)?)?(?:status|progress|check-in)\b"),
+
+    # Help / capabilities
+    ("informational", 4.0, r"^\s*(?:help|what\s+can\s+you\s+do|how\s+do\s+i\s+use\s+(?:this|you|buddy)|how\s+does\s+(?:this|buddy)\s+work)\b"),
+
+    # Forecasts
+    ("forecast", 4.0, r"\b(?:forecast|predict(?:ion|ions)?|projections?|extrapolate)\b"),
+    ("forecast", 3.0, r"\b(?:what|how\s+(?:much|many))\s+will\b"),
+
+    # Arithmetic (answered directly, classified as execution)
+    ("execute", 5.5, _OPERAND_START + _OPERATOR + _OPERAND_END),
+
+    # Polite / indirect action requests
+    ("execute", 3.0, r"\b(?:can|could|would|will)\s+you\s+(?:please\s+)?(?:" + _ACTION_VERBS + r")\b"),
+    ("execute", 3.0, r"\b(?:i\s+(?:need|want)|please)\s+(?:you\s+to\s+)?(?:" + _ACTION_VERBS + r")\b"),
+
+    # Instructional questions ("how do I scrape ...") ask for knowledge, not action
+    ("question", 3.0, r"^\s*(?:how\s+(?:do|can|should)\s+i|how\s+to)\b"),
+
+    # Imperative action verb opening the message
+    ("execute", 3.0, r"^\s*(?:please\s+)?(?:" + _ACTION_VERBS + r")\b"),
+
+    # Question openers and markers (ChatIntentRouter QUESTION_KEYWORDS)
+    ("question", 2.5, r"\btell\s+me\s+about\b|\bexplain\b|\bwhat\s+(?:is|are)\s+(?:a|an|the)?\b|\bmeaning\s+of\b"),
+    ("question", 1.5, r"^\s*(?:what|why|how|when|where|who|which|is|are|does|do|did|can|could|would|should)\b"),
+    ("question", 1.0, r"\?\s*$"),
+
+    # Data wanted from a named site ("contact info from example.com")
+    ("execute", 2.5, r"\b(?:from|on|at)\s+" + _DOMAIN),
+
+    # Action verbs / targets anywhere else in the message
+    ("execute", 1.5, r"\b(?:" + _ACTION_VERBS + r")\b"),
+    ("execute", 1.0, _DOMAIN),
+]
+
+
+@dataclass
+class FastPathDecision:
+    """A deterministic classification the caller can use without the LLM."""
+    intent: str  # acknowledgment | status | informational | forecast | execute | question
+    confidence: float
+    margin: float
+    keywords: List[str]
+    scores: Dict[str, float]
+
+
+class FastIntentRouter:
+    """Single-pass weighted pattern scorer with an LLM escalation margin."""
+
+    def __init__(
+        self,
+        features: Optional[List[Tuple[str, float, str]]] = None,
+        min_score: Optional[float] = None,
+        margin: Optional[float] = None,
+    ):
+        self.features = features if features is not None else INTENT_FEATURES
+        self.min_score = Config.INTENT_FAST_PATH_MIN_SCORE if min_score is None else min_score
+        self.margin = Config.INTENT_FAST_PATH_MARGIN if margin is None else margin
+        self._pattern = re.compile(
+            "|".join(f"(?P<f{i}>{pattern})" for i, (_, _, pattern) in enumerate(self.features)),
+            re.IGNORECASE,
+        )
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.escalations = 0
+        self.negations = 0
+        self.hits_by_intent: Dict[str, int] = {}
+
+    def score(self, message: str) -> Tuple[Dict[str, float], List[str]]:
+        """Per-intent scores and matched keywords, from one scan of message"""
+        scores: Dict[str, float] = {}
+        keywords: List[str] = []
+        for match in self._pattern.finditer(message):
+            intent, weight, _ = self.features[int(match.lastgroup[1:])]
+            scores[intent] = scores.get(intent, 0.0) + weight
+            keyword = match.group().strip().lower()
+            if keyword and keyword not in keywords:
+                keywords.append(keyword)
+        return scores, keywords
+
+    def route(self, message: str) -> Optional[FastPathDecision]:
+        """Decide the intent deterministically, or None to escalate"""
+        scores, keywords = self.score(message.lower().strip())
+        ranked = sorted(scores.values(), reverse=True)
+        top = ranked[0] if ranked else 0.0
+        margin = top - (ranked[1] if len(ranked) > 1 else 0.0)
+
+        negated = NEGATION in scores
+        if not Config.INTENT_FAST_PATH_ENABLED or negated or top < self.min_score or margin < self.margin:
+            with self._lock:
+                self.escalations += 1
+                self.negations += negated
+            return None
+
+        intent = max(scores, key=scores.get)
+        with self._lock:
+            self.hits += 1
+            self.hits_by_intent[intent] = self.hits_by_intent.get(intent, 0) + 1
+        return FastPathDecision(
+            intent=intent,
+            confidence=round(min(0.95, 0.6 + 0.07 * margin), 2),
+            margin=margin,
+            keywords=keywords,
+            scores=scores,
+        )
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            attempts = self.hits + self.escalations
+            return {
+                "attempts": attempts,
+                "hits": self.hits,
+                "escalations": self.escalations,
+                "negations": self.negations,
+                "hit_ratio": round(self.hits / attempts, 4) if attempts else None,
+                "hits_by_intent": dict(self.hits_by_intent),
+                "min_score": self.min_score,
+                "margin": self.margin,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.escalations = 0
+            self.negations = 0
+            self.hits_by_intent = {}
+
+
+# Singleton instance
+fast_intent_router = FastIntentRouter()
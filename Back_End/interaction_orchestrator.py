@@ -45,6 +45,9 @@ from Back_End.artifact_reader import get_latest_artifact
 from Back_End.action_readiness_engine import ActionReadinessEngine, IntentCandidate, ReadinessDecision
 from Back_End.session_context import SessionContextManager, PendingClarification
 from Back_End.clarification_templates import render_clarification
+from Back_End.message_understanding import IntentDecision, MessageUnderstanding, understand_message
+from Back_End.intent_fast_path import FastPathDecision, fast_intent_router
+from Back_End.learning.signal_log_store import append_signals
 
 
 logger = logging.getLogger(__name__)
@@ -77,47 +80,94 @@ class DeterministicIntentClassifier:
     """
     Intent classifier using LLM for robust language understanding.
     
-    Fast path: Acknowledgments (high frequency, regex OK)
-    Main path: LLM classification for all other intents
+    Fast path: single-pass pattern scoring (intent_fast_path) decides
+        unambiguous messages - acknowledgments, status checks, URL extracts
+    Main path: LLM classification when the fast path's margin is too small
     
     Provides natural language tolerance without brittle pattern matching.
     """
     
-    # Non-actionable patterns (fast path, regex OK for these)
-    ACKNOWLEDGMENT_PATTERNS = [
-        r'^\s*(hi|hello|hey|thanks|thank you|ok|okay|yes|no|sure|fine|good)\s*$',
-        r'^\s*(got it|understood|copy that|roger|ack|acknowledged)\s*$'
-    ]
+    # LLM intent labels -> IntentType (unknown labels need clarification)
+    LLM_INTENT_MAP = {
+        "execute": IntentType.REQUEST_EXECUTION,
+        "question": IntentType.QUESTION,
+        "status": IntentType.STATUS_CHECK,
+        "forecast": IntentType.FORECAST_REQUEST,
+        "clarification": IntentType.CLARIFICATION_NEEDED,
+        "informational": IntentType.INFORMATIONAL,
+    }
     
-    def classify(self, message: str) -> IntentClassification:
+    # Fast path intents -> IntentType
+    FAST_PATH_INTENT_MAP = {
+        **LLM_INTENT_MAP,
+        "acknowledgment": IntentType.ACKNOWLEDGMENT,
+    }
+    
+    def classify(
+        self,
+        message: str,
+        llm_decision: Optional[IntentDecision] = None,
+        fast_path: bool = True,
+    ) -> IntentClassification:
         """
         Classify message intent using LLM.
         
         Args:
             message: Raw user message
+            llm_decision: Intent already decided by the fused understanding
+                call; used instead of a separate LLM call
+            fast_path: Try the deterministic fast path first (callers that
+                already tried it on this text pass False)
             
         Returns:
             IntentClassification with intent_type, confidence, keywords, actionable
         """
-        message_lower = message.lower().strip()
-        
-        # FAST PATH: Acknowledgments (regex is OK for high-frequency, low-stakes)
-        for pattern in self.ACKNOWLEDGMENT_PATTERNS:
-            if re.match(pattern, message_lower):
-                return IntentClassification(
-                    intent_type=IntentType.ACKNOWLEDGMENT,
-                    confidence=0.95,
-                    keywords=[],
-                    actionable=False,
-                    reasoning="Acknowledgment/greeting detected"
-                )
+        # FAST PATH: deterministic scoring, escalates on a narrow margin
+        if fast_path:
+            fast = self.classify_fast(message)
+            if fast is not None:
+                return fast
         
         # DEFAULT PATH: Use LLM for everything else
+        if llm_decision is not None:
+            return self._classification_from_llm(
+                llm_decision.intent, llm_decision.confidence, llm_decision.actionable,
+                llm_decision.reasoning, llm_decision.keywords
+            )
         return self._classify_with_llm(message)
     
+    def classify_fast(self, message: str) -> Optional[IntentClassification]:
+        """Deterministic classification, or None when the LLM must decide."""
+        decision = fast_intent_router.route(message)
+        if decision is None:
+            return None
+        return self._classification_from_fast_path(decision)
+    
+    def _classification_from_fast_path(self, decision: FastPathDecision) -> IntentClassification:
+        return IntentClassification(
+            intent_type=self.FAST_PATH_INTENT_MAP[decision.intent],
+            confidence=decision.confidence,
+            keywords=decision.keywords,
+            actionable=decision.intent in ("execute", "forecast"),
+            reasoning=f"Fast path: {decision.intent} by margin {decision.margin:.1f}"
+        )
+    
+    def _classification_from_llm(
+        self, intent_str: str, confidence: float, actionable: bool, reasoning: str, keywords: List[str]
+    ) -> IntentClassification:
+        """Map an LLM intent label and its fields onto an IntentClassification."""
+        return IntentClassification(
+            intent_type=self.LLM_INTENT_MAP.get(intent_str, IntentType.CLARIFICATION_NEEDED),
+            confidence=max(0.0, min(1.0, confidence)),
+            keywords=keywords,
+            actionable=actionable,
+            reasoning=reasoning
+        )
+    
     def _classify_with_llm(self, message: str) -> IntentClassification:
         """Use LLM to classify intent robustly, with smart fallback."""
         from Back_End.llm_client import llm_client
+        from Back_End.llm_response_cache import is_json_object
         import json
         
         prompt = f"""You are an intent classifier for a task automation system.
@@ -155,7 +205,8 @@ Return exactly this JSON structure (no markdown, no code blocks):
 }}}}"""
         
         try:
-            response = llm_client.complete(prompt, max_tokens=200, temperature=0.3)
+            response = llm_client.complete(prompt, max_tokens=200, temperature=0.3, call_site='intent_classification',
+                                           validate=is_json_object)
             
             # If LLM is disabled or fails, use smart fallback
             if not response or not response.strip():
@@ -176,28 +227,7 @@ Return exactly this JSON structure (no markdown, no code blocks):
             reasoning = data.get("reasoning", "LLM classification")
             keywords = data.get("keywords", [])
             
-            # Clamp confidence
-            confidence = max(0.0, min(1.0, confidence))
-            
-            # Map intent string to IntentType
-            intent_map = {
-                "execute": IntentType.REQUEST_EXECUTION,
-                "question": IntentType.QUESTION,
-                "status": IntentType.STATUS_CHECK,
-                "forecast": IntentType.FORECAST_REQUEST,
-                "clarification": IntentType.CLARIFICATION_NEEDED,
-                "informational": IntentType.INFORMATIONAL,
-            }
-            
-            intent_type = intent_map.get(intent_str, IntentType.CLARIFICATION_NEEDED)
-            
-            return IntentClassification(
-                intent_type=intent_type,
-                confidence=confidence,
-                keywords=keywords,
-                actionable=actionable,
-                reasoning=reasoning
-            )
+            return self._classification_from_llm(intent_str, confidence, actionable, reasoning, keywords)
             
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse LLM intent classification JSON: {e}")
@@ -427,8 +457,7 @@ class InteractionOrchestrator:
                 'timestamp': datetime.utcnow().isoformat()
             }
             
-            with open(self.signals_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(signal, ensure_ascii=False) + '\n')
+            append_signals(self.signals_file, [signal])
             
             logger.debug(f"[SIGNAL] chat_observation emitted: {outcome}")
         except Exception as e:
@@ -1087,12 +1116,31 @@ class InteractionOrchestrator:
         if clarification_response:
             return clarification_response
 
+        # Fast path: an unambiguous message is classified deterministically and
+        # never leaves the process - no normalization, and readiness fields
+        # come from the deterministic extractors (an empty field set).
+        fast_intent = self.classifier.classify_fast(message)
+        
+        # Fused understanding: normalization, intent and readiness fields in
+        # one LLM call. Any section it could not provide (or all of them, if
+        # the call fails) is computed by that stage's own call below.
+        normalization_context = session_context_obj.__dict__ if hasattr(session_context_obj, '__dict__') else {}
+        if fast_intent is not None:
+            understanding = MessageUnderstanding(normalization=None, intent=None, readiness_fields={})
+        else:
+            understanding = understand_message(message, session_context=normalization_context)
+        if understanding is None:
+            understanding = MessageUnderstanding(normalization=None, intent=None, readiness_fields=None)
+
         # PHASE 5: Semantic normalization (BEFORE intent classification)
         # Rewrite user input into canonical form to reduce phrasing brittleness
         # Does NOT create missions, execute tools, or bypass safety checks
-        from Back_End.semantic_normalizer import maybe_normalize
+        from Back_End.semantic_normalizer import accept_normalization, maybe_normalize
         original_message = message
-        message = maybe_normalize(message, session_context=session_context_obj.__dict__ if hasattr(session_context_obj, '__dict__') else {})
+        if understanding.normalization is not None:
+            message = accept_normalization(understanding.normalization)
+        elif fast_intent is None:
+            message = maybe_normalize(message, session_context=normalization_context)
         if message != original_message:
             logger.info(f"[PHASE5][NORMALIZATION] Rewrote: '{original_message}' → '{message}'")
 
@@ -1117,7 +1165,10 @@ class InteractionOrchestrator:
             return self._handle_approval_bridge(message, session_id)
 
         # Step 2: Classify intent with trace logging
-        intent = self.classifier.classify(message)
+        # (the fast path is retried only if normalization rewrote the message)
+        intent = fast_intent or self.classifier.classify(
+            message, llm_decision=understanding.intent, fast_path=message != original_message
+        )
         logger.info(f"[ORCHESTRATOR] Intent: {intent.intent_type.value} "
                    f"(confidence: {intent.confidence:.2f}, actionable: {intent.actionable})")
         
@@ -1138,6 +1189,7 @@ class InteractionOrchestrator:
         shadow_readiness = shadow_engine.evaluate(
             user_message=message,
             intent_candidates=shadow_intent_candidates,
+            extracted_fields=understanding.readiness_fields,
         )
 
         # Step 2: Route to handler with trace logging
@@ -1190,7 +1242,10 @@ class InteractionOrchestrator:
         
         # Step 3: Execute handler
         handler = getattr(self, f"_handle_{handler_name}")
-        response = handler(intent=intent, session_id=session_id, trace_id=trace_id, **handler_kwargs)
+        response = handler(
+            intent=intent, session_id=session_id, trace_id=trace_id,
+            extracted_fields=understanding.readiness_fields, **handler_kwargs
+        )
         
         logger.info(f"[ORCHESTRATOR] Response type: {response.response_type.value}, "
                    f"missions: {len(response.missions_spawned)}")
@@ -1434,7 +1489,7 @@ class InteractionOrchestrator:
             self._emit_chat_observation(session_id, intent, message, 'answered')
             return response_envelope
     
-    def _handle_execute(self, intent: IntentClassification, message: str, session_id: str, context: Optional[Dict] = None, trace_id: Optional[str] = None, **kwargs) -> ResponseEnvelope:
+    def _handle_execute(self, intent: IntentClassification, message: str, session_id: str, context: Optional[Dict] = None, trace_id: Optional[str] = None, extracted_fields: Optional[Dict] = None, **kwargs) -> ResponseEnvelope:
         """
         Handle execution requests with observability tracing.
         
@@ -1476,6 +1531,7 @@ class InteractionOrchestrator:
                 session_context=context or {},
                 intent=readiness_intent,
                 context_obj=session_context_obj,  # NEW: Pass session context
+                extracted_fields=extracted_fields,
             )
 
             if readiness.decision == ReadinessDecision.INCOMPLETE and readiness.missing_fields:
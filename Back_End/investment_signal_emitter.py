@@ -20,11 +20,11 @@ from dataclasses import dataclass, asdict
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from pathlib import Path
-import json
 
 from Back_End.investment_core import (
     InvestmentCandidate, InvestmentScore, InvestmentCore
 )
+from Back_End.learning.signal_log_store import append_signals, read_signals
 
 
 @dataclass(frozen=True)
@@ -133,30 +133,16 @@ class InvestmentSignalEmitter:
         stream_file: Path
     ) -> None:
         """Write signal to JSONL file (append-only)."""
-        stream_file.parent.mkdir(parents=True, exist_ok=True)
-        
         # Convert to dict, handling None values
         signal_dict = asdict(signal)
         
-        with open(stream_file, "a", encoding="utf-8") as f:
-            json.dump(signal_dict, f)
-            f.write("\n")
+        append_signals(stream_file, [signal_dict])
     
     @staticmethod
     def get_signals_from_file(stream_file: Path) -> List[InvestmentEvaluationSignal]:
-        """Read all signals from JSONL file."""
-        if not stream_file.exists():
-            return []
-        
-        signals = []
-        with open(stream_file, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    data = json.loads(line)
-                    # Convert to dataclass (handling reasoning list)
-                    signals.append(InvestmentEvaluationSignal(**data))
-        
-        return signals
+        """Read all signals from JSONL file (including rotated segments)."""
+        # Convert to dataclass (handling reasoning list)
+        return [InvestmentEvaluationSignal(**data) for data in read_signals(stream_file)]
     
     @staticmethod
     def get_latest_signal(stream_file: Path) -> Optional[InvestmentEvaluationSignal]:
@@ -206,10 +192,7 @@ class InvestmentSignalEmitter:
         }
         
         if stream_file:
-            stream_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(stream_file, "a", encoding="utf-8") as f:
-                json.dump(summary, f)
-                f.write("\n")
+            append_signals(stream_file, [summary])
         
         return summary
 
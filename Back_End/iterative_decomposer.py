@@ -410,9 +410,10 @@ Respond in JSON:
 }}"""
         
         try:
-            response = llm_client.complete(prompt, max_tokens=200, temperature=0.3)
+            import json
+            response = llm_client.complete(prompt, max_tokens=200, temperature=0.3, call_site='goal_analysis',
+                                           validate=lambda r: isinstance(json.loads(r), dict))
             if response:
-                import json
                 data = json.loads(response)
                 return {
                     'complexity': data.get('complexity', 'complex'),
@@ -14,7 +14,8 @@ from typing import Dict, List, Optional
 from Back_End.iterative_decomposer import iterative_decomposer
 from Back_End.agent import Agent as AtomicAgent
 from Back_End.config import Config
-from Back_End.llm_client import llm_client
+from Back_End.llm_client import LLMStreamError, llm_client
+from Back_End.streaming_events import get_event_emitter
 from Back_End.tool_selector import tool_selector
 
 logger = logging.getLogger(__name__)
@@ -23,9 +24,11 @@ logger = logging.getLogger(__name__)
 class IterativeExecutor:
     """Adaptive goal execution with iterative refinement"""
     
-    def __init__(self, goal: str, domain: str = None):
+    def __init__(self, goal: str, domain: str = None, stream_id: Optional[str] = None):
         self.goal = goal
         self.domain = domain
+        # Event stream that receives the answer incrementally (answer_delta events)
+        self.stream_id = stream_id
         self.execution_history = []
         self.current_findings = {
             'entities_found': {},
@@ -273,7 +276,14 @@ Entities Found:
 
 Create a natural, conversational answer to the goal based on these findings."""
             
-            answer = llm_client.complete(prompt, max_tokens=300, temperature=0.7)
+            if self.stream_id:
+                chunks = llm_client.stream_complete(prompt, max_tokens=300, temperature=0.7)
+                try:
+                    answer = get_event_emitter().stream_answer(self.stream_id, chunks)
+                except LLMStreamError:
+                    answer = None  # truncated: use the findings below
+            else:
+                answer = llm_client.complete(prompt, max_tokens=300, temperature=0.7)
             if answer:
                 return answer.strip()
         
@@ -293,7 +303,7 @@ Create a natural, conversational answer to the goal based on these findings."""
         return '\n'.join(lines) if lines else "Research completed but no conclusive answer found"
 
 
-def execute_goal_iteratively(goal: str, domain: str = None) -> Dict:
+def execute_goal_iteratively(goal: str, domain: str = None, stream_id: Optional[str] = None) -> Dict:
     """
     Execute goal using iterative decomposition (preferred method).
     
@@ -302,6 +312,6 @@ def execute_goal_iteratively(goal: str, domain: str = None) -> Dict:
     - Complex goals iterate until sufficient info found
     - Each result informs the next search query
     """
-    executor = IterativeExecutor(goal, domain=domain)
+    executor = IterativeExecutor(goal, domain=domain, stream_id=stream_id)
     return executor.execute()
 
@@ -0,0 +1,83 @@
+"""
+JSONL tail reader: the last N records of an append-only log.
+
+Dashboards only show the most recent records of logs that grow without
+bound. Reading backwards from EOF in fixed-size blocks and decoding only
+the lines that are returned keeps the cost proportional to N (and the
+record size), not to the size of the log.
+
+- Blank and undecodable lines are skipped (including a partially written
+  last line)
+- A missing file reads as empty
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Union
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+
+def _decode(line: bytes) -> Optional[Any]:
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        return json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
+def iter_jsonl_reverse(
+    path: Union[str, Path],
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> Iterator[Any]:
+    """Yield decoded records newest first, seeking backwards from EOF in blocks."""
+    path = Path(path)
+    if not path.exists():
+        return
+
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        # Start of the earliest line seen so far; completed by the block before it
+        head = b""
+        while position > 0:
+            size = min(block_size, position)
+            position -= size
+            f.seek(position)
+            lines = (f.read(size) + head).split(b"\n")
+            head = lines.pop(0)
+            for line in reversed(lines):
+                record = _decode(line)
+                if record is not None:
+                    yield record
+        record = _decode(head)
+        if record is not None:
+            yield record
+
+
+def tail_jsonl(
+    path: Union[str, Path],
+    limit: int,
+    predicate: Optional[Callable[[Any], bool]] = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> List[Any]:
+    """
+    Last `limit` records (matching `predicate`, if given) in file order.
+
+    Only the blocks holding those records are read, so latency stays flat
+    as the log grows unless matches are rare.
+    """
+    records: List[Any] = []
+    if limit <= 0:
+        return records
+    for record in iter_jsonl_reverse(path, block_size=block_size):
+        if predicate is not None and not predicate(record):
+            continue
+        records.append(record)
+        if len(records) >= limit:
+            break
+    records.reverse()
+    return records
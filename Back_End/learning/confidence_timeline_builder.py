@@ -10,13 +10,28 @@ HARD CONSTRAINTS:
 - Deterministic aggregation only
 """
 
-import json
 from pathlib import Path
 from typing import List, Dict, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from collections import defaultdict
 
+from Back_End.learning.signal_log_reader import SignalLogReader
+from Back_End.learning.signal_log_store import signal_log_exists
+
+
+# Cursor name used for incremental reads of the signal log
+CURSOR_CONSUMER = "confidence_timeline_builder"
+
+# Fields the timeline builders read; carried-forward signals keep only these
+TIMELINE_FIELDS = (
+    "signal_type", "selector", "selector_type", "goal", "signal_id",
+    "domain", "timestamp", "confidence", "reliability_score",
+)
+
+# Most recent timeline-relevant signals carried between runs
+MAX_CARRIED_SIGNALS = 5000
+
 
 @dataclass
 class TimelinePoint:
@@ -62,25 +77,51 @@ class ConfidenceTimelineBuilder:
     - forecast: Tracks forecast reliability over time
     """
     
-    def __init__(self, signals_file: str = "outputs/phase25/learning_signals.jsonl"):
+    def __init__(self, signals_file: str = "outputs/phase25/learning_signals.jsonl", incremental: bool = True):
         self.signals_file = signals_file
         self.signals = []
+        self.incremental = incremental
         
     def load_signals(self) -> None:
-        """Load signals from JSONL file."""
+        """
+        Load signals from JSONL file.
+        
+        In incremental mode only signals appended since the last load are
+        parsed; earlier timeline-relevant signals (trimmed to TIMELINE_FIELDS)
+        are carried forward in the builder's checkpoint. Otherwise every
+        segment is re-read.
+        """
         signals_path = Path(self.signals_file)
-        if not signals_path.exists():
+        if not signal_log_exists(signals_path):
             print(f"Warning: Signals file not found: {self.signals_file}")
             return
         
-        with open(signals_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        self.signals.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
+        reader = SignalLogReader(signals_path, CURSOR_CONSUMER)
+        if not self.incremental:
+            reader.reset()
+            self.signals.extend(reader.read_new())
+            return
+        
+        carried = reader.state.get("signals", [])
+        
+        for signal in reader.read_new():
+            if self._is_timeline_signal(signal):
+                carried.append({k: signal[k] for k in TIMELINE_FIELDS if k in signal})
+        
+        carried = carried[-MAX_CARRIED_SIGNALS:]
+        reader.commit({"signals": carried})
+        self.signals.extend(carried)
+    
+    @staticmethod
+    def _is_timeline_signal(signal: Dict) -> bool:
+        """Whether any timeline builder consumes this signal."""
+        signal_type = signal.get("signal_type", "")
+        return (
+            signal_type in ["selector_outcome", "navigation_intent_ranked",
+                            "intent_action_taken", "forecast_reliability_update",
+                            "confidence_increase", "efficiency_gain"]
+            or "opportunity" in signal_type.lower()
+        )
     
     def build_selector_timelines(self) -> List[ConfidenceTimeline]:
         """Build confidence timelines for selector outcomes."""
@@ -10,13 +10,15 @@ CONSTRAINTS:
 - Observability only - no blocking or corrective action
 """
 
-import json
 import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from collections import defaultdict
 
+from Back_End.learning.signal_log_reader import SignalLogReader
+from Back_End.learning.signal_log_store import append_signals
+
 
 # Constants
 LEARNING_SIGNALS_FILE = Path(os.environ.get("LEARNING_SIGNALS_FILE", "outputs/phase25/learning_signals.jsonl"))
@@ -32,31 +34,54 @@ SEVERITY_MEDIUM = "medium"
 SEVERITY_HIGH = "high"
 
 
+# Cursor name used for incremental reads of the signal log
+CURSOR_CONSUMER = "drift_detector"
+
+
 class DriftDetector:
     """Detects performance degradation over time."""
     
-    def __init__(self, signals_file: Path = LEARNING_SIGNALS_FILE):
-        self.signals_file = signals_file
+    def __init__(self, signals_file: Path = LEARNING_SIGNALS_FILE, incremental: bool = True):
+        self.signals_file = Path(signals_file)
         self.temporal_trends: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.incremental = incremental
+        self.reader = SignalLogReader(self.signals_file, CURSOR_CONSUMER)
+        if not incremental:
+            self.reader.reset()
         
     def load_temporal_trends(self) -> None:
-        """Load temporal_trend_detected signals from JSONL file."""
-        if not self.signals_file.exists():
+        """
+        Load temporal_trend_detected signals from the signal log.
+        
+        In incremental mode only signals appended since the last committed
+        run are parsed; the latest trend per layer/window from earlier runs
+        is carried forward from the checkpoint. Otherwise every segment is
+        re-read.
+        """
+        carried = self.reader.state.get("latest_trends", {})
+        for layer, by_window in carried.items():
+            self.temporal_trends[layer].extend(by_window.values())
+        
+        for signal in self.reader.read_new():
+            self._ingest_signal(signal)
+    
+    def _ingest_signal(self, signal: Dict[str, Any]) -> None:
+        """Keep temporal trend signals, grouped by target layer."""
+        if signal.get("signal_type") == "temporal_trend_detected":
+            target_layer = signal.get("target_layer")
+            if target_layer:
+                self.temporal_trends[target_layer].append(signal)
+    
+    def commit_checkpoint(self) -> None:
+        """Persist the read offset and latest trends for the next incremental run."""
+        if not self.incremental:
             return
         
-        with open(self.signals_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    signal = json.loads(line)
-                    if signal.get("signal_type") == "temporal_trend_detected":
-                        target_layer = signal.get("target_layer")
-                        if target_layer:
-                            self.temporal_trends[target_layer].append(signal)
-                except json.JSONDecodeError:
-                    continue
+        latest_trends = {
+            layer: self.get_latest_trends_by_layer(layer)
+            for layer in self.temporal_trends.keys()
+        }
+        self.reader.commit({"latest_trends": latest_trends})
     
     def get_latest_trends_by_layer(self, layer: str) -> Dict[str, Dict[str, Any]]:
         """
@@ -344,15 +369,8 @@ class DriftDetector:
         if not warnings:
             return 0
         
-        # Ensure directory exists
-        self.signals_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Append warnings
-        with open(self.signals_file, 'a', encoding='utf-8') as f:
-            for warning in warnings:
-                f.write(json.dumps(warning) + '\n')
-        
-        return len(warnings)
+        # Append warnings (rotates the log when the active segment is due)
+        return append_signals(self.signals_file, warnings)
     
     def run(self) -> Dict[str, Any]:
         """
@@ -370,6 +388,9 @@ class DriftDetector:
         # Emit warnings
         emitted_count = self.emit_warnings(warnings)
         
+        # Checkpoint after emitting so a failed run is re-read next time
+        self.commit_checkpoint()
+        
         # Compute summary
         summary = {
             "temporal_trends_loaded": sum(len(trends) for trends in self.temporal_trends.values()),
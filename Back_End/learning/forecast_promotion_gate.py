@@ -19,6 +19,8 @@ from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from collections import defaultdict
 
+from Back_End.learning.signal_log_store import append_signals, read_signals, signal_log_exists
+
 
 @dataclass
 class PromotionEligibility:
@@ -101,18 +103,11 @@ class ForecastPromotionGate:
     def load_signals(self) -> None:
         """Load signals from JSONL file."""
         signals_path = Path(self.signals_file)
-        if not signals_path.exists():
+        if not signal_log_exists(signals_path):
             print(f"Warning: Signals file not found: {self.signals_file}")
             return
         
-        with open(signals_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        self.signals.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
+        self.signals.extend(read_signals(signals_path))
         
         # Index signals by type
         for signal in self.signals:
@@ -390,8 +385,7 @@ class ForecastPromotionGate:
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Append signal to JSONL file
-            with open(output_path, 'a') as f:
-                f.write(json.dumps(signal.to_dict()) + '\n')
+            append_signals(output_path, [signal.to_dict()])
             
             return True
         except Exception as e:
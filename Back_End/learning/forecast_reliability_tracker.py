@@ -17,6 +17,8 @@ from pathlib import Path
 from datetime import datetime, timezone
 from collections import defaultdict
 
+from Back_End.learning.signal_log_store import append_signals
+
 
 @dataclass
 class ReliabilityMetrics:
@@ -265,9 +267,8 @@ class ForecastReliabilityTracker:
             "timestamp": metrics.last_updated
         }
         
-        # Append to signals file
-        with open(self.signals_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(signal) + '\n')
+        # Append to signals file (rotates the log when the active segment is due)
+        append_signals(self.signals_file, [signal])
     
     def emit_suppression_signal(self, domain: str, reliability: float) -> None:
         """
@@ -287,9 +288,8 @@ class ForecastReliabilityTracker:
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
         
-        # Append to signals file
-        with open(self.signals_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(signal) + '\n')
+        # Append to signals file (rotates the log when the active segment is due)
+        append_signals(self.signals_file, [signal])
     
     def track_all_domains(self, domains: List[str]) -> Dict[str, ReliabilityMetrics]:
         """
@@ -17,6 +17,8 @@ from typing import List, Optional, Dict
 from pathlib import Path
 from datetime import datetime, timezone
 
+from Back_End.learning.signal_log_store import read_signals, signal_log_exists
+
 
 @dataclass
 class ForecastView:
@@ -74,28 +76,17 @@ class ForecastViewRenderer:
     
     def load_signals(self) -> None:
         """Load temporal trends and drift warnings from signals file."""
-        if not self.signals_file.exists():
+        if not signal_log_exists(self.signals_file):
             return
         
         self.temporal_trends = []
         self.drift_warnings = []
         
-        with open(self.signals_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                try:
-                    signal = json.loads(line)
-                    
-                    if signal.get("signal_type") == "temporal_trend_detected":
-                        self.temporal_trends.append(signal)
-                    elif signal.get("signal_type") == "drift_warning":
-                        self.drift_warnings.append(signal)
-                
-                except json.JSONDecodeError:
-                    continue
+        for signal in read_signals(self.signals_file, signal_types=["temporal_trend_detected", "drift_warning"]):
+            if signal.get("signal_type") == "temporal_trend_detected":
+                self.temporal_trends.append(signal)
+            else:
+                self.drift_warnings.append(signal)
     
     def load_domain_contracts(self) -> None:
         """Load domain contracts from JSON file."""
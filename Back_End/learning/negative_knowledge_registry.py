@@ -25,6 +25,17 @@ from typing import Dict, List, Any, Optional, Set
 from pathlib import Path
 from dataclasses import dataclass, asdict
 
+from Back_End.learning.signal_log_reader import SignalLogReader
+from Back_End.learning.signal_log_store import signal_log_exists
+
+
+# Cursor name used for incremental reads of the signal log
+CURSOR_CONSUMER = "negative_knowledge_registry"
+
+# Selector failure tallies carried in the checkpoint; the least recently
+# failing selectors are dropped beyond this many
+MAX_TRACKED_SELECTORS = 2000
+
 
 @dataclass
 class NegativeKnowledgeEntry:
@@ -76,16 +87,18 @@ class NegativeKnowledgeRegistry:
     - Uses LLMs for analysis
     """
     
-    def __init__(self, outputs_dir: str = "outputs/phase25"):
+    def __init__(self, outputs_dir: str = "outputs/phase25", incremental: bool = True):
         """
         Initialize the registry.
         
         Args:
             outputs_dir: Directory containing learning_signals.jsonl
+            incremental: Only process signals appended since the last run
         """
         self.outputs_dir = Path(outputs_dir)
         self.registry_file = self.outputs_dir / "negative_knowledge.jsonl"
         self.learning_signals_file = self.outputs_dir / "learning_signals.jsonl"
+        self.incremental = incremental
         
         # In-memory cache of patterns (signature -> entry)
         self._registry: Dict[str, NegativeKnowledgeEntry] = {}
@@ -225,40 +238,59 @@ class NegativeKnowledgeRegistry:
         Returns:
             List of entries for failing selectors
         """
-        entries = []
+        tallies: Dict[str, Dict[str, Any]] = {}
+        touched = self._tally_selector_failures(selector_signals, tallies)
+        return self._report_selector_failures(tallies, touched)
+    
+    @staticmethod
+    def _tally_selector_failures(
+        signals: List[Dict[str, Any]],
+        tallies: Dict[str, Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Count selector_outcome failures into tallies.
         
-        # Group by selector
-        selector_outcomes: Dict[str, List[str]] = {}
+        tallies maps selector -> {"count": failures seen, "evidence": first
+        5 timestamps}, ordered least to most recently failing.
         
-        for signal in selector_signals:
-            if signal.get("signal_type") == "selector_outcome":
-                selector = signal.get("selector", "")
-                outcome = signal.get("outcome", "")
-                
-                if outcome == "failure":
-                    if selector not in selector_outcomes:
-                        selector_outcomes[selector] = []
-                    selector_outcomes[selector].append(signal.get("timestamp", ""))
-        
-        # Create patterns for selectors with multiple failures
-        for selector, timestamps in selector_outcomes.items():
-            if len(timestamps) >= 2:  # At least 2 failures
-                pattern_components = {
-                    "selector": selector,
-                    "selector_type": "css" if selector.startswith((".","#","[")) else "xpath"
-                }
-                
-                confidence = min(0.9, 0.5 + (len(timestamps) * 0.1))
-                
-                entry = self.add_pattern(
+        Returns:
+            Selectors that failed in these signals
+        """
+        touched: List[str] = []
+        for signal in signals:
+            if signal.get("signal_type") != "selector_outcome" or signal.get("outcome") != "failure":
+                continue
+            selector = signal.get("selector", "")
+            # Re-insert so the most recently failing selectors stay last
+            tally = tallies.pop(selector, None) or {"count": 0, "evidence": []}
+            tallies[selector] = tally
+            tally["count"] += 1
+            if len(tally["evidence"]) < 5:
+                tally["evidence"].append(signal.get("timestamp", ""))
+            if selector not in touched:
+                touched.append(selector)
+        return touched
+    
+    def _report_selector_failures(
+        self,
+        tallies: Dict[str, Dict[str, Any]],
+        selectors: List[str]
+    ) -> List[NegativeKnowledgeEntry]:
+        """Record a pattern for each of selectors that failed at least twice"""
+        entries = []
+        for selector in selectors:
+            tally = tallies[selector]
+            if tally["count"] >= 2:  # At least 2 failures
+                entries.append(self.add_pattern(
                     pattern_type="selector",
-                    pattern_components=pattern_components,
-                    reason=f"Selector consistently fails (failed {len(timestamps)} times)",
-                    evidence_signal_ids=timestamps[:5],  # Keep first 5 as evidence
-                    confidence=confidence
-                )
-                entries.append(entry)
-        
+                    pattern_components={
+                        "selector": selector,
+                        "selector_type": "css" if selector.startswith((".","#","[")) else "xpath"
+                    },
+                    reason=f"Selector consistently fails (failed {tally['count']} times)",
+                    evidence_signal_ids=list(tally["evidence"]),
+                    confidence=min(0.9, 0.5 + (tally["count"] * 0.1))
+                ))
         return entries
     
     def analyze_goal_ambiguity(self, ambiguity_signal: Dict[str, Any]) -> Optional[NegativeKnowledgeEntry]:
@@ -356,7 +388,10 @@ class NegativeKnowledgeRegistry:
         """
         Process learning_signals.jsonl to extract negative patterns.
         
-        This is the main analysis function that scans all signals.
+        This is the main analysis function. In incremental mode it resumes
+        from the registry's checkpoint, so each signal is analyzed once;
+        selector failure counts that have not yet reached the reporting
+        threshold are carried forward in the checkpoint state.
         
         Args:
             max_signals: Maximum number of signals to process (None = all)
@@ -364,7 +399,7 @@ class NegativeKnowledgeRegistry:
         Returns:
             Statistics about patterns detected
         """
-        if not self.learning_signals_file.exists():
+        if not signal_log_exists(self.learning_signals_file):
             return {"processed": 0, "patterns_detected": 0}
         
         stats = {
@@ -375,43 +410,51 @@ class NegativeKnowledgeRegistry:
             "cost_patterns": 0
         }
         
-        selector_signals = []
+        reader = SignalLogReader(self.learning_signals_file, CURSOR_CONSUMER)
+        if not self.incremental:
+            reader.reset()
         
-        with open(self.learning_signals_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if max_signals and stats["processed"] >= max_signals:
-                    break
-                
-                if line.strip():
-                    signal = json.loads(line)
-                    stats["processed"] += 1
-                    
-                    # Analyze mission failures
-                    if signal.get("signal_type") in ["mission_failed", "mission_status_update"]:
-                        if signal.get("status") == "failed" or signal.get("signal_type") == "mission_failed":
-                            entry = self.analyze_mission_failure(signal)
-                            if entry:
-                                stats["mission_failures"] += 1
-                    
-                    # Collect selector outcomes for batch analysis
-                    elif signal.get("signal_type") == "selector_outcome":
-                        selector_signals.append(signal)
-                    
-                    # Analyze ambiguity
-                    elif signal.get("signal_type") == "mission_ambiguous":
-                        entry = self.analyze_goal_ambiguity(signal)
-                        if entry:
-                            stats["ambiguity_patterns"] += 1
-                    
-                    # Analyze excessive cost
-                    elif signal.get("signal_type") == "excessive_cost":
-                        entry = self.analyze_high_cost_pattern(signal)
-                        if entry:
-                            stats["cost_patterns"] += 1
-        
-        # Batch analyze selector failures
-        selector_entries = self.analyze_selector_failures(selector_signals)
-        stats["selector_failures"] = len(selector_entries)
+        # selector -> {"count": failures seen, "evidence": first timestamps}
+        selector_failures: Dict[str, Dict[str, Any]] = reader.state.get("selector_failures", {})
+        touched_selectors: List[str] = []
+        
+        for signal in reader.read_new(max_signals=max_signals):
+            stats["processed"] += 1
+            
+            # Analyze mission failures
+            if signal.get("signal_type") in ["mission_failed", "mission_status_update"]:
+                if signal.get("status") == "failed" or signal.get("signal_type") == "mission_failed":
+                    entry = self.analyze_mission_failure(signal)
+                    if entry:
+                        stats["mission_failures"] += 1
+            
+            # Accumulate selector failures for batch analysis
+            elif signal.get("signal_type") == "selector_outcome":
+                for selector in self._tally_selector_failures([signal], selector_failures):
+                    if selector not in touched_selectors:
+                        touched_selectors.append(selector)
+            
+            # Analyze ambiguity
+            elif signal.get("signal_type") == "mission_ambiguous":
+                entry = self.analyze_goal_ambiguity(signal)
+                if entry:
+                    stats["ambiguity_patterns"] += 1
+            
+            # Analyze excessive cost
+            elif signal.get("signal_type") == "excessive_cost":
+                entry = self.analyze_high_cost_pattern(signal)
+                if entry:
+                    stats["cost_patterns"] += 1
+        
+        # Batch analyze selectors that saw new failures in this pass
+        entries = self._report_selector_failures(selector_failures, touched_selectors)
+        stats["selector_failures"] += len(entries)
+        
+        # Keep only the most recently failing selectors in the checkpoint
+        for selector in list(selector_failures)[:-MAX_TRACKED_SELECTORS]:
+            del selector_failures[selector]
+        
+        reader.commit({"selector_failures": selector_failures})
         
         stats["patterns_detected"] = (
             stats["mission_failures"] + 
@@ -0,0 +1,224 @@
+"""
+Signal Log Reader: incremental consumption of learning_signals.jsonl
+
+Gives each learning consumer (drift detector, temporal aggregator,
+negative knowledge registry, ...) a durable byte-offset cursor so a run
+only parses signals appended since that consumer's previous run.
+
+Cursors follow the log across rotation: once the active file is sealed
+into a segment by SignalLogStore, a consumer finishes that segment from its
+saved offset and then continues with any later segments and the new
+active file.
+
+CONSTRAINTS:
+- READ-ONLY over the signal log (cursors live in a sidecar directory)
+- Only complete, newline-terminated lines are consumed
+- Cursor and carried-forward consumer state are committed atomically
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from Back_End.learning.signal_log_store import (
+    SignalLogStore,
+    get_signal_log_store,
+    head_fingerprint,
+    open_segment,
+    segment_exists,
+)
+
+
+# Sidecar directory (next to the signal log) holding one cursor file per consumer
+CURSOR_DIR_NAME = ".signal_cursors"
+
+
+class SignalLogReader:
+    """
+    Reads a JSONL signal log from a per-consumer checkpoint.
+
+    Usage:
+        reader = SignalLogReader(signals_file, consumer="drift_detector")
+        state = reader.state
+        for signal in reader.read_new():
+            ...  # fold signal into state
+        reader.commit(state)
+
+    A consumer without a checkpoint starts at the oldest sealed segment.
+    If the active log shrinks below the saved offset or its head no longer
+    matches the saved fingerprint, the cursor is reset and the
+    carried-forward state is discarded.
+    """
+
+    def __init__(
+        self,
+        signals_file: Path,
+        consumer: str,
+        cursor_dir: Optional[Path] = None,
+        store: Optional[SignalLogStore] = None,
+    ):
+        self.signals_file = Path(signals_file)
+        self.consumer = consumer
+        self.cursor_dir = Path(cursor_dir) if cursor_dir else self.signals_file.parent / CURSOR_DIR_NAME
+        self.cursor_file = self.cursor_dir / f"{consumer}.json"
+        self.store = store or get_signal_log_store(self.signals_file)
+
+        # Position: index into the store's sealed segments (None = active file)
+        self.segment: Optional[int] = None
+        self.offset = 0
+        # Sealed segments that existed when the active-file position was taken
+        self._sealed_count = 0
+        self.state: Dict[str, Any] = {}
+        self.signals_read = 0
+
+        self.reset()
+        self._load_checkpoint()
+
+    def _load_checkpoint(self) -> None:
+        """Load the saved cursor, discarding it if the log was replaced."""
+        if not self.cursor_file.exists():
+            return
+
+        try:
+            with open(self.cursor_file, 'r', encoding='utf-8') as f:
+                checkpoint = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+
+        segments = self.store.segment_paths()
+        self._sealed_count = len(segments)
+        offset = int(checkpoint.get("offset", 0))
+        segment_name = checkpoint.get("segment")
+
+        if segment_name:
+            names = [path.name for path in segments]
+            if segment_name not in names:
+                return
+            self.segment = names.index(segment_name)
+        else:
+            sealed_count = int(checkpoint.get("sealed_count", len(segments)))
+            if sealed_count < len(segments):
+                # The active file we were reading has since been sealed
+                self.segment = sealed_count
+                path = segments[sealed_count]
+            else:
+                self.segment = None
+                path = self.signals_file
+                if not path.exists() or offset > path.stat().st_size:
+                    self.reset()
+                    return
+
+            if checkpoint.get("fingerprint", "") != head_fingerprint(path, offset):
+                self.reset()
+                return
+
+        self.offset = offset
+        self.state = checkpoint.get("state") or {}
+
+    def position_rotated(self) -> bool:
+        """Whether the active file this cursor points into has since been sealed."""
+        return self.segment is None and len(self.store.segment_paths()) > self._sealed_count
+
+    def read_new(self, max_signals: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield signals appended since the last commit.
+
+        The in-memory position advances past each yielded line (and past
+        blank or malformed lines), so stopping early and committing
+        resumes exactly after the last signal consumed.
+
+        Args:
+            max_signals: Stop after this many signals (None = until EOF)
+        """
+        segments = self.store.segment_paths()
+        if self.segment is None and len(segments) > self._sealed_count:
+            # Rotated since our position was taken: it now lives in a sealed segment
+            self.segment = self._sealed_count
+        self._sealed_count = len(segments)
+
+        while max_signals is None or self.signals_read < max_signals:
+            sealed = self.segment is not None
+            path = segments[self.segment] if sealed else self.signals_file
+            if not segment_exists(path):
+                return
+
+            exhausted = True
+            with open_segment(path) as f:
+                f.seek(self.offset)
+                while max_signals is None or self.signals_read < max_signals:
+                    raw = f.readline()
+                    if not raw or not raw.endswith(b"\n"):
+                        # EOF or a partially written line; pick it up next run
+                        break
+
+                    self.offset += len(raw)
+                    line = raw.strip()
+                    if not line:
+                        continue
+                    try:
+                        signal = json.loads(line)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        continue
+
+                    self.signals_read += 1
+                    yield signal
+                else:
+                    exhausted = False
+
+            if not sealed or not exhausted:
+                return
+
+            # Finished a sealed segment; move on to the next one (or the active file)
+            self.segment = self.segment + 1 if self.segment + 1 < len(segments) else None
+            self.offset = 0
+
+    def commit(self, state: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Persist the current position and consumer state atomically.
+
+        Args:
+            state: JSON-serializable analysis state to carry into the next run
+        """
+        if state is not None:
+            self.state = state
+
+        segments = self.store.segment_paths()
+        if self.segment is None and len(segments) > self._sealed_count:
+            # Rotated since our position was taken (e.g. by our own emitter)
+            self.segment = self._sealed_count
+        if self.segment is not None:
+            path = segments[self.segment]
+            segment_name = path.name
+        else:
+            path = self.signals_file
+            segment_name = None
+
+        checkpoint = {
+            "consumer": self.consumer,
+            "signals_file": str(self.signals_file),
+            "segment": segment_name,
+            "sealed_count": len(segments),
+            "offset": self.offset,
+            "fingerprint": head_fingerprint(path, self.offset),
+            "state": self.state,
+            "committed_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+        self.cursor_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cursor_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.cursor_file)
+
+    def reset(self) -> None:
+        """Rewind to the oldest segment and drop carried-forward state (not persisted until commit)."""
+        segments = self.store.segment_paths()
+        self.segment = 0 if segments else None
+        self._sealed_count = len(segments)
+        self.offset = 0
+        self.state = {}
+        self.signals_read = 0
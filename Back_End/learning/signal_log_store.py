@@ -0,0 +1,548 @@
+"""
+Signal Log Store: segmented, rotated and indexed learning_signals.jsonl
+
+The active log keeps its historical path (so tail readers are unaffected).
+Once it spans SEGMENT_SECONDS or grows past MAX_SEGMENT_BYTES it is sealed
+into a (optionally gzip-compressed) segment under a sidecar directory, and a
+sidecar index records which segments contain each signal_type, mission_id
+and hourly time bucket. Readers can then open only the segments they need.
+
+Layout for outputs/phase25/learning_signals.jsonl:
+    learning_signals.jsonl                   active segment (append target)
+    learning_signals_segments/index.json     segment index
+    learning_signals_segments/learning_signals.<start>-<end>.jsonl.gz
+
+Rotation only renames the active file (under the store lock); scanning
+the sealed segment for the index and gzipping it run on a background
+thread. Until that finishes the segment is listed as "pending": it is read
+from its plain .jsonl file and every query treats it as a possible match.
+
+Every writer and reader of a signal log must go through
+get_signal_log_store() (or append_signals/read_signals/tail_signals): a
+writer holding its own handle on the active file would keep appending to
+the renamed segment after rotation.
+
+CONSTRAINTS:
+- Append-only: sealed segments are never rewritten
+- Rotation is a rename, so writers never block on compression
+- Index keys are derived deterministically from signal fields
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from Back_End.jsonl_tail import iter_jsonl_reverse
+
+
+# Rotation policy (environment overrides for deployments and tests)
+SEGMENT_SECONDS = int(os.environ.get("SIGNAL_LOG_SEGMENT_SECONDS", str(24 * 3600)))
+MAX_SEGMENT_BYTES = int(os.environ.get("SIGNAL_LOG_MAX_SEGMENT_BYTES", str(64 * 1024 * 1024)))
+COMPRESS_SEGMENTS = os.environ.get("SIGNAL_LOG_COMPRESS", "true").lower() == "true"
+
+INDEX_FILE_NAME = "index.json"
+
+# Bytes at the head of a log file used to recognise it after rotation
+FINGERPRINT_BYTES = 256
+
+# Index keys maintained per segment
+INDEX_KEYS = ("signal_type", "mission_id", "bucket")
+
+logger = logging.getLogger(__name__)
+
+
+def time_bucket(timestamp: Optional[str]) -> Optional[str]:
+    """Hourly bucket ("YYYY-MM-DDTHH") for an ISO timestamp, if parseable."""
+    if not timestamp or not isinstance(timestamp, str) or len(timestamp) < 13:
+        return None
+    bucket = timestamp[:13]
+    return bucket if bucket[10] == "T" else None
+
+
+def _plain_path(path: Path) -> Path:
+    """Where a segment's data lives before it has been compressed."""
+    return path.with_suffix("") if path.suffix == ".gz" else path
+
+
+def segment_exists(path: Path) -> bool:
+    """Whether a segment (or its not yet compressed data) is on disk."""
+    return path.exists() or _plain_path(path).exists()
+
+
+def head_fingerprint(path: Path, length: int) -> str:
+    """Hash of the first `length` (<= FINGERPRINT_BYTES) uncompressed bytes of a log file."""
+    length = min(length, FINGERPRINT_BYTES)
+    if length <= 0 or not segment_exists(path):
+        return ""
+    with open_segment(path) as f:
+        head = f.read(length)
+    return hashlib.sha256(head).hexdigest()[:16]
+
+
+def open_segment(path: Path):
+    """
+    Open a plain or gzip segment for binary reading.
+
+    A .gz segment still being compressed is read from its plain file; the
+    compressed file is tried again in case compression finished meanwhile.
+    Offsets are in uncompressed bytes either way.
+    """
+    if path.suffix != ".gz":
+        return open(path, 'rb')
+    for candidate in (path, _plain_path(path), path):
+        try:
+            if candidate.suffix == ".gz":
+                return gzip.open(candidate, 'rb')
+            return open(candidate, 'rb')
+        except FileNotFoundError:
+            continue
+    raise FileNotFoundError(str(path))
+
+
+class SignalLogStore:
+    """
+    Append/rotate/query front-end for one signal log.
+
+    Use get_signal_log_store(path) rather than constructing directly, so all
+    emitters in a process share one lock and one rotation clock per log.
+    """
+
+    def __init__(
+        self,
+        active_file: Path,
+        segment_seconds: int = SEGMENT_SECONDS,
+        max_segment_bytes: int = MAX_SEGMENT_BYTES,
+        compress: bool = COMPRESS_SEGMENTS,
+    ):
+        self.active_file = Path(active_file)
+        self.segment_dir = self.active_file.parent / f"{self.active_file.stem}_segments"
+        self.index_file = self.segment_dir / INDEX_FILE_NAME
+        self.segment_seconds = segment_seconds
+        self.max_segment_bytes = max_segment_bytes
+        self.compress = compress
+
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, Any]] = None
+        self._index_mtime: Optional[float] = None
+        self._sealers: List[threading.Thread] = []
+        self._resumed_pending = False
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def _empty_index(self) -> Dict[str, Any]:
+        return {
+            "active_started_at": None,
+            "segments": [],
+            "keys": {key: {} for key in INDEX_KEYS},
+        }
+
+    def load_index(self) -> Dict[str, Any]:
+        """Load the sidecar index (cached until the file changes on disk)."""
+        if not self.index_file.exists():
+            if self._index is None:
+                self._index = self._empty_index()
+            return self._index
+
+        mtime = self.index_file.stat().st_mtime
+        if self._index is None or mtime != self._index_mtime:
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    self._index = json.load(f)
+                self._index_mtime = mtime
+            except (OSError, json.JSONDecodeError):
+                self._index = self._empty_index()
+        return self._index
+
+    def _save_index(self, index: Dict[str, Any]) -> None:
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.index_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(tmp_file, self.index_file)
+        self._index = index
+        self._index_mtime = self.index_file.stat().st_mtime
+
+    # ------------------------------------------------------------------
+    # Append / rotate
+    # ------------------------------------------------------------------
+
+    def append(self, signal: Dict[str, Any]) -> None:
+        """Append one signal to the active segment."""
+        self.append_many([signal])
+
+    def append_many(self, signals: Iterable[Dict[str, Any]]) -> int:
+        """
+        Append signals to the active segment, rotating first if it is due.
+
+        Returns:
+            Number of signals written
+        """
+        lines = [json.dumps(signal) + "\n" for signal in signals]
+        if not lines:
+            return 0
+
+        with self._lock:
+            sealed = self._maybe_rotate_locked()
+            self.active_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.active_file, 'a', encoding='utf-8') as f:
+                f.write("".join(lines))
+
+            index = self.load_index()
+            if not index.get("active_started_at"):
+                index["active_started_at"] = datetime.now(timezone.utc).isoformat()
+                self._save_index(index)
+
+            pending = self._claim_pending_locked()
+
+        if sealed is not None:
+            self._seal_in_background(sealed)
+        for segment in pending:
+            self._seal_in_background(segment)
+        return len(lines)
+
+    def _rotation_due(self, now: datetime) -> bool:
+        if not self.active_file.exists():
+            return False
+        size = self.active_file.stat().st_size
+        if size == 0:
+            return False
+        if size >= self.max_segment_bytes:
+            return True
+
+        started_at = self.load_index().get("active_started_at")
+        if not started_at:
+            return False
+        try:
+            started = datetime.fromisoformat(started_at)
+        except ValueError:
+            return True
+        return (now - started).total_seconds() >= self.segment_seconds
+
+    def maybe_rotate(self, now: Optional[datetime] = None, wait: bool = False) -> Optional[Path]:
+        """Seal the active segment if it has reached its time or size bound."""
+        with self._lock:
+            segment = self._maybe_rotate_locked(now)
+        return self._start_sealing(segment, wait)
+
+    def _maybe_rotate_locked(self, now: Optional[datetime] = None) -> Optional[Path]:
+        now = now or datetime.now(timezone.utc)
+        if not self._rotation_due(now):
+            return None
+        return self._rotate_locked(now)
+
+    def rotate(self, now: Optional[datetime] = None, wait: bool = False) -> Optional[Path]:
+        """
+        Seal the active segment unconditionally (no-op if it is empty).
+
+        Returns the segment's path; it is indexed and compressed in the
+        background unless wait=True.
+        """
+        with self._lock:
+            segment = self._rotate_locked(now or datetime.now(timezone.utc))
+        return self._start_sealing(segment, wait)
+
+    def wait_for_sealing(self, timeout: Optional[float] = None) -> None:
+        """Block until background sealing of rotated segments has finished."""
+        for thread in list(self._sealers):
+            thread.join(timeout)
+
+    def _start_sealing(self, segment: Optional[Path], wait: bool) -> Optional[Path]:
+        if segment is None:
+            return None
+        if wait:
+            self._seal(segment)
+        else:
+            self._seal_in_background(segment)
+        return segment
+
+    def _rotate_locked(self, now: datetime) -> Optional[Path]:
+        """Rename the active file into a pending segment (caller holds _lock)."""
+        if not self.active_file.exists() or self.active_file.stat().st_size == 0:
+            return None
+
+        index = self.load_index()
+        started_at = index.get("active_started_at") or now.isoformat()
+        try:
+            started = datetime.fromisoformat(started_at)
+        except ValueError:
+            started = now
+
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        name = f"{self.active_file.stem}.{started:%Y%m%dT%H%M%S}-{now:%Y%m%dT%H%M%S}"
+        sealing = self.segment_dir / f"{name}.jsonl"
+        suffix = 1
+        while sealing.exists() or sealing.with_suffix(".jsonl.gz").exists():
+            sealing = self.segment_dir / f"{name}-{suffix}.jsonl"
+            suffix += 1
+
+        try:
+            os.replace(self.active_file, sealing)
+        except FileNotFoundError:
+            # Another process rotated it first
+            return None
+
+        segment_path = sealing.with_suffix(".jsonl.gz") if self.compress else sealing
+        index["segments"].append({
+            "file": segment_path.name,
+            "started_at": started.isoformat(),
+            "ended_at": now.isoformat(),
+            "compressed": self.compress,
+            "pending": True,
+        })
+        index["active_started_at"] = None
+        self._save_index(index)
+
+        return segment_path
+
+    def _claim_pending_locked(self) -> List[Path]:
+        """Pending segments left by an earlier process, once per store (caller holds _lock)."""
+        if self._resumed_pending:
+            return []
+        self._resumed_pending = True
+        return [
+            self.segment_dir / segment["file"]
+            for segment in self.load_index().get("segments", [])
+            if segment.get("pending")
+        ]
+
+    def _seal_in_background(self, segment: Path) -> None:
+        thread = threading.Thread(target=self._seal, args=(segment,), name="signal-log-seal", daemon=True)
+        self._sealers = [t for t in self._sealers if t.is_alive()] + [thread]
+        thread.start()
+
+    def _seal(self, segment: Path) -> None:
+        """Index and (optionally) compress a pending segment, outside the store lock."""
+        plain = _plain_path(segment)
+        try:
+            if not plain.exists():
+                return
+            entry, keys = self._scan_segment(plain)
+            if segment != plain:
+                tmp_file = segment.with_name(f"{segment.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                with open(plain, 'rb') as src, gzip.open(tmp_file, 'wb') as dst:
+                    while True:
+                        chunk = src.read(1024 * 1024)
+                        if not chunk:
+                            break
+                        dst.write(chunk)
+                os.replace(tmp_file, segment)
+
+            with self._lock:
+                index = self.load_index()
+                record = next((s for s in index.get("segments", []) if s["file"] == segment.name), None)
+                if record is None or not record.get("pending"):
+                    return  # Sealed by another process meanwhile
+                record.update(entry)
+                record.pop("pending", None)
+                for key, values in keys.items():
+                    postings = index["keys"].setdefault(key, {})
+                    for value in values:
+                        postings.setdefault(value, []).append(segment.name)
+                self._save_index(index)
+
+            if segment != plain:
+                try:
+                    plain.unlink()
+                except OSError as e:
+                    # e.g. still open by a reader on Windows; the .gz is authoritative
+                    logger.warning(f"[SIGNAL_LOG] Could not remove sealed plain segment {plain}: {e}")
+        except Exception as e:
+            logger.warning(f"[SIGNAL_LOG] Sealing {segment.name} failed; it stays pending: {e}")
+
+    def _scan_segment(self, path: Path) -> Tuple[Dict[str, Any], Dict[str, List[str]]]:
+        """Build the index entry and key postings for a freshly sealed segment."""
+        keys: Dict[str, set] = {key: set() for key in INDEX_KEYS}
+        count = 0
+        size = 0
+        with open(path, 'rb') as f:
+            for raw in f:
+                size += len(raw)
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    signal = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                count += 1
+                if signal.get("signal_type"):
+                    keys["signal_type"].add(str(signal["signal_type"]))
+                if signal.get("mission_id"):
+                    keys["mission_id"].add(str(signal["mission_id"]))
+                bucket = time_bucket(signal.get("timestamp"))
+                if bucket:
+                    keys["bucket"].add(bucket)
+
+        entry = {
+            "signals": count,
+            "bytes": size,
+            "fingerprint": head_fingerprint(path, FINGERPRINT_BYTES),
+        }
+        return entry, {key: sorted(values) for key, values in keys.items()}
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+
+    def segment_paths(self) -> List[Path]:
+        """All sealed segments, oldest first."""
+        return [self.segment_dir / s["file"] for s in self.load_index().get("segments", [])]
+
+    def find_segments(
+        self,
+        signal_types: Optional[Iterable[str]] = None,
+        mission_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> List[Path]:
+        """
+        Sealed segments that may contain matching signals, oldest first.
+
+        Args:
+            signal_types: Match any of these signal types
+            mission_id: Match this mission
+            since/until: ISO timestamps bounding the hourly buckets
+        """
+        index = self.load_index()
+        keys = index.get("keys", {})
+        candidates = [s["file"] for s in index.get("segments", [])]
+        selected = set(candidates)
+
+        if signal_types is not None:
+            postings = keys.get("signal_type", {})
+            matched = set()
+            for signal_type in signal_types:
+                matched.update(postings.get(signal_type, []))
+            selected &= matched
+
+        if mission_id is not None:
+            selected &= set(keys.get("mission_id", {}).get(str(mission_id), []))
+
+        if since is not None or until is not None:
+            low = time_bucket(since) if since else None
+            high = time_bucket(until) if until else None
+            matched = set()
+            for bucket, files in keys.get("bucket", {}).items():
+                if low and bucket < low:
+                    continue
+                if high and bucket > high:
+                    continue
+                matched.update(files)
+            selected &= matched
+
+        # Pending segments are not indexed yet and may match anything
+        selected.update(s["file"] for s in index.get("segments", []) if s.get("pending"))
+        return [self.segment_dir / name for name in candidates if name in selected]
+
+    def read(
+        self,
+        signal_types: Optional[Iterable[str]] = None,
+        mission_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Matching signals from indexed segments and the active segment, in log order.
+        """
+        wanted_types = set(signal_types) if signal_types is not None else None
+        files = self.find_segments(wanted_types, mission_id, since, until) + [self.active_file]
+
+        results: List[Dict[str, Any]] = []
+        for path in files:
+            for signal in self._iter_file(path):
+                if wanted_types is not None and signal.get("signal_type") not in wanted_types:
+                    continue
+                if mission_id is not None and signal.get("mission_id") != mission_id:
+                    continue
+                timestamp = signal.get("timestamp") or ""
+                if since is not None and timestamp < since:
+                    continue
+                if until is not None and timestamp > until:
+                    continue
+                results.append(signal)
+        return results
+
+    def tail(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        The last `limit` signals, reaching back into sealed segments as needed.
+
+        Plain files (the active file, uncompressed or still pending segments)
+        are read backwards from EOF, so the cost stays proportional to
+        `limit`; a gzip segment is only decompressed when the newer files
+        did not fill it.
+        """
+        newest_first: List[Dict[str, Any]] = []
+        for path in [self.active_file] + list(reversed(self.segment_paths())):
+            needed = limit - len(newest_first)
+            if needed <= 0:
+                break
+            plain = _plain_path(path)
+            if plain.exists():
+                try:
+                    for signal in iter_jsonl_reverse(plain):
+                        newest_first.append(signal)
+                        if len(newest_first) >= limit:
+                            break
+                    continue
+                except FileNotFoundError:
+                    pass  # a pending segment finished compressing: read the .gz
+            newest_first.extend(reversed(deque(self._iter_file(path), maxlen=needed)))
+        newest_first.reverse()
+        return newest_first
+
+    def _iter_file(self, path: Path) -> Iterator[Dict[str, Any]]:
+        if not segment_exists(path):
+            return
+        with open_segment(path) as f:
+            for raw in f:
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+
+
+_stores: Dict[str, SignalLogStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_signal_log_store(active_file: Path) -> SignalLogStore:
+    """Get or create the shared store for a signal log path."""
+    key = str(Path(active_file).resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = SignalLogStore(Path(active_file))
+            _stores[key] = store
+        return store
+
+
+def append_signals(active_file: Path, signals: Iterable[Dict[str, Any]]) -> int:
+    """Append signals to a signal log through its shared store."""
+    return get_signal_log_store(active_file).append_many(signals)
+
+
+def signal_log_exists(active_file: Path) -> bool:
+    """Whether a signal log has an active file or any sealed segments."""
+    return segment_exists(Path(active_file)) or bool(get_signal_log_store(active_file).segment_paths())
+
+
+def read_signals(active_file: Path, **filters: Any) -> List[Dict[str, Any]]:
+    """All signals in a signal log (sealed segments and active file), optionally filtered."""
+    return get_signal_log_store(active_file).read(**filters)
+
+
+def tail_signals(active_file: Path, limit: int) -> List[Dict[str, Any]]:
+    """The last `limit` signals in a signal log."""
+    return get_signal_log_store(active_file).tail(limit)
@@ -10,7 +10,6 @@ CONSTRAINTS:
 - NO predictions or causal inference
 """
 
-import json
 import os
 from datetime import datetime, timezone
 from pathlib import Path
@@ -18,6 +17,9 @@ from typing import Dict, List, Any, Optional
 from collections import defaultdict
 import statistics
 
+from Back_End.learning.signal_log_reader import SignalLogReader
+from Back_End.learning.signal_log_store import append_signals
+
 
 # Constants
 LEARNING_SIGNALS_FILE = Path(os.environ.get("LEARNING_SIGNALS_FILE", "outputs/phase25/learning_signals.jsonl"))
@@ -30,31 +32,54 @@ WINDOW_LONG = 200
 # Supported signal layers
 SUPPORTED_LAYERS = ["selector", "intent", "mission", "opportunity"]
 
+# Cursor name used for incremental reads of the signal log
+CURSOR_CONSUMER = "temporal_aggregator"
+
 
 class TemporalAggregator:
     """Aggregates signals over time and detects trends."""
     
-    def __init__(self, signals_file: Path = LEARNING_SIGNALS_FILE):
-        self.signals_file = signals_file
+    def __init__(self, signals_file: Path = LEARNING_SIGNALS_FILE, incremental: bool = True):
+        self.signals_file = Path(signals_file)
         self.signals_by_layer: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.incremental = incremental
+        self.reader = SignalLogReader(self.signals_file, CURSOR_CONSUMER)
+        if not incremental:
+            self.reader.reset()
         
     def load_signals(self) -> None:
-        """Load all signals from JSONL file."""
-        if not self.signals_file.exists():
+        """
+        Load signals from the signal log.
+        
+        In incremental mode only signals appended since the last committed
+        run are parsed. Windows never look further back than WINDOW_LONG
+        signals, so the tail of each layer is carried forward in the
+        checkpoint and the trends match a full re-scan. Otherwise every
+        segment is re-read.
+        """
+        carried = self.reader.state.get("signals_by_layer", {})
+        for layer, signals in carried.items():
+            self.signals_by_layer[layer].extend(signals)
+        
+        for signal in self.reader.read_new():
+            self._ingest_signal(signal)
+    
+    def _ingest_signal(self, signal: Dict[str, Any]) -> None:
+        """Keep signals from supported layers, grouped by layer."""
+        layer = signal.get("signal_layer")
+        if layer in SUPPORTED_LAYERS:
+            self.signals_by_layer[layer].append(signal)
+    
+    def commit_checkpoint(self) -> None:
+        """Persist the read offset and the last WINDOW_LONG signals per layer."""
+        if not self.incremental:
             return
         
-        with open(self.signals_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    signal = json.loads(line)
-                    layer = signal.get("signal_layer")
-                    if layer in SUPPORTED_LAYERS:
-                        self.signals_by_layer[layer].append(signal)
-                except json.JSONDecodeError:
-                    continue
+        tails = {
+            layer: signals[-WINDOW_LONG:]
+            for layer, signals in self.signals_by_layer.items()
+        }
+        self.reader.commit({"signals_by_layer": tails})
     
     def compute_rolling_metrics(
         self, 
@@ -244,15 +269,8 @@ class TemporalAggregator:
         if not trends:
             return 0
         
-        # Ensure directory exists
-        self.signals_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Append signals
-        with open(self.signals_file, 'a', encoding='utf-8') as f:
-            for trend in trends:
-                f.write(json.dumps(trend) + '\n')
-        
-        return len(trends)
+        # Append signals (rotates the log when the active segment is due)
+        return append_signals(self.signals_file, trends)
     
     def run(self) -> Dict[str, Any]:
         """
@@ -270,6 +288,9 @@ class TemporalAggregator:
         # Emit trends
         emitted_count = self.emit_trends(trends)
         
+        # Checkpoint after emitting so a failed run is re-read next time
+        self.commit_checkpoint()
+        
         # Compute summary
         summary = {
             "total_signals_loaded": sum(len(signals) for signals in self.signals_by_layer.values()),
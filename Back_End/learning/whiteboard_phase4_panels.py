@@ -16,6 +16,8 @@ from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from Back_End.learning.signal_log_store import read_signals, signal_log_exists
+
 # Import confidence timeline builder for Phase 4 Step 7
 try:
     from Back_End.learning.confidence_timeline_builder import (
@@ -60,32 +62,23 @@ class Phase4WhiteboardPanels:
     
     def load_signals(self) -> None:
         """Load signals from JSONL file."""
-        if not self.signals_file.exists():
+        if not signal_log_exists(self.signals_file):
             return
         
         self.temporal_trends = []
         self.drift_warnings = []
         self.reliability_updates = []
         
-        with open(self.signals_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                try:
-                    signal = json.loads(line)
-                    signal_type = signal.get("signal_type")
-                    
-                    if signal_type == "temporal_trend_detected":
-                        self.temporal_trends.append(signal)
-                    elif signal_type == "drift_warning":
-                        self.drift_warnings.append(signal)
-                    elif signal_type == "forecast_reliability_update":
-                        self.reliability_updates.append(signal)
-                
-                except json.JSONDecodeError:
-                    continue
+        wanted = ["temporal_trend_detected", "drift_warning", "forecast_reliability_update"]
+        for signal in read_signals(self.signals_file, signal_types=wanted):
+            signal_type = signal.get("signal_type")
+            
+            if signal_type == "temporal_trend_detected":
+                self.temporal_trends.append(signal)
+            elif signal_type == "drift_warning":
+                self.drift_warnings.append(signal)
+            else:
+                self.reliability_updates.append(signal)
     
     def load_domain_contracts(self) -> None:
         """Load domain contracts if available."""
@@ -3,12 +3,12 @@ Learning Signal Writer for Capability Classification
 Emits learning signals when tasks are classified
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 from Back_End.capability_boundary_model import ClassificationResult, Capability
+from Back_End.learning.signal_log_store import get_signal_log_store
 
 
 class LearningSignalWriter:
@@ -43,22 +43,12 @@ class LearningSignalWriter:
             },
         }
         
-        # Append to JSONL file (one JSON object per line)
-        with open(self.log_path, "a") as f:
-            f.write(json.dumps(signal) + "\n")
+        # Append to JSONL file (one JSON object per line, rotated into segments)
+        get_signal_log_store(self.log_path).append(signal)
     
     def read_signals(self) -> list:
-        """Read all logged signals"""
-        if not self.log_path.exists():
-            return []
-        
-        signals = []
-        with open(self.log_path, "r") as f:
-            for line in f:
-                if line.strip():
-                    signals.append(json.loads(line))
-        
-        return signals
+        """Read all logged classification signals, including sealed segments"""
+        return get_signal_log_store(self.log_path).read(signal_types=["capability_classified"])
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics from logged signals"""
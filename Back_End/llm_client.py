@@ -3,11 +3,13 @@ LLM Client: Unified interface for language models (OpenAI, Anthropic, local)
 """
 
 import os
+import asyncio
 import logging
 import json
 import time
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional
 from Back_End.config import Config
+from Back_End.llm_response_cache import cache_key, get_llm_response_cache
 
 
 # Helper function to log external API usage
@@ -20,6 +22,35 @@ def _log_external_api(company: str, request_type: str, duration_ms: float = 0.0,
         logging.debug(f"Could not log API usage: {e}")
 
 
+class LLMStreamError(RuntimeError):
+    """The provider failed after a completion started streaming"""
+
+
+class FakeStreamingProvider:
+    """Offline provider that streams canned responses word by word
+    
+    Selected with LLM_PROVIDER=fake (or installed directly on a client by
+    tests). Responses are served in order, the last one repeating; each
+    call is recorded in self.calls.
+    """
+    
+    def __init__(self, responses: Optional[List[str]] = None, chunk_size: int = 1, delay: float = 0.0):
+        self.responses = list(responses) if responses else ["This is a streamed answer from the fake provider."]
+        self.chunk_size = max(1, chunk_size)
+        self.delay = delay
+        self.calls: List[Dict] = []
+    
+    def stream(self, prompt: str, system_prompt: str = "", max_tokens: int = 500, temperature: float = 0.7) -> Iterator[str]:
+        index = min(len(self.calls), len(self.responses) - 1)
+        self.calls.append({'prompt': prompt, 'system_prompt': system_prompt, 'max_tokens': max_tokens})
+        words = self.responses[index].split(' ')
+        for start in range(0, len(words), self.chunk_size):
+            if self.delay:
+                time.sleep(self.delay)
+            chunk = ' '.join(words[start:start + self.chunk_size])
+            yield chunk if start == 0 else ' ' + chunk
+
+
 class LLMClient:
     """Universal LLM client with fallback to pattern-based heuristics"""
     
@@ -31,6 +62,8 @@ class LLMClient:
             self._init_openai()
         elif self.provider == 'anthropic':
             self._init_anthropic()
+        elif self.provider == 'fake':
+            self._init_fake()
         
         logging.info(f"LLM Client initialized: provider={self.provider}, enabled={self.enabled}")
     
@@ -70,7 +103,14 @@ class LLMClient:
             logging.error(f"Anthropic initialization failed: {e}")
             self.enabled = False
     
-    def complete(self, prompt: str, system_prompt: str = "", max_tokens: int = 500, temperature: float = 0.7) -> Optional[str]:
+    def _init_fake(self, provider: Optional[FakeStreamingProvider] = None):
+        """Initialize the offline fake provider"""
+        self.fake_provider = provider or FakeStreamingProvider()
+        self.model = 'fake-stream'
+    
+    def complete(self, prompt: str, system_prompt: str = "", max_tokens: int = 500, temperature: float = 0.7,
+                 call_site: Optional[str] = None, cache_ttl: Optional[float] = None,
+                 validate: Optional[Callable[[str], bool]] = None) -> Optional[str]:
         """
         Get completion from LLM with fallback to None if unavailable.
         
@@ -79,6 +119,11 @@ class LLMClient:
             system_prompt: System instructions
             max_tokens: Max response length
             temperature: Creativity (0.0-1.0)
+            call_site: Names the caller and opts the call into the response
+                cache (see llm_response_cache.CALL_SITE_TTLS)
+            cache_ttl: Overrides the call site's cache TTL in seconds
+            validate: Checks a fresh response before it is cached; a response
+                it rejects (or raises on) is returned but not cached
         
         Returns:
             LLM response text or None if unavailable
@@ -86,14 +131,100 @@ class LLMClient:
         if not self.enabled:
             return None
         
+        cache = key = None
+        if call_site and Config.LLM_CACHE_ENABLED:
+            cache = get_llm_response_cache()
+            if cache.cacheable(temperature):
+                key = cache_key(self.provider, getattr(self, 'model', ''), system_prompt, prompt, temperature, max_tokens)
+                cached = cache.get(key, call_site)
+                if cached is not None:
+                    self.last_usage = {
+                        'input_tokens': 0,
+                        'output_tokens': 0,
+                        'total_tokens': 0,
+                        'model': getattr(self, 'model', ''),
+                        'cost_usd': 0.0,
+                        'cached': True
+                    }
+                    return cached
+            else:
+                cache.record_bypass(call_site)
+                cache = None
+        
         try:
+            response = None
             if self.provider == 'openai':
-                return self._complete_openai(prompt, system_prompt, max_tokens, temperature)
+                response = self._complete_openai(prompt, system_prompt, max_tokens, temperature)
             elif self.provider == 'anthropic':
-                return self._complete_anthropic(prompt, system_prompt, max_tokens, temperature)
+                response = self._complete_anthropic(prompt, system_prompt, max_tokens, temperature)
+            elif self.provider == 'fake':
+                response = "".join(self._stream_fake(prompt, system_prompt, max_tokens, temperature)).strip()
         except Exception as e:
             logging.error(f"LLM completion failed ({self.provider}): {type(e).__name__}: {e}")
             return None
+        
+        if cache is not None and response:
+            if self._accepts(validate, response):
+                cache.put(key, response, call_site, ttl=cache_ttl)
+            else:
+                cache.record_rejected(call_site)
+        return response
+    
+    @staticmethod
+    def _accepts(validate: Optional[Callable[[str], bool]], response: str) -> bool:
+        if validate is None:
+            return True
+        try:
+            return bool(validate(response))
+        except Exception as e:
+            logging.debug(f"Response validator raised {type(e).__name__}: {e}")
+            return False
+    
+    def stream_complete(self, prompt: str, system_prompt: str = "", max_tokens: int = 500,
+                        temperature: float = 0.7) -> Iterator[str]:
+        """
+        Stream a completion as text chunks while the provider generates it.
+        
+        Yields nothing when the LLM is unavailable. A provider error after
+        the stream started is logged and raised as LLMStreamError, so callers
+        know the chunks already yielded are a truncated answer and can fall
+        back. Streamed answers are never cached.
+        """
+        if not self.enabled:
+            return
+        
+        if self.provider == 'openai':
+            chunks = self._stream_openai(prompt, system_prompt, max_tokens, temperature)
+        elif self.provider == 'anthropic':
+            chunks = self._stream_anthropic(prompt, system_prompt, max_tokens, temperature)
+        elif self.provider == 'fake':
+            chunks = self._stream_fake(prompt, system_prompt, max_tokens, temperature)
+        else:
+            return
+        
+        try:
+            for chunk in chunks:
+                if chunk:
+                    yield chunk
+        except Exception as e:
+            logging.error(f"LLM streaming failed ({self.provider}): {type(e).__name__}: {e}")
+            raise LLMStreamError(f"{self.provider} stream ended early: {type(e).__name__}: {e}") from e
+    
+    async def astream_complete(self, prompt: str, system_prompt: str = "", max_tokens: int = 500,
+                               temperature: float = 0.7) -> AsyncIterator[str]:
+        """stream_complete() for async callers; provider I/O runs in the default executor"""
+        loop = asyncio.get_running_loop()
+        chunks = self.stream_complete(prompt, system_prompt, max_tokens, temperature)
+        done = object()
+        while True:
+            chunk = await loop.run_in_executor(None, next, chunks, done)
+            if chunk is done:
+                return
+            yield chunk
+    
+    def get_cache_stats(self) -> dict:
+        """Response cache counters (hits, misses, hit rate) per call site"""
+        return get_llm_response_cache().stats()
     
     def _complete_openai(self, prompt: str, system_prompt: str, max_tokens: int, temperature: float) -> str:
         """OpenAI completion - returns text content"""
@@ -110,27 +241,57 @@ class LLMClient:
             temperature=temperature
         )
         
+        self._record_openai_usage(response.usage, start_time)
+        return response.choices[0].message.content.strip()
+    
+    def _stream_openai(self, prompt: str, system_prompt: str, max_tokens: int, temperature: float) -> Iterator[str]:
+        """OpenAI streamed completion - yields content deltas"""
+        start_time = time.time()
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        
+        stream = self.openai.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        
+        usage = None
+        for event in stream:
+            # The final event carries usage and no choices
+            if getattr(event, 'usage', None):
+                usage = event.usage
+            if event.choices and event.choices[0].delta.content:
+                yield event.choices[0].delta.content
+        
+        if usage is not None:
+            self._record_openai_usage(usage, start_time, "chat_completion_stream")
+    
+    def _record_openai_usage(self, usage, start_time: float, request_type: str = "chat_completion") -> None:
         # Calculate duration and cost
         duration_ms = (time.time() - start_time) * 1000
         # Estimate cost based on token usage (rough estimate)
         # GPT-4o-mini: ~$0.00015 per 1K input tokens, ~$0.000600 per 1K output tokens
-        input_cost = response.usage.prompt_tokens * 0.00015 / 1000
-        output_cost = response.usage.completion_tokens * 0.000600 / 1000
+        input_cost = usage.prompt_tokens * 0.00015 / 1000
+        output_cost = usage.completion_tokens * 0.000600 / 1000
         total_cost = input_cost + output_cost
         
         # Log API usage
-        _log_external_api("OpenAI", "chat_completion", duration_ms, total_cost)
+        _log_external_api("OpenAI", request_type, duration_ms, total_cost)
         
         # Store last usage for tracking (can be retrieved separately)
         self.last_usage = {
-            'input_tokens': response.usage.prompt_tokens,
-            'output_tokens': response.usage.completion_tokens,
-            'total_tokens': response.usage.total_tokens,
+            'input_tokens': usage.prompt_tokens,
+            'output_tokens': usage.completion_tokens,
+            'total_tokens': usage.total_tokens,
             'model': self.model,
             'cost_usd': total_cost
         }
-        
-        return response.choices[0].message.content.strip()
     
     def get_last_usage(self) -> dict:
         """Get token usage from last API call"""
@@ -147,27 +308,61 @@ class LLMClient:
             messages=[{"role": "user", "content": prompt}]
         )
         
+        self._record_anthropic_usage(response.usage, start_time)
+        return response.content[0].text.strip()
+    
+    def _stream_anthropic(self, prompt: str, system_prompt: str, max_tokens: int, temperature: float) -> Iterator[str]:
+        """Anthropic streamed completion - yields text deltas"""
+        start_time = time.time()
+        with self.anthropic_client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system_prompt if system_prompt else "You are a helpful AI assistant.",
+            messages=[{"role": "user", "content": prompt}]
+        ) as stream:
+            for text in stream.text_stream:
+                yield text
+            final = stream.get_final_message()
+        
+        self._record_anthropic_usage(final.usage, start_time, "chat_completion_stream")
+    
+    def _record_anthropic_usage(self, usage, start_time: float, request_type: str = "chat_completion") -> None:
         # Calculate duration and cost
         duration_ms = (time.time() - start_time) * 1000
         # Estimate cost based on token usage
         # Claude-3.5-Sonnet: $0.003 per 1K input, $0.015 per 1K output
-        input_cost = response.usage.input_tokens * 0.003 / 1000
-        output_cost = response.usage.output_tokens * 0.015 / 1000
+        input_cost = usage.input_tokens * 0.003 / 1000
+        output_cost = usage.output_tokens * 0.015 / 1000
         total_cost = input_cost + output_cost
         
         # Log API usage
-        _log_external_api("Anthropic", "chat_completion", duration_ms, total_cost)
+        _log_external_api("Anthropic", request_type, duration_ms, total_cost)
         
         # Store last usage for tracking
         self.last_usage = {
-            'input_tokens': response.usage.input_tokens,
-            'output_tokens': response.usage.output_tokens,
-            'total_tokens': response.usage.input_tokens + response.usage.output_tokens,
+            'input_tokens': usage.input_tokens,
+            'output_tokens': usage.output_tokens,
+            'total_tokens': usage.input_tokens + usage.output_tokens,
             'model': self.model,
             'cost_usd': total_cost
         }
+    
+    def _stream_fake(self, prompt: str, system_prompt: str, max_tokens: int, temperature: float) -> Iterator[str]:
+        """Offline fake provider - yields canned word chunks"""
+        text = []
+        for chunk in self.fake_provider.stream(prompt, system_prompt, max_tokens, temperature):
+            text.append(chunk)
+            yield chunk
         
-        return response.content[0].text.strip()
+        output_tokens = len("".join(text).split())
+        self.last_usage = {
+            'input_tokens': len(prompt.split()),
+            'output_tokens': output_tokens,
+            'total_tokens': len(prompt.split()) + output_tokens,
+            'model': self.model,
+            'cost_usd': 0.0
+        }
     
     def select_tool(self, goal: str, available_tools: List[Dict]) -> Optional[Dict]:
         """
@@ -297,10 +492,17 @@ JSON response:"""
             logging.error(f"LLM goal decomposition failed: {e}")
             return None
     
-    def synthesize_answer(self, goal: str, observations: List[Dict]) -> Optional[str]:
+    def synthesize_answer(self, goal: str, observations: List[Dict], stream_id: Optional[str] = None) -> Optional[str]:
         """
         Use LLM to synthesize observations into a natural, helpful answer.
         
+        Args:
+            goal: The user's goal
+            observations: Tool observations ({'tool', 'observation'})
+            stream_id: When set, the answer is streamed as it is generated:
+                answer_delta events, then one answer_complete, are emitted
+                on this stream (see streaming_events.stream_answer)
+        
         Returns:
             Natural language answer or None
         """
@@ -329,6 +531,11 @@ Tool Observations:
 Synthesize a natural, helpful answer:"""
 
         try:
+            if stream_id:
+                from Back_End.streaming_events import get_event_emitter
+                chunks = self.stream_complete(prompt, system_prompt, max_tokens=500, temperature=0.7)
+                response = get_event_emitter().stream_answer(stream_id, chunks)
+                return response.strip() or None
             response = self.complete(prompt, system_prompt, max_tokens=500, temperature=0.7)
             return response
         except Exception as e:
@@ -0,0 +1,290 @@
+"""
+LLM Response Cache: content-addressed cache for deterministic completions
+
+The same classification, extraction and normalization prompts reach the
+LLM over and over. A completion is keyed by a SHA-256 of everything that
+determines it (provider, model, system prompt, prompt, temperature,
+max_tokens) and served from:
+
+- a memory tier: a SessionCache LRU bounded by entry count and bytes
+- a disk tier: a SQLite table (WAL) that survives restarts; disk hits are
+  promoted into the memory tier
+
+Each call site names itself and gets its own TTL (CALL_SITE_TTLS, falling
+back to LLM_CACHE_DEFAULT_TTL_SECONDS). Calls above
+LLM_CACHE_MAX_TEMPERATURE are sampled for variety and bypass the cache.
+A caller passes a validator with the call (e.g. is_json_object) and only
+responses it accepts are stored, so a malformed completion is retried on
+the next call instead of being served until its TTL runs out.
+Hits, misses, stores, rejections and bypasses are counted per call site.
+
+CONSTRAINTS:
+- Only non-empty responses are stored (a failed call is never cached)
+- Only responses the call site's validator accepts are stored
+- Disk errors degrade to memory-only caching, never to a failed completion
+- All operations are thread-safe
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from Back_End.config import Config
+from Back_End.session_cache import SessionCache
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached response stays valid, per call site
+CALL_SITE_TTLS: Dict[str, float] = {
+    'intent_classification': 3600,
+    'message_understanding': 3600,
+    'semantic_normalization': 24 * 3600,
+    'readiness_extraction': 6 * 3600,
+    'tool_input': 6 * 3600,
+    'goal_analysis': 3600,
+}
+
+# Expired disk rows are deleted every PRUNE_EVERY stores
+PRUNE_EVERY = 500
+
+
+def cache_key(
+    provider: str,
+    model: str,
+    system_prompt: str,
+    prompt: str,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Content address of one completion request"""
+    material = json.dumps(
+        [provider, model, system_prompt, prompt, round(float(temperature), 4), int(max_tokens)],
+        ensure_ascii=False,
+        separators=(',', ':'),
+    )
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+def is_json_object(response: str) -> bool:
+    """Validator for call sites that parse the response as a JSON object
+    (a surrounding markdown code fence is tolerated, as the parsers strip it)"""
+    text = response.strip()
+    if text.startswith("```"):
+        text = text.strip("`").strip()
+        if text.startswith("json"):
+            text = text[4:]
+    try:
+        return isinstance(json.loads(text), dict)
+    except ValueError:
+        return False
+
+
+class LLMResponseCache:
+    """Two-tier (memory LRU + SQLite) cache of LLM completions."""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        default_ttl: Optional[float] = None,
+        max_temperature: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.db_path = Path(db_path or Config.LLM_CACHE_DB_PATH)
+        self.default_ttl = Config.LLM_CACHE_DEFAULT_TTL_SECONDS if default_ttl is None else default_ttl
+        self.max_temperature = Config.LLM_CACHE_MAX_TEMPERATURE if max_temperature is None else max_temperature
+        self._clock = clock
+
+        # Wall-clock expiry is stored with each entry, so the LRU itself has no TTL
+        self._memory: SessionCache[Tuple[str, float]] = SessionCache(
+            'llm_responses',
+            max_entries=Config.LLM_CACHE_MAX_ENTRIES if max_entries is None else max_entries,
+            ttl_seconds=0,
+            max_bytes=Config.LLM_CACHE_MAX_BYTES if max_bytes is None else max_bytes,
+            sizeof=lambda entry: len(entry[0]) + 64,
+        )
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_failed = False
+        self._stores_since_prune = 0
+        # call site -> counters
+        self._site_stats: Dict[str, Dict[str, int]] = {}
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def cacheable(self, temperature: float) -> bool:
+        return temperature <= self.max_temperature
+
+    def ttl_for(self, call_site: str) -> float:
+        return CALL_SITE_TTLS.get(call_site, self.default_ttl)
+
+    def get(self, key: str, call_site: str) -> Optional[str]:
+        """Cached response for key, or None (counted as a miss)"""
+        now = self._clock()
+        entry = self._memory.get(key)
+        if entry is not None:
+            if entry[1] > now:
+                self._count(call_site, 'memory_hits')
+                return entry[0]
+            self._memory.pop(key)
+
+        entry = self._disk_get(key, now)
+        if entry is not None:
+            self._memory.put(key, entry)
+            self._count(call_site, 'disk_hits')
+            return entry[0]
+
+        self._count(call_site, 'misses')
+        return None
+
+    def put(self, key: str, response: str, call_site: str, ttl: Optional[float] = None) -> None:
+        if not response:
+            return
+        ttl = self.ttl_for(call_site) if ttl is None else ttl
+        if ttl <= 0:
+            return
+        now = self._clock()
+        entry = (response, now + ttl)
+        self._memory.put(key, entry)
+        self._disk_put(key, entry, call_site, now)
+        self._count(call_site, 'stores')
+
+    def record_bypass(self, call_site: str) -> None:
+        self._count(call_site, 'bypassed')
+
+    def record_rejected(self, call_site: str) -> None:
+        """A response the call site's validator refused; it was not stored"""
+        self._count(call_site, 'rejected')
+
+    def clear(self) -> None:
+        self._memory.clear()
+        with self._lock:
+            conn = self._connection()
+            if conn is not None:
+                try:
+                    conn.execute("DELETE FROM llm_responses")
+                    conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"LLM cache clear failed: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sites = {site: dict(counts) for site, counts in self._site_stats.items()}
+        totals = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0, 'rejected': 0, 'bypassed': 0}
+        for counts in sites.values():
+            for name in totals:
+                totals[name] += counts.get(name, 0)
+            counts['hit_rate'] = self._hit_rate(counts)
+        memory = self._memory.stats()
+        return {
+            **totals,
+            'hit_rate': self._hit_rate(totals),
+            'memory_entries': memory['entries'],
+            'memory_bytes': memory['bytes'],
+            'memory_evictions': memory['evictions'],
+            'disk_enabled': not self._disk_failed,
+            'call_sites': sites,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _hit_rate(counts: Dict[str, int]) -> Optional[float]:
+        hits = counts.get('memory_hits', 0) + counts.get('disk_hits', 0)
+        lookups = hits + counts.get('misses', 0)
+        return round(hits / lookups, 4) if lookups else None
+
+    def _count(self, call_site: str, name: str) -> None:
+        with self._lock:
+            counts = self._site_stats.setdefault(call_site, {})
+            counts[name] = counts.get(name, 0) + 1
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Open the disk tier on first use (caller holds _lock)"""
+        if self._conn is not None or self._disk_failed:
+            return self._conn
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    call_site TEXT,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_expires ON llm_responses(expires_at)")
+            conn.commit()
+            self._conn = conn
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache disk tier unavailable ({self.db_path}): {e}")
+            self._disk_failed = True
+        return self._conn
+
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT response, expires_at FROM llm_responses WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache read failed: {e}")
+                return None
+        return (row[0], row[1]) if row else None
+
+    def _disk_put(self, key: str, entry: Tuple[str, float], call_site: str, now: float) -> None:
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses (key, response, call_site, created_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, entry[0], call_site, now, entry[1]),
+                )
+                self._stores_since_prune += 1
+                if self._stores_since_prune >= PRUNE_EVERY:
+                    conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (now,))
+                    self._stores_since_prune = 0
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache write failed: {e}")
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """Process-wide response cache, created on first use"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMResponseCache()
+        return _cache
@@ -11,25 +11,53 @@ Cost Savings: 70-90% reduction in Firebase writes ($170-305/month at scale)
 import sqlite3
 import json
 import logging
+import queue
 import threading
+import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Iterable, Optional
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# Pooled connections (WAL lets readers run alongside the single writer)
+POOL_SIZE = 4
+# Seconds a connection waits on a locked database before failing
+BUSY_TIMEOUT_SECONDS = 30.0
+# `synced` value for events Firebase rejected on their own; the sync scan skips them
+QUARANTINED = -1
+
+_INSERT_EVENT_SQL = """
+    INSERT INTO missions
+    (mission_id, event_type, status, timestamp, data, synced)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
 class LocalMissionStore:
-    """Thread-safe local SQLite storage for mission events."""
+    """Thread-safe local SQLite storage for mission events.
+    
+    Connections come from a small pool and are kept open, so each one
+    reuses its compiled statements. The database runs in WAL mode: reads
+    take no lock and do not block the writer, and writes are serialized
+    by `_lock` because SQLite allows one writer at a time.
+    """
     
-    def __init__(self, db_path: str = "outputs/buddy_missions.db"):
+    def __init__(self, db_path: str = "outputs/buddy_missions.db", pool_size: int = POOL_SIZE):
         """Initialize local mission store with SQLite database.
         
         Args:
             db_path: Path to SQLite database file (created if doesn't exist)
+            pool_size: Maximum number of open connections
         """
         self.db_path = Path(db_path)
+        self.pool_size = max(1, pool_size)
         self._lock = threading.Lock()
+        self._pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._pool_lock = threading.Lock()
+        self._open_connections = 0
+        # Called with the number of events after every successful write
+        self._write_listeners: List[Callable[[int], None]] = []
         
         # Create outputs directory if it doesn't exist
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -64,24 +92,90 @@ class LocalMissionStore:
                 ON missions(mission_id)
             """)
             
-            # Create index on synced for sync service
+            # Covering index for the sync scan (WHERE synced = 0 ORDER BY id);
+            # replaces the single-column idx_synced
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_synced 
-                ON missions(synced)
+                CREATE INDEX IF NOT EXISTS idx_synced_id 
+                ON missions(synced, id)
             """)
+            cursor.execute("DROP INDEX IF EXISTS idx_synced")
             
             conn.commit()
             logger.info("Database schema initialized")
     
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
     @contextmanager
     def _get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
-        conn.row_factory = sqlite3.Row
+        """Context manager that borrows a pooled connection."""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                create = self._open_connections < self.pool_size
+                if create:
+                    self._open_connections += 1
+            if create:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._pool_lock:
+                        self._open_connections -= 1
+                    raise
+            else:
+                conn = self._pool.get()
         try:
             yield conn
         finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._pool.put(conn)
+    
+    def close(self) -> None:
+        """Close every idle pooled connection (e.g. before deleting the database file)."""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                return
             conn.close()
+            with self._pool_lock:
+                self._open_connections -= 1
+    
+    def add_write_listener(self, listener: Callable[[int], None]) -> None:
+        """Call `listener(count)` after each committed write (e.g. to wake the sync service)."""
+        if listener not in self._write_listeners:
+            self._write_listeners.append(listener)
+    
+    def remove_write_listener(self, listener: Callable[[int], None]) -> None:
+        if listener in self._write_listeners:
+            self._write_listeners.remove(listener)
+    
+    def _notify_write(self, count: int) -> None:
+        for listener in list(self._write_listeners):
+            try:
+                listener(count)
+            except Exception as e:
+                logger.error(f"Mission write listener failed: {e}")
+    
+    def _event_row(self, mission_data: Dict[str, Any], synced: bool) -> tuple:
+        # A stable id that outlives this database (it is the event's Firestore
+        # document id); events rebuilt from Firebase already carry theirs
+        if not mission_data.get('event_id'):
+            mission_data = {**mission_data, 'event_id': uuid.uuid4().hex}
+        return (
+            mission_data.get('mission_id'),
+            mission_data.get('event_type'),
+            mission_data.get('status'),
+            mission_data.get('timestamp', datetime.utcnow().isoformat()),
+            json.dumps(mission_data),
+            1 if synced else 0,
+        )
     
     def write_mission_event(self, mission_data: Dict[str, Any]) -> bool:
         """Write a mission event to local SQLite database.
@@ -92,30 +186,39 @@ class LocalMissionStore:
         Returns:
             bool: True if write successful, False otherwise
         """
-        with self._lock:
-            try:
+        if not self.write_mission_events([mission_data]):
+            return False
+        logger.debug(f"Mission event written locally: {mission_data.get('mission_id')} → {mission_data.get('event_type')}")
+        return True
+    
+    def write_mission_events(self, events: Iterable[Dict[str, Any]], synced: bool = False) -> int:
+        """Write a batch of mission events in a single transaction.
+        
+        Args:
+            events: Mission data dictionaries
+            synced: Store the events as already synced (e.g. rebuilt from Firebase)
+            
+        Returns:
+            Number of events written (0 on failure, including an event that
+            cannot be serialized; the batch is all or nothing)
+        """
+        events = list(events)
+        if not events:
+            return 0
+        try:
+            rows = [self._event_row(event, synced) for event in events]
+            with self._lock:
                 with self._get_connection() as conn:
-                    cursor = conn.cursor()
-                    
-                    cursor.execute("""
-                        INSERT INTO missions 
-                        (mission_id, event_type, status, timestamp, data, synced)
-                        VALUES (?, ?, ?, ?, ?, 0)
-                    """, (
-                        mission_data.get('mission_id'),
-                        mission_data.get('event_type'),
-                        mission_data.get('status'),
-                        mission_data.get('timestamp', datetime.utcnow().isoformat()),
-                        json.dumps(mission_data)
-                    ))
-                    
+                    conn.executemany(_INSERT_EVENT_SQL, rows)
                     conn.commit()
-                    logger.info(f"Mission event written locally: {mission_data.get('mission_id')} → {mission_data.get('event_type')}")
-                    return True
                     
-            except Exception as e:
-                logger.error(f"Failed to write mission event locally: {e}")
-                return False
+        except Exception as e:
+            logger.error(f"Failed to write {len(events)} mission event(s) locally: {e}")
+            return 0
+        
+        if not synced:
+            self._notify_write(len(rows))
+        return len(rows)
     
     def get_mission_events(self, mission_id: str) -> List[Dict[str, Any]]:
         """Get all events for a specific mission.
@@ -126,22 +229,21 @@ class LocalMissionStore:
         Returns:
             List of mission event dictionaries
         """
-        with self._lock:
-            try:
-                with self._get_connection() as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        SELECT data FROM missions 
-                        WHERE mission_id = ?
-                        ORDER BY timestamp ASC
-                    """, (mission_id,))
-                    
-                    rows = cursor.fetchall()
-                    return [json.loads(row['data']) for row in rows]
-                    
-            except Exception as e:
-                logger.error(f"Failed to get mission events: {e}")
-                return []
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT data FROM missions 
+                    WHERE mission_id = ?
+                    ORDER BY timestamp ASC
+                """, (mission_id,))
+                
+                rows = cursor.fetchall()
+                return [json.loads(row['data']) for row in rows]
+                
+        except Exception as e:
+            logger.error(f"Failed to get mission events: {e}")
+            return []
     
     def list_missions(self) -> List[str]:
         """List all unique mission IDs in local storage.
@@ -149,24 +251,23 @@ class LocalMissionStore:
         Returns:
             List of mission IDs
         """
-        with self._lock:
-            try:
-                with self._get_connection() as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        SELECT DISTINCT mission_id FROM missions
-                        ORDER BY created_at DESC
-                    """)
-                    
-                    rows = cursor.fetchall()
-                    return [row['mission_id'] for row in rows]
-                    
-            except Exception as e:
-                logger.error(f"Failed to list missions: {e}")
-                return []
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT DISTINCT mission_id FROM missions
+                    ORDER BY created_at DESC
+                """)
+                
+                rows = cursor.fetchall()
+                return [row['mission_id'] for row in rows]
+                
+        except Exception as e:
+            logger.error(f"Failed to list missions: {e}")
+            return []
     
     def get_unsynced_events(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get unsynced mission events for sync service.
+        """Get unsynced mission events for sync service, oldest write first.
         
         Args:
             limit: Maximum number of events to return
@@ -174,29 +275,28 @@ class LocalMissionStore:
         Returns:
             List of unsynced mission event dictionaries with row IDs
         """
-        with self._lock:
-            try:
-                with self._get_connection() as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        SELECT id, data FROM missions 
-                        WHERE synced = 0
-                        ORDER BY timestamp ASC
-                        LIMIT ?
-                    """, (limit,))
-                    
-                    rows = cursor.fetchall()
-                    return [
-                        {'row_id': row['id'], 'data': json.loads(row['data'])} 
-                        for row in rows
-                    ]
-                    
-            except Exception as e:
-                logger.error(f"Failed to get unsynced events: {e}")
-                return []
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT id, data FROM missions 
+                    WHERE synced = 0
+                    ORDER BY id ASC
+                    LIMIT ?
+                """, (limit,))
+                
+                rows = cursor.fetchall()
+                return [
+                    {'row_id': row['id'], 'data': json.loads(row['data'])} 
+                    for row in rows
+                ]
+                
+        except Exception as e:
+            logger.error(f"Failed to get unsynced events: {e}")
+            return []
     
     def mark_synced(self, row_ids: List[int]) -> bool:
-        """Mark mission events as synced to Firebase.
+        """Mark mission events as synced to Firebase (one transaction).
         
         Args:
             row_ids: List of row IDs to mark as synced
@@ -204,18 +304,15 @@ class LocalMissionStore:
         Returns:
             bool: True if successful, False otherwise
         """
+        if not row_ids:
+            return True
         with self._lock:
             try:
                 with self._get_connection() as conn:
-                    cursor = conn.cursor()
-                    
-                    placeholders = ','.join('?' * len(row_ids))
-                    cursor.execute(f"""
-                        UPDATE missions 
-                        SET synced = 1
-                        WHERE id IN ({placeholders})
-                    """, row_ids)
-                    
+                    conn.executemany(
+                        "UPDATE missions SET synced = 1 WHERE id = ?",
+                        [(row_id,) for row_id in row_ids]
+                    )
                     conn.commit()
                     logger.info(f"Marked {len(row_ids)} events as synced")
                     return True
@@ -224,43 +321,126 @@ class LocalMissionStore:
                 logger.error(f"Failed to mark events as synced: {e}")
                 return False
     
-    def get_stats(self) -> Dict[str, Any]:
-        """Get storage statistics for monitoring.
+    def mark_quarantined(self, row_ids: List[int]) -> bool:
+        """Take mission events out of the sync backlog after Firebase rejected them.
+        
+        The rows stay in the local store (synced = QUARANTINED) for inspection;
+        clear_synced_events never removes them.
         
+        Args:
+            row_ids: List of row IDs to quarantine
+            
         Returns:
-            Dictionary with storage stats
+            bool: True if successful, False otherwise
         """
+        if not row_ids:
+            return True
         with self._lock:
             try:
                 with self._get_connection() as conn:
-                    cursor = conn.cursor()
-                    
-                    # Total events
-                    cursor.execute("SELECT COUNT(*) as count FROM missions")
-                    total_events = cursor.fetchone()['count']
-                    
-                    # Unsynced events
-                    cursor.execute("SELECT COUNT(*) as count FROM missions WHERE synced = 0")
-                    unsynced_events = cursor.fetchone()['count']
-                    
-                    # Unique missions
-                    cursor.execute("SELECT COUNT(DISTINCT mission_id) as count FROM missions")
-                    unique_missions = cursor.fetchone()['count']
-                    
-                    # Database size
-                    db_size = self.db_path.stat().st_size if self.db_path.exists() else 0
-                    
-                    return {
-                        'total_events': total_events,
-                        'unsynced_events': unsynced_events,
-                        'unique_missions': unique_missions,
-                        'database_size_bytes': db_size,
-                        'database_size_mb': round(db_size / (1024 * 1024), 2)
-                    }
+                    conn.executemany(
+                        "UPDATE missions SET synced = ? WHERE id = ?",
+                        [(QUARANTINED, row_id) for row_id in row_ids]
+                    )
+                    conn.commit()
+                    logger.warning(f"Quarantined {len(row_ids)} events Firebase rejected")
+                    return True
                     
             except Exception as e:
-                logger.error(f"Failed to get stats: {e}")
-                return {}
+                logger.error(f"Failed to quarantine events: {e}")
+                return False
+    
+    def get_quarantined_events(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get quarantined mission events, oldest write first.
+        
+        Args:
+            limit: Maximum number of events to return
+            
+        Returns:
+            List of quarantined mission event dictionaries with row IDs
+        """
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute("""
+                    SELECT id, data FROM missions 
+                    WHERE synced = ?
+                    ORDER BY id ASC
+                    LIMIT ?
+                """, (QUARANTINED, limit)).fetchall()
+                return [
+                    {'row_id': row['id'], 'data': json.loads(row['data'])} 
+                    for row in rows
+                ]
+                
+        except Exception as e:
+            logger.error(f"Failed to get quarantined events: {e}")
+            return []
+    
+    def get_sync_backlog(self) -> Dict[str, Any]:
+        """Unsynced event count and when the oldest one was written (UTC).
+        
+        Returns:
+            Dictionary with unsynced_events and oldest_unsynced_at
+            (CURRENT_TIMESTAMP format, None when fully synced)
+        """
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute("""
+                    SELECT COUNT(*) AS count, MIN(id) AS oldest_id
+                    FROM missions WHERE synced = 0
+                """).fetchone()
+                oldest_at = None
+                if row['oldest_id'] is not None:
+                    oldest_at = conn.execute(
+                        "SELECT created_at FROM missions WHERE id = ?", (row['oldest_id'],)
+                    ).fetchone()['created_at']
+                return {'unsynced_events': row['count'], 'oldest_unsynced_at': oldest_at}
+                
+        except Exception as e:
+            logger.error(f"Failed to get sync backlog: {e}")
+            return {'unsynced_events': 0, 'oldest_unsynced_at': None}
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get storage statistics for monitoring.
+        
+        Returns:
+            Dictionary with storage stats
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                
+                # Total events
+                cursor.execute("SELECT COUNT(*) as count FROM missions")
+                total_events = cursor.fetchone()['count']
+                
+                # Unsynced events
+                cursor.execute("SELECT COUNT(*) as count FROM missions WHERE synced = 0")
+                unsynced_events = cursor.fetchone()['count']
+                
+                # Events Firebase rejected
+                cursor.execute("SELECT COUNT(*) as count FROM missions WHERE synced = ?", (QUARANTINED,))
+                quarantined_events = cursor.fetchone()['count']
+                
+                # Unique missions
+                cursor.execute("SELECT COUNT(DISTINCT mission_id) as count FROM missions")
+                unique_missions = cursor.fetchone()['count']
+                
+                # Database size
+                db_size = self.db_path.stat().st_size if self.db_path.exists() else 0
+                
+                return {
+                    'total_events': total_events,
+                    'unsynced_events': unsynced_events,
+                    'quarantined_events': quarantined_events,
+                    'unique_missions': unique_missions,
+                    'database_size_bytes': db_size,
+                    'database_size_mb': round(db_size / (1024 * 1024), 2)
+                }
+                
+        except Exception as e:
+            logger.error(f"Failed to get stats: {e}")
+            return {}
     
     def clear_synced_events(self, older_than_days: int = 30) -> int:
         """Clear old synced events to keep database size manageable.
@@ -38,6 +38,7 @@ except Exception as e:
 
 try:
     from Back_End.whiteboard_metrics import collect_whiteboard_summary, log_api_usage
+    from Back_End.usage_log_sink import shutdown_usage_log_sink
     from Back_End.composite_agent import execute_goal
     from Back_End.iterative_executor import execute_goal_iteratively
     from Back_End.config import Config
@@ -72,6 +73,7 @@ except (ImportError, ModuleNotFoundError) as e:
     logging.debug(f"Fallback import mode (Back_End not in path): {e}")
     # Fallback: import from current directory (works when deployed directly)
     from whiteboard_metrics import collect_whiteboard_summary, log_api_usage
+    from usage_log_sink import shutdown_usage_log_sink
     from composite_agent import execute_goal
     from iterative_executor import execute_goal_iteratively
     from config import Config
@@ -567,12 +569,15 @@ async def api_usage_middleware(request: Request, call_next):
     user_id = None
     if isinstance(user, dict):
         user_id = user.get("uid") or user.get("user_id") or user.get("email")
+    # Log the matched route template so per-endpoint rollups stay bounded
+    route = request.scope.get("route")
+    path = getattr(route, "path", None) or "unmatched"
 
     # Phase 18: Sanitize log data before writing
     log_data = sanitize_log_data({
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "method": request.method,
-        "path": request.url.path,
+        "path": path,
         "status_code": response.status_code,
         "duration_ms": round(duration_ms, 2),
         "user_id": user_id,
@@ -922,6 +927,27 @@ async def shutdown_executor():
         logging.error(f"[MAIN] Error stopping executor: {e}", exc_info=True)
 
 
+@app.on_event("shutdown")
+async def shutdown_tool_tracker():
+    """Stop the tool pool and flush pending tool performance deltas on app shutdown."""
+    try:
+        tool_registry.shutdown()
+        await asyncio.to_thread(tracker.close)
+        logging.info("[MAIN] Tool performance tracker flushed")
+    except Exception as e:
+        logging.error(f"[MAIN] Error flushing tool performance tracker: {e}", exc_info=True)
+
+
+@app.on_event("shutdown")
+async def shutdown_usage_log():
+    """Flush queued API usage records on app shutdown."""
+    try:
+        await asyncio.to_thread(shutdown_usage_log_sink)
+        logging.info("[MAIN] Usage log sink flushed")
+    except Exception as e:
+        logging.error(f"[MAIN] Error flushing usage log sink: {e}", exc_info=True)
+
+
 @app.get("/api/status")
 async def root():
     return {"status": "running", "version": "1.0.0", "agent": "autonomous", "features": ["domains", "goal_decomposition"]}
@@ -2771,10 +2797,15 @@ async def get_pending_escalations(status: Optional[str] = None):
     return JSONResponse(content={'count': len(requests), 'requests': requests})
 
 @app.post("/chat")
-async def chat(goal: str, domain: Optional[str] = None):
-    """Execute a goal (atomic or composite) and return full execution history"""
+async def chat(goal: str, domain: Optional[str] = None, stream_id: Optional[str] = None):
+    """Execute a goal (atomic or composite) and return full execution history
+    
+    With stream_id, the LLM answer is also streamed as answer_delta events
+    on ws://.../ws/stream/{stream_id} while it is generated.
+    """
     goal_record = success_tracker.record_goal(goal=goal, domain=domain or "general", initial_confidence=0.5)
-    result = execute_goal(goal, domain=domain)
+    # Off the event loop, so the stream's send loops deliver deltas while the answer is generated
+    result = await asyncio.to_thread(execute_goal, goal, domain=domain, stream_id=stream_id)
     response_text = result.get('final_answer') or result.get('synthesis', {}).get('synthesis_narrative') or str(result)
     tools_used = _collect_tools_from_result(result)
     success_tracker.record_response(
@@ -2787,7 +2818,7 @@ async def chat(goal: str, domain: Optional[str] = None):
     return JSONResponse(content=result)
 
 @app.post("/chat/iterative")
-async def chat_iterative(goal: str, domain: Optional[str] = None):
+async def chat_iterative(goal: str, domain: Optional[str] = None, stream_id: Optional[str] = None):
     """
     Execute a goal using SMART iterative decomposition.
     
@@ -2798,9 +2829,11 @@ async def chat_iterative(goal: str, domain: Optional[str] = None):
     - Stops when confidence is high, not after N steps
     
     Returns execution log showing each iteration and how it informed the next.
+    With stream_id, the final answer is streamed as answer_delta events on
+    ws://.../ws/stream/{stream_id}.
     """
     goal_record = success_tracker.record_goal(goal=goal, domain=domain or "general", initial_confidence=0.5)
-    result = execute_goal_iteratively(goal, domain=domain)
+    result = await asyncio.to_thread(execute_goal_iteratively, goal, domain=domain, stream_id=stream_id)
     response_text = result.get('final_answer') or str(result)
     tools_used = _collect_tools_from_result(result)
     success_tracker.record_response(
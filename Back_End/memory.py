@@ -16,6 +16,15 @@ class MockMemory:
     def set(self, key, value):
         self.data[key] = value
         return True
+
+    def get_many(self, keys):
+        """Get several keys at once; missing keys map to None"""
+        return {key: self.data.get(key) for key in keys}
+
+    def set_many(self, items):
+        """Set several key/value pairs at once"""
+        self.data.update(items)
+        return True
     
     def get_all(self):
         """Get all stored values as a dict"""
@@ -117,6 +126,45 @@ class FirebaseMemory:
             logging.error(f"[FIREBASE_MEMORY] SET ERROR: key={key}, error={e}")
             return False
     
+    # Firestore caps a batched write at 500 operations
+    _BATCH_LIMIT = 500
+
+    def get_many(self, keys):
+        """Get several keys in one round trip; missing keys map to None, a failed read returns None"""
+        keys = list(keys)
+        result = {key: None for key in keys}
+        try:
+            refs = {
+                self._sanitize_key(key): key for key in keys
+            }
+            collection = self._db.collection(self._collection)
+            docs = self._db.get_all([collection.document(doc_id) for doc_id in refs])
+            for doc in docs:
+                if doc.exists:
+                    result[refs[doc.id]] = doc.to_dict().get('value')
+            logging.debug(f"[FIREBASE_MEMORY] GET_MANY: {len(keys)} keys")
+        except Exception as e:
+            logging.error(f"[FIREBASE_MEMORY] GET_MANY ERROR: keys={len(keys)}, error={e}")
+            # Absent and unreadable must not look alike: callers would overwrite real records
+            return None
+        return result
+
+    def set_many(self, items):
+        """Set several key/value pairs with batched writes"""
+        try:
+            collection = self._db.collection(self._collection)
+            pending = list(items.items())
+            for start in range(0, len(pending), self._BATCH_LIMIT):
+                batch = self._db.batch()
+                for key, value in pending[start:start + self._BATCH_LIMIT]:
+                    batch.set(collection.document(self._sanitize_key(key)), {'value': value})
+                batch.commit()
+            logging.info(f"[FIREBASE_MEMORY] SET_MANY SUCCESS: {len(pending)} keys persisted to Firebase")
+            return True
+        except Exception as e:
+            logging.error(f"[FIREBASE_MEMORY] SET_MANY ERROR: keys={len(items)}, error={e}")
+            return False
+
     def get_all(self):
         """Get all documents from the collection as a dict"""
         try:
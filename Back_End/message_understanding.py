@@ -0,0 +1,178 @@
+"""
+Message Understanding: one fused LLM call per chat turn
+
+process_message used to pay for three sequential LLM round trips before
+routing: semantic normalization, intent classification and readiness
+field extraction. understand_message() asks for all three in a single
+structured response.
+
+Each section of the response is validated on its own. A section that is
+missing or malformed comes back as None, and the orchestrator runs that
+stage's own LLM call instead; if the whole call fails, every stage falls
+back.
+
+CONSTRAINTS (same as the stages it replaces):
+- MUST NOT create missions, execute tools or modify session context
+- MUST NOT invent URLs, objects or constraints
+- Normalization is still gated by NORMALIZATION_CONFIDENCE_THRESHOLD
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+import json
+import logging
+
+from Back_End.config import Config
+from Back_End.semantic_normalizer import NormalizationResult, build_context_hints
+
+logger = logging.getLogger(__name__)
+
+# Intent labels the fused prompt may return (same vocabulary as _classify_with_llm)
+INTENT_LABELS = ("execute", "question", "status", "forecast", "clarification", "informational")
+
+
+@dataclass
+class IntentDecision:
+    """Classifier section of the fused response."""
+    intent: str  # one of INTENT_LABELS
+    confidence: float
+    actionable: bool
+    reasoning: str
+    keywords: List[str]
+
+
+@dataclass
+class MessageUnderstanding:
+    """Fused response; a None section means that stage must run on its own."""
+    normalization: Optional[NormalizationResult]
+    intent: Optional[IntentDecision]
+    readiness_fields: Optional[Dict[str, Optional[str]]]
+
+
+def understand_message(text: str, session_context: Optional[dict] = None) -> Optional[MessageUnderstanding]:
+    """
+    Normalize, classify and extract readiness fields in one LLM call.
+
+    Returns None when the fused call is disabled, the LLM is unavailable or
+    the response is not a JSON object.
+    """
+    if not Config.FUSED_UNDERSTANDING_ENABLED or not text or not text.strip():
+        return None
+
+    from Back_End.llm_client import llm_client
+    from Back_End.llm_response_cache import is_json_object
+    if not llm_client.enabled:
+        return None
+
+    try:
+        response = llm_client.complete(
+            _build_prompt(text, session_context), max_tokens=400, temperature=0.1,
+            call_site='message_understanding', validate=is_json_object
+        )
+        if not response:
+            logger.warning("[UNDERSTAND] No response from LLM - stages fall back")
+            return None
+        data = json.loads(_strip_code_fence(response))
+        if not isinstance(data, dict):
+            raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+    except Exception as e:
+        logger.warning(f"[UNDERSTAND] Fused call failed ({e}) - stages fall back")
+        return None
+
+    understanding = MessageUnderstanding(
+        normalization=_parse_normalization(text, data.get("normalization")),
+        intent=_parse_intent(data.get("intent")),
+        readiness_fields=_parse_readiness_fields(data.get("fields")),
+    )
+    logger.info(
+        "[UNDERSTAND] sections: "
+        f"normalization={understanding.normalization is not None} "
+        f"intent={understanding.intent is not None} "
+        f"fields={understanding.readiness_fields is not None}"
+    )
+    return understanding
+
+
+def _build_prompt(text: str, session_context: Optional[dict]) -> str:
+    return """You analyze one user message for a task automation system. You are not an agent: do not act, only describe.
+
+Return three sections:
+
+1. normalization: rewrite the message into canonical command form that preserves intent.
+   - Rewrite only when meaning is clear; never add intent or invent URLs, objects or constraints
+   - If unclear, return the original text with LOW confidence
+   - Examples: "What is 1+2?" → "calculate 1 + 2"; "Go to example.com" → "navigate to example.com";
+     "Open that site" → "navigate to example.com" (only if last_visited_url is example.com);
+     "Do it again" → "repeat last_mission"; "Tell me more" → unchanged, low confidence
+
+2. intent: classify the intent as one of "execute", "question", "status", "forecast", "clarification", "informational".
+   - Action verbs like navigate, extract, get, search, scrape, find, collect → ALWAYS "execute"
+   - "clarification" ONLY when the message is truly unclear
+
+3. fields: for web automation requests, what data to get (action_object, e.g. "prices", "contact info")
+   and the target website or domain (source_url); null when not present in the message.
+
+Context (for reference resolution ONLY, do NOT invent values):""" + build_context_hints(session_context) + """
+
+User message: \"""" + text + """\"
+
+Return ONLY valid JSON (no markdown, no explanation):
+{
+  "normalization": {"normalized_text": "...", "confidence": 0.0, "reason": "brief"},
+  "intent": {"intent_type": "execute", "confidence": 0.0, "actionable": true, "reasoning": "brief", "keywords": []},
+  "fields": {"action_object": null, "source_url": null}
+}
+"""
+
+
+def _strip_code_fence(response: str) -> str:
+    response = response.strip()
+    if response.startswith("```"):
+        lines = response.split("\n")
+        response = "\n".join(lines[1:-1]) if len(lines) > 2 else response
+    return response.strip()
+
+
+def _clamp(value: Any) -> float:
+    return max(0.0, min(1.0, float(value)))
+
+
+def _parse_normalization(text: str, section: Any) -> Optional[NormalizationResult]:
+    try:
+        normalized_text = section["normalized_text"]
+        if not isinstance(normalized_text, str) or not normalized_text.strip():
+            return None
+        return NormalizationResult(
+            original_text=text,
+            normalized_text=normalized_text,
+            confidence=_clamp(section.get("confidence", 0.0)),
+            reason=str(section.get("reason", "No reason provided")),
+        )
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+
+
+def _parse_intent(section: Any) -> Optional[IntentDecision]:
+    try:
+        intent = str(section["intent_type"]).lower()
+        if intent not in INTENT_LABELS:
+            return None
+        keywords = section.get("keywords") or []
+        return IntentDecision(
+            intent=intent,
+            confidence=_clamp(section.get("confidence", 0.5)),
+            actionable=bool(section.get("actionable", False)),
+            reasoning=str(section.get("reasoning", "LLM classification")),
+            keywords=[str(k) for k in keywords] if isinstance(keywords, list) else [],
+        )
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+
+
+def _parse_readiness_fields(section: Any) -> Optional[Dict[str, Optional[str]]]:
+    if not isinstance(section, dict) or not {"action_object", "source_url"} & section.keys():
+        return None
+    return {
+        key: (str(section[key]) if section.get(key) not in (None, "", "null") else None)
+        for key in ("action_object", "source_url")
+    }
@@ -5,12 +5,13 @@ Purely read-only instrumentation - no behavior changes, no retries, no autonomy.
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from Back_End.learning.signal_log_store import read_signals
+
 
 @dataclass
 class MissionCostReport:
@@ -105,9 +106,6 @@ class MissionCostAccountant:
         Returns:
             MissionCostReport with normalized costs, or None if insufficient data
         """
-        if not self.signals_file.exists():
-            return None
-        
         # Read all signals for this mission
         mission_signals = self._read_mission_signals(mission_id)
         
@@ -146,15 +144,8 @@ class MissionCostAccountant:
         signals = []
         
         try:
-            with open(self.signals_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            signal = json.loads(line)
-                            if signal.get("mission_id") == mission_id:
-                                signals.append(signal)
-                        except json.JSONDecodeError:
-                            continue
+            # The store's mission index skips rotated segments without this mission
+            signals = read_signals(self.signals_file, mission_id=mission_id)
         except Exception:
             pass
         
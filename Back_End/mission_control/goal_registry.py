@@ -11,6 +11,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
 from Back_End.learning.signal_priority import apply_signal_priority
+from Back_End.learning.signal_log_store import append_signals
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -200,9 +201,5 @@ class GoalRegistry:
 
     def _emit_signal(self, signal: Dict[str, Any]) -> None:
         """Emit signal to learning_signals.jsonl."""
-        signals_file = Path("outputs/phase25/learning_signals.jsonl")
-        signals_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(signals_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(signal) + "\n")
+        append_signals(Path("outputs/phase25/learning_signals.jsonl"), [signal])
 
@@ -160,35 +160,79 @@ class MissionStore:
                 logger.warning("MissionStore initialized WITHOUT Firebase persistence")
     
     def _load_from_firebase(self) -> None:
-        """Load all existing missions from Firebase on startup."""
+        """Load all existing missions from Firebase on startup.
+        
+        One collection-group query over every mission's events subcollection
+        instead of one query per mission.
+        """
         if not self._firebase_enabled or not self._db:
             return
         
         try:
-            # Load all mission documents
-            docs = self._collection.stream()
-            loaded_count = 0
-            for doc in docs:
-                mission_id = doc.id
-                # Load events subcollection
-                events_ref = self._collection.document(mission_id).collection('events')
-                events_docs = events_ref.order_by('timestamp').stream()
-                
-                events = []
-                for event_doc in events_docs:
-                    event_data = event_doc.to_dict()
-                    event_data['mission_id'] = mission_id  # Ensure mission_id is set
-                    mission = Mission.from_dict(event_data)
-                    events.append(mission)
-                
-                if events:
-                    self._missions[mission_id] = events
-                    loaded_count += 1
-            
-            logger.info(f"Loaded {loaded_count} missions from Firebase")
+            events_by_mission: Dict[str, List[Mission]] = {}
+            for event_doc in self._db.collection_group('events').stream():
+                mission_id = self._mission_id_of(event_doc)
+                if not mission_id:
+                    continue
+                event_data = event_doc.to_dict()
+                event_data['mission_id'] = mission_id  # Ensure mission_id is set
+                events_by_mission.setdefault(mission_id, []).append(Mission.from_dict(event_data))
+            
+            for mission_id, events in events_by_mission.items():
+                events.sort(key=lambda event: event.timestamp)
+                self._missions[mission_id] = events
+            
+            logger.info(f"Loaded {len(events_by_mission)} missions from Firebase")
         except Exception as e:
             logger.error(f"Failed to load missions from Firebase: {e}")
     
+    def _mission_id_of(self, doc: Any) -> Optional[str]:
+        """Mission id owning a subcollection document, or None if it is not under missions/"""
+        mission_ref = doc.reference.parent.parent
+        if mission_ref is None or mission_ref.parent.id != self._collection.id:
+            return None
+        return mission_ref.id
+    
+    def _query_feedback(
+        self,
+        tool: Optional[str] = None,
+        mission_type: Optional[str] = None,
+        since: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Feedback documents across all missions from one collection-group query.
+        
+        Filters on tool_used, mission_type and timestamp run server-side; they
+        need the composite indexes in firestore.indexes.json. Until those are
+        deployed, falls back to one unfiltered group query filtered here.
+        """
+        query = self._db.collection_group('feedback')
+        if tool:
+            query = query.where('tool_used', '==', tool)
+        if mission_type:
+            query = query.where('mission_type', '==', mission_type)
+        if since:
+            query = query.where('timestamp', '>=', since)
+        
+        try:
+            docs = list(query.stream())
+        except Exception as e:
+            logger.warning(f"[MISSION_STORE] Filtered feedback query failed ({e}); filtering client-side")
+            docs = list(self._db.collection_group('feedback').stream())
+        
+        feedbacks = []
+        for doc in docs:
+            if not self._mission_id_of(doc):
+                continue
+            feedback_data = doc.to_dict()
+            if tool and feedback_data.get('tool_used') != tool:
+                continue
+            if mission_type and feedback_data.get('mission_type') != mission_type:
+                continue
+            if since and feedback_data.get('timestamp', '') < since:
+                continue
+            feedbacks.append(feedback_data)
+        return feedbacks
+    
     def _save_to_firebase(self, mission: Mission) -> None:
         """Save a mission event to Firebase."""
         if not self._firebase_enabled or not self._db:
@@ -544,28 +588,7 @@ class MissionStore:
             from datetime import timedelta
             
             cutoff_time = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
-            feedbacks = []
-            
-            # Query all missions for feedback documents
-            missions_ref = self._collection.stream()
-            
-            for mission_doc in missions_ref:
-                mission_id = mission_doc.id
-                feedback_ref = self._collection.document(mission_id).collection('feedback')
-                
-                # Query feedback documents
-                query = feedback_ref.where('timestamp', '>=', cutoff_time)
-                
-                for feedback_doc in query.stream():
-                    feedback_data = feedback_doc.to_dict()
-                    
-                    # Apply filters
-                    if tool and feedback_data.get('tool_used') != tool:
-                        continue
-                    if mission_type and feedback_data.get('mission_type') != mission_type:
-                        continue
-                    
-                    feedbacks.append(feedback_data)
+            feedbacks = self._query_feedback(tool=tool, mission_type=mission_type, since=cutoff_time)
             
             logger.debug(f"[MISSION_STORE] Retrieved {len(feedbacks)} feedbacks")
             return feedbacks
@@ -658,18 +681,18 @@ class MissionStore:
             return []
         
         try:
-            surveys = []
-            missions_ref = self._collection.stream()
-            
-            for mission_doc in missions_ref:
-                mission_id = mission_doc.id
-                survey_ref = self._collection.document(mission_id).collection('survey').document(mission_id)
-                doc = survey_ref.get()
-                
-                if doc.exists:
-                    surveys.append(doc.to_dict())
-                    if len(surveys) >= limit:
-                        break
+            # Parent documents flag completed surveys; fetch those surveys in one batch
+            mission_docs = (
+                self._collection.where('survey_completed', '==', True)
+                .select(['mission_id'])
+                .limit(limit)
+                .stream()
+            )
+            survey_refs = [
+                self._collection.document(doc.id).collection('survey').document(doc.id)
+                for doc in mission_docs
+            ]
+            surveys = [doc.to_dict() for doc in self._db.get_all(survey_refs) if doc.exists] if survey_refs else []
             
             logger.debug(f"[MISSION_STORE] Retrieved {len(surveys)} surveys")
             return surveys
@@ -716,31 +739,15 @@ class MissionStore:
             satisfactions = []
             
             # Query feedback documents for cost information
-            missions_ref = self._collection.stream()
-            
-            for mission_doc in missions_ref:
-                mission_id = mission_doc.id
-                feedback_ref = self._collection.document(mission_id).collection('feedback').document(mission_id)
-                doc = feedback_ref.get()
+            for doc_data in self._query_feedback(tool=tool, mission_type=mission_type, since=cutoff_time):
+                # Note: For now, we estimate cost from execution time
+                # In real system, would pull from actual cost tracking
+                exec_time = doc_data.get('execution_time_seconds', 0)
+                estimated_cost = max(0.01, exec_time * 0.1)  # $0.10 per second estimate
                 
-                if doc.exists:
-                    doc_data = doc.to_dict()
-                    
-                    if doc_data.get('tool_used') != tool:
-                        continue
-                    if mission_type and doc_data.get('mission_type') != mission_type:
-                        continue
-                    if doc_data.get('timestamp', '') < cutoff_time:
-                        continue
-                    
-                    # Note: For now, we estimate cost from execution time
-                    # In real system, would pull from actual cost tracking
-                    exec_time = doc_data.get('execution_time_seconds', 0)
-                    estimated_cost = max(0.01, exec_time * 0.1)  # $0.10 per second estimate
-                    
-                    costs.append(estimated_cost)
-                    if doc_data.get('user_satisfaction'):
-                        satisfactions.append(doc_data['user_satisfaction'])
+                costs.append(estimated_cost)
+                if doc_data.get('user_satisfaction'):
+                    satisfactions.append(doc_data['user_satisfaction'])
             
             if not costs:
                 return {
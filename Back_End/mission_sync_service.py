@@ -1,24 +1,36 @@
 """
 Background sync service for syncing local SQLite missions to Firebase.
 
-This service runs in a background thread and periodically syncs unsynced
-mission events from the local SQLite database to Firebase Firestore.
+This service runs in a background thread and syncs unsynced mission events
+from the local SQLite database to Firebase Firestore.
 
 Sync Strategy:
-- Check for unsynced events every 5 minutes (configurable)
-- Batch sync up to 100 events at a time
-- Retry failed syncs with exponential backoff
-- Log all sync operations for monitoring
+- Local writes wake the service; a short debounce coalesces bursts, and an
+  idle check still runs every sync interval (default 5 minutes)
+- Events are pushed with Firestore batched writes (up to 500 per commit)
+- Several batches commit concurrently, scaled to the backlog depth, and the
+  service keeps draining without sleeping while a backlog remains
+- Failed commits are retried with exponential backoff; a batch that still
+  fails is bisected so one bad event cannot hold back the rest, and events
+  Firebase rejects on their own are quarantined in the local store
+- Each event is written under its event_id (stamped by the local store and
+  restored by a rebuild), so a retried commit overwrites instead of
+  duplicating and a rebuilt database never reuses a cloud document id
+- Backlog depth and sync lag are reported by get_stats()
 """
 
-import os
+import hashlib
+import json
+import math
 import time
 import logging
 import threading
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
+from Back_End.config import Config
 from Back_End.local_mission_store import get_local_mission_store
 
 # Firebase imports
@@ -26,7 +38,6 @@ try:
     from firebase_admin import firestore
     import firebase_admin
     from firebase_admin import credentials
-    from Back_End.config import Config
     FIREBASE_AVAILABLE = Config.FIREBASE_ENABLED
 except ImportError:
     FIREBASE_AVAILABLE = False
@@ -34,20 +45,48 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Firestore rejects batched writes with more than 500 operations
+FIRESTORE_BATCH_LIMIT = 500
+# Backoff after a round where every batch failed
+MAX_FAILURE_BACKOFF_SECONDS = 60
+
+def event_document_id(mission_data: Dict[str, Any]) -> str:
+    """Firestore document id for an event: its event_id, or for events stored
+    before event ids existed, a hash of the event's content"""
+    if mission_data.get('event_id'):
+        return str(mission_data['event_id'])
+    content = json.dumps(mission_data, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()[:32]
+
+
 class MissionSyncService:
     """Background service for syncing local missions to Firebase."""
     
-    def __init__(self, sync_interval_seconds: int = 300, batch_size: int = 100):
+    def __init__(
+        self,
+        sync_interval_seconds: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        debounce_seconds: Optional[float] = None
+    ):
         """Initialize sync service.
         
         Args:
-            sync_interval_seconds: How often to check for unsynced events (default 5 minutes)
-            batch_size: Maximum events to sync per batch (default 100)
+            sync_interval_seconds: Idle check interval when no writes arrive (default 5 minutes)
+            batch_size: Events per Firestore batched write (default 500, the Firestore maximum)
+            max_concurrency: Batches committed at once when the backlog is deep (default 4)
+            debounce_seconds: Wait after a write to coalesce a burst (default 1s)
         """
-        self.sync_interval = sync_interval_seconds
-        self.batch_size = batch_size
+        self.sync_interval = Config.MISSION_SYNC_INTERVAL_SECONDS if sync_interval_seconds is None else sync_interval_seconds
+        self.batch_size = min(Config.MISSION_SYNC_BATCH_SIZE if batch_size is None else batch_size, FIRESTORE_BATCH_LIMIT)
+        self.max_concurrency = max(1, Config.MISSION_SYNC_CONCURRENCY if max_concurrency is None else max_concurrency)
+        self.debounce_seconds = Config.MISSION_SYNC_DEBOUNCE_SECONDS if debounce_seconds is None else debounce_seconds
         self.running = False
         self.thread: threading.Thread = None
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._consecutive_failures = 0
         
         self.local_store = get_local_mission_store()
         
@@ -77,13 +116,21 @@ class MissionSyncService:
             'total_failed': 0,
             'last_sync_time': None,
             'last_sync_count': 0,
-            'last_error': None
+            'last_error': None,
+            'batches_committed': 0,
+            'batches_failed': 0,
+            'total_quarantined': 0,
+            'last_round_seconds': None,
+            'last_round_concurrency': 0
         }
         
         # Setup logging
         self._setup_logging()
         
-        logger.info(f"MissionSyncService initialized (interval: {sync_interval_seconds}s, batch: {batch_size})")
+        logger.info(
+            f"MissionSyncService initialized (interval: {self.sync_interval}s, batch: {self.batch_size}, "
+            f"concurrency: {self.max_concurrency})"
+        )
     
     def _setup_logging(self):
         """Setup dedicated log file for sync operations."""
@@ -107,6 +154,9 @@ class MissionSyncService:
             return
         
         self.running = True
+        self._stopped.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="mission-sync")
+        self.local_store.add_write_listener(self._on_local_write)
         self.thread = threading.Thread(target=self._sync_loop, daemon=True)
         self.thread.start()
         
@@ -118,122 +168,236 @@ class MissionSyncService:
             return
         
         self.running = False
+        self.local_store.remove_write_listener(self._on_local_write)
+        self._stopped.set()
+        self._wake.set()
         if self.thread:
             self.thread.join(timeout=10)
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
         
         logger.info("Sync service stopped")
     
+    def _on_local_write(self, count: int) -> None:
+        """Write listener registered with the local store"""
+        self._wake.set()
+    
     def _sync_loop(self):
         """Main sync loop running in background thread."""
         logger.info("Sync loop started")
         
         while self.running:
             try:
-                # Perform sync
-                self._sync_batch()
+                # Sleep until a local write (or the idle interval)
+                self._wake.wait(self.sync_interval)
+                if not self.running:
+                    break
                 
-                # Sleep until next sync interval
-                time.sleep(self.sync_interval)
+                # Coalesce a burst of writes unless a full batch is already waiting
+                if self.debounce_seconds > 0 and self._backlog_depth() < self.batch_size:
+                    self._stopped.wait(self.debounce_seconds)
+                self._wake.clear()
+                
+                # Drain: keep syncing while rounds make progress
+                while self.running:
+                    synced, failed = self._sync_round()
+                    if failed and not synced:
+                        self._consecutive_failures += 1
+                        backoff = min(2 ** self._consecutive_failures, MAX_FAILURE_BACKOFF_SECONDS)
+                        self._stopped.wait(backoff)
+                        break
+                    self._consecutive_failures = 0
+                    if not synced:
+                        break
                 
             except Exception as e:
                 logger.error(f"Error in sync loop: {e}")
                 self.stats['last_error'] = str(e)
-                time.sleep(60)  # Wait 1 minute before retry on error
+                self._stopped.wait(60)  # Wait 1 minute before retry on error
+    
+    def _backlog_depth(self) -> int:
+        return self.local_store.get_sync_backlog()['unsynced_events']
     
     def _sync_batch(self):
-        """Sync a batch of unsynced events to Firebase."""
+        """Sync one round of unsynced events to Firebase (kept for callers of the old API)."""
+        self._sync_round()
+    
+    def _sync_round(self) -> Tuple[int, int]:
+        """Push up to max_concurrency batches of unsynced events concurrently.
+        
+        The number of batches scales with the backlog, so a deep backlog is
+        committed in parallel and a trickle goes out as one small batch.
+        Successful rows are marked synced in one local transaction.
+        
+        Returns:
+            (synced, failed) event counts
+        """
         try:
-            # Get unsynced events
-            unsynced = self.local_store.get_unsynced_events(limit=self.batch_size)
+            started = time.monotonic()
+            backlog = self._backlog_depth()
+            if not backlog:
+                logger.debug("No unsynced events found")
+                return 0, 0
             
+            concurrency = min(self.max_concurrency, math.ceil(backlog / self.batch_size))
+            unsynced = self.local_store.get_unsynced_events(limit=self.batch_size * concurrency)
             if not unsynced:
-                logger.debug("No unsynced events found")
-                return
+                return 0, 0
             
-            logger.info(f"Syncing {len(unsynced)} events to Firebase...")
+            batches = [unsynced[i:i + self.batch_size] for i in range(0, len(unsynced), self.batch_size)]
+            logger.info(f"Syncing {len(unsynced)} events to Firebase in {len(batches)} batch(es)...")
             
-            synced_row_ids = []
-            failed_count = 0
+            if len(batches) > 1 and self._executor is not None:
+                results = list(self._executor.map(self._commit_batch, batches))
+            else:
+                results = [self._commit_batch(batch) for batch in batches]
             
-            for event in unsynced:
-                row_id = event['row_id']
-                mission_data = event['data']
-                
-                # Sync to Firebase with retry logic
-                if self._sync_to_firebase(mission_data):
-                    synced_row_ids.append(row_id)
-                else:
-                    failed_count += 1
+            synced_row_ids: List[int] = []
+            quarantined_row_ids: List[int] = []
+            failed_count = 0
+            for batch, ok in zip(batches, results):
+                if ok:
+                    synced_row_ids.extend(event['row_id'] for event in batch)
+                    self.stats['batches_committed'] += 1
+                    continue
+                self.stats['batches_failed'] += 1
+                split = self._bisect_batch(batch)
+                if split is None:
+                    failed_count += len(batch)
+                    continue
+                committed, rejected = split
+                synced_row_ids.extend(committed)
+                quarantined_row_ids.extend(rejected)
             
             # Mark synced events
             if synced_row_ids:
                 self.local_store.mark_synced(synced_row_ids)
+            if quarantined_row_ids:
+                self.local_store.mark_quarantined(quarantined_row_ids)
             
             # Update stats
             self.stats['total_synced'] += len(synced_row_ids)
             self.stats['total_failed'] += failed_count
+            self.stats['total_quarantined'] += len(quarantined_row_ids)
             self.stats['last_sync_time'] = datetime.utcnow().isoformat()
             self.stats['last_sync_count'] = len(synced_row_ids)
+            self.stats['last_round_seconds'] = round(time.monotonic() - started, 3)
+            self.stats['last_round_concurrency'] = len(batches)
             
-            if failed_count > 0:
-                logger.warning(f"⚠️ Sync completed: {len(synced_row_ids)} synced, {failed_count} failed")
+            if failed_count or quarantined_row_ids:
+                logger.warning(
+                    f"⚠️ Sync completed: {len(synced_row_ids)} synced, {failed_count} failed, "
+                    f"{len(quarantined_row_ids)} quarantined"
+                )
             else:
                 logger.info(f"✅ Sync completed: {len(synced_row_ids)} events synced")
+            return len(synced_row_ids), failed_count
                 
         except Exception as e:
             logger.error(f"Failed to sync batch: {e}")
             self.stats['last_error'] = str(e)
+            return 0, 0
     
-    def _sync_to_firebase(self, mission_data: Dict[str, Any], max_retries: int = 3) -> bool:
-        """Sync a single mission event to Firebase with retry logic.
+    def _commit_batch(self, events: List[Dict[str, Any]], max_retries: int = 3) -> bool:
+        """Write events to Firebase in one batched write, with retry logic.
         
         Args:
-            mission_data: Mission data to sync
+            events: Unsynced events ({'row_id', 'data'}) from the local store
             max_retries: Maximum retry attempts
             
         Returns:
-            bool: True if sync successful, False otherwise
+            bool: True if the batch was committed, False otherwise
         """
         if not self._firebase_enabled or not self._db:
             logger.warning("Firebase not enabled - cannot sync")
             return False
         
-        mission_id = mission_data.get('mission_id')
-        event_type = mission_data.get('event_type')
-        
         for attempt in range(max_retries):
             try:
-                # Write to Firebase
-                doc_ref = self._db.collection('missions').document(mission_id)
-                
-                # Store in subcollection 'events' like the original implementation
-                events_ref = doc_ref.collection('events')
-                events_ref.add({
-                    'mission_id': mission_id,
-                    'event_type': event_type,
-                    'status': mission_data.get('status'),
-                    'timestamp': mission_data.get('timestamp'),
-                    'data': mission_data,
-                    'synced_at': datetime.utcnow().isoformat()
-                })
+                batch = self._db.batch()
+                synced_at = datetime.utcnow().isoformat()
+                for event in events:
+                    mission_data = event['data']
+                    mission_id = mission_data.get('mission_id')
+                    # Store in subcollection 'events' like the original implementation
+                    # Keyed by the event's own id so a retried commit overwrites itself
+                    event_ref = (
+                        self._db.collection('missions').document(mission_id)
+                        .collection('events').document(event_document_id(mission_data))
+                    )
+                    batch.set(event_ref, {
+                        'mission_id': mission_id,
+                        'event_type': mission_data.get('event_type'),
+                        'status': mission_data.get('status'),
+                        'timestamp': mission_data.get('timestamp'),
+                        'data': mission_data,
+                        'synced_at': synced_at
+                    })
+                batch.commit()
                 
-                logger.debug(f"✓ Synced: {mission_id} → {event_type}")
+                logger.debug(f"✓ Synced batch of {len(events)} events")
                 return True
                 
             except Exception as e:
                 wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
-                logger.warning(f"Sync attempt {attempt + 1}/{max_retries} failed for {mission_id}: {e}")
+                logger.warning(f"Sync attempt {attempt + 1}/{max_retries} failed for batch of {len(events)}: {e}")
+                self.stats['last_error'] = str(e)
                 
                 if attempt < max_retries - 1:
                     time.sleep(wait_time)
                 else:
-                    logger.error(f"❌ All sync attempts failed for {mission_id}")
+                    logger.error(f"❌ All sync attempts failed for batch of {len(events)} events")
                     return False
         
         return False
     
+    def _bisect_batch(self, events: List[Dict[str, Any]]) -> Optional[Tuple[List[int], List[int]]]:
+        """Split a failed batch in halves until the events Firebase rejects are isolated.
+        
+        Each half is committed once (no backoff). When nothing commits within
+        a run of 2 * log2(batch) failures the problem is not a bad event but
+        Firebase itself, so the split is abandoned and the whole batch stays
+        unsynced for the next round's backoff.
+        
+        Args:
+            events: A batch that failed every attempt of _commit_batch
+            
+        Returns:
+            (committed row ids, rejected row ids), or None if no event could
+            be committed
+        """
+        if len(events) < 2:
+            return None
+        budget = 2 * math.ceil(math.log2(len(events)))
+        committed: List[int] = []
+        rejected: List[int] = []
+        failures_in_a_row = 0
+        mid = len(events) // 2
+        stack = [events[mid:], events[:mid]]
+        while stack:
+            part = stack.pop()
+            if self._commit_batch(part, max_retries=1):
+                committed.extend(event['row_id'] for event in part)
+                failures_in_a_row = 0
+                continue
+            failures_in_a_row += 1
+            if failures_in_a_row > budget:
+                # Firebase went away mid-split: keep what committed, retry the rest later
+                rejected = []
+                break
+            if len(part) == 1:
+                rejected.append(part[0]['row_id'])
+            else:
+                mid = len(part) // 2
+                stack.extend((part[mid:], part[:mid]))
+        
+        if not committed:
+            return None
+        return committed, rejected
+    
     def force_sync(self) -> Dict[str, Any]:
-        """Force an immediate sync and return results.
+        """Force an immediate sync of the whole backlog and return results.
         
         Returns:
             Dictionary with sync results
@@ -241,7 +405,10 @@ class MissionSyncService:
         logger.info("Force sync requested")
         
         initial_stats = self.stats.copy()
-        self._sync_batch()
+        while True:
+            synced, failed = self._sync_round()
+            if not synced:
+                break
         
         return {
             'synced': self.stats['total_synced'] - initial_stats['total_synced'],
@@ -249,6 +416,22 @@ class MissionSyncService:
             'timestamp': datetime.utcnow().isoformat()
         }
     
+    def get_sync_metrics(self) -> Dict[str, Any]:
+        """Backlog depth and sync lag (age of the oldest unsynced event).
+        
+        Returns:
+            Dictionary with backlog_depth and sync_lag_seconds
+        """
+        backlog = self.local_store.get_sync_backlog()
+        lag = 0.0
+        if backlog['oldest_unsynced_at']:
+            oldest = datetime.strptime(backlog['oldest_unsynced_at'], '%Y-%m-%d %H:%M:%S')
+            lag = max(0.0, (datetime.utcnow() - oldest).total_seconds())
+        return {
+            'backlog_depth': backlog['unsynced_events'],
+            'sync_lag_seconds': round(lag, 1)
+        }
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get sync service statistics.
         
@@ -260,9 +443,11 @@ class MissionSyncService:
         return {
             'sync_service': {
                 **self.stats,
+                **self.get_sync_metrics(),
                 'running': self.running,
                 'sync_interval_seconds': self.sync_interval,
-                'batch_size': self.batch_size
+                'batch_size': self.batch_size,
+                'max_concurrency': self.max_concurrency
             },
             'local_storage': local_stats
         }
@@ -6,6 +6,7 @@ import os
 import logging
 import time
 from typing import Dict, List, Optional
+from Back_End.config import Config
 from Back_End.mployer_scraper import MployerScraper
 from Back_End.screenshot_capture import capture_full_context
 
@@ -256,24 +257,28 @@ def register_mployer_tools(tool_registry):
     tool_registry.register(
         'mployer_login',
         mployer_login,
+        max_concurrency=Config.SLOW_TOOL_CONCURRENCY,
         description='Log into Mployer account. Must be called before any other Mployer operations.'
     )
     
     tool_registry.register(
         'mployer_navigate_to_search',
         mployer_navigate_to_search,
+        max_concurrency=Config.SLOW_TOOL_CONCURRENCY,
         description='Navigate to the employer search page on Mployer. Call after login.'
     )
     
     tool_registry.register(
         'mployer_search_employers',
         mployer_search_employers,
+        max_concurrency=Config.SLOW_TOOL_CONCURRENCY,
         description='Search for employers on Mployer. Parameters: state (e.g., "MD"), min_employees, max_employees, industry, max_results.'
     )
     
     tool_registry.register(
         'mployer_extract_contacts',
         mployer_extract_contacts,
+        max_concurrency=Config.SLOW_TOOL_CONCURRENCY,
         description='Extract contact details from a specific employer on Mployer. Parameters: employer_name, max_contacts.'
     )
     
@@ -13,6 +13,8 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone
 from dataclasses import dataclass
 
+from Back_End.jsonl_tail import tail_jsonl
+from Back_End.learning.signal_log_store import tail_signals
 from Back_End.learning.signal_priority import apply_signal_priority
 
 
@@ -141,38 +143,30 @@ class Phase25DashboardAggregator:
     
     def _get_recent_missions(self, limit: int = 10) -> List[Dict]:
         """Get most recent missions from missions.jsonl"""
-        missions = []
         try:
             missions_file = Path("outputs/phase25/missions.jsonl")
-            if missions_file.exists():
-                with open(missions_file, 'r') as f:
-                    for line in f:
-                        event = json.loads(line)
-                        # Only include mission_created events
-                        if event.get('event_type') == 'mission_created':
-                            mission = event.get('mission', {})
-                            missions.append({
-                                'mission_id': mission.get('mission_id'),
-                                'objective': mission.get('objective', {}).get('description', 'Unknown'),
-                                'status': mission.get('status', 'unknown'),
-                                'created_at': mission.get('created_at')
-                            })
-            # Return most recent
-            return missions[-limit:] if len(missions) > limit else missions
+            # Only include mission_created events
+            events = tail_jsonl(
+                missions_file, limit,
+                predicate=lambda event: event.get('event_type') == 'mission_created'
+            )
+            missions = []
+            for event in events:
+                mission = event.get('mission', {})
+                missions.append({
+                    'mission_id': mission.get('mission_id'),
+                    'objective': mission.get('objective', {}).get('description', 'Unknown'),
+                    'status': mission.get('status', 'unknown'),
+                    'created_at': mission.get('created_at')
+                })
+            return missions
         except:
             return []
     
     def _get_recent_executions(self, limit: int = 10) -> List[Dict]:
         """Get most recent tool executions"""
-        executions = []
         try:
-            if self.execution_log.exists():
-                with open(self.execution_log, 'r') as f:
-                    for line in f:
-                        exec_data = json.loads(line)
-                        executions.append(exec_data)
-            # Return most recent
-            return executions[-limit:] if len(executions) > limit else executions
+            return tail_jsonl(self.execution_log, limit)
         except:
             return []
     
@@ -190,14 +184,8 @@ class Phase25DashboardAggregator:
     
     def _get_recent_rollbacks(self, limit: int = 5) -> List[Dict]:
         """Get recent rollback events from Phase 24"""
-        rollbacks = []
         try:
-            if self.phase24_rollbacks.exists():
-                with open(self.phase24_rollbacks, 'r') as f:
-                    for line in f:
-                        rb = json.loads(line)
-                        rollbacks.append(rb)
-            return rollbacks[-limit:] if len(rollbacks) > limit else rollbacks
+            return tail_jsonl(self.phase24_rollbacks, limit)
         except:
             pass
         return []
@@ -237,19 +225,19 @@ class Phase25DashboardAggregator:
         """Competitor research results from web scraping tasks"""
         insights = []
         try:
-            if self.execution_log.exists():
-                with open(self.execution_log, 'r') as f:
-                    for line in f:
-                        exec_data = json.loads(line)
-                        if 'research' in exec_data.get('action_type', ''):
-                            insights.append({
-                                "timestamp": exec_data.get('timestamp'),
-                                "source": exec_data.get('tool_name'),
-                                "data": exec_data.get('data_extracted', {})
-                            })
+            research = tail_jsonl(
+                self.execution_log, 5,
+                predicate=lambda exec_data: 'research' in exec_data.get('action_type', '')
+            )
+            for exec_data in research:
+                insights.append({
+                    "timestamp": exec_data.get('timestamp'),
+                    "source": exec_data.get('tool_name'),
+                    "data": exec_data.get('data_extracted', {})
+                })
         except:
             pass
-        return insights[-5:] if len(insights) > 5 else insights
+        return insights
     
     def _get_ghl_trends(self) -> Dict[str, Any]:
         """GHL campaign performance trends"""
@@ -276,15 +264,9 @@ class Phase25DashboardAggregator:
     
     def _get_learning_signals(self, limit: int = 10) -> List[Dict]:
         """Recent learning signals (no filtering to avoid signal loss)."""
-        signals = []
         signals_file = self.data_dir / "learning_signals.jsonl"
         try:
-            if signals_file.exists():
-                with open(signals_file, 'r') as f:
-                    for line in f:
-                        sig = json.loads(line)
-                        signals.append(apply_signal_priority(sig))
-            return signals[-limit:] if len(signals) > limit else signals
+            return [apply_signal_priority(sig) for sig in tail_signals(signals_file, limit)]
         except:
             pass
         return []
@@ -13,6 +13,7 @@ from enum import Enum
 from dataclasses import dataclass, field, asdict
 
 from Back_End.learning.signal_priority import apply_signal_priority
+from Back_End.learning.signal_log_store import append_signals
 
 
 class ExecutionMode(Enum):
@@ -197,8 +198,7 @@ class Phase25Orchestrator:
                     signal_data["signal_source"] = "web_navigator"
                 
                 signal_data = apply_signal_priority(signal_data)
-                with open(self.learning_signals, 'a') as f:
-                    f.write(json.dumps(signal_data) + '\n')
+                append_signals(self.learning_signals, [signal_data])
             else:
                 # Phase 25 meta signals: construct from parameters
                 signal = {
@@ -211,8 +211,7 @@ class Phase25Orchestrator:
                     "timestamp": datetime.now(timezone.utc).isoformat()
                 }
                 signal = apply_signal_priority(signal)
-                with open(self.learning_signals, 'a') as f:
-                    f.write(json.dumps(signal) + '\n')
+                append_signals(self.learning_signals, [signal])
         except Exception as e:
             print(f"Error logging signal: {e}")
     
@@ -0,0 +1,176 @@
+"""
+Quantile Sketch: compact, mergeable percentile estimates
+
+A DDSketch-style sketch. Positive values are counted in logarithmically
+spaced bins, so any quantile is returned within RELATIVE_ACCURACY of the
+true value (1% by default) while memory grows only with the log of the
+value range, not with the number of values recorded.
+
+Sketches with the same accuracy merge by adding bin counts, so per-hour
+or per-process sketches can be combined into any larger window exactly
+as if the values had been recorded into one sketch.
+
+CONSTRAINTS:
+- Values <= MIN_INDEXABLE_VALUE (including negatives) are counted as zero
+- Serialized form is plain JSON (bin keys are strings)
+- Only sketches with the same relative accuracy may be merged
+"""
+
+import math
+from typing import Any, Dict, Iterable, Optional
+
+
+RELATIVE_ACCURACY = 0.01
+MIN_INDEXABLE_VALUE = 1e-9
+
+# Bins kept before the lowest ones are collapsed together
+MAX_BINS = 2048
+
+
+class QuantileSketch:
+    """
+    Relative-error quantile sketch.
+
+    Usage:
+        sketch = QuantileSketch()
+        for duration_ms in durations:
+            sketch.add(duration_ms)
+        p95 = sketch.quantile(0.95)
+    """
+
+    def __init__(self, relative_accuracy: float = RELATIVE_ACCURACY, max_bins: int = MAX_BINS):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+        self.bins: Dict[int, float] = {}
+        self.zero_count = 0.0
+        self.count = 0.0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def _index(self, value: float) -> int:
+        return int(math.ceil(math.log(value) / self._log_gamma))
+
+    def _value(self, index: int) -> float:
+        # Midpoint (in relative terms) of bin (gamma^(i-1), gamma^i]
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+    def add(self, value: float, weight: float = 1.0) -> None:
+        """Record `value` (`weight` times)."""
+        value = float(value)
+        if weight <= 0 or math.isnan(value):
+            return
+        if value <= MIN_INDEXABLE_VALUE:
+            self.zero_count += weight
+        else:
+            index = self._index(value)
+            self.bins[index] = self.bins.get(index, 0.0) + weight
+            if len(self.bins) > self.max_bins:
+                self._collapse()
+
+        self.count += weight
+        self.sum += value * weight
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def add_many(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Fold `other` into this sketch."""
+        if other.count == 0:
+            return
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+
+        for index, weight in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0.0) + weight
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def _collapse(self) -> None:
+        """Merge the lowest bins so at most max_bins remain (keeps upper quantiles exact)."""
+        ordered = sorted(self.bins)
+        excess = len(ordered) - self.max_bins
+        target = ordered[excess]
+        for index in ordered[:excess]:
+            self.bins[target] += self.bins.pop(index)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile (0 <= q <= 1).
+
+        Uses the same nearest-rank convention as a sorted-list lookup at
+        round(q * (count - 1)). Returns 0.0 for an empty sketch.
+        """
+        if self.count <= 0:
+            return 0.0
+        q = max(0.0, min(1.0, q))
+        rank = round(q * (self.count - 1))
+
+        if rank < self.zero_count:
+            return max(self.min, 0.0) if self.min is not None and self.min > 0 else (self.min or 0.0)
+
+        seen = self.zero_count
+        estimate = self.max or 0.0
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if seen > rank:
+                estimate = self._value(index)
+                break
+        return max(self.min or 0.0, min(self.max or 0.0, estimate))
+
+    def percentile(self, percentile: float) -> float:
+        """Estimate a percentile on the 0-100 scale."""
+        return self.quantile(percentile / 100)
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "bins": {str(index): weight for index, weight in self.bins.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "QuantileSketch":
+        data = data or {}
+        sketch = cls(relative_accuracy=float(data.get("relative_accuracy", RELATIVE_ACCURACY)))
+        sketch.bins = {int(index): float(weight) for index, weight in (data.get("bins") or {}).items()}
+        sketch.zero_count = float(data.get("zero_count", 0.0))
+        sketch.count = float(data.get("count", 0.0))
+        sketch.sum = float(data.get("sum", 0.0))
+        sketch.min = data.get("min")
+        sketch.max = data.get("max")
+        return sketch
@@ -11,11 +11,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-import json
 
 from Back_End.build_registry import BuildRegistry
 from Back_End.build_review import BuildReviewRegistry, BuildReviewVerdict
 from Back_End.build_deliverable import DeliverableRegistry, DeliverableReadiness
+from Back_End.learning.signal_log_store import append_signals
 
 
 @dataclass(frozen=True)
@@ -132,8 +132,6 @@ class RevenueReadinessGate:
         """Emit readiness signal to learning_signals.jsonl (append-only)."""
         if stream_file is None:
             stream_file = Path("outputs/phase25/learning_signals.jsonl")
-        stream_file.parent.mkdir(parents=True, exist_ok=True)
-
         signal = {
             "signal_type": "revenue_readiness_evaluated",
             "signal_layer": "economic",
@@ -142,7 +140,5 @@ class RevenueReadinessGate:
             "payload": result.to_dict(),
         }
 
-        with stream_file.open("a", encoding="utf-8") as f:
-            json.dump(signal, f)
-            f.write("\n")
+        append_signals(stream_file, [signal])
 
@@ -18,16 +18,24 @@ Supported Engines:
 - google_jobs: Job listings, requirements, companies
 
 Philosophy: Each engine returns normalized results. Tools compose engines.
+
+All engines share one pooled keep-alive HTTP session; search_many() fans a
+query out to several engines concurrently under an overall deadline.
 """
 
 import logging
 import requests
 import time
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, wait
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional, Any, Tuple
 from Back_End.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Per-request HTTP timeout for one engine query
+REQUEST_TIMEOUT_SECONDS = 15
+
 # Import API usage logging
 def _log_external_api(company: str, request_type: str, duration_ms: float = 0.0, cost_usd: float = 0.0):
     """Log external API usage for metrics"""
@@ -41,13 +49,111 @@ def _log_external_api(company: str, request_type: str, duration_ms: float = 0.0,
 class SearchEnginesRegistry:
     """Unified interface to SerpAPI engines"""
     
-    def __init__(self):
+    # engine name -> search method
+    ENGINE_METHODS = {
+        "google": "search_google",
+        "google_maps": "search_google_maps",
+        "google_news": "search_google_news",
+        "linkedin": "search_linkedin",
+        "google_scholar": "search_google_scholar",
+        "google_shopping": "search_google_shopping",
+        "youtube": "search_youtube",
+        "google_trends": "search_google_trends",
+        "amazon": "search_amazon",
+        "google_jobs": "search_google_jobs",
+    }
+    
+    def __init__(self, base_url: str = "https://serpapi.com/search"):
         self.api_key = Config.API_KEYS.get('SERPAPI')
-        self.base_url = "https://serpapi.com/search"
+        self.base_url = base_url
+        
+        # One keep-alive connection pool shared by every engine and thread
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=Config.SEARCH_ENGINE_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         
         if not self.api_key:
             logger.warning("[SEARCH_ENGINES] SerpAPI key not configured")
     
+    def _get(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """GET one SerpAPI query over the pooled session"""
+        response = self.session.get(self.base_url, params=params, timeout=REQUEST_TIMEOUT_SECONDS)
+        return response.json()
+    
+    def search_engine(self, engine: str, query: str, num: int = 10) -> Dict[str, Any]:
+        """Run query on one engine by name"""
+        method_name = self.ENGINE_METHODS.get(engine)
+        if method_name is None:
+            return {"error": f"Unknown engine: {engine}"}
+        method = getattr(self, method_name)
+        if engine == "google_trends":
+            return method(query)
+        return method(query, num=num)
+    
+    def search_many(
+        self,
+        engines: List[str],
+        query: str,
+        num: int = 10,
+        deadline_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Query several engines concurrently and collect what finishes in time.
+        
+        Returns:
+            {
+                'results_by_engine': {engine: results},  # in `engines` order
+                'latency_ms': {engine: ms},
+                'timed_out': [engine, ...]
+            }
+        
+        An engine still running at the deadline gets an error result (its
+        latency is the deadline); the other engines' results are kept.
+        """
+        if deadline_seconds is None:
+            deadline_seconds = Config.SEARCH_MULTI_ENGINE_DEADLINE_SECONDS
+        engines = list(dict.fromkeys(engines))
+        if not engines:
+            return {"results_by_engine": {}, "latency_ms": {}, "timed_out": []}
+        
+        workers = max(1, min(Config.SEARCH_ENGINE_WORKERS, len(engines)))
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="search_engine")
+        try:
+            futures = {engine: pool.submit(self._timed_search, engine, query, num) for engine in engines}
+            wait(futures.values(), timeout=deadline_seconds)
+        finally:
+            # Late engines finish in the background; their results are discarded
+            pool.shutdown(wait=False, cancel_futures=True)
+        
+        results_by_engine: Dict[str, Any] = {}
+        latency_ms: Dict[str, float] = {}
+        timed_out: List[str] = []
+        for engine, future in futures.items():
+            if future.done() and not future.cancelled():
+                results_by_engine[engine], latency_ms[engine] = future.result()
+            else:
+                timed_out.append(engine)
+                results_by_engine[engine] = {
+                    "error": f"Timed out after {deadline_seconds:g}s",
+                    "engine": engine,
+                    "timed_out": True
+                }
+                latency_ms[engine] = round(deadline_seconds * 1000, 1)
+        
+        if timed_out:
+            logger.warning(f"[SEARCH_ENGINES] Deadline reached; partial results without {timed_out}")
+        return {"results_by_engine": results_by_engine, "latency_ms": latency_ms, "timed_out": timed_out}
+    
+    def _timed_search(self, engine: str, query: str, num: int) -> Tuple[Dict[str, Any], float]:
+        start = time.monotonic()
+        try:
+            results = self.search_engine(engine, query, num=num)
+        except Exception as e:
+            logger.warning(f"[SEARCH_ENGINES] Engine {engine} failed: {e}")
+            results = {"error": str(e), "engine": engine}
+        return results, round((time.monotonic() - start) * 1000, 1)
+    
     def search_google(self, query: str, num: int = 10, safe: str = "on") -> Dict[str, Any]:
         """
         General Google search - broadest coverage
@@ -63,8 +169,7 @@ class SearchEnginesRegistry:
                 "safe": safe
             }
             
-            response = requests.get(self.base_url, params=params, timeout=15)
-            data = response.json()
+            data = self._get(params)
             
             results = {
                 "engine": "google",
@@ -122,8 +227,7 @@ class SearchEnginesRegistry:
             if location:
                 params["location"] = location
             
-            response = requests.get(self.base_url, params=params, timeout=15)
-            data = response.json()
+            data = self._get(params)
             
             results = {
                 "engine": "google_maps",
@@ -169,8 +273,7 @@ class SearchEnginesRegistry:
                 "num": num
             }
             
-            response = requests.get(self.base_url, params=params, timeout=15)
-            data = response.json()
+            data = self._get(params)
             
             results = {
                 "engine": "google_news",
@@ -216,8 +319,7 @@ class SearchEnginesRegistry:
                 "num": num
             }
             
-            response = requests.get(self.base_url, params=params, timeout=15)
-            data = response.json()
+            data = self._get(params)
             
             results = {
                 "engine": "linkedin",
@@ -276,8 +378,7 @@ class SearchEnginesRegistry:
                 "num": num
             }
             
-            response = requests.get(self.base_url, params=params, timeout=15)
-            data = response.json()
+            data = self._get(params)
             
             results = {
                 "engine": "google_scholar",
@@ -320,8 +421,7 @@ class SearchEnginesRegistry:
                 "num": num
             }
             
-            response = requests.get(self.base_url, params=params, timeout=15)
-            data = response.json()
+            data = self._get(params)
             
             results = {
                 "engine": "google_shopping",
@@ -364,8 +464,7 @@ class SearchEnginesRegistry:
                 "num": num
             }
             
-            response = requests.get(self.base_url, params=params, timeout=15)
-            data = response.json()
+            data = self._get(params)
             
             results = {
                 "engine": "youtube",
@@ -406,8 +505,7 @@ class SearchEnginesRegistry:
                 "q": query
             }
             
-            response = requests.get(self.base_url, params=params, timeout=15)
-            data = response.json()
+            data = self._get(params)
             
             results = {
                 "engine": "google_trends",
@@ -444,8 +542,7 @@ class SearchEnginesRegistry:
                 "num": num
             }
             
-            response = requests.get(self.base_url, params=params, timeout=15)
-            data = response.json()
+            data = self._get(params)
             
             results = {
                 "engine": "amazon",
@@ -490,8 +587,7 @@ class SearchEnginesRegistry:
             if location:
                 params["location"] = location
             
-            response = requests.get(self.base_url, params=params, timeout=15)
-            data = response.json()
+            data = self._get(params)
             
             results = {
                 "engine": "google_jobs",
@@ -56,35 +56,33 @@ def maybe_normalize(text: str, session_context: Optional[dict] = None) -> str:
         return text
     
     try:
-        result = _attempt_normalization(text, session_context)
-        
-        if result.confidence >= NORMALIZATION_CONFIDENCE_THRESHOLD:
-            logger.info(
-                f"Normalization accepted (conf={result.confidence:.2f}): "
-                f"'{result.original_text}' → '{result.normalized_text}'"
-            )
-            return result.normalized_text
-        else:
-            logger.info(
-                f"Normalization rejected (conf={result.confidence:.2f}): "
-                f"using original text. Reason: {result.reason}"
-            )
-            return result.original_text
-            
+        return accept_normalization(_attempt_normalization(text, session_context))
     except Exception as e:
         logger.warning(f"Normalization failed: {e}. Using original text.")
         return text
 
 
-def _attempt_normalization(text: str, session_context: Optional[dict]) -> NormalizationResult:
+def accept_normalization(result: NormalizationResult) -> str:
     """
-    Call LLM to attempt semantic normalization.
+    Apply the confidence threshold to a normalization result.
     
-    Returns NormalizationResult with confidence score.
+    Returns normalized_text if confidence >= THRESHOLD, otherwise original_text.
     """
-    from Back_End.llm_client import llm_client
-    
-    # Build context hints (but never guess missing values)
+    if result.confidence >= NORMALIZATION_CONFIDENCE_THRESHOLD:
+        logger.info(
+            f"Normalization accepted (conf={result.confidence:.2f}): "
+            f"'{result.original_text}' → '{result.normalized_text}'"
+        )
+        return result.normalized_text
+    logger.info(
+        f"Normalization rejected (conf={result.confidence:.2f}): "
+        f"using original text. Reason: {result.reason}"
+    )
+    return result.original_text
+
+
+def build_context_hints(session_context: Optional[dict]) -> str:
+    """Reference-resolution hints for the prompt (never guessed values)"""
     context_hints = ""
     if session_context:
         last_url = session_context.get("last_visited_url")
@@ -95,8 +93,20 @@ def _attempt_normalization(text: str, session_context: Optional[dict]) -> Normal
         if last_artifact:
             context_hints += "\n- last_artifact_id: " + str(last_artifact)
     
-    if not context_hints:
-        context_hints = "\n- (no context available)"
+    return context_hints or "\n- (no context available)"
+
+
+def _attempt_normalization(text: str, session_context: Optional[dict]) -> NormalizationResult:
+    """
+    Call LLM to attempt semantic normalization.
+    
+    Returns NormalizationResult with confidence score.
+    """
+    from Back_End.llm_client import llm_client
+    from Back_End.llm_response_cache import is_json_object
+    
+    # Build context hints (but never guess missing values)
+    context_hints = build_context_hints(session_context)
     
     prompt = """You are a semantic rewrite engine, not an agent.
 
@@ -138,7 +148,8 @@ Confidence scale:
 """
 
     try:
-        response = llm_client.complete(prompt, max_tokens=200, temperature=0.1)
+        response = llm_client.complete(prompt, max_tokens=200, temperature=0.1, call_site='semantic_normalization',
+                                       validate=is_json_object)
         
         if not response:
             logger.warning("LLM returned no response for normalization")
@@ -0,0 +1,268 @@
+"""
+Session Cache: bounded in-memory tier for per-session state
+
+Replaces the plain dicts that held every chat session, session context and
+conversation for the life of the process. Entries are kept in least-recently
+used order and evicted when any of these limits is exceeded:
+
+- max_entries: number of sessions held
+- ttl_seconds: time since the entry was last read or written
+- max_bytes: estimated memory, from the `sizeof` callable (re-measured via
+  resize() after an entry grows in place)
+
+A limit of 0 disables it. Owners that persist their sessions rehydrate an
+evicted entry on the next miss; owners whose entries may hold state kept
+nowhere else pass a `pinned` predicate, and pinned entries are skipped by
+eviction and expiry until they no longer hold it. Hits, misses, evictions
+and expirations are counted per cache and reported by get_cache_stats().
+
+CONSTRAINTS:
+- All operations are thread-safe
+- The entry just written is never evicted by its own put()
+- Pinned entries are never evicted or expired (a cache of only pinned
+  entries may exceed its limits)
+- `in`, len(), items() and values() do not count as hits or refresh recency
+"""
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from Back_End.config import Config
+
+
+V = TypeVar("V")
+
+# Live caches by name, for health reporting
+_registry: "weakref.WeakValueDictionary[str, SessionCache]" = weakref.WeakValueDictionary()
+
+_MISSING: Any = object()
+
+
+class SessionCache(Generic[V]):
+    """LRU + TTL + memory-budget cache keyed by session id."""
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[V], int]] = None,
+        on_evict: Optional[Callable[[str, V], None]] = None,
+        pinned: Optional[Callable[[V], bool]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.max_entries = Config.SESSION_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self.ttl_seconds = Config.SESSION_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.max_bytes = Config.SESSION_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self._sizeof = sizeof
+        self._on_evict = on_evict
+        self._pinned = pinned
+        self._clock = clock
+
+        self._lock = threading.RLock()
+        # key -> (value, last_touched, size); oldest first
+        self._entries: "OrderedDict[str, Tuple[V, float, int]]" = OrderedDict()
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        _registry[name] = self
+
+    @classmethod
+    def unbounded(cls, name: str, **kwargs: Any) -> "SessionCache[V]":
+        """A cache that never evicts (for owners with no store to rehydrate from)"""
+        return cls(name, max_entries=0, ttl_seconds=0, max_bytes=0, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, default: Optional[V] = None) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            now = self._clock()
+            if entry is None or self._expired(entry, now):
+                if entry is not None:
+                    self._remove(key, expired=True)
+                self.misses += 1
+                return default
+            value, _, size = entry
+            self._entries[key] = (value, now, size)
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __getitem__(self, key: str) -> V:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._expired(entry, self._clock())
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire()
+            return len(self._entries)
+
+    def items(self) -> List[Tuple[str, V]]:
+        with self._lock:
+            self._expire()
+            return [(key, entry[0]) for key, entry in self._entries.items()]
+
+    def values(self) -> List[V]:
+        return [value for _, value in self.items()]
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def put(self, key: str, value: V) -> V:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            size = self._measure(value)
+            self._entries[key] = (value, self._clock(), size)
+            self._bytes += size
+            self._enforce()
+            return value
+
+    __setitem__ = put
+
+    def setdefault(self, key: str, value: V) -> V:
+        """Return the live entry for key, storing value if there is none"""
+        with self._lock:
+            existing = self.get(key)
+            return existing if existing is not None else self.put(key, value)
+
+    def resize(self, key: str) -> None:
+        """Re-measure an entry that grew in place, then enforce the budget"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            value, touched, size = entry
+            new_size = self._measure(value)
+            self._entries[key] = (value, touched, new_size)
+            self._bytes += new_size - size
+            self._enforce()
+
+    def pop(self, key: str, default: Optional[V] = None) -> Optional[V]:
+        """Remove an entry on request (not counted as an eviction)"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return default
+            self._bytes -= entry[2]
+            return entry[0]
+
+    def __delitem__(self, key: str) -> None:
+        if self.pop(key) is None:
+            raise KeyError(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    # ------------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------------
+
+    def _measure(self, value: V) -> int:
+        return self._sizeof(value) if self._sizeof else 0
+
+    def _is_pinned(self, value: V) -> bool:
+        return self._pinned is not None and self._pinned(value)
+
+    def _idle(self, entry: Tuple[V, float, int], now: float) -> bool:
+        return bool(self.ttl_seconds) and now - entry[1] > self.ttl_seconds
+
+    def _expired(self, entry: Tuple[V, float, int], now: float) -> bool:
+        return self._idle(entry, now) and not self._is_pinned(entry[0])
+
+    def _skip_pinned(self, key: str, now: float) -> None:
+        # A pinned entry counts as just used, keeping the list ordered by last touch
+        value, _, size = self._entries[key]
+        self._entries[key] = (value, now, size)
+        self._entries.move_to_end(key)
+
+    def _expire(self) -> None:
+        # Entries are ordered by last touch, so the expired ones are at the front
+        now = self._clock()
+        for _ in range(len(self._entries)):
+            key, entry = next(iter(self._entries.items()))
+            if not self._idle(entry, now):
+                break
+            if self._is_pinned(entry[0]):
+                self._skip_pinned(key, now)
+            else:
+                self._remove(key, expired=True)
+
+    def _over_budget(self) -> bool:
+        return bool(
+            (self.max_entries and len(self._entries) > self.max_entries)
+            or (self.max_bytes and self._bytes > self.max_bytes)
+        )
+
+    def _enforce(self) -> None:
+        self._expire()
+        newest = next(reversed(self._entries), None)
+        now = self._clock()
+        for _ in range(len(self._entries)):
+            if not self._over_budget():
+                break
+            key = next(iter(self._entries))
+            if key == newest:
+                break
+            if self._is_pinned(self._entries[key][0]):
+                self._skip_pinned(key, now)
+            else:
+                self._remove(key, expired=False)
+
+    def _remove(self, key: str, expired: bool) -> None:
+        value, _, size = self._entries.pop(key)
+        self._bytes -= size
+        if expired:
+            self.expirations += 1
+        else:
+            self.evictions += 1
+        if self._on_evict:
+            try:
+                self._on_evict(key, value)
+            except Exception as e:
+                print(f"Warning: {self.name} eviction callback failed for {key}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Counters for every live session cache, keyed by cache name"""
+    return {name: cache.stats() for name, cache in list(_registry.items())}
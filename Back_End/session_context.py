@@ -23,6 +23,7 @@ from collections import deque
 from typing import Optional, Deque, Dict, Any, List, TYPE_CHECKING
 
 from Back_End.action_readiness_engine import ClarificationType
+from Back_End.session_cache import SessionCache
 
 if TYPE_CHECKING:
     from Back_End.interaction_orchestrator import IntentType
@@ -207,6 +208,10 @@ class SessionContext:
         
         return dict(self.pending_mission)
     
+    def has_pending_state(self) -> bool:
+        """Whether a mission approval or clarification is still awaiting the user."""
+        return self.pending_mission is not None or self.pending_clarification is not None
+    
     def clear_pending_mission(self) -> None:
         """
         Clear the pending mission after approval/rejection.
@@ -282,23 +287,33 @@ class SessionContextManager:
     Memory-only manager for per-session contexts.
     
     One context per session_id. Lifetime: session active only.
+    Contexts are held in a bounded SessionCache, so an idle or least
+    recently used session's context is dropped, exactly as if the session
+    had expired (it is never persisted, so nothing is rehydrated). A context
+    with a pending mission or clarification is pinned until it is resolved.
     """
     
     def __init__(self):
-        self._contexts: Dict[str, SessionContext] = {}
+        self._contexts: SessionCache[SessionContext] = SessionCache(
+            'session_contexts', pinned=SessionContext.has_pending_state
+        )
     
     def get_or_create(self, session_id: str) -> SessionContext:
         """Get existing context or create new one."""
-        if session_id not in self._contexts:
-            self._contexts[session_id] = SessionContext(session_id=session_id)
-        return self._contexts[session_id]
+        context = self._contexts.get(session_id)
+        if context is None:
+            context = self._contexts.put(session_id, SessionContext(session_id=session_id))
+        return context
     
     def clear_session(self, session_id: str) -> None:
         """Clear context when session expires."""
-        if session_id in self._contexts:
-            del self._contexts[session_id]
+        self._contexts.pop(session_id)
     
     def get_all_sessions(self) -> Dict[str, SessionContext]:
         """For testing/debugging only."""
-        return dict(self._contexts)
+        return dict(self._contexts.items())
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters for the context cache."""
+        return self._contexts.stats()
 
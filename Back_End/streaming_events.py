@@ -5,10 +5,22 @@ NO control commands, NO autonomy
 """
 
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Any, Optional
 import json
+import threading
+import time
+
+
+# Events kept per mission for late subscribers and ?after_seq= resume
+EVENT_BUFFER_SIZE = 100
+# A finished mission's buffer is dropped this long after its final event
+FINISHED_MISSION_BUFFER_TTL_SECONDS = 300.0
+# Answer text arriving within this window of the last delta event is
+# coalesced into the next one (the first delta is always sent at once)
+ANSWER_DELTA_INTERVAL_SECONDS = 0.05
 
 
 class StreamingEventType(Enum):
@@ -31,6 +43,13 @@ class StreamingEventType(Enum):
     
     # Status changes
     MISSION_STATUS_CHANGE = "mission_status_change"
+    
+    # Incremental LLM answers
+    ANSWER_DELTA = "answer_delta"
+    ANSWER_COMPLETE = "answer_complete"
+    
+    # Sent only to a resuming subscriber whose missed events left the buffer
+    STREAM_GAP = "stream_gap"
 
 
 class SelectorAttemptStatus(Enum):
@@ -69,6 +88,7 @@ class StreamingEvent:
     timestamp: datetime
     sequence_number: int
     data: Dict[str, Any]
+    _json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -83,6 +103,12 @@ class StreamingEvent:
     def to_json(self) -> str:
         """Convert to JSON string"""
         return json.dumps(self.to_dict())
+    
+    def serialized(self) -> str:
+        """JSON string computed once and shared by every subscriber"""
+        if self._json is None:
+            self._json = self.to_json()
+        return self._json
 
 
 @dataclass
@@ -249,63 +275,157 @@ class MissionStatusChangeEvent(StreamingEvent):
         )
 
 
+TERMINAL_MISSION_STATUSES = {
+    MissionStatus.COMPLETED.value,
+    MissionStatus.FAILED.value,
+    MissionStatus.CANCELLED.value,
+}
+
+
 class StreamingEventEmitter:
-    """Emits streaming events (observability only)"""
+    """Emits streaming events (observability only)
+    
+    Each mission keeps its last `buffer_size` events in a ring buffer so
+    late subscribers can replay them (or only those after a sequence
+    number). Once a mission stops, its buffer and sequence counter are
+    dropped after `finished_ttl` seconds.
+    """
     
-    def __init__(self):
+    def __init__(
+        self,
+        buffer_size: int = EVENT_BUFFER_SIZE,
+        finished_ttl: float = FINISHED_MISSION_BUFFER_TTL_SECONDS,
+    ):
         """Initialize emitter"""
         self.event_listeners: Dict[str, List[callable]] = {}
         self.mission_sequences: Dict[str, int] = {}
-        self.event_buffer: Dict[str, List[StreamingEvent]] = {}  # Buffer for late subscribers
-        self.buffer_size = 100  # Keep last 100 events per mission
-    
-    def subscribe(self, mission_id: str, callback: callable) -> None:
-        """Subscribe to events for a mission and replay buffered events"""
-        if mission_id not in self.event_listeners:
-            self.event_listeners[mission_id] = []
-        self.event_listeners[mission_id].append(callback)
+        self.event_buffer: Dict[str, Deque[StreamingEvent]] = {}  # Buffer for late subscribers
+        self.buffer_size = buffer_size  # Keep last N events per mission
+        self.finished_ttl = finished_ttl
+        self._finished_at: Dict[str, float] = {}  # mission_id -> monotonic time of final event
+        self._lock = threading.RLock()
+    
+    def subscribe(self, mission_id: str, callback: callable, after_seq: Optional[int] = None) -> None:
+        """Subscribe to events for a mission and replay buffered events
         
-        # IMPORTANT: Replay buffered events to the new subscriber
-        # This ensures WebSocket clients that connect late still see prior events
-        if mission_id in self.event_buffer:
-            print(f"[EVENT BUFFER] Replaying {len(self.event_buffer[mission_id])} buffered events for mission {mission_id}")
-            for buffered_event in self.event_buffer[mission_id]:
-                try:
-                    callback(buffered_event)
-                except Exception as e:
-                    print(f"Error replaying buffered event to subscriber: {e}")
+        Args:
+            mission_id: Mission to follow
+            callback: Called with each StreamingEvent
+            after_seq: Replay only buffered events with a higher sequence_number
+                (for clients resuming a stream); None replays the whole buffer
+        """
+        with self._lock:
+            self._expire_finished()
+            self.event_listeners.setdefault(mission_id, []).append(callback)
+            # IMPORTANT: Replay buffered events to the new subscriber
+            # This ensures WebSocket clients that connect late still see prior events
+            replay = self.buffered_events(mission_id, after_seq)
+        
+        if replay:
+            print(f"[EVENT BUFFER] Replaying {len(replay)} buffered events for mission {mission_id}")
+        for buffered_event in replay:
+            try:
+                callback(buffered_event)
+            except Exception as e:
+                print(f"Error replaying buffered event to subscriber: {e}")
     
     def unsubscribe(self, mission_id: str, callback: callable) -> None:
         """Unsubscribe from events for a mission"""
-        if mission_id in self.event_listeners:
-            self.event_listeners[mission_id].remove(callback)
+        with self._lock:
+            listeners = self.event_listeners.get(mission_id)
+            if listeners and callback in listeners:
+                listeners.remove(callback)
+                if not listeners:
+                    del self.event_listeners[mission_id]
+    
+    def buffered_events(self, mission_id: str, after_seq: Optional[int] = None) -> List[StreamingEvent]:
+        """Buffered events for a mission, optionally only those after a sequence number
+        
+        When events after after_seq have already left the ring (or the
+        mission's numbering restarted), the replay starts with a stream_gap
+        event so the client knows its stream is incomplete.
+        """
+        with self._lock:
+            buffer = self.event_buffer.get(mission_id, ())
+            if after_seq is None:
+                return list(buffer)
+            replay = [event for event in buffer if event.sequence_number > after_seq]
+            current = self.mission_sequences.get(mission_id, 0)
+            oldest = buffer[0].sequence_number if buffer else current + 1
+            reset = after_seq > current
+            if reset or oldest > after_seq + 1:
+                replay.insert(0, self._gap_event(mission_id, after_seq, oldest, reset))
+            return replay
+    
+    @staticmethod
+    def _gap_event(mission_id: str, after_seq: int, oldest: int, reset: bool) -> StreamingEvent:
+        """Not buffered or broadcast; numbered just before the first replayed event"""
+        return StreamingEvent(
+            mission_id=mission_id,
+            event_type=StreamingEventType.STREAM_GAP,
+            timestamp=datetime.utcnow(),
+            sequence_number=oldest - 1,
+            data={
+                "requested_after_seq": after_seq,
+                "oldest_available_seq": oldest,
+                "reset": reset,
+            },
+        )
     
     def emit(self, event: StreamingEvent) -> None:
         """Emit an event to all listeners and buffer it for late subscribers"""
         mission_id = event.mission_id
         
-        # Track sequence numbers per mission
-        if mission_id not in self.mission_sequences:
-            self.mission_sequences[mission_id] = 0
-        self.mission_sequences[mission_id] += 1
-        event.sequence_number = self.mission_sequences[mission_id]
-        
-        # Buffer the event (for late subscribers)
-        if mission_id not in self.event_buffer:
-            self.event_buffer[mission_id] = []
-        self.event_buffer[mission_id].append(event)
-        # Keep buffer size limited
-        if len(self.event_buffer[mission_id]) > self.buffer_size:
-            self.event_buffer[mission_id].pop(0)
+        with self._lock:
+            self._expire_finished()
+            
+            # Track sequence numbers per mission
+            self.mission_sequences[mission_id] = self.mission_sequences.get(mission_id, 0) + 1
+            event.sequence_number = self.mission_sequences[mission_id]
+            event._json = None
+            
+            # Buffer the event (for late subscribers); the deque drops the oldest
+            if mission_id not in self.event_buffer:
+                self.event_buffer[mission_id] = deque(maxlen=self.buffer_size)
+            self.event_buffer[mission_id].append(event)
+            
+            if self._is_final(event):
+                self._finished_at[mission_id] = time.monotonic()
+            else:
+                self._finished_at.pop(mission_id, None)
+            
+            listeners = list(self.event_listeners.get(mission_id, ()))
         
         # Notify all listeners (one-way broadcast, no response expected)
-        if mission_id in self.event_listeners:
-            for callback in self.event_listeners[mission_id]:
-                try:
-                    callback(event)
-                except Exception as e:
-                    # Listener errors don't affect other listeners
-                    print(f"Listener error for {mission_id}: {e}")
+        for callback in listeners:
+            try:
+                callback(event)
+            except Exception as e:
+                # Listener errors don't affect other listeners
+                print(f"Listener error for {mission_id}: {e}")
+    
+    @staticmethod
+    def _is_final(event: StreamingEvent) -> bool:
+        if event.event_type == StreamingEventType.MISSION_STOP:
+            return True
+        if event.event_type == StreamingEventType.ANSWER_COMPLETE:
+            # Answer-only streams end here; any later event reopens the buffer
+            return True
+        return (
+            event.event_type == StreamingEventType.MISSION_STATUS_CHANGE
+            and event.data.get("new_status") in TERMINAL_MISSION_STATUSES
+        )
+    
+    def _expire_finished(self) -> None:
+        """Drop buffers of missions that finished more than finished_ttl ago"""
+        if not self._finished_at:
+            return
+        cutoff = time.monotonic() - self.finished_ttl
+        for mission_id, finished_at in list(self._finished_at.items()):
+            if finished_at <= cutoff:
+                del self._finished_at[mission_id]
+                self.event_buffer.pop(mission_id, None)
+                self.mission_sequences.pop(mission_id, None)
     
     def emit_mission_start(
         self,
@@ -484,6 +604,102 @@ class StreamingEventEmitter:
         )
         self.emit(event)
     
+    def emit_answer_delta(
+        self,
+        mission_id: str,
+        delta: str,
+        index: int,
+    ) -> None:
+        """Emit the next piece of an answer being generated"""
+        event = StreamingEvent(
+            mission_id=mission_id,
+            event_type=StreamingEventType.ANSWER_DELTA,
+            timestamp=datetime.utcnow(),
+            sequence_number=0,  # Will be overridden
+            data={
+                "delta": delta,
+                "index": index,
+            },
+        )
+        self.emit(event)
+    
+    def emit_answer_complete(
+        self,
+        mission_id: str,
+        answer: str,
+        deltas: int,
+        time_to_first_token_ms: Optional[float] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Emit the full answer once generation ends
+        
+        With an error the stream broke off: `completed` is False and the
+        answer is only the part generated before the failure.
+        """
+        event = StreamingEvent(
+            mission_id=mission_id,
+            event_type=StreamingEventType.ANSWER_COMPLETE,
+            timestamp=datetime.utcnow(),
+            sequence_number=0,  # Will be overridden
+            data={
+                "answer": answer,
+                "deltas": deltas,
+                "time_to_first_token_ms": time_to_first_token_ms,
+                "completed": error is None,
+                "error": error,
+                "completed_at": datetime.utcnow().isoformat(),
+            },
+        )
+        self.emit(event)
+    
+    def stream_answer(
+        self,
+        mission_id: str,
+        chunks: Iterable[str],
+        min_interval: float = ANSWER_DELTA_INTERVAL_SECONDS,
+    ) -> str:
+        """Emit answer deltas as chunks arrive and return the full answer
+        
+        The first chunk is emitted at once; later chunks are coalesced so a
+        token-per-event stream does not flood the replay buffer. An
+        answer_complete event is always emitted; if the chunks raise it is
+        marked incomplete and the error propagates to the caller.
+        """
+        parts: List[str] = []
+        pending: List[str] = []
+        deltas = 0
+        started = time.monotonic()
+        first_token_ms = None
+        last_emit = 0.0
+        
+        def flush() -> None:
+            nonlocal deltas, last_emit
+            if pending:
+                self.emit_answer_delta(mission_id, "".join(pending), deltas)
+                pending.clear()
+                deltas += 1
+                last_emit = time.monotonic()
+        
+        error = None
+        try:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                if first_token_ms is None:
+                    first_token_ms = round((time.monotonic() - started) * 1000, 1)
+                parts.append(chunk)
+                pending.append(chunk)
+                if deltas == 0 or time.monotonic() - last_emit >= min_interval:
+                    flush()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            flush()
+            answer = "".join(parts)
+            self.emit_answer_complete(mission_id, answer, deltas, first_token_ms, error=error)
+        return answer
+    
     def emit_mission_status_change(
         self,
         mission_id: str,
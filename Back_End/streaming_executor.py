@@ -4,10 +4,12 @@ Streaming execution wrapper that provides real-time progress updates via WebSock
 import logging
 import asyncio
 import json
+import uuid
 from typing import Dict, List, Optional, Callable
 from Back_End.agent import Agent
 from Back_End.goal_decomposer import goal_decomposer
 from Back_End.config import Config
+from Back_End.streaming_events import StreamingEventType, get_event_emitter
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -109,8 +111,8 @@ class StreamingExecutor:
             if state.get('done'):
                 break
         
-        # Final answer
-        final_answer = self._extract_answer(steps)
+        # Final answer (streamed as answer_delta updates when the LLM writes it)
+        final_answer = await self._stream_answer(goal, steps)
         
         await self.send_update({
             'type': 'execution_complete',
@@ -246,6 +248,45 @@ class StreamingExecutor:
             return obs_str[:200] + "..."
         return obs_str
     
+    async def _stream_answer(self, goal: str, steps: List[Dict]) -> str:
+        """Synthesize the answer with the LLM, forwarding each delta as it arrives"""
+        from Back_End.llm_client import llm_client
+        
+        if not (llm_client.enabled and steps):
+            return self._extract_answer(steps)
+        
+        loop = asyncio.get_running_loop()
+        deltas: asyncio.Queue = asyncio.Queue()
+        stream_id = f"ws_answer_{uuid.uuid4().hex}"
+        
+        def forward(event):
+            # Called on the synthesis thread
+            if event.event_type == StreamingEventType.ANSWER_DELTA:
+                loop.call_soon_threadsafe(deltas.put_nowait, event.data)
+        
+        emitter = get_event_emitter()
+        emitter.subscribe(stream_id, forward)
+        try:
+            synthesis = loop.run_in_executor(None, llm_client.synthesize_answer, goal, steps, stream_id)
+            while not synthesis.done():
+                next_delta = asyncio.ensure_future(deltas.get())
+                await asyncio.wait({next_delta, synthesis}, return_when=asyncio.FIRST_COMPLETED)
+                if next_delta.done():
+                    await self.send_update({'type': 'answer_delta', **next_delta.result()})
+                else:
+                    next_delta.cancel()
+            # Deltas queued before synthesis finished
+            while not deltas.empty():
+                await self.send_update({'type': 'answer_delta', **deltas.get_nowait()})
+            answer = synthesis.result()
+        except Exception as e:
+            logger.error(f"Answer streaming failed: {e}")
+            answer = None
+        finally:
+            emitter.unsubscribe(stream_id, forward)
+        
+        return answer or self._extract_answer(steps)
+    
     def _extract_answer(self, steps: List[Dict]) -> str:
         """Extract final answer from steps"""
         for step in reversed(steps):
@@ -26,6 +26,7 @@ class SystemHealthMonitor:
             "OpenAI": self._check_openai,
             "LLM Client": self._check_llm_client,
             "Mission Store": self._check_mission_store,
+            "Session Caches": self._check_session_caches,
         }
         
         # AGENT INTELLIGENCE
@@ -48,6 +49,7 @@ class SystemHealthMonitor:
         # TOOLS & EXECUTION
         tools_checks = {
             "Tool Registry": self._check_tool_registry,
+            "Mission Executor": self._check_mission_executor,
             "Web Scraper": self._check_web_scraper,
             "SerpAPI": self._check_serpapi,
             "Execution Stream": self._check_execution_stream,
@@ -150,15 +152,15 @@ class SystemHealthMonitor:
         try:
             from Back_End.conversation.session_store import get_conversation_store
             store = get_conversation_store()
-            # Try to get sessions (doesn't require API call, just local access)
             if store:
-                # Access the sessions via list_sessions() method
-                sessions = store.list_sessions()
-                if sessions:
+                # In-memory count only: list_sessions() would flush the writer
+                # and page through every session header in Firestore
+                cached = store.count_cached_sessions()
+                if cached:
                     return {
                         "status": "green",
                         "message": "Firebase session store accessible",
-                        "details": f"Loaded {len(sessions)} active sessions"
+                        "details": f"Loaded {cached} active sessions"
                     }
                 else:
                     return {
@@ -245,10 +247,17 @@ class SystemHealthMonitor:
             from Back_End.llm_client import LLMClient
             client = LLMClient()
             if client.enabled:
+                cache = client.get_cache_stats()
+                hit_rate = cache['hit_rate']
                 return {
                     "status": "green",
                     "message": "LLM Client initialized and enabled",
-                    "details": f"Provider: {client.provider}"
+                    "details": (
+                        f"Provider: {client.provider}; response cache: "
+                        f"{'n/a' if hit_rate is None else f'{hit_rate:.0%}'} hit rate, "
+                        f"{cache['memory_hits'] + cache['disk_hits']} hits/{cache['misses']} misses, "
+                        f"{cache['bypassed']} bypassed"
+                    )
                 }
             else:
                 return {
@@ -267,11 +276,18 @@ class SystemHealthMonitor:
         """Check Interaction Orchestrator"""
         try:
             from Back_End.interaction_orchestrator import InteractionOrchestrator
+            from Back_End.intent_fast_path import fast_intent_router
             orch = InteractionOrchestrator()
+            fast_path = fast_intent_router.stats()
+            hit_ratio = fast_path["hit_ratio"]
             return {
                 "status": "green",
                 "message": "Orchestrator initialized",
-                "details": "Ready to process intents and generate missions"
+                "details": (
+                    "Ready to process intents and generate missions; intent fast path: "
+                    f"{'n/a' if hit_ratio is None else f'{hit_ratio:.0%}'} hit ratio "
+                    f"({fast_path['hits']}/{fast_path['attempts']})"
+                )
             }
         except Exception as e:
             return {
@@ -304,6 +320,30 @@ class SystemHealthMonitor:
                 "error": str(e)
             }
     
+    def _check_session_caches(self) -> Dict[str, Any]:
+        """Check in-memory session caches"""
+        try:
+            from Back_End.session_cache import get_cache_stats
+            caches = get_cache_stats()
+            if not caches:
+                return {
+                    "status": "yellow",
+                    "message": "No session caches initialized",
+                    "details": None
+                }
+            return {
+                "status": "green",
+                "message": f"{len(caches)} session caches active",
+                "details": "; ".join(
+                    f"{name}: {c['entries']} entries, {c['bytes'] // 1024}KB, "
+                    f"{c['hits']} hits/{c['misses']} misses, "
+                    f"{c['evictions']} evicted, {c['expirations']} expired"
+                    for name, c in sorted(caches.items())
+                )
+            }
+        except Exception as e:
+            return {"status": "red", "message": "Session cache check failed", "error": str(e)}
+    
     def _check_action_readiness(self) -> Dict[str, Any]:
         """Check Action Readiness Engine"""
         try:
@@ -364,15 +404,37 @@ class SystemHealthMonitor:
             from Back_End.tool_registry import tool_registry
             if tool_registry and hasattr(tool_registry, 'tools'):
                 count = len(tool_registry.tools)
+                pool = tool_registry.get_pool_stats()
                 return {
-                    "status": "green",
+                    "status": "yellow" if pool["abandoned_running"] else "green",
                     "message": "Tool Registry accessible",
-                    "details": f"{count} tools registered"
+                    "details": (
+                        f"{count} tools registered, {pool['running']}/{pool['max_workers']} workers busy, "
+                        f"{pool['queued']} queued, {pool['abandoned_running']} timed out still running"
+                    )
                 }
             return {"status": "gray", "message": "Tool Registry empty", "details": None}
         except Exception as e:
             return {"status": "red", "message": "Tool Registry check failed", "error": str(e)}
     
+    def _check_mission_executor(self) -> Dict[str, Any]:
+        """Check Mission Executor"""
+        try:
+            from Back_End.execution import executor
+            metrics = executor.get_metrics()
+            return {
+                "status": "green" if executor.running else "yellow",
+                "message": "Mission Executor running" if executor.running else "Mission Executor not running",
+                "details": (
+                    f"{metrics['running']}/{metrics['workers']} workers busy, {metrics['queued']} queued, "
+                    f"{metrics['waiting_for_capacity']} waiting on tenant/tool caps, "
+                    f"p95 queue wait {metrics['queue_wait_ms']['p95']:.0f}ms, "
+                    f"p95 run time {metrics['run_time_ms']['p95']:.0f}ms"
+                )
+            }
+        except Exception as e:
+            return {"status": "red", "message": "Mission Executor check failed", "error": str(e)}
+    
     def _check_web_scraper(self) -> Dict[str, Any]:
         """Check Web Scraper"""
         try:
@@ -0,0 +1,177 @@
+"""
+Shared test fixtures.
+
+fake_firestore: an in-memory Firestore stand-in covering the client calls
+the stores make (collections, subcollections, collection-group queries,
+start_after paging, get_all and batched writes). Every round trip increments `rpcs`.
+"""
+
+import uuid
+
+import pytest
+
+
+class FakeSnapshot:
+    def __init__(self, db, path):
+        self.reference = db.ref(path)
+        self.id = path[-1]
+        self._data = db.docs.get(path)
+        self.exists = self._data is not None
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class FakeQuery:
+    def __init__(self, db, collection_path=None, group=None):
+        self.db = db
+        self.collection_path = collection_path
+        self.group = group
+        self.filters = []
+        self.ordering = None
+        self._limit = None
+        self._start_after = None
+
+    def _copy(self):
+        query = FakeQuery(self.db, self.collection_path, self.group)
+        query.filters = list(self.filters)
+        query.ordering = self.ordering
+        query._limit = self._limit
+        query._start_after = self._start_after
+        return query
+
+    def where(self, field, op, value):
+        query = self._copy()
+        query.filters.append((field, op, value))
+        return query
+
+    def select(self, fields):
+        return self._copy()
+
+    def order_by(self, field, direction='ASCENDING'):
+        query = self._copy()
+        query.ordering = (field, direction)
+        return query
+
+    def start_after(self, snapshot):
+        query = self._copy()
+        query._start_after = snapshot.reference.path
+        return query
+
+    def limit(self, count):
+        query = self._copy()
+        query._limit = count
+        return query
+
+    def _matches(self, data):
+        for field, op, value in self.filters:
+            if op == '==' and data.get(field) != value:
+                return False
+            if op == '>=' and not (data.get(field) is not None and data.get(field) >= value):
+                return False
+        return True
+
+    def stream(self):
+        self.db.rpcs += 1
+        if self.group and self.filters and self.db.missing_group_indexes:
+            raise RuntimeError("FAILED_PRECONDITION: The query requires an index")
+        paths = []
+        for path in sorted(self.db.docs):
+            in_scope = (
+                path[-2] == self.group if self.group
+                else path[:-1] == self.collection_path
+            )
+            if in_scope and self._matches(self.db.docs[path]):
+                paths.append(path)
+        if self.ordering:
+            field, direction = self.ordering
+            # Like Firestore, ordering drops documents without the field
+            paths = [p for p in paths if field in self.db.docs[p]]
+            paths.sort(key=lambda p: self.db.docs[p][field], reverse=direction == 'DESCENDING')
+        if self._start_after in paths:
+            paths = paths[paths.index(self._start_after) + 1:]
+        if self._limit:
+            paths = paths[:self._limit]
+        return iter([FakeSnapshot(self.db, path) for path in paths])
+
+
+class FakeCollection(FakeQuery):
+    def __init__(self, db, path):
+        super().__init__(db, collection_path=path)
+        self.path = path
+        self.id = path[-1]
+        self.parent = db.ref(path[:-1]) if len(path) > 1 else None
+
+    def document(self, doc_id=None):
+        return self.db.ref(self.path + (doc_id or uuid.uuid4().hex,))
+
+
+class FakeDocument:
+    def __init__(self, db, path):
+        self.db = db
+        self.path = path
+        self.id = path[-1]
+        self.parent = db.ref(path[:-1])
+
+    def collection(self, name):
+        return self.db.ref(self.path + (name,))
+
+    def set(self, data, merge=False):
+        base = self.db.docs.get(self.path, {}) if merge else {}
+        self.db.docs[self.path] = {**base, **data}
+
+    def delete(self):
+        self.db.docs.pop(self.path, None)
+
+    def get(self):
+        self.db.rpcs += 1
+        return FakeSnapshot(self.db, self.path)
+
+
+class FakeBatch:
+    def __init__(self, db):
+        self.db = db
+        self.ops = []
+
+    def set(self, ref, data, merge=False):
+        self.ops.append(lambda: ref.set(data, merge=merge))
+
+    def delete(self, ref):
+        self.ops.append(ref.delete)
+
+    def commit(self):
+        self.db.rpcs += 1
+        self.db.commits.append(len(self.ops))
+        for op in self.ops:
+            op()
+
+
+class FakeFirestore:
+    """Documents keyed by path tuple; counts every round trip"""
+
+    def __init__(self):
+        self.docs = {}
+        self.rpcs = 0
+        self.commits = []
+        self.missing_group_indexes = False
+
+    def ref(self, path):
+        return FakeCollection(self, path) if len(path) % 2 else FakeDocument(self, path)
+
+    def collection(self, name):
+        return self.ref((name,))
+
+    def collection_group(self, name):
+        return FakeQuery(self, group=name)
+
+    def get_all(self, refs):
+        self.rpcs += 1
+        return [FakeSnapshot(self, ref.path) for ref in refs]
+
+    def batch(self):
+        return FakeBatch(self)
+
+
+@pytest.fixture
+def fake_firestore():
+    return FakeFirestore()
@@ -0,0 +1,176 @@
+"""
+Answer streaming - Validation Tests
+
+Tests that LLMClient streams completions chunk by chunk (sync and async)
+from the offline fake provider, that a stream broken off mid-answer is
+reported as a failure (answer_complete marked incomplete, no truncated
+answer returned), that synthesize_answer emits the first answer_delta
+before generation finishes and coalesces the rest, that the /ws
+StreamingExecutor forwards deltas to its WebSocket as they arrive, and
+that /chat runs the executor off the event loop so a /ws/stream client
+gets the first delta while the answer is still being generated.
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+
+import pytest
+
+from Back_End import llm_client as llm_client_module
+from Back_End import streaming_events
+from Back_End.llm_client import FakeStreamingProvider, LLMClient, LLMStreamError
+from Back_End.streaming_events import StreamingEventEmitter, StreamingEventType
+from Back_End.streaming_executor import StreamingExecutor
+
+
+ANSWER = "Paris is the capital of France and its largest city."
+STEPS = [{'tool': 'web_search', 'observation': {'result': 'Paris'}}]
+
+
+def _fake_client(monkeypatch, delay=0.0, chunk_size=1):
+    monkeypatch.setenv('LLM_PROVIDER', 'fake')
+    client = LLMClient()
+    client._init_fake(FakeStreamingProvider([ANSWER], chunk_size=chunk_size, delay=delay))
+    return client
+
+
+def test_fake_provider_streams_sync_and_async(monkeypatch):
+    client = _fake_client(monkeypatch)
+    assert client.enabled and client.provider == 'fake'
+
+    chunks = list(client.stream_complete("capital of France?"))
+    assert len(chunks) == len(ANSWER.split()) and "".join(chunks) == ANSWER
+    assert client.complete("capital of France?") == ANSWER
+
+    async def collect():
+        return [chunk async for chunk in client.astream_complete("capital of France?")]
+
+    assert "".join(asyncio.run(collect())) == ANSWER
+    assert len(client.fake_provider.calls) == 3
+    assert client.get_last_usage()['output_tokens'] == len(ANSWER.split())
+
+
+def test_stream_error_is_reported_not_truncated(monkeypatch):
+    client = _fake_client(monkeypatch)
+
+    def broken(*args):
+        yield "Paris"
+        raise ConnectionError("stream reset")
+
+    monkeypatch.setattr(client.fake_provider, 'stream', broken)
+    received = []
+    with pytest.raises(LLMStreamError, match="stream reset"):
+        for chunk in client.stream_complete("capital?"):
+            received.append(chunk)
+    assert received == ["Paris"]
+
+    emitter = StreamingEventEmitter()
+    monkeypatch.setattr(streaming_events, '_global_emitter', emitter)
+    events = []
+    emitter.subscribe('answer-2', events.append)
+
+    assert client.synthesize_answer("capital?", STEPS, stream_id='answer-2') is None
+    complete = events[-1]
+    assert complete.event_type == StreamingEventType.ANSWER_COMPLETE
+    assert complete.data['completed'] is False and 'stream reset' in complete.data['error']
+    assert complete.data['answer'] == "Paris"
+
+
+def test_first_delta_arrives_before_generation_finishes(monkeypatch):
+    client = _fake_client(monkeypatch, delay=0.02)
+    emitter = StreamingEventEmitter()
+    monkeypatch.setattr(streaming_events, '_global_emitter', emitter)
+    received = []
+    emitter.subscribe('answer-1', lambda event: received.append((time.monotonic(), event)))
+
+    started = time.monotonic()
+    answer = client.synthesize_answer("capital of France?", STEPS, stream_id='answer-1')
+    finished = time.monotonic()
+
+    assert answer == ANSWER
+    deltas = [e for _, e in received if e.event_type == StreamingEventType.ANSWER_DELTA]
+    complete = received[-1][1]
+    assert complete.event_type == StreamingEventType.ANSWER_COMPLETE
+    assert "".join(e.data['delta'] for e in deltas) == ANSWER == complete.data['answer']
+    assert complete.data['completed'] is True and complete.data['error'] is None
+    # Every word as its own event would be 10; the 50ms window coalesces them
+    assert 1 < len(deltas) < len(ANSWER.split()) and complete.data['deltas'] == len(deltas)
+    assert received[0][0] - started < (finished - started) / 2
+    assert complete.data['time_to_first_token_ms'] < 100
+
+
+def test_streaming_executor_forwards_deltas(monkeypatch):
+    client = _fake_client(monkeypatch, delay=0.01, chunk_size=3)
+    monkeypatch.setattr(llm_client_module, 'llm_client', client)
+
+    class _FakeWebSocket:
+        def __init__(self):
+            self.sent = []
+
+        async def send_json(self, update):
+            self.sent.append(update)
+
+    websocket = _FakeWebSocket()
+    executor = StreamingExecutor(websocket)
+    answer = asyncio.run(executor._stream_answer("capital of France?", STEPS))
+
+    assert answer == ANSWER
+    deltas = [u for u in websocket.sent if u['type'] == 'answer_delta']
+    assert deltas and "".join(u['delta'] for u in deltas) == ANSWER
+    assert [u['index'] for u in deltas] == list(range(len(deltas)))
+    listeners = streaming_events.get_event_emitter().event_listeners
+    assert not [stream_id for stream_id in listeners if stream_id.startswith('ws_answer_')]
+
+
+def test_disabled_llm_falls_back_to_observation(monkeypatch):
+    class _Disabled:
+        enabled = False
+
+    monkeypatch.setattr(llm_client_module, 'llm_client', _Disabled())
+    steps = [{'observation': {'answer': 'Paris'}}]
+    assert asyncio.run(StreamingExecutor()._stream_answer("capital?", steps)) == 'Paris'
+
+
+def test_chat_endpoint_delivers_first_delta_before_answer_completes(monkeypatch):
+    main = pytest.importorskip("Back_End.main")
+    from fastapi.testclient import TestClient
+
+    first_delta_seen = threading.Event()
+    seen_while_generating = []
+
+    def slow_chunks():
+        yield "Paris"
+        # Generation stays open until the client has the first delta
+        seen_while_generating.append(first_delta_seen.wait(5))
+        yield " is the capital."
+
+    def fake_execute_goal(goal, domain=None, stream_id=None):
+        answer = streaming_events.get_event_emitter().stream_answer(stream_id, slow_chunks())
+        return {'final_answer': answer}
+
+    class _Tracker:
+        def record_goal(self, **kwargs):
+            return {'id': 'goal-1'}
+
+        def record_response(self, **kwargs):
+            pass
+
+    monkeypatch.setattr(main, 'execute_goal', fake_execute_goal)
+    monkeypatch.setattr(main, 'success_tracker', _Tracker())
+    stream_id = f"chat-{uuid.uuid4().hex}"
+
+    # One TestClient portal: the request and the socket share an event loop, as under uvicorn
+    with TestClient(main.app) as client, client.websocket_connect(f"/ws/stream/{stream_id}") as ws:
+        responses = []
+        request = threading.Thread(target=lambda: responses.append(
+            client.post("/chat", params={'goal': 'capital?', 'stream_id': stream_id})))
+        request.start()
+        first = ws.receive_json()
+        first_delta_seen.set()
+        request.join(10)
+
+    assert first['event_type'] == 'answer_delta' and first['data']['delta'] == 'Paris'
+    assert seen_while_generating == [True]
+    assert responses[0].json()['final_answer'] == "Paris is the capital."
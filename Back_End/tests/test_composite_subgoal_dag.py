@@ -0,0 +1,113 @@
+"""
+Composite subgoal DAG - Validation Tests
+
+Tests that independent subgoals of a composite goal run concurrently,
+that synthesis subgoals wait for the subgoals before them, that results
+come back in subgoal order, and that a subgoal past its deadline is
+reported as timed out without holding up the rest.
+"""
+
+import threading
+import time
+
+import pytest
+
+from Back_End import composite_agent
+from Back_End.composite_agent import CompositeAgentExecutor
+
+
+class _State:
+    def __init__(self):
+        self.done = False
+        self.confidence = 0.9
+
+
+class _FakeAgent:
+    """One-step agent whose step sleeps for the delay named in its goal"""
+
+    delays = {}
+    events = []
+    lock = threading.Lock()
+
+    def __init__(self, goal, domain=None):
+        self.goal = goal
+        self.state = _State()
+
+    def step(self):
+        with self.lock:
+            self.events.append(('start', self.goal))
+        time.sleep(self.delays.get(self.goal, 0.0))
+        with self.lock:
+            self.events.append(('end', self.goal))
+        self.state.done = True
+        return {'done': True, 'decision': {'tool': 'web_search'}, 'observation': {'results': [self.goal]}}
+
+
+def _executor(monkeypatch, subgoals, delays, workers=4, timeout=5.0):
+    monkeypatch.setattr(composite_agent, 'AtomicAgent', _FakeAgent)
+    monkeypatch.setattr(composite_agent.Config, 'COMPOSITE_SUBGOAL_WORKERS', workers)
+    monkeypatch.setattr(composite_agent.Config, 'COMPOSITE_SUBGOAL_TIMEOUT_SECONDS', timeout)
+    _FakeAgent.delays = delays
+    _FakeAgent.events = []
+    executor = CompositeAgentExecutor.__new__(CompositeAgentExecutor)
+    executor.goal = 'compare a and b'
+    executor.domain = None
+    executor.is_composite = True
+    executor.subgoals = [
+        {'index': i, 'goal': goal, 'type': sg_type, 'confidence': 0.9}
+        for i, (goal, sg_type) in enumerate(subgoals)
+    ]
+    return executor
+
+
+def test_independent_subgoals_run_concurrently_then_synthesis(monkeypatch):
+    executor = _executor(
+        monkeypatch,
+        [('research a', 'research'), ('research b', 'research'), ('combine', 'synthesis')],
+        {'research a': 0.3, 'research b': 0.3, 'combine': 0.05},
+    )
+
+    started = time.monotonic()
+    result = executor.execute()
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.55  # longest branch (0.35s), not the sum (0.65s)
+    assert [r['subgoal_index'] for r in result['subgoal_results']] == [0, 1, 2]
+    assert result['total_steps'] == 3
+    events = _FakeAgent.events
+    assert events.index(('start', 'combine')) > events.index(('end', 'research a'))
+    assert events.index(('start', 'combine')) > events.index(('end', 'research b'))
+
+
+def test_worker_limit_and_explicit_dependencies(monkeypatch):
+    executor = _executor(
+        monkeypatch,
+        [('a', 'general'), ('b', 'general'), ('c', 'general')],
+        {'a': 0.1, 'b': 0.1, 'c': 0.0},
+        workers=1,
+    )
+    executor.subgoals[1]['depends_on'] = [2]  # later subgoals cannot be prerequisites
+    executor.subgoals[2]['depends_on'] = [0]
+
+    result = executor.execute()
+
+    assert [r['subgoal'] for r in result['subgoal_results']] == ['a', 'b', 'c']
+    assert [goal for kind, goal in _FakeAgent.events if kind == 'start'] == ['a', 'b', 'c']
+    assert executor._subgoal_dependencies() == {0: set(), 1: set(), 2: {0}}
+
+
+def test_slow_subgoal_times_out_without_blocking_others(monkeypatch):
+    executor = _executor(
+        monkeypatch,
+        [('stuck', 'research'), ('quick', 'research'), ('wrap up', 'synthesis')],
+        {'stuck': 1.0},
+        timeout=0.2,
+    )
+
+    started = time.monotonic()
+    results = executor.execute()['subgoal_results']
+
+    assert time.monotonic() - started < 0.8
+    assert [r['timed_out'] for r in results] == [True, False, False]
+    assert results[0]['steps'] == 0 and results[1]['key_findings']
+    assert results[2]['confidence'] == pytest.approx(0.9)
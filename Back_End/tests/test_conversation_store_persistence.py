@@ -0,0 +1,146 @@
+"""
+ConversationStore persistence - Validation Tests
+
+Tests that messages are written append-only (one document per message,
+never the whole history), that writes are batched off the caller, that
+startup loads only recent session headers and pages messages in on use,
+that listings page through every stored header, that a cache miss only
+waits for queued writes of that session, and that sessions stored with an
+in-document message array still load.
+"""
+
+import pytest
+
+from Back_End.conversation.session_store import ConversationStore
+
+
+def _store(db, preload=None):
+    store = ConversationStore()
+    store._db = db
+    store._collection = db.collection('conversation_sessions')
+    store._firebase_enabled = True
+    if preload is not None:
+        store._load_from_firebase(limit=preload)
+    return store
+
+
+def _message_docs(db, session_id):
+    return {
+        path[-1]: data for path, data in db.docs.items()
+        if path[:3] == ('conversation_sessions', session_id, 'messages')
+    }
+
+
+def test_messages_are_appended_as_documents_in_batches(fake_firestore):
+    db = fake_firestore
+    store = _store(db)
+    store.get_or_create('s1', source='chat_ui', external_user_id=None)
+    for i in range(30):
+        store.append_message('s1', 'user' if i % 2 == 0 else 'assistant', f"text {i}", 'chat_ui')
+    assert store.flush()
+
+    messages = _message_docs(db, 's1')
+    assert len(messages) == 30
+    assert messages['00000030']['text'] == "text 29"
+    header = db.docs[('conversation_sessions', 's1')]
+    assert 'messages' not in header
+    assert header['message_count'] == 30
+    assert header['role_counts'] == {'user': 15, 'assistant': 15}
+    # Far fewer commits than writes, and no commit carries the history
+    assert len(db.commits) < 30
+    assert max(db.commits) <= 31
+
+
+def test_startup_pages_in_recent_headers_then_messages_on_use(fake_firestore):
+    db = fake_firestore
+    writer = _store(db)
+    for n in range(5):
+        writer.get_or_create(f"s{n}", source='chat_ui', external_user_id=None)
+        writer.append_message(f"s{n}", 'user', f"hello {n}", 'chat_ui')
+        writer.flush()
+
+    db.rpcs = 0
+    store = _store(db, preload=3)
+    assert db.rpcs == 1
+    assert {session_id for session_id, _ in store._sessions.items()} == {'s2', 's3', 's4'}
+    summary = store.list_sessions()[0]
+    assert not summary.messages_loaded
+    assert summary.message_count == 1 and summary.role_count('user') == 1
+
+    session = store.get_session('s4')
+    assert [m.text for m in session.messages] == ["hello 4"]
+
+    # Older sessions are fetched on first access and keep appending in order
+    store.append_message('s0', 'assistant', "welcome back", 'chat_ui')
+    store.flush()
+    assert [m.message_id for m in store.get_session('s0').messages] == ['msg_1', 'msg_2']
+    assert sorted(_message_docs(db, 's0')) == ['00000001', '00000002']
+
+
+def test_list_sessions_pages_through_stored_headers(fake_firestore):
+    db = fake_firestore
+    writer = _store(db)
+    for n in range(7):
+        writer.get_or_create(f"s{n}", source='chat_ui', external_user_id=None)
+        writer.flush()
+
+    store = _store(db, preload=2)
+    db.rpcs = 0
+    listed = store.list_sessions(page_size=3)
+    assert [s.session_id for s in listed] == [f"s{n}" for n in range(6, -1, -1)]
+    assert db.rpcs == 3
+    # Cached sessions are returned as is, not rebuilt from their header
+    assert listed[0] is store._sessions.get('s6')
+
+    # A session created but not yet written is listed too
+    store.get_or_create('new', source='chat_ui', external_user_id=None)
+    assert store.list_sessions()[0].session_id == 'new'
+
+
+def test_cache_miss_waits_only_for_that_sessions_writes(fake_firestore, monkeypatch):
+    db = fake_firestore
+    store = _store(db)
+    store.get_or_create('s1', source='chat_ui', external_user_id=None)
+    store.flush()
+    reader = _store(db)
+    flushes = []
+    monkeypatch.setattr(reader, 'flush', lambda timeout=5.0: flushes.append(1) or True)
+
+    reader.get_session('s1')
+    assert flushes == []
+
+    reader._queued_writes['s2'] += 1
+    reader.get_session('s2')
+    assert flushes == [1]
+
+
+def test_sessions_with_in_document_messages_still_load(fake_firestore):
+    db = fake_firestore
+    db.collection('conversation_sessions').document('old').set({
+        'session_id': 'old', 'source': 'telegram', 'external_user_id': 'u1',
+        'messages': [
+            {'message_id': 'msg_1', 'role': 'user', 'text': 'hi', 'timestamp': 't1', 'source': 'telegram'},
+        ],
+        'linked_goals': [], 'title': '', 'archived': False,
+    })
+
+    store = _store(db, preload=10)
+    assert store.get_session('old').message_count == 1
+
+    store.append_message('old', 'assistant', 'hello again', 'buddy_core')
+    store.flush()
+    reloaded = _store(db)
+    assert [m.text for m in reloaded.get_session('old').messages] == ['hi', 'hello again']
+
+
+def test_delete_removes_session_and_messages(fake_firestore):
+    db = fake_firestore
+    store = _store(db)
+    store.get_or_create('gone', source='chat_ui', external_user_id=None)
+    store.append_message('gone', 'user', 'bye', 'chat_ui')
+
+    assert store.delete_session('gone')
+    store.flush()
+    assert not [path for path in db.docs if path[:2] == ('conversation_sessions', 'gone')]
+    with pytest.raises(ValueError):
+        store.append_message('gone', 'user', 'still there?', 'chat_ui')
@@ -0,0 +1,114 @@
+"""
+Intent fast path - Validation Tests
+
+Tests that unambiguous messages (acknowledgments, status checks, URL
+extracts, plain questions) are classified by the single-pass pattern
+scorer, that close calls and negated commands escalate to the LLM, that
+dates and phone numbers are not read as arithmetic, that the hit ratio is
+reported, and that a fast-path turn makes no LLM call at all.
+"""
+
+import pytest
+
+from Back_End import llm_client as llm_client_module
+from Back_End import observability
+from Back_End.intent_fast_path import FastIntentRouter
+from Back_End.interaction_orchestrator import DeterministicIntentClassifier, InteractionOrchestrator, IntentType
+
+
+@pytest.fixture(autouse=True)
+def trace_sink(tmp_path, monkeypatch):
+    """Decision traces go to tmp_path, not outputs/debug"""
+    monkeypatch.setattr(observability, 'DEBUG_DIR', tmp_path)
+    monkeypatch.setattr(observability, 'DECISION_TRACES_FILE', tmp_path / 'decision_traces.jsonl')
+    monkeypatch.setattr(observability, 'DUPLICATES_FILE', tmp_path / 'duplicates.jsonl')
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    """Orchestrator whose learning signals go to tmp_path, not outputs/phase25"""
+    orchestrator = InteractionOrchestrator()
+    orchestrator.signals_file = tmp_path / 'learning_signals.jsonl'
+    return orchestrator
+
+
+@pytest.mark.parametrize("message, intent", [
+    ("thanks", "acknowledgment"),
+    ("What's the status of my current missions?", "status"),
+    ("are you online?", "status"),
+    ("extract prices from shop.com", "execute"),
+    ("can you get the team page from https://example.com/about?", "execute"),
+    ("I need contact info from example.com", "execute"),
+    ("calculate 15 * 4", "execute"),
+    ("what is 10 - 3", "execute"),
+    ("How do I scrape a website?", "question"),
+    ("What is Python?", "question"),
+    ("Can you predict future trends based on historical data?", "forecast"),
+    ("help", "informational"),
+])
+def test_unambiguous_messages_take_the_fast_path(message, intent):
+    decision = FastIntentRouter(min_score=2.5, margin=1.5).route(message)
+    assert decision is not None and decision.intent == intent
+    assert 0.6 <= decision.confidence <= 0.95
+
+
+def test_close_calls_escalate_and_hit_ratio_is_reported():
+    router = FastIntentRouter(min_score=2.5, margin=1.5)
+    for message in ["do it again", "xyz abc qwerty", "tell me about prices on shop.com", "thanks"]:
+        router.route(message)
+
+    scores, _ = router.score("tell me about prices on shop.com")
+    assert scores == {'question': 2.5, 'execute': 2.5}  # tie: the LLM decides
+    stats = router.stats()
+    assert stats['hits'] == 1 and stats['escalations'] == 3 and stats['hit_ratio'] == 0.25
+    assert stats['hits_by_intent'] == {'acknowledgment': 1}
+
+
+@pytest.mark.parametrize("message", [
+    "dont open google.com",
+    "Don't open google.com",
+    "please do not navigate to example.com",
+    "stop searching for cats",
+    "cancel the scrape of shop.com",
+])
+def test_negated_commands_escalate(message):
+    router = FastIntentRouter(min_score=2.5, margin=1.5)
+    assert router.route(message) is None
+    assert router.stats()['negations'] == 1
+
+
+@pytest.mark.parametrize("message", [
+    "2024-01-05 report",
+    "call 555-123-4567",
+    "dates 1/5/2024 and 2/5/2024",
+    "release v2.0-1 notes",
+])
+def test_dates_and_phone_numbers_are_not_arithmetic(message):
+    router = FastIntentRouter(min_score=2.5, margin=1.5)
+    scores, _ = router.score(message.lower())
+    assert scores.get('execute', 0.0) < 5.5
+    assert router.route(message) is None
+
+
+def test_classifier_escalates_only_below_the_margin(monkeypatch):
+    calls = []
+    classifier = DeterministicIntentClassifier()
+    monkeypatch.setattr(classifier, '_classify_with_llm', lambda message: calls.append(message))
+
+    result = classifier.classify("Get product names and prices from amazon.com")
+    assert result.intent_type == IntentType.REQUEST_EXECUTION and result.actionable
+    assert 'get' in result.keywords
+    classifier.classify("do it again")
+    assert calls == ["do it again"]
+
+
+def test_fast_path_turn_never_calls_the_llm(monkeypatch, orchestrator):
+    calls = []
+    client = llm_client_module.llm_client
+    monkeypatch.setattr(client, 'enabled', True)
+    monkeypatch.setattr(client, 'complete', lambda *args, **kwargs: calls.append(kwargs.get('call_site')))
+
+    orchestrator.process_message("thanks", "fast-session")
+    orchestrator.process_message("What's the status of my missions?", "fast-session")
+
+    assert calls == []
@@ -0,0 +1,79 @@
+"""
+JSONL tail reader - Validation Tests
+
+Tests that records read backwards in blocks match a full forward parse
+(including lines that straddle blocks), that predicates and partial
+lines are handled, that only the tail of the file is read, and that the
+dashboard readers return the same recent records as before.
+"""
+
+import json
+from pathlib import Path
+
+from Back_End import jsonl_tail
+from Back_End.jsonl_tail import iter_jsonl_reverse, tail_jsonl
+from Back_End.phase25_dashboard_aggregator import Phase25DashboardAggregator
+
+
+def _write(path: Path, records, trailer: str = "") -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+        f.write(trailer)
+
+
+def test_reverse_blocks_match_forward_parse(tmp_path):
+    log = tmp_path / "log.jsonl"
+    records = [{"i": i, "pad": "x" * (i % 37), "text": "ü" * (i % 5)} for i in range(500)]
+    _write(log, records)
+
+    for block_size in (7, 64, 4096):
+        assert list(iter_jsonl_reverse(log, block_size=block_size)) == records[::-1]
+        assert tail_jsonl(log, 3, block_size=block_size) == records[-3:]
+
+
+def test_predicate_blank_and_partial_lines(tmp_path):
+    log = tmp_path / "log.jsonl"
+    records = [{"i": i, "kind": "even" if i % 2 == 0 else "odd"} for i in range(20)]
+    _write(log, records[:10], trailer="\n\nnot json\n")
+    with open(log, "a", encoding="utf-8") as f:
+        for record in records[10:]:
+            f.write(json.dumps(record) + "\n")
+        f.write('{"i": 99, "kind": "ev')  # writer mid-append
+
+    evens = tail_jsonl(log, 4, predicate=lambda r: r["kind"] == "even", block_size=16)
+    assert [r["i"] for r in evens] == [12, 14, 16, 18]
+    assert tail_jsonl(log, 100) == records
+    assert tail_jsonl(tmp_path / "missing.jsonl", 5) == []
+    assert tail_jsonl(log, 0) == []
+
+
+def test_only_the_tail_of_a_large_log_is_decoded(tmp_path, monkeypatch):
+    log = tmp_path / "log.jsonl"
+    _write(log, ({"i": i} for i in range(50_000)))
+
+    decoded = []
+    real_decode = jsonl_tail._decode
+    monkeypatch.setattr(jsonl_tail, "_decode", lambda line: decoded.append(line) or real_decode(line))
+
+    assert [r["i"] for r in tail_jsonl(log, 10, block_size=1024)] == list(range(49_990, 50_000))
+    assert len(decoded) < 200
+
+
+def test_dashboard_readers_return_most_recent_records(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    data_dir = tmp_path / "outputs" / "phase25"
+    data_dir.mkdir(parents=True)
+    _write(data_dir / "tool_execution_log.jsonl", [{"execution_id": f"e{i}"} for i in range(30)])
+    _write(data_dir / "missions.jsonl", [
+        {"event_type": "mission_created" if i % 3 == 0 else "mission_status_update",
+         "mission": {"mission_id": f"m{i}", "objective": {"description": f"goal {i}"}}}
+        for i in range(30)
+    ])
+    _write(data_dir / "learning_signals.jsonl", [{"signal_type": "selector_outcome", "n": i} for i in range(30)])
+
+    aggregator = Phase25DashboardAggregator(data_dir=str(data_dir))
+
+    assert [e["execution_id"] for e in aggregator._get_recent_executions(limit=3)] == ["e27", "e28", "e29"]
+    assert [m["mission_id"] for m in aggregator._get_recent_missions(limit=2)] == ["m24", "m27"]
+    assert [s["n"] for s in aggregator._get_learning_signals(limit=2)] == [28, 29]
@@ -0,0 +1,126 @@
+"""
+LLM response cache - Validation Tests
+
+Tests that repeated deterministic completions are served from the cache
+keyed on the full request, that high-temperature and unnamed calls always
+reach the provider, that entries survive a restart through the SQLite tier
+and expire after their call site's TTL, that a response the call site's
+validator rejects is returned but not cached, and that hit rates are
+reported per call site.
+"""
+
+import pytest
+
+from Back_End import llm_client as llm_client_module
+from Back_End.llm_client import LLMClient
+from Back_End.llm_response_cache import CALL_SITE_TTLS, LLMResponseCache, is_json_object
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    cache = LLMResponseCache(str(tmp_path / "llm_cache.db"), max_temperature=0.3, default_ttl=60, clock=clock)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def client(cache, monkeypatch):
+    monkeypatch.setattr(llm_client_module, 'get_llm_response_cache', lambda: cache)
+    client = LLMClient.__new__(LLMClient)
+    client.provider = 'openai'
+    client.enabled = True
+    client.model = 'gpt-test'
+    client.calls = []
+
+    def fake_complete(prompt, system_prompt, max_tokens, temperature):
+        client.calls.append((prompt, temperature, max_tokens))
+        return None if prompt == 'fail' else f"answer {len(client.calls)}"
+
+    client._complete_openai = fake_complete
+    return client
+
+
+def test_repeated_calls_hit_the_cache(client, cache):
+    first = client.complete("classify: hi", max_tokens=200, temperature=0.3, call_site='intent_classification')
+    again = client.complete("classify: hi", max_tokens=200, temperature=0.3, call_site='intent_classification')
+    assert first == again == "answer 1"
+    assert client.get_last_usage()['cached'] is True
+
+    # Any part of the request changes the key
+    client.complete("classify: hi", max_tokens=100, temperature=0.3, call_site='intent_classification')
+    client.complete("classify: hi", max_tokens=200, temperature=0.2, call_site='intent_classification')
+    client.complete("classify: hi", system_prompt="be brief", max_tokens=200, temperature=0.3,
+                    call_site='intent_classification')
+    assert len(client.calls) == 4
+
+    stats = client.get_cache_stats()
+    assert stats['memory_hits'] == 1 and stats['misses'] == 4 and stats['stores'] == 4
+    assert stats['call_sites']['intent_classification']['hit_rate'] == pytest.approx(0.2)
+
+
+def test_hot_unnamed_and_failed_calls_reach_the_provider(client, cache):
+    for _ in range(2):
+        client.complete("write a poem", temperature=0.7, call_site='tool_input')
+        client.complete("summarize", temperature=0.3)
+        client.complete("fail", temperature=0.1, call_site='semantic_normalization')
+    assert len(client.calls) == 6
+
+    stats = cache.stats()
+    assert stats['call_sites']['tool_input'] == {'bypassed': 2, 'hit_rate': None}
+    assert stats['call_sites']['semantic_normalization']['misses'] == 2
+    assert stats['stores'] == 0
+
+
+def test_disk_tier_survives_restart_and_entries_expire(tmp_path, cache, clock):
+    cache.put('k1', 'classified', 'intent_classification')
+    cache.put('k2', 'normalized', 'semantic_normalization')
+    cache.close()
+
+    restarted = LLMResponseCache(str(tmp_path / "llm_cache.db"), clock=clock)
+    assert restarted.get('k1', 'intent_classification') == 'classified'
+    assert restarted.get('k1', 'intent_classification') == 'classified'
+    stats = restarted.stats()
+    assert stats['disk_hits'] == 1 and stats['memory_hits'] == 1
+
+    # Past the intent TTL, still inside the normalization TTL
+    clock.now += CALL_SITE_TTLS['intent_classification'] + 1
+    assert restarted.get('k1', 'intent_classification') is None
+    assert restarted.get('k2', 'semantic_normalization') == 'normalized'
+    restarted.close()
+
+
+def test_rejected_responses_are_not_cached(client, cache):
+    replies = iter(['{"intent_type": "exec', '```json\n{"intent_type": "execute"}\n```'])
+    client._complete_openai = lambda *args: next(replies)
+
+    truncated = client.complete("classify: hi", temperature=0.1, call_site='intent_classification',
+                                validate=is_json_object)
+    retried = client.complete("classify: hi", temperature=0.1, call_site='intent_classification',
+                              validate=is_json_object)
+    cached = client.complete("classify: hi", temperature=0.1, call_site='intent_classification',
+                             validate=is_json_object)
+
+    assert truncated == '{"intent_type": "exec'
+    assert retried == cached == '```json\n{"intent_type": "execute"}\n```'
+    counts = cache.stats()['call_sites']['intent_classification']
+    assert counts['rejected'] == 1 and counts['stores'] == 1 and counts['memory_hits'] == 1
+
+    def raising(response):
+        raise ValueError("bad")
+
+    client._complete_openai = lambda *args: "anything"
+    client.complete("extract: x", temperature=0.1, call_site='tool_input', validate=raising)
+    assert cache.stats()['call_sites']['tool_input']['rejected'] == 1
@@ -0,0 +1,102 @@
+"""
+LocalMissionStore - Validation Tests
+
+Tests that mission events are written through pooled WAL connections,
+that batches and sync marks are single transactions (an unserializable
+event fails its batch instead of raising), that a read does
+not wait on a write in progress, and that the sync scan uses the
+(synced, id) covering index.
+"""
+
+import threading
+import time
+
+import pytest
+
+from Back_End.local_mission_store import LocalMissionStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LocalMissionStore(str(tmp_path / "missions.db"), pool_size=3)
+    yield store
+    store.close()
+
+
+def _event(i, mission_id=None):
+    return {
+        'mission_id': mission_id or f"m{i % 10}",
+        'event_type': 'progress',
+        'status': 'active',
+        'timestamp': f"2026-01-01T00:00:{i % 60:02d}",
+        'step': i,
+    }
+
+
+def test_batch_write_and_mark_synced(store):
+    assert store.write_mission_event(_event(0, 'solo'))
+    assert store.write_mission_events([_event(i) for i in range(1, 1500)]) == 1499
+
+    unsynced = store.get_unsynced_events(limit=2000)
+    assert len(unsynced) == 1500
+    assert [e['data']['step'] for e in unsynced[:3]] == [0, 1, 2]  # write order
+
+    assert store.mark_synced([e['row_id'] for e in unsynced[:1200]])  # above SQLite's 999-variable limit
+    assert [e['data']['step'] for e in store.get_unsynced_events()] == list(range(1200, 1300))
+    stats = store.get_stats()
+    assert stats['total_events'] == 1500 and stats['unsynced_events'] == 300
+
+    assert store.write_mission_events([_event(9000)], synced=True) == 1
+    assert store.get_stats()['unsynced_events'] == 300
+
+
+def test_failed_batch_writes_nothing(store):
+    bad = {'mission_id': 'm1'}  # event_type is NOT NULL
+    assert store.write_mission_events([_event(1), bad]) == 0
+    assert store.get_stats()['total_events'] == 0
+
+    unserializable = dict(_event(2), payload=object())
+    assert store.write_mission_event(unserializable) is False
+    assert store.write_mission_events([_event(3), unserializable]) == 0
+    assert store.get_stats()['total_events'] == 0
+
+
+def test_reads_do_not_wait_for_a_write_in_progress(store):
+    store.write_mission_event(_event(1, 'm1'))
+    writing = threading.Event()
+
+    def slow_write():
+        with store._lock, store._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("INSERT INTO missions (mission_id, event_type, timestamp, data) VALUES ('m2', 'x', 't', '{}')")
+            writing.set()
+            time.sleep(0.5)
+            conn.commit()
+
+    writer = threading.Thread(target=slow_write)
+    writer.start()
+    writing.wait(2)
+    started = time.monotonic()
+    assert [e['step'] for e in store.get_mission_events('m1')] == [1]
+    assert time.monotonic() - started < 0.25
+    writer.join()
+    assert 'm2' in store.list_missions()
+
+
+def test_wal_pool_and_sync_index(store):
+    for i in range(20):
+        store.get_mission_events('m1')
+    assert store._open_connections == 1  # connections are reused, not reopened
+
+    with store._get_connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        plan = ' '.join(
+            str(row[-1]) for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id, data FROM missions WHERE synced = 0 ORDER BY id LIMIT 10"
+            )
+        )
+    assert 'idx_synced_id' in plan and 'TEMP B-TREE' not in plan
+
+    store.close()
+    assert store._open_connections == 0
+    assert store.get_stats()['total_events'] == 0  # reopens on demand
@@ -0,0 +1,118 @@
+"""
+Fused message understanding - Validation Tests
+
+Tests that a chat turn makes one LLM call for normalization, intent
+classification and readiness fields, that a section missing from the
+fused response (or a failed fused call) falls back to that stage's own
+call, and that readiness uses the fused fields without extracting again.
+"""
+
+import json
+
+import pytest
+
+from Back_End import llm_client as llm_client_module
+from Back_End import observability
+from Back_End.action_readiness_engine import ActionReadinessEngine, ReadinessDecision
+from Back_End.interaction_orchestrator import InteractionOrchestrator, IntentType
+from Back_End.message_understanding import understand_message
+
+
+FUSED = {
+    "normalization": {"normalized_text": "explain python", "confidence": 0.4, "reason": "ambiguous"},
+    "intent": {"intent_type": "question", "confidence": 0.9, "actionable": False,
+               "reasoning": "asks for information", "keywords": ["python"]},
+    "fields": {"action_object": None, "source_url": None},
+}
+
+
+@pytest.fixture(autouse=True)
+def trace_sink(tmp_path, monkeypatch):
+    """Decision traces go to tmp_path, not outputs/debug"""
+    monkeypatch.setattr(observability, 'DEBUG_DIR', tmp_path)
+    monkeypatch.setattr(observability, 'DECISION_TRACES_FILE', tmp_path / 'decision_traces.jsonl')
+    monkeypatch.setattr(observability, 'DUPLICATES_FILE', tmp_path / 'duplicates.jsonl')
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    """Orchestrator whose learning signals go to tmp_path, not outputs/phase25"""
+    orchestrator = InteractionOrchestrator()
+    orchestrator.signals_file = tmp_path / 'learning_signals.jsonl'
+    return orchestrator
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    """Fake LLM: records call sites, answers the fused call with llm.fused"""
+    client = llm_client_module.llm_client
+
+    class _Fake:
+        fused = FUSED
+        calls = []
+
+        def complete(self, prompt, system_prompt="", max_tokens=500, temperature=0.7,
+                     call_site=None, cache_ttl=None, validate=None):
+            self.calls.append(call_site)
+            if call_site == 'message_understanding':
+                return self.fused if isinstance(self.fused, str) else json.dumps(self.fused)
+            return None
+
+    fake = _Fake()
+    fake.calls = []
+    monkeypatch.setattr(client, 'enabled', True)
+    monkeypatch.setattr(client, 'complete', fake.complete)
+    return fake
+
+
+def test_one_llm_call_per_turn(llm, orchestrator):
+    understanding = understand_message("what do you think about python")
+    assert understanding.intent.intent == 'question'
+    assert understanding.normalization.normalized_text == 'explain python'
+    assert understanding.readiness_fields == {'action_object': None, 'source_url': None}
+
+    llm.calls.clear()
+    classify = orchestrator.classifier.classify
+    seen = []
+    orchestrator.classifier.classify = lambda message, **kw: seen.append(message) or classify(message, **kw)
+
+    orchestrator.process_message("what do you think about python", "fused-session")
+
+    assert llm.calls == ['message_understanding']
+    assert seen == ["what do you think about python"]  # low-confidence rewrite rejected
+
+
+@pytest.mark.parametrize("fused, fallbacks", [
+    ({"normalization": FUSED["normalization"]}, ['intent_classification']),
+    ({"intent": {"intent_type": "dance"}, "fields": "none"}, ['semantic_normalization', 'intent_classification']),
+    ("not json", ['semantic_normalization', 'intent_classification']),
+])
+def test_missing_sections_fall_back_to_stage_calls(llm, orchestrator, fused, fallbacks):
+    llm.fused = fused
+
+    orchestrator.process_message("what do you think about python", "fallback-session")
+
+    assert llm.calls == ['message_understanding'] + fallbacks
+
+
+def test_classifier_uses_fused_decision(llm, orchestrator):
+    understanding = understand_message("get prices from shop.com")
+    classification = orchestrator.classifier.classify(
+        "get prices from shop.com", llm_decision=understanding.intent, fast_path=False
+    )
+    assert classification.intent_type == IntentType.QUESTION and classification.confidence == 0.9
+    assert llm.calls == ['message_understanding']
+
+
+def test_readiness_uses_fused_fields(monkeypatch):
+    def no_extraction(self, message):
+        raise AssertionError("fields were already extracted")
+
+    monkeypatch.setattr(ActionReadinessEngine, '_llm_extract_fields', no_extraction)
+    result = ActionReadinessEngine().validate(
+        user_message="get me prices from shop.com",
+        intent='extract',
+        extracted_fields={'action_object': 'prices', 'source_url': 'shop.com'},
+    )
+    assert result.decision == ReadinessDecision.READY
+    assert result.action_object == 'prices' and result.source_url == 'https://shop.com'
@@ -0,0 +1,128 @@
+"""
+Whiteboard metrics rollup - Validation Tests
+
+Tests that range queries over hourly/daily buckets match a full scan,
+that only appended records are folded, that the tables survive a restart
+(persisted per bucket, rewriting only changed buckets, without double
+counting after a torn commit) and that the quantile sketch stays within
+its relative accuracy.
+"""
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from Back_End.quantile_sketch import QuantileSketch
+from Back_End.whiteboard.metrics_rollup import MetricsRollup
+
+
+NOW = datetime(2026, 3, 10, 15, 30, tzinfo=timezone.utc)
+
+
+def _append(path: Path, ts: datetime, duration: float, endpoint: str = "/api/a") -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"timestamp": ts.isoformat(), "path": endpoint, "duration_ms": duration}) + "\n")
+
+
+def _fold(record):
+    ts = datetime.fromisoformat(record["timestamp"])
+    duration = record["duration_ms"]
+    return ts, {"requests": 1, "endpoints": {record["path"]: {"count": 1}}}, {"latency": duration}
+
+
+def test_range_query_merges_days_and_edge_hours(tmp_path):
+    log = tmp_path / "api_usage.jsonl"
+    for hours_ago in range(0, 24 * 6):
+        _append(log, NOW - timedelta(hours=hours_ago), float(hours_ago + 1))
+
+    rollup = MetricsRollup(log, "api_usage", _fold)
+    window = rollup.query(NOW - timedelta(days=3), NOW, now=NOW)
+
+    # 3 days back, edges widened to whole hours
+    assert window.counters["requests"] == 24 * 3 + 1
+    assert window.counters["endpoints"]["/api/a"]["count"] == 24 * 3 + 1
+    assert window.sketch("latency").count == 24 * 3 + 1
+    assert window.buckets_merged < 24 * 3
+
+
+def test_only_appended_records_are_folded_and_state_survives_restart(tmp_path):
+    log = tmp_path / "api_usage.jsonl"
+    _append(log, NOW, 10.0)
+    rollup = MetricsRollup(log, "api_usage", _fold)
+    assert rollup.refresh(NOW) == 1
+
+    _append(log, NOW, 20.0, "/api/b")
+    assert rollup.refresh(NOW) == 1
+    assert rollup.refresh(NOW) == 0
+
+    restarted = MetricsRollup(log, "api_usage", _fold)
+    assert restarted.refresh(NOW) == 0
+    window = restarted.query(NOW - timedelta(days=1), NOW, now=NOW)
+    assert window.counters["requests"] == 2
+    assert set(window.counters["endpoints"]) == {"/api/a", "/api/b"}
+
+
+def test_only_changed_buckets_are_rewritten(tmp_path):
+    log = tmp_path / "api_usage.jsonl"
+    for days_ago in range(3):
+        _append(log, NOW - timedelta(days=days_ago), 10.0)
+    rollup = MetricsRollup(log, "api_usage", _fold)
+    rollup.refresh(NOW)
+
+    epoch_dir = next(rollup.tables_root.iterdir())
+    assert len(list((epoch_dir / "daily").glob("*.json"))) == 3
+    checkpoint = json.loads(rollup.reader.cursor_file.read_text())
+    assert "hourly" not in checkpoint["state"] and "daily" not in checkpoint["state"]
+
+    mtimes = {p.name: p.stat().st_mtime_ns for p in (epoch_dir / "daily").glob("*.json")}
+    _append(log, NOW, 20.0)
+    rollup.refresh(NOW)
+    changed = [p.name for p in (epoch_dir / "daily").glob("*.json") if p.stat().st_mtime_ns != mtimes[p.name]]
+    assert changed == [NOW.strftime("%Y-%m-%d") + ".json"]
+
+
+def test_torn_commit_falls_back_to_committed_buckets(tmp_path, monkeypatch):
+    log = tmp_path / "api_usage.jsonl"
+    _append(log, NOW, 10.0)
+    rollup = MetricsRollup(log, "api_usage", _fold)
+    rollup.refresh(NOW)
+
+    # Buckets are written, then the process dies before the cursor commit
+    _append(log, NOW, 20.0)
+    monkeypatch.setattr(rollup.reader, "commit", lambda state=None: None)
+    rollup.refresh(NOW)
+
+    restarted = MetricsRollup(log, "api_usage", _fold)
+    window = restarted.query(NOW - timedelta(days=1), NOW, now=NOW)
+    assert window.counters["requests"] == 2
+
+
+def test_replaced_log_is_rebuilt(tmp_path):
+    log = tmp_path / "api_usage.jsonl"
+    _append(log, NOW, 10.0)
+    _append(log, NOW, 10.0)
+    rollup = MetricsRollup(log, "api_usage", _fold)
+    rollup.refresh(NOW)
+
+    log.unlink()
+    _append(log, NOW, 5.0)
+
+    window = rollup.query(NOW - timedelta(days=1), NOW, now=NOW)
+    assert window.counters["requests"] == 1
+
+
+def test_sketch_quantiles_are_within_relative_accuracy_and_mergeable():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(4, 1) for _ in range(5000)]
+    left, right = QuantileSketch(), QuantileSketch()
+    for i, value in enumerate(values):
+        (left if i % 2 else right).add(value)
+    left.merge(QuantileSketch.from_dict(json.loads(json.dumps(right.to_dict()))))
+
+    ordered = sorted(values)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[round(q * (len(ordered) - 1))]
+        assert abs(left.quantile(q) - exact) <= exact * 0.0101
+    assert left.count == len(values)
+    assert QuantileSketch().quantile(0.5) == 0.0
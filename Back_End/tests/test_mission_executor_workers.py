@@ -0,0 +1,150 @@
+"""
+Concurrent MissionExecutor workers - Validation Tests
+
+Tests that missions run concurrently up to the worker count, that
+per-tenant and per-tool-class caps hold without blocking other missions,
+that workers wake on enqueue, that queue-wait / run-time metrics are
+recorded, that a mission waiting for a cap cannot be queued twice and
+that a failing mission task is logged without stopping the loop.
+"""
+
+import asyncio
+import logging
+
+from Back_End.execution import MissionExecutor, execution_queue
+
+
+class RecordingExecutor(MissionExecutor):
+    """Executor whose missions just sleep, recording peak concurrency"""
+
+    def __init__(self, tmp_path, duration=0.05, **kwargs):
+        super().__init__(
+            missions_file=str(tmp_path / "missions.jsonl"),
+            signals_file=str(tmp_path / "signals.jsonl"),
+            **kwargs
+        )
+        self.duration = duration
+        self.active = []
+        self.peak = 0
+        self.order = []
+
+    async def execute_mission(self, mission_data):
+        self.active.append(mission_data)
+        self.peak = max(self.peak, len(self.active))
+        self.order.append(mission_data["mission_id"])
+        await asyncio.sleep(self.duration)
+        self.active.remove(mission_data)
+        return {"success": True, "mission_id": mission_data["mission_id"], "status": "completed"}
+
+
+def _mission(mission_id, tenant="t1", objective_type="search"):
+    return {
+        "mission_id": mission_id,
+        "tenant_id": tenant,
+        "objective": {"type": objective_type, "description": mission_id},
+    }
+
+
+async def _run_until_idle(executor, count):
+    task = asyncio.create_task(executor.run_executor_loop())
+    for _ in range(200):
+        await asyncio.sleep(0.01)
+        if executor.get_metrics()["completed"] == count:
+            break
+    executor.stop()
+    await task
+
+
+def test_missions_run_concurrently_up_to_worker_count(tmp_path):
+    executor = RecordingExecutor(tmp_path, max_workers=3, max_per_tenant=0, tool_class_limits={})
+    for i in range(6):
+        execution_queue.enqueue(_mission(f"m{i}", tenant=f"t{i}"))
+
+    asyncio.run(_run_until_idle(executor, 6))
+
+    metrics = executor.get_metrics()
+    assert executor.peak == 3
+    assert metrics["completed"] == 6
+    assert metrics["queued"] == 0
+    assert metrics["queue_wait_ms"]["count"] == 6
+    assert metrics["run_time_ms"]["p50"] >= 40
+
+
+def test_tenant_and_tool_class_caps_do_not_block_other_missions(tmp_path):
+    executor = RecordingExecutor(
+        tmp_path, max_workers=4, max_per_tenant=1, tool_class_limits={"web_navigation": 1}
+    )
+    execution_queue.enqueue(_mission("a1", tenant="a"))
+    execution_queue.enqueue(_mission("a2", tenant="a"))
+    execution_queue.enqueue(_mission("b1", tenant="b", objective_type="navigate"))
+    execution_queue.enqueue(_mission("c1", tenant="c", objective_type="extract"))
+    execution_queue.enqueue(_mission("d1", tenant="d"))
+
+    asyncio.run(_run_until_idle(executor, 5))
+
+    # a2 waits for a1 and c1 for b1 (web_navigation), but d1 starts immediately
+    assert executor.peak == 3
+    assert executor.order.index("d1") < executor.order.index("a2")
+    assert executor.order.index("d1") < executor.order.index("c1")
+    assert executor.get_metrics()["completed"] == 5
+
+
+def test_worker_wakes_on_enqueue_and_stop_finishes_running_missions(tmp_path):
+    executor = RecordingExecutor(tmp_path, duration=0.2, max_workers=2)
+
+    async def run():
+        task = asyncio.create_task(executor.run_executor_loop())
+        await asyncio.sleep(0.05)
+        execution_queue.enqueue(_mission("late"))
+        await asyncio.sleep(0.02)
+        assert executor.get_metrics()["running"] == 1
+        executor.stop()
+        await task
+
+    asyncio.run(run())
+    metrics = executor.get_metrics()
+    assert metrics["completed"] == 1
+    assert metrics["queue_wait_ms"]["p99"] < 20
+    assert not executor.running
+
+
+def test_mission_waiting_for_capacity_is_not_queued_twice(tmp_path):
+    executor = RecordingExecutor(tmp_path, duration=0.1, max_workers=4, max_per_tenant=1)
+
+    async def run():
+        task = asyncio.create_task(executor.run_executor_loop())
+        execution_queue.enqueue(_mission("a1", tenant="a"))
+        execution_queue.enqueue(_mission("a2", tenant="a"))
+        await asyncio.sleep(0.03)
+        assert executor.get_metrics()["waiting_for_capacity"] == 1
+        execution_queue.enqueue(_mission("a2", tenant="a"))  # still undispatched
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if executor.get_metrics()["completed"] == 2:
+                break
+        await asyncio.sleep(0.05)
+        executor.stop()
+        await task
+
+    asyncio.run(run())
+    assert executor.order == ["a1", "a2"]
+    assert executor.get_metrics()["queued"] == 0
+
+
+def test_failing_mission_task_is_logged_and_loop_continues(tmp_path, caplog):
+    class FlakyExecutor(RecordingExecutor):
+        async def execute_mission(self, mission_data):
+            if mission_data["mission_id"] == "bad":
+                raise RuntimeError("bookkeeping bug")
+            return await super().execute_mission(mission_data)
+
+    executor = FlakyExecutor(tmp_path, max_workers=2)
+    execution_queue.enqueue(_mission("bad", tenant="x"))
+    execution_queue.enqueue(_mission("good", tenant="y"))
+
+    with caplog.at_level(logging.ERROR):
+        asyncio.run(_run_until_idle(executor, 1))
+
+    metrics = executor.get_metrics()
+    assert metrics["completed"] == 1 and metrics["failed"] == 1
+    assert "bookkeeping bug" in caplog.text
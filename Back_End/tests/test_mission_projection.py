@@ -0,0 +1,89 @@
+"""
+Mission whiteboard projection - Validation Tests
+
+Tests that the projection files records by mission incrementally, picks
+up appends between requests and rebuilds when a log is replaced.
+"""
+
+import json
+from pathlib import Path
+
+from Back_End.whiteboard.mission_projection import MissionWhiteboardProjection
+
+
+def _append(path: Path, record: dict) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def _projection(tmp_path: Path) -> MissionWhiteboardProjection:
+    return MissionWhiteboardProjection(
+        tmp_path / "missions.jsonl",
+        tmp_path / "learning_signals.jsonl",
+        tmp_path / "builds.jsonl",
+        tmp_path / "build_deliverables.jsonl",
+        tmp_path / "build_reviews.jsonl",
+        tmp_path / "artifacts.jsonl",
+    )
+
+
+def test_mission_view_is_keyed_by_mission(tmp_path):
+    _append(tmp_path / "missions.jsonl", {"event_type": "mission_created", "mission": {"mission_id": "m1"}})
+    _append(tmp_path / "missions.jsonl", {"event_type": "mission_created", "mission": {"mission_id": "m2"}})
+    _append(tmp_path / "missions.jsonl", {"event_type": "mission_status_update", "mission_id": "m1", "status": "completed"})
+    _append(tmp_path / "learning_signals.jsonl", {"signal_type": "goal_evaluation", "mission_id": "m1"})
+    _append(tmp_path / "learning_signals.jsonl", {"signal_type": "goal_evaluation", "mission_id": "m2"})
+    _append(tmp_path / "learning_signals.jsonl", {"signal_type": "unrelated", "mission_id": "m1"})
+    _append(tmp_path / "learning_signals.jsonl", {"signal_type": "drift_warning", "mission_id": "m2"})
+    _append(tmp_path / "artifacts.jsonl", {"created_by": "m1", "artifact_type": "table"})
+
+    view = _projection(tmp_path).mission_view("m1")
+
+    assert len(view["mission_records"]) == 2
+    assert [s["signal_type"] for s in view["signals"]] == ["goal_evaluation"]
+    assert len(view["drift_warnings"]) == 1
+    assert view["artifacts"] == [{"created_by": "m1", "artifact_type": "table"}]
+
+
+def test_builds_deliverables_and_reviews_follow_mission(tmp_path):
+    _append(tmp_path / "builds.jsonl", {
+        "event_type": "build_created",
+        "build": {"build_id": "b1", "mission_ids": ["m1"]},
+    })
+    _append(tmp_path / "builds.jsonl", {"event_type": "build_status_update", "build_id": "b1", "status": "done"})
+    _append(tmp_path / "builds.jsonl", {"event_type": "build_created", "build": {"build_id": "b2", "mission_ids": ["m2"]}})
+    _append(tmp_path / "build_deliverables.jsonl", {"build_id": "b1", "mission_id": "m1"})
+    _append(tmp_path / "build_reviews.jsonl", {"build_id": "b1", "verdict": "approve"})
+    _append(tmp_path / "build_reviews.jsonl", {"build_id": "b2", "verdict": "reject"})
+
+    view = _projection(tmp_path).mission_view("m1")
+
+    assert [r["event_type"] for r in view["build_records"]] == ["build_created", "build_status_update"]
+    assert view["deliverables"] == {"b1": [{"build_id": "b1", "mission_id": "m1"}]}
+    assert [r["verdict"] for r in view["build_reviews"]] == ["approve"]
+
+
+def test_appends_between_requests_are_picked_up(tmp_path):
+    signals_file = tmp_path / "learning_signals.jsonl"
+    projection = _projection(tmp_path)
+    _append(signals_file, {"signal_type": "mission_progress_update", "mission_id": "m1", "items_collected": 1})
+    assert len(projection.mission_view("m1")["signals"]) == 1
+
+    _append(signals_file, {"signal_type": "mission_progress_update", "mission_id": "m1", "items_collected": 2})
+
+    assert projection.refresh()["signals"] == 1
+    assert [s["items_collected"] for s in projection.mission_view("m1")["signals"]] == [1, 2]
+
+
+def test_replaced_source_is_rebuilt(tmp_path):
+    missions_file = tmp_path / "missions.jsonl"
+    projection = _projection(tmp_path)
+    _append(missions_file, {"event_type": "mission_status_update", "mission_id": "m1", "status": "active"})
+    _append(missions_file, {"event_type": "mission_status_update", "mission_id": "m1", "status": "completed"})
+    assert len(projection.mission_view("m1")["mission_records"]) == 2
+
+    missions_file.unlink()
+    _append(missions_file, {"event_type": "mission_status_update", "mission_id": "m1", "status": "failed"})
+
+    records = projection.mission_view("m1")["mission_records"]
+    assert [r["status"] for r in records] == ["failed"]
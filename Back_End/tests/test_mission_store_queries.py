@@ -0,0 +1,105 @@
+"""
+MissionStore Firestore access - Validation Tests
+
+Tests that startup load, feedback/cost queries and survey listing use a
+constant number of round trips (collection-group queries and get_all)
+instead of one per mission, against the in-memory Firestore stand-in
+from conftest.py.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from Back_End.mission_store import MissionStore
+
+
+@pytest.fixture
+def db(fake_firestore):
+    return fake_firestore
+
+
+@pytest.fixture
+def store(db, monkeypatch):
+    monkeypatch.setenv('MISSION_STORAGE_MODE', 'cloud-direct')
+    store = MissionStore()
+    store._db = db
+    store._collection = db.collection('missions')
+    store._firebase_enabled = True
+    return store
+
+
+def _seed_feedback(db, count):
+    now = datetime.now(timezone.utc)
+    for i in range(count):
+        mission_id = f"m{i}"
+        db.collection('missions').document(mission_id).set({'mission_id': mission_id})
+        db.collection('missions').document(mission_id).collection('feedback').document(mission_id).set({
+            'mission_id': mission_id,
+            'tool_used': 'web_search' if i % 2 else 'web_extract',
+            'mission_type': 'search' if i % 3 else 'extract',
+            'execution_time_seconds': 2,
+            'user_satisfaction': 4,
+            'timestamp': (now - timedelta(days=i)).isoformat(),
+        })
+
+
+def test_tool_costs_use_one_query_regardless_of_mission_count(db, store):
+    _seed_feedback(db, 40)
+    # Feedback outside missions/ must not be counted
+    db.collection('archive').document('x').collection('feedback').document('x').set({
+        'tool_used': 'web_search', 'mission_type': 'search',
+        'timestamp': datetime.now(timezone.utc).isoformat(), 'execution_time_seconds': 2,
+    })
+    db.rpcs = 0
+
+    costs = store.get_tool_costs('web_search', mission_type='search', days=30)
+
+    expected = [i for i in range(40) if i % 2 and i % 3 and i < 30]
+    assert costs['execution_count'] == len(expected)
+    assert costs['total_cost'] == pytest.approx(0.2 * len(expected))
+    assert costs['avg_satisfaction'] == 4
+    assert db.rpcs == 1
+
+
+def test_feedback_query_falls_back_without_composite_index(db, store):
+    _seed_feedback(db, 10)
+    db.missing_group_indexes = True
+    db.rpcs = 0
+
+    feedbacks = store.get_mission_feedbacks(tool='web_extract', days=5)
+
+    assert sorted(f['mission_id'] for f in feedbacks) == ['m0', 'm2', 'm4']
+    assert db.rpcs == 2
+
+
+def test_surveys_are_fetched_in_one_batch(db, store):
+    for i in range(10):
+        mission = db.collection('missions').document(f"m{i}")
+        mission.set({'mission_id': f"m{i}", 'survey_completed': i < 6})
+        if i < 6:
+            mission.collection('survey').document(f"m{i}").set({'mission_id': f"m{i}", 'score': i})
+    db.rpcs = 0
+
+    surveys = store.get_all_mission_surveys(limit=4)
+
+    assert [s['mission_id'] for s in surveys] == ['m0', 'm1', 'm2', 'm3']
+    assert db.rpcs == 2
+
+
+def test_startup_load_groups_events_from_one_query(db, store):
+    for mission_id, stamps in (('a', ['2026-01-02', '2026-01-01']), ('b', ['2026-01-03'])):
+        for stamp in stamps:
+            db.collection('missions').document(mission_id).collection('events').document(stamp).set({
+                'event_type': 'mission_proposed', 'status': 'proposed',
+                'objective': {}, 'timestamp': stamp,
+            })
+    db.collection('other').document('c').collection('events').document('e').set({'timestamp': 'x'})
+    db.rpcs = 0
+
+    store._load_from_firebase()
+
+    assert db.rpcs == 1
+    assert set(store._missions) == {'a', 'b'}
+    assert [e.timestamp for e in store._missions['a']] == ['2026-01-01', '2026-01-02']
+    assert store._missions['a'][0].mission_id == 'a'
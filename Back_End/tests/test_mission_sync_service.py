@@ -0,0 +1,174 @@
+"""
+MissionSyncService - Validation Tests
+
+Tests that the backlog is pushed in Firestore batched writes of at most
+500 events with several batches per round, that a local write wakes a
+running service instead of waiting for the poll interval, and that a
+failed commit leaves its events unsynced with backlog depth and sync lag
+reported, that a batch holding an event Firestore rejects is bisected so
+the rest sync and only the bad event is quarantined, and that events are
+written under their event_id so a replayed commit does not duplicate them
+and events written after a rebuild from Firebase do not overwrite history.
+"""
+
+import time
+
+import pytest
+
+import rebuild_local_from_cloud
+from Back_End import mission_sync_service
+from Back_End.local_mission_store import LocalMissionStore
+from Back_End.mission_sync_service import MissionSyncService
+
+
+@pytest.fixture
+def local_store(tmp_path):
+    store = LocalMissionStore(str(tmp_path / "missions.db"))
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def make_service(local_store, fake_firestore, monkeypatch):
+    monkeypatch.setattr(mission_sync_service, 'get_local_mission_store', lambda: local_store)
+    monkeypatch.setattr(MissionSyncService, '_setup_logging', lambda self: None)
+    services = []
+
+    def make(**kwargs):
+        service = MissionSyncService(**kwargs)
+        service._db = fake_firestore
+        service._firebase_enabled = True
+        services.append(service)
+        return service
+
+    yield make
+    for service in services:
+        service.stop()
+
+
+def _events(count, start=0):
+    return [
+        {'mission_id': f"m{i % 7}", 'event_type': 'progress', 'status': 'active',
+         'timestamp': f"2026-01-01T00:00:{i % 60:02d}", 'step': i}
+        for i in range(start, start + count)
+    ]
+
+
+def _synced_docs(db):
+    return [data for path, data in db.docs.items() if path[0] == 'missions' and path[2] == 'events']
+
+
+def test_backlog_is_pushed_in_concurrent_batches(local_store, fake_firestore, make_service):
+    service = make_service(sync_interval_seconds=60, batch_size=500, max_concurrency=4)
+    local_store.write_mission_events(_events(1200))
+    assert service.get_sync_metrics()['backlog_depth'] == 1200
+
+    result = service.force_sync()
+
+    assert result['synced'] == 1200 and result['failed'] == 0
+    assert sorted(fake_firestore.commits) == [200, 500, 500]
+    assert service.stats['last_round_concurrency'] == 3
+    docs = _synced_docs(fake_firestore)
+    assert len(docs) == 1200 and sorted(d['data']['step'] for d in docs) == list(range(1200))
+    assert service.get_sync_metrics() == {'backlog_depth': 0, 'sync_lag_seconds': 0.0}
+
+
+def test_batch_size_is_capped_at_firestore_limit(make_service):
+    assert make_service(batch_size=2000).batch_size == 500
+
+
+def test_local_write_wakes_running_service(local_store, fake_firestore, make_service):
+    service = make_service(sync_interval_seconds=300, batch_size=500, debounce_seconds=0.05)
+    service.start()
+
+    local_store.write_mission_event(_events(1)[0])
+    local_store.write_mission_events(_events(3, start=1))
+
+    deadline = time.monotonic() + 3
+    while service.get_sync_metrics()['backlog_depth'] and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert service.get_sync_metrics()['backlog_depth'] == 0
+    assert len(_synced_docs(fake_firestore)) == 4
+    assert len(fake_firestore.commits) == 1  # the burst went out as one batch
+
+
+def test_failed_commit_keeps_events_unsynced(local_store, fake_firestore, make_service, monkeypatch):
+    service = make_service(sync_interval_seconds=60, batch_size=500)
+    monkeypatch.setattr(mission_sync_service.time, 'sleep', lambda seconds: None)
+
+    def failing_commit(batch):
+        raise RuntimeError("deadline exceeded")
+
+    monkeypatch.setattr(type(fake_firestore.batch()), 'commit', failing_commit)
+    local_store.write_mission_events(_events(10))
+
+    result = service.force_sync()
+
+    assert result == {'synced': 0, 'failed': 10, 'timestamp': result['timestamp']}
+    assert service.stats['batches_failed'] == 1
+    assert 'deadline exceeded' in service.stats['last_error']
+    metrics = service.get_stats()['sync_service']
+    assert metrics['backlog_depth'] == 10 and metrics['sync_lag_seconds'] >= 0
+
+
+def test_rejected_event_is_quarantined_and_rest_sync(local_store, fake_firestore, make_service, monkeypatch):
+    service = make_service(sync_interval_seconds=60, batch_size=500)
+    monkeypatch.setattr(mission_sync_service.time, 'sleep', lambda seconds: None)
+    FakeBatch = type(fake_firestore.batch())
+    original_set, original_commit = FakeBatch.set, FakeBatch.commit
+
+    def recording_set(batch, ref, data, merge=False):
+        batch.__dict__.setdefault('steps', []).append(data['data']['step'])
+        original_set(batch, ref, data, merge=merge)
+
+    def rejecting_commit(batch):
+        if 37 in batch.__dict__.get('steps', []):
+            raise ValueError("invalid nested entity")
+        original_commit(batch)
+
+    monkeypatch.setattr(FakeBatch, 'set', recording_set)
+    monkeypatch.setattr(FakeBatch, 'commit', rejecting_commit)
+    local_store.write_mission_events(_events(100))
+
+    result = service.force_sync()
+
+    assert result['synced'] == 99 and result['failed'] == 0
+    assert service.stats['total_quarantined'] == 1
+    assert sorted(d['data']['step'] for d in _synced_docs(fake_firestore)) == [i for i in range(100) if i != 37]
+    assert [e['data']['step'] for e in local_store.get_quarantined_events()] == [37]
+    assert local_store.get_stats()['quarantined_events'] == 1
+    assert service.get_sync_metrics()['backlog_depth'] == 0
+
+
+def test_events_are_keyed_by_event_id(local_store, fake_firestore, make_service):
+    service = make_service(sync_interval_seconds=60, batch_size=500)
+    local_store.write_mission_events(_events(5))
+    events = local_store.get_unsynced_events()
+
+    assert service._commit_batch(events) and service._commit_batch(events)  # replayed commit
+
+    docs = {path[3]: data for path, data in fake_firestore.docs.items() if path[0] == 'missions'}
+    assert sorted(docs) == sorted(e['data']['event_id'] for e in events)
+
+
+def test_events_written_after_rebuild_keep_cloud_history(local_store, fake_firestore, make_service, monkeypatch):
+    service = make_service(sync_interval_seconds=60, batch_size=500)
+    other, m0 = _events(2, start=1), _events(1, start=7) + _events(1, start=14)  # m0 at rows 3-4
+    local_store.write_mission_events(other + m0)
+    service.force_sync()
+
+    # Rebuild m0 into a fresh database, so its events take rows 1-2
+    monkeypatch.setattr(rebuild_local_from_cloud, 'get_local_mission_store', lambda: local_store)
+    events_ref = fake_firestore.collection('missions').document('m0').collection('events')
+    downloaded = [rebuild_local_from_cloud.event_from_doc('m0', doc) for doc in events_ref.order_by('timestamp').stream()]
+    rebuild_local_from_cloud.rebuild_local_database(downloaded)
+    assert local_store.get_sync_backlog()['unsynced_events'] == 0
+
+    local_store.write_mission_event({'mission_id': 'm0', 'event_type': 'progress', 'status': 'active',
+                                     'timestamp': '2026-01-01T00:01:00', 'step': 99})
+    service.force_sync()
+
+    # The new event (row 3) sits beside m0's history instead of replacing it
+    steps = sorted(d['data']['step'] for d in _synced_docs(fake_firestore) if d['mission_id'] == 'm0')
+    assert steps == [7, 14, 99]
+    assert len(_synced_docs(fake_firestore)) == 5
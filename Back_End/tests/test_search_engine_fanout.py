@@ -0,0 +1,105 @@
+"""
+Multi-engine search fan-out - Validation Tests
+
+Tests against a local mock SerpAPI server that engine queries run
+concurrently (wall time is the slowest engine, not the sum), that an
+engine missing the overall deadline is reported as timed out while the
+others' results are kept, and that repeated searches reuse the pooled
+keep-alive connections.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from Back_End import whiteboard_metrics
+from Back_End.search_engines_registry import SearchEnginesRegistry
+from Back_End.usage_log_sink import get_usage_log_sink
+
+
+# engine -> (SerpAPI response, delay in seconds)
+RESPONSES = {
+    "google": ({"organic_results": [{"title": "Acme", "link": "https://acme.com", "position": 1}]}, 0.3),
+    "google_maps": ({"place_results": [{"title": "Acme HQ", "link": "https://maps.example/acme"}]}, 0.3),
+    "google_news": ({"news_results": [{"title": "Acme raises", "link": "https://news.example/acme"}]}, 0.3),
+    "linkedin": ({"profiles": [{"name": "Jane Doe", "link": "https://linkedin.example/jane"}]}, 2.0),
+}
+
+
+@pytest.fixture
+def serpapi(tmp_path, monkeypatch):
+    """Mock SerpAPI: answers per engine after its delay, records client connections"""
+    # External API usage records go to tmp_path, not outputs/phase25
+    monkeypatch.setattr(whiteboard_metrics, "EXTERNAL_API_LOG", tmp_path / "external_api_usage.jsonl")
+    connections = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+
+        def do_GET(self):
+            connections.add(self.client_address)
+            engine = parse_qs(urlparse(self.path).query)["engine"][0]
+            payload, delay = RESPONSES[engine]
+            time.sleep(delay)
+            body = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    registry = SearchEnginesRegistry(base_url=f"http://127.0.0.1:{server.server_port}/search")
+    registry.api_key = "test-key"
+    registry.connections = connections
+    yield registry
+    get_usage_log_sink().flush()
+    registry.session.close()
+    server.shutdown()
+    server.server_close()
+
+
+def test_engines_are_queried_concurrently(serpapi):
+    started = time.monotonic()
+    fanout = serpapi.search_many(["google", "google_maps", "google_news"], "acme corp", num=5)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.8  # three 0.3s round trips run side by side
+    by_engine = fanout["results_by_engine"]
+    assert list(by_engine) == ["google", "google_maps", "google_news"]
+    assert by_engine["google"]["results"][0]["url"] == "https://acme.com"
+    assert by_engine["google_maps"]["businesses"][0]["name"] == "Acme HQ"
+    assert by_engine["google_news"]["articles"][0]["title"] == "Acme raises"
+    assert fanout["timed_out"] == []
+    assert all(300 <= ms < 800 for ms in fanout["latency_ms"].values())
+
+
+def test_deadline_returns_partial_results(serpapi):
+    started = time.monotonic()
+    fanout = serpapi.search_many(["google", "linkedin", "yahoo"], "acme corp", deadline_seconds=0.8)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.5
+    assert fanout["timed_out"] == ["linkedin"]
+    assert fanout["results_by_engine"]["linkedin"]["timed_out"] is True
+    assert fanout["latency_ms"]["linkedin"] == 800.0
+    assert fanout["results_by_engine"]["google"]["results"]
+    assert fanout["results_by_engine"]["yahoo"] == {"error": "Unknown engine: yahoo"}
+
+
+def test_pooled_connections_are_reused(serpapi):
+    engines = ["google", "google_maps", "google_news"]
+    serpapi.search_many(engines, "acme corp")
+    serpapi.search_many(engines, "acme inc")
+    serpapi.search_google("acme")
+
+    assert len(serpapi.connections) <= len(engines)
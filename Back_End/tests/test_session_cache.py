@@ -0,0 +1,149 @@
+"""
+Session caches - Validation Tests
+
+Tests that the session cache evicts by count, idle time and byte budget
+with hit/miss/eviction counters, and that the stores built on it stay
+correct when a session is evicted: conversations are fetched back from
+Firestore with every queued write, session counts come from memory
+without a Firestore listing, chat handlers keep their message count
+and session contexts start fresh unless they hold a pending mission or
+clarification.
+"""
+
+from Back_End.conversation.session_store import ConversationStore
+from Back_End.session_cache import SessionCache, get_cache_stats
+from Back_End.session_context import SessionContextManager
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction_and_counters():
+    cache = SessionCache('test_lru', max_entries=2, ttl_seconds=0, max_bytes=0)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1  # 'b' is now least recently used
+    cache.put('c', 3)
+
+    assert 'b' not in cache and 'a' in cache and 'c' in cache
+    assert cache.get('b') is None
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (1, 1, 1)
+    assert get_cache_stats()['test_lru']['entries'] == 2
+
+
+def test_ttl_and_byte_budget():
+    clock = _Clock()
+    evicted = []
+    cache = SessionCache(
+        'test_budget', max_entries=0, ttl_seconds=10, max_bytes=100,
+        sizeof=len, on_evict=lambda key, value: evicted.append(key), clock=clock,
+    )
+    cache.put('idle', 'x' * 10)
+    clock.now = 5
+    cache.put('busy', 'y' * 10)
+    clock.now = 12
+    assert 'idle' not in cache and cache.get('busy') == 'y' * 10
+    assert len(cache) == 1 and cache.stats()['expirations'] == 1
+
+    big = ['z' * 30]
+    cache.put('big', big)  # sized by list length: 1 byte
+    cache.put('wide', 'w' * 95)
+    assert 'busy' not in cache and 'wide' in cache
+    big.extend(['z'] * 20)
+    cache.resize('big')
+    assert 'big' not in cache and cache.stats()['bytes'] == 95
+    assert evicted == ['idle', 'busy', 'big']
+
+    # A single entry over budget is still kept: its put() never evicts it
+    cache.put('huge', 'h' * 500)
+    assert list(dict(cache.items())) == ['huge']
+
+
+def test_evicted_conversation_is_fetched_back_with_queued_writes(fake_firestore):
+    db = fake_firestore
+    store = ConversationStore()
+    store._db = db
+    store._collection = db.collection('conversation_sessions')
+    store._firebase_enabled = True
+    store._sessions = SessionCache('conversation_sessions_test', max_entries=2, ttl_seconds=0, max_bytes=0)
+
+    for sid in ('s1', 's2', 's3'):
+        store.get_or_create(sid, source='chat_ui', external_user_id=None)
+        store.append_message(sid, 'user', f"hello {sid}", 'chat_ui')
+    assert len(store._sessions) == 2
+    # Listings come from Firestore, so the evicted session is still listed
+    assert len(store.list_sessions()) == 3
+    # Count-only callers read the cache and never query Firestore
+    assert store.count_cached_sessions() == 2
+
+    # s1 was evicted before its writes were flushed; the next message still
+    # gets the next sequence number
+    store.append_message('s1', 'assistant', "hi again", 'chat_ui')
+    store.flush()
+    session = store.get_session('s1')
+    assert [m.message_id for m in session.messages] == ['msg_1', 'msg_2']
+    messages = sorted(p[-1] for p in db.docs if p[:3] == ('conversation_sessions', 's1', 'messages'))
+    assert messages == ['00000001', '00000002']
+    stats = store.cache_stats()
+    assert stats['evictions'] >= 2 and stats['misses'] >= 1
+
+
+def test_context_cache_drops_idle_contexts():
+    manager = SessionContextManager()
+    clock = _Clock()
+    manager._contexts = SessionCache('session_contexts_test', max_entries=10, ttl_seconds=60, max_bytes=0, clock=clock)
+
+    context = manager.get_or_create('s1')
+    context.add_source_url('https://example.com')
+    assert manager.get_or_create('s1') is context
+
+    clock.now = 61
+    fresh = manager.get_or_create('s1')
+    assert fresh is not context and not fresh.recent_source_urls
+    assert manager.cache_stats()['expirations'] == 1
+
+
+def test_pinned_entries_are_never_evicted_or_expired():
+    clock = _Clock()
+    pending = {'p'}
+    cache = SessionCache(
+        'test_pinned', max_entries=2, ttl_seconds=10, max_bytes=0,
+        pinned=lambda value: value in pending, clock=clock,
+    )
+    cache.put('a', 'p')
+    cache.put('b', 'x')
+    cache.put('c', 'y')
+    assert 'a' in cache and 'b' not in cache and 'c' in cache
+
+    clock.now = 20
+    assert cache.get('a') == 'p' and 'c' not in cache
+
+    pending.clear()
+    clock.now = 40
+    assert 'a' not in cache
+
+
+def test_context_with_pending_mission_survives_idle_expiry():
+    manager = SessionContextManager()
+    clock = _Clock()
+    manager._contexts = SessionCache(
+        'session_contexts_pending_test', max_entries=1, ttl_seconds=60, max_bytes=0,
+        pinned=manager._contexts._pinned, clock=clock,
+    )
+
+    context = manager.get_or_create('s1')
+    context.set_pending_mission({'mission_id': 'm1'})
+    manager.get_or_create('s2')
+    clock.now = 120
+    assert manager.get_or_create('s1') is context
+    assert context.get_pending_mission() == {'mission_id': 'm1'}
+
+    context.clear_pending_mission()
+    clock.now = 240
+    assert manager.get_or_create('s1') is not context
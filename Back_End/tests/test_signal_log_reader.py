@@ -0,0 +1,174 @@
+"""
+Incremental signal log consumption - Validation Tests
+
+Tests that SignalLogReader resumes from durable per-consumer cursors and
+that learning consumers carry analysis state forward between runs.
+"""
+
+import json
+from pathlib import Path
+
+from Back_End.learning.signal_log_reader import SignalLogReader
+from Back_End.learning.drift_detector import DriftDetector
+from Back_End.learning.temporal_signal_aggregator import TemporalAggregator
+from Back_End.learning.negative_knowledge_registry import NegativeKnowledgeRegistry
+
+
+def _write_signal(path: Path, signal: dict) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(signal) + "\n")
+
+
+def test_reader_resumes_after_commit(tmp_path):
+    signals_file = tmp_path / "learning_signals.jsonl"
+    for i in range(3):
+        _write_signal(signals_file, {"signal_type": "a", "n": i})
+
+    reader = SignalLogReader(signals_file, consumer="test")
+    assert [s["n"] for s in reader.read_new()] == [0, 1, 2]
+    reader.commit({"seen": 3})
+
+    _write_signal(signals_file, {"signal_type": "a", "n": 3})
+
+    reader = SignalLogReader(signals_file, consumer="test")
+    assert reader.state == {"seen": 3}
+    assert [s["n"] for s in reader.read_new()] == [3]
+
+
+def test_reader_skips_partial_trailing_line(tmp_path):
+    signals_file = tmp_path / "learning_signals.jsonl"
+    _write_signal(signals_file, {"n": 0})
+    with open(signals_file, "a", encoding="utf-8") as f:
+        f.write('{"n": 1')
+
+    reader = SignalLogReader(signals_file, consumer="test")
+    assert [s["n"] for s in reader.read_new()] == [0]
+    reader.commit()
+
+    with open(signals_file, "a", encoding="utf-8") as f:
+        f.write('}\n')
+
+    reader = SignalLogReader(signals_file, consumer="test")
+    assert [s["n"] for s in reader.read_new()] == [1]
+
+
+def test_reader_resets_when_log_is_replaced(tmp_path):
+    signals_file = tmp_path / "learning_signals.jsonl"
+    for i in range(3):
+        _write_signal(signals_file, {"n": i})
+
+    reader = SignalLogReader(signals_file, consumer="test")
+    list(reader.read_new())
+    reader.commit({"seen": 3})
+
+    signals_file.unlink()
+    _write_signal(signals_file, {"n": 100})
+
+    reader = SignalLogReader(signals_file, consumer="test")
+    assert reader.state == {}
+    assert [s["n"] for s in reader.read_new()] == [100]
+
+
+def test_reader_max_signals_resumes_at_next_signal(tmp_path):
+    signals_file = tmp_path / "learning_signals.jsonl"
+    for i in range(5):
+        _write_signal(signals_file, {"n": i})
+
+    reader = SignalLogReader(signals_file, consumer="test")
+    assert [s["n"] for s in reader.read_new(max_signals=2)] == [0, 1]
+    reader.commit()
+
+    reader = SignalLogReader(signals_file, consumer="test")
+    assert [s["n"] for s in reader.read_new()] == [2, 3, 4]
+
+
+def test_temporal_aggregator_matches_full_scan(tmp_path):
+    signals_file = tmp_path / "learning_signals.jsonl"
+    for i in range(30):
+        _write_signal(signals_file, {
+            "signal_layer": "selector",
+            "outcome": "success" if i % 3 else "failure",
+            "confidence": 0.5 + (i % 5) * 0.1,
+        })
+    TemporalAggregator(signals_file).run()
+
+    for i in range(30):
+        _write_signal(signals_file, {
+            "signal_layer": "selector",
+            "outcome": "failure",
+            "confidence": 0.2,
+        })
+
+    incremental = TemporalAggregator(signals_file)
+    incremental.load_signals()
+    assert incremental.reader.signals_read <= 30 + 3  # new signals plus emitted trends
+
+    full = TemporalAggregator(signals_file, incremental=False)
+    full.load_signals()
+
+    def _metrics(trends):
+        return [(t["window"], t["rolling_count"], t.get("success_rate"), t["avg_confidence"]) for t in trends]
+
+    assert _metrics(incremental.aggregate_layer("selector")) == _metrics(full.aggregate_layer("selector"))
+
+
+def test_drift_detector_carries_latest_trends_forward(tmp_path):
+    signals_file = tmp_path / "learning_signals.jsonl"
+    _write_signal(signals_file, {
+        "signal_type": "temporal_trend_detected",
+        "target_layer": "selector",
+        "window": "medium",
+        "avg_confidence": 0.9,
+        "timestamp": "2026-02-07T12:00:00+00:00",
+    })
+    DriftDetector(signals_file).run()
+
+    _write_signal(signals_file, {
+        "signal_type": "temporal_trend_detected",
+        "target_layer": "selector",
+        "window": "short",
+        "avg_confidence": 0.5,
+        "timestamp": "2026-02-07T13:00:00+00:00",
+    })
+    summary = DriftDetector(signals_file).run()
+
+    assert summary["warnings_by_type"]["confidence_decay"] == 1
+
+
+def test_negative_knowledge_counts_selector_failures_across_runs(tmp_path):
+    signals_file = tmp_path / "learning_signals.jsonl"
+    failure = {"signal_type": "selector_outcome", "selector": "#submit", "outcome": "failure"}
+
+    _write_signal(signals_file, {**failure, "timestamp": "t1"})
+    stats = NegativeKnowledgeRegistry(outputs_dir=str(tmp_path)).process_learning_signals()
+    assert stats["selector_failures"] == 0
+
+    _write_signal(signals_file, {**failure, "timestamp": "t2"})
+    registry = NegativeKnowledgeRegistry(outputs_dir=str(tmp_path))
+    stats = registry.process_learning_signals()
+    assert stats["processed"] == 1
+    assert stats["selector_failures"] == 1
+
+    # Nothing new appended: nothing re-analyzed
+    stats = registry.process_learning_signals()
+    assert stats["processed"] == 0
+    assert len(registry.get_patterns_by_type("selector")) == 1
+
+
+def test_negative_knowledge_checkpoint_keeps_recent_selectors(tmp_path, monkeypatch):
+    from Back_End.learning import negative_knowledge_registry
+
+    monkeypatch.setattr(negative_knowledge_registry, "MAX_TRACKED_SELECTORS", 3)
+    signals_file = tmp_path / "learning_signals.jsonl"
+    for selector in ["#a", "#b", "#c", "#a", "#d"]:
+        _write_signal(signals_file, {"signal_type": "selector_outcome", "selector": selector,
+                                     "outcome": "failure", "timestamp": selector})
+
+    registry = NegativeKnowledgeRegistry(outputs_dir=str(tmp_path))
+    stats = registry.process_learning_signals()
+    assert stats["selector_failures"] == 1  # only #a failed twice
+
+    state = SignalLogReader(signals_file, negative_knowledge_registry.CURSOR_CONSUMER).state
+    assert list(state["selector_failures"]) == ["#c", "#a", "#d"]
+    assert registry.analyze_selector_failures([{"signal_type": "selector_outcome", "selector": "#x",
+                                                "outcome": "failure"}] * 2)[0].occurrence_count == 1
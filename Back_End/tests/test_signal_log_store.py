@@ -0,0 +1,144 @@
+"""
+Segmented signal log store - Validation Tests
+
+Tests rotation into compressed segments, the sidecar index, indexed reads,
+that appends never wait for a segment to be compressed, that incremental
+readers follow the log across rotation, and that tail reads backwards and
+only decompresses a segment when newer files do not fill the limit.
+"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+from Back_End.learning.signal_log_reader import SignalLogReader
+from Back_End.learning.signal_log_store import SignalLogStore
+
+
+def _signal(n, mission_id="m1", signal_type="selector_outcome", hour=12):
+    return {
+        "signal_type": signal_type,
+        "mission_id": mission_id,
+        "n": n,
+        "timestamp": f"2026-02-07T{hour:02d}:00:00+00:00",
+    }
+
+
+def test_rotation_seals_compressed_segment_and_indexes_it(tmp_path):
+    store = SignalLogStore(tmp_path / "learning_signals.jsonl", compress=True)
+    store.append_many([_signal(0, "m1"), _signal(1, "m2", "drift_warning", hour=13)])
+
+    segment = store.rotate(wait=True)
+
+    assert segment is not None and segment.name.endswith(".jsonl.gz")
+    assert not store.active_file.exists()
+    index = store.load_index()
+    assert index["segments"][0]["signals"] == 2
+    assert index["keys"]["mission_id"]["m2"] == [segment.name]
+    assert sorted(index["keys"]["bucket"]) == ["2026-02-07T12", "2026-02-07T13"]
+
+
+def test_time_bound_rotation_on_append(tmp_path):
+    store = SignalLogStore(tmp_path / "learning_signals.jsonl", segment_seconds=60)
+    store.append(_signal(0))
+    assert store.maybe_rotate() is None
+
+    later = datetime.now(timezone.utc) + timedelta(seconds=61)
+    assert store.maybe_rotate(now=later) is not None
+    assert len(store.segment_paths()) == 1
+
+
+def test_size_bound_rotation_on_append(tmp_path):
+    store = SignalLogStore(tmp_path / "learning_signals.jsonl", max_segment_bytes=200)
+    for i in range(10):
+        store.append(_signal(i))
+
+    assert len(store.segment_paths()) >= 2
+    assert [s["n"] for s in store.read()] == list(range(10))
+
+
+def test_read_only_opens_matching_segments(tmp_path):
+    store = SignalLogStore(tmp_path / "learning_signals.jsonl")
+    store.append(_signal(0, "m1"))
+    store.rotate(wait=True)
+    store.append(_signal(1, "m2"))
+    store.rotate(wait=True)
+    store.append(_signal(2, "m1"))
+
+    assert len(store.find_segments(mission_id="m1")) == 1
+    assert store.find_segments(signal_types=["drift_warning"]) == []
+    assert [s["n"] for s in store.read(mission_id="m1")] == [0, 2]
+    assert store.find_segments(since="2026-02-07T13:00:00") == []
+
+
+def test_reader_follows_log_across_rotation(tmp_path):
+    signals_file = tmp_path / "learning_signals.jsonl"
+    store = SignalLogStore(signals_file)
+    store.append_many([_signal(0), _signal(1)])
+
+    reader = SignalLogReader(signals_file, consumer="test", store=store)
+    assert [s["n"] for s in reader.read_new(max_signals=1)] == [0]
+    reader.commit()
+
+    store.append(_signal(2))
+    store.rotate()
+    store.append(_signal(3))
+
+    reader = SignalLogReader(signals_file, consumer="test", store=store)
+    assert [s["n"] for s in reader.read_new()] == [1, 2, 3]
+    reader.commit()
+
+    store.append(_signal(4))
+    reader = SignalLogReader(signals_file, consumer="test", store=store)
+    assert [s["n"] for s in reader.read_new()] == [4]
+
+
+def test_new_consumer_starts_at_oldest_segment(tmp_path):
+    signals_file = tmp_path / "learning_signals.jsonl"
+    store = SignalLogStore(signals_file)
+    store.append(_signal(0))
+    store.rotate()
+    store.append(_signal(1))
+
+    reader = SignalLogReader(signals_file, consumer="fresh", store=store)
+    assert [s["n"] for s in reader.read_new()] == [0, 1]
+
+
+def test_rotation_compresses_in_background(tmp_path):
+    store = SignalLogStore(tmp_path / "learning_signals.jsonl", max_segment_bytes=200)
+    gate = threading.Event()
+    seal = store._seal
+    store._seal = lambda segment: gate.wait(5) and seal(segment)
+
+    for i in range(6):
+        store.append(_signal(i, f"m{i}"))  # rotates without waiting for the gate
+
+    segment = store.segment_paths()[0]
+    assert not segment.exists() and store.load_index()["segments"][0]["pending"]
+    assert store.find_segments(mission_id="m0") == store.segment_paths()
+    assert [s["n"] for s in store.read()] == list(range(6))
+
+    gate.set()
+    store.wait_for_sealing()
+    index = store.load_index()
+    assert segment.exists() and not segment.with_suffix("").exists()
+    assert not any(s.get("pending") for s in index["segments"])
+    assert index["keys"]["mission_id"]["m0"] == [segment.name]
+    assert [s["n"] for s in store.read()] == list(range(6))
+
+
+def test_tail_reads_backwards_and_decompresses_only_when_needed(tmp_path):
+    store = SignalLogStore(tmp_path / "learning_signals.jsonl", compress=True)
+    store.append_many([_signal(i) for i in range(5)])
+    store.rotate(wait=True)
+    store.append_many([_signal(i) for i in range(5, 20)])
+
+    opened = []
+    iter_file = store._iter_file
+    store._iter_file = lambda path: opened.append(path.name) or iter_file(path)
+
+    assert [s["n"] for s in store.tail(10)] == list(range(10, 20))
+    assert opened == []  # served from the end of the active file
+
+    assert [s["n"] for s in store.tail(18)] == list(range(2, 20))
+    assert opened == [store.segment_paths()[0].name]
+    assert [s["n"] for s in store.tail(50)] == list(range(20))
@@ -0,0 +1,177 @@
+"""
+Streaming event fan-out - Validation Tests
+
+Tests that mission event buffers are bounded rings dropped after the
+mission finishes, that late subscribers can resume after a sequence
+number and are sent a stream_gap event when the events they missed left
+the ring, and that the WebSocket manager serializes each event once,
+sends it to every client from a per-client queue, drops a slow consumer
+(whose backlog the ring can still replay) and unsubscribes on disconnect.
+"""
+
+import asyncio
+import json
+import threading
+
+from Back_End import streaming_events, websocket_streaming
+from Back_End.streaming_events import MissionStatus, StreamingEventEmitter, StreamingEventType
+from Back_End.websocket_streaming import WebSocketStreamManager
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeWebSocket:
+    def __init__(self, block=False):
+        self.sent = []
+        self.closed = None
+        self._gate = asyncio.Event()
+        if not block:
+            self._gate.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        await self._gate.wait()
+        self.sent.append(json.loads(text))
+
+    async def close(self, code=1000, reason=""):
+        self.closed = code
+
+
+def test_ring_buffer_resume_and_finished_expiry(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(streaming_events.time, 'monotonic', clock)
+    emitter = StreamingEventEmitter(buffer_size=5, finished_ttl=60)
+
+    for step in range(8):
+        emitter.emit_mission_progress('m1', step * 10, f"step {step}")
+    assert [e.sequence_number for e in emitter.event_buffer['m1']] == [4, 5, 6, 7, 8]
+
+    replayed = []
+    emitter.subscribe('m1', replayed.append, after_seq=6)
+    assert [e.sequence_number for e in replayed] == [7, 8]
+
+    emitter.emit_mission_stop('m1', 'done', MissionStatus.COMPLETED)
+    emitter.emit_mission_start('m2', 'other')
+    clock.now += 30
+    emitter.emit_mission_progress('m2', 50, 'halfway')
+    assert 'm1' in emitter.event_buffer  # still inside the TTL
+
+    clock.now += 31
+    emitter.emit_mission_progress('m2', 60, 'later')
+    assert 'm1' not in emitter.event_buffer and 'm1' not in emitter.mission_sequences
+    assert [e.sequence_number for e in emitter.event_buffer['m2']] == [1, 2, 3]
+
+    emitter.unsubscribe('m1', replayed.append)
+    emitter.unsubscribe('m1', replayed.append)  # already gone: no error
+    assert 'm1' not in emitter.event_listeners
+
+
+def test_events_serialized_once_for_all_clients(monkeypatch):
+    emitter = StreamingEventEmitter()
+    monkeypatch.setattr(websocket_streaming, 'get_event_emitter', lambda: emitter)
+    calls = []
+    original = streaming_events.StreamingEvent.to_json
+    monkeypatch.setattr(streaming_events.StreamingEvent, 'to_json', lambda self: calls.append(1) or original(self))
+
+    async def scenario():
+        manager = WebSocketStreamManager()
+        emitter.emit_mission_start('m1', 'objective')
+        first, second = _FakeWebSocket(), _FakeWebSocket()
+        await manager.connect('m1', first)
+        await manager.connect('m1', second, after_seq=1)
+
+        # Emitted from a worker thread, as the execution service does
+        worker = threading.Thread(target=emitter.emit_mission_progress, args=('m1', 50, 'halfway'))
+        worker.start()
+        worker.join()
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+
+        await manager.disconnect('m1', first)
+        await manager.disconnect('m1', second)
+        return first, second, manager
+
+    first, second, manager = asyncio.run(scenario())
+    assert [m['sequence_number'] for m in first.sent] == [1, 2]
+    assert [m['sequence_number'] for m in second.sent] == [2]
+    assert len(calls) == 2  # one serialization per event, not per client
+    assert 'm1' not in emitter.event_listeners and not manager.active_connections
+
+
+def test_slow_consumer_is_dropped_without_blocking_others(monkeypatch):
+    emitter = StreamingEventEmitter(buffer_size=500)
+    monkeypatch.setattr(websocket_streaming, 'get_event_emitter', lambda: emitter)
+    monkeypatch.setattr(websocket_streaming, 'CLIENT_SEND_QUEUE_SIZE', 10)
+
+    async def scenario():
+        manager = WebSocketStreamManager()
+        slow, fast = _FakeWebSocket(block=True), _FakeWebSocket()
+        await manager.connect('m1', slow)
+        await manager.connect('m1', fast)
+        for step in range(30):
+            emitter.emit_mission_progress('m1', step, f"step {step}")
+            await asyncio.sleep(0)
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+        return slow, fast, manager
+
+    slow, fast, manager = asyncio.run(scenario())
+    assert len(fast.sent) == 30
+    assert slow.closed == websocket_streaming.SLOW_CONSUMER_CLOSE_CODE
+    assert manager.slow_consumers_dropped == 1
+    assert manager.active_connections['m1'] == {fast}
+    assert len(emitter.event_listeners['m1']) == 1
+
+
+def test_resume_past_the_ring_starts_with_a_gap_event():
+    emitter = StreamingEventEmitter(buffer_size=5)
+    for step in range(8):
+        emitter.emit_mission_progress('m1', step * 10, f"step {step}")
+
+    replayed = emitter.buffered_events('m1', after_seq=1)  # seqs 2-3 were evicted
+    gap = replayed[0]
+    assert gap.event_type == StreamingEventType.STREAM_GAP
+    assert gap.data == {'requested_after_seq': 1, 'oldest_available_seq': 4, 'reset': False}
+    assert [e.sequence_number for e in replayed] == [3, 4, 5, 6, 7, 8]
+    assert gap not in emitter.event_buffer['m1']
+
+    assert [e.sequence_number for e in emitter.buffered_events('m1', after_seq=3)] == [4, 5, 6, 7, 8]
+    reset = emitter.buffered_events('m1', after_seq=40)  # numbering restarted since
+    assert [e.event_type for e in reset] == [StreamingEventType.STREAM_GAP]
+    assert reset[0].data['reset'] is True
+
+
+def test_dropped_slow_consumer_can_resume_from_the_ring(monkeypatch):
+    assert websocket_streaming.CLIENT_SEND_QUEUE_SIZE < streaming_events.EVENT_BUFFER_SIZE
+    emitter = StreamingEventEmitter()
+    monkeypatch.setattr(websocket_streaming, 'get_event_emitter', lambda: emitter)
+
+    async def scenario():
+        manager = WebSocketStreamManager()
+        slow = _FakeWebSocket(block=True)
+        await manager.connect('m1', slow)
+        for step in range(websocket_streaming.CLIENT_SEND_QUEUE_SIZE + 5):
+            emitter.emit_mission_progress('m1', step, f"step {step}")
+            await asyncio.sleep(0)
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+
+        resumed = _FakeWebSocket()
+        await manager.connect('m1', resumed, after_seq=0)  # it never received anything
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+        await manager.disconnect('m1', resumed)
+        return slow, resumed
+
+    slow, resumed = asyncio.run(scenario())
+    assert slow.closed == websocket_streaming.SLOW_CONSUMER_CLOSE_CODE
+    total = websocket_streaming.CLIENT_SEND_QUEUE_SIZE + 5
+    assert [m['sequence_number'] for m in resumed.sent] == list(range(1, total + 1))
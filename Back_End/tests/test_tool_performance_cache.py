@@ -0,0 +1,120 @@
+"""
+Write-behind ToolPerformanceTracker - Validation Tests
+
+Tests that tool calls are served from the local copy without store
+round trips, that flushes write coalesced deltas in one batch and merge
+with records written elsewhere, and that failed flushes (write or read)
+are retried without overwriting stored totals.
+"""
+
+from Back_End.memory import MockMemory
+from Back_End.tool_performance import ToolPerformanceTracker
+
+
+class CountingMemory(MockMemory):
+    def __init__(self):
+        super().__init__()
+        self.calls = {"get": 0, "set": 0, "get_many": 0, "set_many": 0}
+        self.fail_writes = False
+        self.fail_reads = False
+
+    def get(self, key):
+        self.calls["get"] += 1
+        return super().get(key)
+
+    def set(self, key, value):
+        self.calls["set"] += 1
+        return super().set(key, value)
+
+    def get_many(self, keys):
+        self.calls["get_many"] += 1
+        if self.fail_reads:
+            return None
+        return super().get_many(keys)
+
+    def set_many(self, items):
+        self.calls["set_many"] += 1
+        if self.fail_writes:
+            return False
+        return super().set_many(items)
+
+
+def _tracker(store):
+    # Large interval: tests flush explicitly
+    return ToolPerformanceTracker(store=store, flush_interval=3600, cache_ttl=3600)
+
+
+def test_calls_are_served_locally_and_flushed_in_one_batch():
+    store = CountingMemory()
+    tracker = _tracker(store)
+
+    for i in range(20):
+        tracker.record_usage("web_search", i % 4 != 0, 100.0 + i, domain="marketing", failure_mode="timeout")
+    reads_after_warmup = store.calls["get"]
+    assert tracker.get_usefulness_score("web_search", "marketing") > 0.5
+    assert store.calls["get"] == reads_after_warmup == 2
+    assert store.calls["set"] == store.calls["set_many"] == 0
+
+    assert tracker.flush() == 2
+    assert store.calls["set_many"] == 1
+    stored = store.data["tool_performance:web_search:marketing"]
+    assert stored["total_calls"] == 20
+    assert stored["failed_calls"] == 5
+    assert len(stored["history"]) == 10
+    assert stored["p95_latency_ms"] > stored["p50_latency_ms"]
+    assert store.data["tool_performance:web_search:_global"]["total_calls"] == 20
+    assert tracker.flush() == 0
+
+
+def test_flush_merges_with_records_written_by_other_processes():
+    store = CountingMemory()
+    other = _tracker(store)
+    other.record_usage("calculate", True, 10.0)
+    other.flush()
+
+    tracker = _tracker(store)
+    tracker.record_usage("calculate", False, 30.0)
+    other.record_usage("calculate", True, 20.0)
+    other.flush()
+    tracker.flush()
+
+    stored = store.data["tool_performance:calculate:_global"]
+    assert stored["total_calls"] == 3
+    assert stored["successful_calls"] == 2
+    assert abs(stored["avg_latency_ms"] - 20.0) < 1e-9
+
+
+def test_failed_flush_keeps_deltas_for_retry():
+    store = CountingMemory()
+    tracker = _tracker(store)
+    tracker.record_usage("calculate", True, 10.0)
+
+    store.fail_writes = True
+    assert tracker.flush() == 0
+    tracker.record_usage("calculate", True, 10.0)
+
+    store.fail_writes = False
+    assert tracker.flush() == 1
+    assert store.data["tool_performance:calculate:_global"]["total_calls"] == 2
+    assert tracker.get_stats("calculate")["total_calls"] == 2
+
+
+def test_failed_read_keeps_deltas_and_stored_totals():
+    store = CountingMemory()
+    other = _tracker(store)
+    for _ in range(5):
+        other.record_usage("calculate", True, 10.0)
+    other.flush()
+
+    tracker = _tracker(store)
+    tracker.record_usage("calculate", False, 30.0)
+    store.fail_reads = True
+    assert tracker.flush() == 0
+    assert store.calls["set_many"] == 1
+    assert store.data["tool_performance:calculate:_global"]["total_calls"] == 5
+
+    store.fail_reads = False
+    assert tracker.flush() == 1
+    stored = store.data["tool_performance:calculate:_global"]
+    assert stored["total_calls"] == 6
+    assert stored["failed_calls"] == 1
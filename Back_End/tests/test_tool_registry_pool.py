@@ -0,0 +1,110 @@
+"""
+Pooled ToolRegistry execution - Validation Tests
+
+Tests that calls run on the shared pool, that per-tool concurrency limits
+and timeouts are enforced, that cancellable tools are signalled on
+timeout, that call_async awaits without blocking the loop and that a
+cancelled call_async does not leak a concurrency slot.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from Back_End.config import Config
+from Back_End.tool_registry import ToolRegistry
+
+
+@pytest.fixture(autouse=True)
+def _short_timeout(monkeypatch):
+    monkeypatch.setattr(Config, "TIMEOUT", 0.3)
+    monkeypatch.setattr(Config, "MOCK_MODE", False)
+
+
+def test_call_runs_on_pool_and_reports_errors():
+    registry = ToolRegistry(max_workers=2)
+    registry.register("echo", lambda text: {"text": text, "thread": threading.current_thread().name})
+    registry.register("boom", lambda: 1 / 0)
+
+    result = registry.call("echo", "hi")
+    assert result["text"] == "hi"
+    assert result["thread"].startswith("tool")
+    assert "division by zero" in registry.call("boom")["error"]
+    assert registry.get_pool_stats()["tools"]["echo"]["completed"] == 1
+    registry.shutdown(wait=True)
+
+
+def test_timeout_sets_cancel_event_for_cancellable_tools():
+    registry = ToolRegistry(max_workers=2)
+    stopped = threading.Event()
+
+    def slow(cancel_event):
+        cancel_event.wait(5)
+        stopped.set()
+        return {"stopped": True}
+
+    registry.register("slow", slow, cancellable=True)
+
+    assert registry.call("slow") == {"error": "Tool execution timed out."}
+    assert stopped.wait(1)
+    stats = registry.get_pool_stats()["tools"]["slow"]
+    assert stats["timeouts"] == 1
+    registry.shutdown(wait=True)
+    assert registry.get_pool_stats()["abandoned_running"] == 0
+
+
+def test_per_tool_concurrency_limit_rejects_when_saturated():
+    registry = ToolRegistry(max_workers=4)
+    release = threading.Event()
+    registry.register("single", lambda: release.wait(2) and {"ok": True}, max_concurrency=1)
+
+    first = threading.Thread(target=registry.call, args=("single",))
+    first.start()
+    time.sleep(0.05)
+
+    result = registry.call("single")
+    assert "concurrency limit" in result["error"]
+    assert registry.get_pool_stats()["tools"]["single"]["rejected"] == 1
+
+    release.set()
+    first.join()
+    registry.shutdown(wait=True)
+
+
+def test_call_async_does_not_block_the_event_loop():
+    registry = ToolRegistry(max_workers=4)
+    registry.register("sleepy", lambda: time.sleep(0.1) or {"ok": True})
+
+    async def run():
+        started = time.perf_counter()
+        results = await asyncio.gather(*(registry.call_async("sleepy") for _ in range(4)))
+        return results, time.perf_counter() - started
+
+    results, elapsed = asyncio.run(run())
+    assert results == [{"ok": True}] * 4
+    assert elapsed < 0.3
+    registry.shutdown(wait=True)
+
+
+def test_cancelled_call_async_returns_late_acquired_slot():
+    registry = ToolRegistry(max_workers=4)
+    release = threading.Event()
+    registry.register("single", lambda: release.wait(2) and {"ok": True}, max_concurrency=1)
+
+    async def run():
+        holder = asyncio.ensure_future(registry.call_async("single"))
+        await asyncio.sleep(0.05)
+        waiting = asyncio.ensure_future(registry.call_async("single"))
+        await asyncio.sleep(0.05)
+        waiting.cancel()
+        release.set()  # the cancelled waiter's acquire now succeeds in its thread
+        assert await holder == {"ok": True}
+        await asyncio.sleep(0.1)
+
+    asyncio.run(run())
+    semaphore = registry.tools["single"]["semaphore"]
+    assert semaphore.acquire(blocking=False)
+    semaphore.release()
+    registry.shutdown(wait=True)
@@ -0,0 +1,57 @@
+"""
+Usage log sink - Validation Tests
+
+Tests that records are batched per file in submission order, that a full
+queue drops and counts instead of blocking, and that close() flushes.
+"""
+
+import json
+from pathlib import Path
+
+from Back_End.usage_log_sink import UsageLogSink
+
+
+def _read(path: Path) -> list:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_records_are_batched_per_file_in_order(tmp_path):
+    sink = UsageLogSink(batch_size=50, flush_interval=0.05)
+    api_log = tmp_path / "api_usage.jsonl"
+    external_log = tmp_path / "nested" / "external_api_usage.jsonl"
+
+    for n in range(120):
+        assert sink.submit(api_log if n % 2 else external_log, {"n": n})
+    assert sink.flush()
+
+    assert [r["n"] for r in _read(api_log)] == list(range(1, 120, 2))
+    assert [r["n"] for r in _read(external_log)] == list(range(0, 120, 2))
+    stats = sink.stats()
+    assert stats["written"] == 120
+    assert stats["dropped"] == 0
+    assert stats["batches"] < 120
+    sink.close()
+
+
+def test_full_queue_drops_and_counts(tmp_path):
+    sink = UsageLogSink(max_queue_size=3)
+    path = tmp_path / "api_usage.jsonl"
+    # Hold the writer off the queue so it stays full
+    sink._ensure_started = lambda: None
+
+    accepted = [sink.submit(path, {"n": n}) for n in range(5)]
+
+    assert accepted == [True, True, True, False, False]
+    assert sink.stats()["dropped"] == 2
+
+
+def test_close_flushes_queued_records(tmp_path):
+    sink = UsageLogSink(batch_size=1000, flush_interval=60)
+    path = tmp_path / "api_usage.jsonl"
+    for n in range(10):
+        sink.submit(path, {"n": n})
+
+    sink.close()
+
+    assert [r["n"] for r in _read(path)] == list(range(10))
+    assert sink.submit(path, {"n": 10}) is False
@@ -1,17 +1,48 @@
-import json
+import atexit
+import copy
 import logging
+import threading
+import time
 from datetime import datetime
+from Back_End.config import Config
 from Back_End.memory import memory
+from Back_End.quantile_sketch import QuantileSketch
+
+# Keep only the last N failure modes / history points per record
+MAX_FAILURE_MODES = 10
+MAX_HISTORY = 10
 
 class ToolPerformanceTracker:
-    def __init__(self):
+    """
+    Write-behind tool performance tracker.
+
+    record_usage() updates an in-process copy of each tool/domain record
+    and accumulates a delta for it. A background thread flushes the
+    coalesced deltas every TOOL_PERF_FLUSH_SECONDS: one batched read of the
+    dirty records, merge, one batched write. get_stats() and
+    get_usefulness_score() are served from the local copy, so tool calls
+    and tool selection do not touch the network once a record is cached.
+    """
+
+    def __init__(self, store=None, flush_interval: float = None, cache_ttl: float = None):
         self.collection_key = "tool_performance"
-    
-    def record_usage(self, tool_name: str, success: bool, latency_ms: float, 
+        self.store = store or memory
+        self.flush_interval = Config.TOOL_PERF_FLUSH_SECONDS if flush_interval is None else flush_interval
+        self.cache_ttl = Config.TOOL_PERF_CACHE_TTL_SECONDS if cache_ttl is None else cache_ttl
+
+        self._lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._cache = {}        # key -> record (None = not stored)
+        self._loaded_at = {}    # key -> monotonic time of last read
+        self._pending = {}      # key -> delta not yet flushed
+        self._flush_thread = None
+        self._stop = threading.Event()
+
+    def record_usage(self, tool_name: str, success: bool, latency_ms: float,
                     domain: str = "_global", failure_mode: str = None, context: dict = None):
         """
         Track tool performance scoped to domain.
-        
+
         Args:
             tool_name: Name of tool
             success: Whether tool succeeded
@@ -21,66 +52,138 @@ class ToolPerformanceTracker:
             context: Additional context
         """
         try:
-            # Record domain-specific performance
-            domain_key = f"{self.collection_key}:{tool_name}:{domain}"
-            domain_data = memory.safe_call('get', domain_key) or self._init_record(tool_name, domain)
-            
-            # Update domain-specific metrics
-            domain_data['total_calls'] += 1
-            if success:
-                domain_data['successful_calls'] += 1
-            else:
-                domain_data['failed_calls'] += 1
-                if failure_mode:
-                    domain_data['failure_modes'].append(failure_mode)
-                    # Keep only last 10 failure modes
-                    if len(domain_data['failure_modes']) > 10:
-                        domain_data['failure_modes'] = domain_data['failure_modes'][-10:]
-            
-            # Update domain-specific latency (running average)
-            prev_avg = domain_data['avg_latency_ms']
-            n = domain_data['total_calls']
-            domain_data['avg_latency_ms'] = ((prev_avg * (n - 1)) + latency_ms) / n
-            
-            # Update timestamp
-            domain_data['last_used'] = datetime.utcnow().isoformat()
-            
-            # Append to history (keep last 10)
-            domain_data['history'].append({
-                'timestamp': domain_data['last_used'],
+            last_used = datetime.utcnow().isoformat()
+
+            # Domain-specific record keeps failure modes and history
+            domain_key = self._key(tool_name, domain)
+            domain_delta = self._new_delta()
+            domain_delta['calls'] = 1
+            domain_delta['successes' if success else 'failures'] = 1
+            domain_delta['latency_sum'] = latency_ms
+            domain_delta['latency_sketch'].add(latency_ms)
+            domain_delta['last_used'] = last_used
+            if not success and failure_mode:
+                domain_delta['failure_modes'].append(failure_mode)
+            domain_delta['history'].append({
+                'timestamp': last_used,
                 'success': success,
                 'latency_ms': latency_ms,
                 'failure_mode': failure_mode,
                 'context': context or {}
             })
-            if len(domain_data['history']) > 10:
-                domain_data['history'] = domain_data['history'][-10:]
-            
-            # Save domain-specific record
-            memory.safe_call('set', domain_key, domain_data)
-            
+
             # ALSO update global aggregate (for fallback when no domain history)
-            global_key = f"{self.collection_key}:{tool_name}:_global"
-            global_data = memory.safe_call('get', global_key) or self._init_record(tool_name, "_global")
-            
-            # Update global metrics
-            global_data['total_calls'] += 1
-            if success:
-                global_data['successful_calls'] += 1
-            else:
-                global_data['failed_calls'] += 1
-            
-            prev_avg_global = global_data['avg_latency_ms']
-            n_global = global_data['total_calls']
-            global_data['avg_latency_ms'] = ((prev_avg_global * (n_global - 1)) + latency_ms) / n_global
-            global_data['last_used'] = datetime.utcnow().isoformat()
-            
-            memory.safe_call('set', global_key, global_data)
-            return domain_data
+            global_key = self._key(tool_name, "_global")
+            global_delta = self._new_delta()
+            global_delta['calls'] = 1
+            global_delta['successes' if success else 'failures'] = 1
+            global_delta['latency_sum'] = latency_ms
+            global_delta['latency_sketch'].add(latency_ms)
+            global_delta['last_used'] = last_used
+
+            # Warm the cache outside the lock (reads through to memory only on a miss)
+            self._cached(domain_key)
+            self._cached(global_key)
+            with self._lock:
+                domain_data = self._apply_local(domain_key, tool_name, domain, domain_delta)
+                if global_key != domain_key:
+                    self._apply_local(global_key, tool_name, "_global", global_delta)
+                result = copy.deepcopy(domain_data)
+
+            self._ensure_flusher()
+            return result
         except Exception as e:
             logging.error(f"Tool performance tracking failed: {e}")
             return None
-    
+
+    def _key(self, tool_name: str, domain: str) -> str:
+        return f"{self.collection_key}:{tool_name}:{domain}"
+
+    def _new_delta(self) -> dict:
+        return {
+            'calls': 0,
+            'successes': 0,
+            'failures': 0,
+            'latency_sum': 0.0,
+            'latency_sketch': QuantileSketch(),
+            'failure_modes': [],
+            'history': [],
+            'last_used': None,
+        }
+
+    def _merge_delta(self, target: dict, delta: dict):
+        """Coalesce delta into target (both unflushed deltas)"""
+        target['calls'] += delta['calls']
+        target['successes'] += delta['successes']
+        target['failures'] += delta['failures']
+        target['latency_sum'] += delta['latency_sum']
+        target['latency_sketch'].merge(delta['latency_sketch'])
+        target['failure_modes'] = (target['failure_modes'] + delta['failure_modes'])[-MAX_FAILURE_MODES:]
+        target['history'] = (target['history'] + delta['history'])[-MAX_HISTORY:]
+        target['last_used'] = delta['last_used'] or target['last_used']
+
+    def _apply_delta(self, record: dict, delta: dict) -> dict:
+        """Apply a delta to a stored record in place"""
+        prev_calls = record['total_calls']
+        record['total_calls'] += delta['calls']
+        record['successful_calls'] += delta['successes']
+        record['failed_calls'] += delta['failures']
+
+        # Update latency (running average)
+        if record['total_calls']:
+            record['avg_latency_ms'] = ((record['avg_latency_ms'] * prev_calls) + delta['latency_sum']) / record['total_calls']
+
+        # Records created before sketches existed start one from this delta
+        sketch = QuantileSketch.from_dict(record.get('latency_sketch'))
+        sketch.merge(delta['latency_sketch'])
+        record['latency_sketch'] = sketch.to_dict()
+        record['p50_latency_ms'] = sketch.quantile(0.50)
+        record['p95_latency_ms'] = sketch.quantile(0.95)
+        record['p99_latency_ms'] = sketch.quantile(0.99)
+
+        if delta['failure_modes']:
+            record['failure_modes'] = (record.get('failure_modes', []) + delta['failure_modes'])[-MAX_FAILURE_MODES:]
+        if delta['history']:
+            record['history'] = (record.get('history', []) + delta['history'])[-MAX_HISTORY:]
+        if delta['last_used']:
+            record['last_used'] = delta['last_used']
+        return record
+
+    def _apply_local(self, key: str, tool_name: str, domain: str, delta: dict) -> dict:
+        """Update the cached record and queue the delta for the next flush (caller holds lock)"""
+        record = self._cached(key)
+        if record is None:
+            record = self._init_record(tool_name, domain)
+            self._cache[key] = record
+        self._apply_delta(record, delta)
+
+        pending = self._pending.get(key)
+        if pending is None:
+            self._pending[key] = {'tool_name': tool_name, 'domain': domain, 'delta': delta}
+        else:
+            self._merge_delta(pending['delta'], delta)
+        return record
+
+    def _cached(self, key: str):
+        """Cached record for key, reading through to memory on a miss or expired clean entry"""
+        with self._lock:
+            fresh = (
+                key in self._cache
+                and (key in self._pending or time.monotonic() - self._loaded_at.get(key, 0) < self.cache_ttl)
+            )
+            if fresh:
+                return self._cache[key]
+
+        # Copy so local updates never alias the stored value
+        value = copy.deepcopy(self.store.safe_call('get', key))
+        with self._lock:
+            if key in self._pending:
+                # Recorded locally while we were reading; keep the local copy
+                return self._cache[key]
+            self._cache[key] = value
+            self._loaded_at[key] = time.monotonic()
+            return value
+
     def _init_record(self, tool_name: str, domain: str) -> dict:
         """Initialize a new performance record"""
         return {
@@ -90,28 +193,120 @@ class ToolPerformanceTracker:
             'successful_calls': 0,
             'failed_calls': 0,
             'avg_latency_ms': 0.0,
+            'p50_latency_ms': 0.0,
+            'p95_latency_ms': 0.0,
+            'p99_latency_ms': 0.0,
+            'latency_sketch': QuantileSketch().to_dict(),
             'last_used': None,
             'failure_modes': [],
             'history': [],
             'created_at': datetime.utcnow().isoformat()
         }
-    
+
+    def flush(self) -> int:
+        """
+        Write coalesced deltas for every dirty record.
+
+        Reads the current stored records in one batch (other processes may
+        have written them), applies the deltas and writes them back in one
+        batch. Returns the number of records written.
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+
+            stored = self.store.safe_call('get_many', list(pending))
+            if stored is None:
+                # Unknown stored totals: starting fresh records would overwrite them
+                self._requeue(pending)
+                logging.warning(f"Tool performance flush read failed; {len(pending)} records kept for retry")
+                return 0
+
+            merged = {}
+            for key, entry in pending.items():
+                record = copy.deepcopy(stored.get(key)) or self._init_record(entry['tool_name'], entry['domain'])
+                merged[key] = self._apply_delta(record, entry['delta'])
+
+            if not self.store.safe_call('set_many', merged):
+                # Keep the deltas for the next flush rather than losing them
+                self._requeue(pending)
+                logging.warning(f"Tool performance flush failed; {len(pending)} records kept for retry")
+                return 0
+
+            with self._lock:
+                now = time.monotonic()
+                for key, record in merged.items():
+                    record = copy.deepcopy(record)
+                    newer = self._pending.get(key)
+                    if newer is not None:
+                        # Calls recorded during the flush stay pending on top of the stored record
+                        self._apply_delta(record, copy.deepcopy(newer['delta']))
+                    self._cache[key] = record
+                    self._loaded_at[key] = now
+            return len(merged)
+
+    def _requeue(self, pending):
+        """Put unflushed deltas back, under any recorded since the flush began"""
+        with self._lock:
+            for key, entry in pending.items():
+                newer = self._pending.get(key)
+                if newer is not None:
+                    self._merge_delta(entry['delta'], newer['delta'])
+                self._pending[key] = entry
+
+    def _ensure_flusher(self):
+        if self._flush_thread is not None and self._flush_thread.is_alive():
+            return
+        with self._lock:
+            if self._stop.is_set() or (self._flush_thread is not None and self._flush_thread.is_alive()):
+                return
+            self._flush_thread = threading.Thread(target=self._flush_loop, name="tool-perf-flush", daemon=True)
+            self._flush_thread.start()
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logging.error(f"Tool performance flush failed: {e}")
+
+    def close(self):
+        """Stop the background flusher and write any remaining deltas"""
+        self._stop.set()
+        try:
+            self.flush()
+        except Exception as e:
+            logging.error(f"Tool performance final flush failed: {e}")
+
     def get_stats(self, tool_name: str, domain: str = "_global"):
         """
         Get stats for tool in specific domain.
         If no domain history exists, falls back to global.
         """
-        domain_key = f"{self.collection_key}:{tool_name}:{domain}"
-        stats = memory.safe_call('get', domain_key)
-        
+        domain_key = self._key(tool_name, domain)
+        stats = self._cached(domain_key)
+
         # If no domain-specific history and not requesting global, fall back to global
         if not stats and domain != "_global":
             logging.debug(f"No history for {tool_name} in domain '{domain}', using global fallback")
-            global_key = f"{self.collection_key}:{tool_name}:_global"
-            stats = memory.safe_call('get', global_key)
-        
-        return stats
-    
+            global_key = self._key(tool_name, "_global")
+            stats = self._cached(global_key)
+
+        if stats is None:
+            return None
+        with self._lock:
+            return copy.deepcopy(stats)
+
+    def get_latency_sketch(self, tool_name: str, domain: str = "_global") -> QuantileSketch:
+        """
+        Latency sketch for tool in domain (global fallback as in get_stats).
+        Sketches merge, e.g. to combine several domains of one tool.
+        """
+        stats = self.get_stats(tool_name, domain) or {}
+        return QuantileSketch.from_dict(stats.get('latency_sketch'))
+
     def get_all_stats(self):
         """Note: This is a simplified version. In production, you'd query all keys matching the pattern."""
         from Back_End.tool_registry import tool_registry
@@ -122,7 +317,7 @@ class ToolPerformanceTracker:
             if stats:
                 all_stats[tool_name] = stats
         return all_stats
-    
+
     def get_usefulness_score(self, tool_name: str, domain: str = "_global") -> float:
         """
         Calculate a usefulness score (0.0 to 1.0) for tool in domain.
@@ -131,11 +326,11 @@ class ToolPerformanceTracker:
         stats = self.get_stats(tool_name, domain)
         if not stats or stats['total_calls'] == 0:
             return 0.5  # neutral default
-        
+
         success_rate = stats['successful_calls'] / stats['total_calls']
         # Weight by total calls (more calls = more confidence in the metric)
         confidence = min(1.0, stats['total_calls'] / 10.0)
         return (success_rate * 0.7 + 0.5 * 0.3) * confidence
 
 tracker = ToolPerformanceTracker()
-
+atexit.register(tracker.close)
@@ -1,62 +1,225 @@
+import asyncio
 import threading
 import time
 import logging
-from typing import Callable, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, Any, Optional, Tuple
 from Back_End.config import Config
 
 class ToolRegistry:
-    def __init__(self):
+    """
+    Registry of callable tools, executed on a bounded shared thread pool.
+
+    - Config.TOOL_POOL_WORKERS threads run all tool calls
+    - max_concurrency caps in-flight calls of one tool (waiting counts toward the timeout)
+    - cancellable tools receive a `cancel_event` kwarg that is set when the call
+      times out; calls still queued when they time out are never started
+    """
+
+    def __init__(self, max_workers: int = None):
         self.tools = {}
+        self.max_workers = max_workers or Config.TOOL_POOL_WORKERS
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
 
-    def register(self, name: str, func: Callable, mock_func: Callable = None, description: str = ""):
+    def register(self, name: str, func: Callable, mock_func: Callable = None, description: str = "",
+                 max_concurrency: int = None, cancellable: bool = False):
         self.tools[name] = {
             'func': func,
             'mock_func': mock_func,
-            'description': description
+            'description': description,
+            'max_concurrency': max_concurrency,
+            'cancellable': cancellable,
+            'semaphore': threading.BoundedSemaphore(max_concurrency) if max_concurrency else None,
         }
 
-    def call(self, name: str, *args, domain: str = "_global", **kwargs) -> Any:
-        tool = self.tools.get(name)
-        if not tool:
-            return {'error': f'Tool {name} not found.'}
-        func = tool['mock_func'] if Config.MOCK_MODE and tool['mock_func'] else tool['func']
-        result = {'error': 'Tool execution failed (timeout).'}
-        start_time = time.time()
-        def target():
-            nonlocal result
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="tool"
+                    )
+        return self._executor
+
+    def _stat(self, name: str, field: str, delta: int = 1):
+        with self._stats_lock:
+            stats = self._stats.setdefault(name, {
+                'queued': 0, 'running': 0, 'completed': 0, 'timeouts': 0,
+                'cancelled': 0, 'rejected': 0, 'abandoned_running': 0,
+            })
+            stats[field] += delta
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Queue depth and outcome counters, overall and per tool"""
+        with self._stats_lock:
+            per_tool = {name: dict(stats) for name, stats in self._stats.items()}
+        return {
+            'max_workers': self.max_workers,
+            'queued': sum(s['queued'] for s in per_tool.values()),
+            'running': sum(s['running'] for s in per_tool.values()),
+            'abandoned_running': sum(s['abandoned_running'] for s in per_tool.values()),
+            'tools': per_tool,
+        }
+
+    def _submit(self, name: str, tool: dict, func: Callable, args: tuple, kwargs: dict) -> Tuple[Future, dict]:
+        """Submit one call to the pool. The semaphore (if any) must already be held."""
+        cancel_event = None
+        if tool.get('cancellable'):
+            cancel_event = threading.Event()
+            kwargs = dict(kwargs, cancel_event=cancel_event)
+        state = {'timed_out': False}
+        state_lock = threading.Lock()
+
+        def run():
+            with state_lock:
+                self._stat(name, 'queued', -1)
+                self._stat(name, 'running')
             try:
-                result = func(*args, **kwargs)
+                return func(*args, **kwargs)
             except Exception as e:
                 logging.exception(f"Tool {name} failed: {e}")
-                result = {'error': str(e)}
-        thread = threading.Thread(target=target)
-        thread.start()
-        thread.join(timeout=Config.TIMEOUT)
-        latency_ms = (time.time() - start_time) * 1000
-        
-        if thread.is_alive():
-            result = {'error': 'Tool execution timed out.'}
-            success = False
-            failure_mode = 'timeout'
-        else:
-            success = 'error' not in result
-            failure_mode = result.get('failure_type') if not success else None
-        
+                return {'error': str(e)}
+            finally:
+                with state_lock:
+                    self._stat(name, 'running', -1)
+                    self._stat(name, 'completed')
+                    if state['timed_out']:
+                        self._stat(name, 'abandoned_running', -1)
+
+        def release(_future):
+            semaphore = tool.get('semaphore')
+            if semaphore is not None:
+                semaphore.release()
+
+        self._stat(name, 'queued')
+        future = self._get_executor().submit(run)
+        future.add_done_callback(release)
+
+        def on_timeout():
+            with state_lock:
+                if future.cancel():
+                    # Never started: undo the queued count
+                    self._stat(name, 'queued', -1)
+                    self._stat(name, 'cancelled')
+                elif not future.done():
+                    state['timed_out'] = True
+                    self._stat(name, 'abandoned_running')
+            self._stat(name, 'timeouts')
+            if cancel_event is not None:
+                cancel_event.set()
+
+        state['on_timeout'] = on_timeout
+        return future, state
+
+    def _resolve(self, name: str):
+        tool = self.tools.get(name)
+        if not tool:
+            return None, None
+        func = tool['mock_func'] if Config.MOCK_MODE and tool['mock_func'] else tool['func']
+        return tool, func
+
+    @staticmethod
+    def _outcome(result: Any) -> Tuple[bool, Optional[str]]:
+        success = 'error' not in result
+        failure_mode = result.get('failure_type') if not success else None
+        return success, failure_mode
+
+    def _track(self, name: str, success: bool, latency_ms: float, domain: str,
+               failure_mode: Optional[str], args: tuple, kwargs: dict):
         # Track performance (now with domain)
         try:
             from Back_End.tool_performance import tracker
             tracker.record_usage(
-                name, 
-                success, 
-                latency_ms, 
+                name,
+                success,
+                latency_ms,
                 domain=domain,
                 failure_mode=failure_mode,
                 context={'args_count': len(args), 'kwargs_count': len(kwargs)}
             )
         except Exception as e:
             logging.debug(f"Performance tracking skipped: {e}")
-        
+
+    def call(self, name: str, *args, domain: str = "_global", **kwargs) -> Any:
+        tool, func = self._resolve(name)
+        if not tool:
+            return {'error': f'Tool {name} not found.'}
+        start_time = time.time()
+        deadline = start_time + Config.TIMEOUT
+
+        semaphore = tool.get('semaphore')
+        if semaphore is not None and not semaphore.acquire(timeout=Config.TIMEOUT):
+            self._stat(name, 'rejected')
+            result = {'error': f'Tool {name} concurrency limit reached.'}
+            success, failure_mode = False, 'concurrency_limit'
+        else:
+            future, state = self._submit(name, tool, func, args, kwargs)
+            try:
+                result = future.result(timeout=max(0.0, deadline - time.time()))
+                success, failure_mode = self._outcome(result)
+            except FutureTimeoutError:
+                state['on_timeout']()
+                result = {'error': 'Tool execution timed out.'}
+                success = False
+                failure_mode = 'timeout'
+        latency_ms = (time.time() - start_time) * 1000
+
+        self._track(name, success, latency_ms, domain, failure_mode, args, kwargs)
         return result
 
-tool_registry = ToolRegistry()
+    async def call_async(self, name: str, *args, domain: str = "_global", **kwargs) -> Any:
+        """Awaitable call(): runs on the tool pool without blocking the event loop thread"""
+        tool, func = self._resolve(name)
+        if not tool:
+            return {'error': f'Tool {name} not found.'}
+        start_time = time.time()
+        deadline = start_time + Config.TIMEOUT
+
+        semaphore = tool.get('semaphore')
+        acquired = semaphore is None or semaphore.acquire(blocking=False)
+        if not acquired:
+            waiter = asyncio.ensure_future(asyncio.to_thread(semaphore.acquire, timeout=Config.TIMEOUT))
+            try:
+                acquired = await asyncio.shield(waiter)
+            except asyncio.CancelledError:
+                # The acquire keeps running in its thread; give back a slot it wins after we are gone
+                waiter.add_done_callback(lambda done: self._release_abandoned(done, semaphore))
+                raise
+        if not acquired:
+            self._stat(name, 'rejected')
+            result = {'error': f'Tool {name} concurrency limit reached.'}
+            success, failure_mode = False, 'concurrency_limit'
+        else:
+            future, state = self._submit(name, tool, func, args, kwargs)
+            try:
+                result = await asyncio.wait_for(
+                    asyncio.shield(asyncio.wrap_future(future)),
+                    timeout=max(0.0, deadline - time.time())
+                )
+                success, failure_mode = self._outcome(result)
+            except asyncio.TimeoutError:
+                state['on_timeout']()
+                result = {'error': 'Tool execution timed out.'}
+                success = False
+                failure_mode = 'timeout'
+        latency_ms = (time.time() - start_time) * 1000
+
+        self._track(name, success, latency_ms, domain, failure_mode, args, kwargs)
+        return result
 
+    @staticmethod
+    def _release_abandoned(waiter: asyncio.Future, semaphore: threading.BoundedSemaphore):
+        if not waiter.cancelled() and waiter.exception() is None and waiter.result():
+            semaphore.release()
+
+    def shutdown(self, wait: bool = False):
+        """Stop accepting tool calls; queued calls are cancelled"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+tool_registry = ToolRegistry()
@@ -358,16 +358,11 @@ class ToolSelector:
         # Use LLM to extract the appropriate input from the goal
         try:
             prompt = self._build_input_extraction_prompt(tool_name, goal)
-            response = llm_client.complete(prompt, max_tokens=200, temperature=0.3)
-            extracted_input = response.strip()
+            response = llm_client.complete(prompt, max_tokens=200, temperature=0.3, call_site='tool_input',
+                                           validate=lambda r: bool(self._clean_extracted_input(r)))
+            extracted_input = self._clean_extracted_input(response)
             
-            # Remove surrounding quotes if present (LLM sometimes adds them)
             if extracted_input:
-                if (extracted_input.startswith('"') and extracted_input.endswith('"')) or \
-                   (extracted_input.startswith("'") and extracted_input.endswith("'")):
-                    extracted_input = extracted_input[1:-1]
-            
-            if extracted_input and extracted_input.lower() not in ['none', 'n/a', 'not found', 'unable']:
                 logging.info(f"[INPUT_EXTRACTION] {tool_name}: {extracted_input[:100]}")
                 return extracted_input
         except Exception as e:
@@ -376,6 +371,21 @@ class ToolSelector:
         # Fallback: return the whole goal if LLM fails
         return goal
     
+    @staticmethod
+    def _clean_extracted_input(response: str) -> str:
+        """Extracted input without surrounding quotes, or '' if the LLM found none"""
+        extracted_input = response.strip()
+        
+        # Remove surrounding quotes if present (LLM sometimes adds them)
+        if extracted_input:
+            if (extracted_input.startswith('"') and extracted_input.endswith('"')) or \
+               (extracted_input.startswith("'") and extracted_input.endswith("'")):
+                extracted_input = extracted_input[1:-1]
+        
+        if extracted_input.lower() in ['none', 'n/a', 'not found', 'unable']:
+            return ''
+        return extracted_input
+    
     def _build_input_extraction_prompt(self, tool_name: str, goal: str) -> str:
         """Build an LLM prompt for extracting tool-specific input from goal"""
         
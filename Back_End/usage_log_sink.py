@@ -0,0 +1,218 @@
+"""
+Usage Log Sink: non-blocking, batched JSONL writer for usage metrics
+
+API-usage and external-API records are enqueued on a bounded in-memory
+queue and written by one background thread. The writer drains up to
+BATCH_SIZE records at a time and flushes when the batch is full or
+FLUSH_INTERVAL_SECONDS has passed since the first queued record, opening
+each target file once per batch.
+
+Callers (the HTTP middleware on the event loop, LLM/API clients on worker
+threads) never touch the disk: submit() is a put_nowait on the queue.
+
+CONSTRAINTS:
+- submit() never blocks; when the queue is full the record is dropped and counted
+- Records for one file are written in submission order
+- close() flushes everything still queued (called on app shutdown and at exit)
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Sink policy (environment overrides for deployments and tests)
+MAX_QUEUE_SIZE = int(os.environ.get("USAGE_LOG_MAX_QUEUE", "10000"))
+BATCH_SIZE = int(os.environ.get("USAGE_LOG_BATCH_SIZE", "256"))
+FLUSH_INTERVAL_SECONDS = float(os.environ.get("USAGE_LOG_FLUSH_SECONDS", "1.0"))
+
+# Log a warning on the first drop and then every N drops
+DROP_WARNING_EVERY = 1000
+
+
+class _Marker:
+    """Control item placed on the queue; the writer sets `done` once handled."""
+
+    def __init__(self, stop: bool = False):
+        self.stop = stop
+        self.done = threading.Event()
+
+
+class UsageLogSink:
+    """
+    Background batching writer for append-only JSONL usage logs.
+
+    Use get_usage_log_sink() rather than constructing directly, so every
+    logger in a process shares one queue and one writer thread.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = MAX_QUEUE_SIZE,
+        batch_size: int = BATCH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+    ):
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval)
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, max_queue_size))
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.write_errors = 0
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def submit(self, path: Path, record: Dict[str, Any]) -> bool:
+        """Queue a record for `path`. Returns False if it was dropped."""
+        if self._closed:
+            return self._drop()
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((Path(path), record))
+        except queue.Full:
+            return self._drop()
+        return True
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until everything queued before this call has been written."""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        marker = _Marker()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Flush queued records and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        marker = _Marker(stop=True)
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            logging.warning("[USAGE_LOG] Queue full at shutdown; some records were not written")
+            return
+        thread.join(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "write_errors": self.write_errors,
+        }
+
+    def _drop(self) -> bool:
+        with self._lock:
+            self.dropped += 1
+            dropped = self.dropped
+        if dropped == 1 or dropped % DROP_WARNING_EVERY == 0:
+            logging.warning(f"[USAGE_LOG] Sink overloaded, {dropped} record(s) dropped so far")
+        return False
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._closed or (self._thread is not None and self._thread.is_alive()):
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="usage-log-sink", daemon=True
+            )
+            self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Writer side
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            batch: List[Tuple[Path, Dict[str, Any]]] = []
+            marker = self._collect(batch)
+            if batch:
+                self._write(batch)
+            if marker is not None:
+                marker.done.set()
+                if marker.stop:
+                    return
+
+    def _collect(self, batch: List[Tuple[Path, Dict[str, Any]]]) -> Optional[_Marker]:
+        """Fill `batch` until it is full, the flush interval lapses or a marker arrives."""
+        item = self._queue.get()
+        if isinstance(item, _Marker):
+            return item
+        batch.append(item)
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                return None
+            if isinstance(item, _Marker):
+                return item
+            batch.append(item)
+        return None
+
+    def _write(self, batch: List[Tuple[Path, Dict[str, Any]]]) -> None:
+        lines_by_path: Dict[Path, List[str]] = {}
+        for path, record in batch:
+            try:
+                line = json.dumps(record, default=str)
+            except (TypeError, ValueError) as e:
+                self.write_errors += 1
+                logging.debug(f"[USAGE_LOG] Unserializable record skipped: {e}")
+                continue
+            lines_by_path.setdefault(path, []).append(line + "\n")
+
+        for path, lines in lines_by_path.items():
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with path.open("a", encoding="utf-8") as handle:
+                    handle.write("".join(lines))
+                self.written += len(lines)
+            except OSError as e:
+                self.write_errors += len(lines)
+                logging.warning(f"[USAGE_LOG] Failed to write {len(lines)} record(s) to {path}: {e}")
+        self.batches += 1
+
+
+_sink: Optional[UsageLogSink] = None
+_sink_lock = threading.Lock()
+
+
+def get_usage_log_sink() -> UsageLogSink:
+    """Process-wide usage log sink (flushed automatically at interpreter exit)."""
+    global _sink
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                _sink = UsageLogSink()
+                atexit.register(_sink.close)
+    return _sink
+
+
+def shutdown_usage_log_sink(timeout: Optional[float] = 5.0) -> None:
+    """Flush and stop the process-wide sink, if one was created."""
+    if _sink is not None:
+        _sink.close(timeout)
@@ -340,50 +340,30 @@ class WebDiscovery:
         return engine_map.get(task_category, ["google"])
     
     def search_multi_engine(self, query: str, task_category: TaskCategory, num_results: int = 10) -> Dict[str, Any]:
-        """Search using multiple engines for comprehensive results"""
+        """Search using multiple engines for comprehensive results
+        
+        Engines are queried concurrently under SEARCH_MULTI_ENGINE_DEADLINE_SECONDS;
+        an engine that misses the deadline is listed in 'timed_out' and the
+        others' results are returned.
+        """
         
         engines_to_use = self.select_engines_for_task(task_category)
+        logger.info(f"[MULTI_SEARCH] Querying engines concurrently: {engines_to_use}")
+        fanout = self.search_engines.search_many(engines_to_use, query, num=num_results)
+        
         all_results = {
             "query": query,
             "task_category": task_category.value,
             "engines_used": engines_to_use,
-            "results_by_engine": {}
+            "results_by_engine": fanout["results_by_engine"],
+            "latency_ms": fanout["latency_ms"],
+            "timed_out": fanout["timed_out"]
         }
         
-        for engine in engines_to_use:
-            try:
-                logger.info(f"[MULTI_SEARCH] Using engine: {engine}")
-                
-                if engine == "google":
-                    results = self.search_engines.search_google(query, num=num_results)
-                elif engine == "google_maps":
-                    results = self.search_engines.search_google_maps(query, num=num_results)
-                elif engine == "google_news":
-                    results = self.search_engines.search_google_news(query, num=num_results)
-                elif engine == "linkedin":
-                    results = self.search_engines.search_linkedin(query, num=num_results)
-                elif engine == "google_scholar":
-                    results = self.search_engines.search_google_scholar(query, num=num_results)
-                elif engine == "google_shopping":
-                    results = self.search_engines.search_google_shopping(query, num=num_results)
-                elif engine == "youtube":
-                    results = self.search_engines.search_youtube(query, num=num_results)
-                elif engine == "google_trends":
-                    results = self.search_engines.search_google_trends(query)
-                elif engine == "amazon":
-                    results = self.search_engines.search_amazon(query, num=num_results)
-                elif engine == "google_jobs":
-                    results = self.search_engines.search_google_jobs(query, num=num_results)
-                else:
-                    results = {"error": f"Unknown engine: {engine}"}
-                
-                all_results["results_by_engine"][engine] = results
-                
-            except Exception as e:
-                logger.warning(f"[MULTI_SEARCH_ERROR] Engine {engine} failed: {e}")
-                all_results["results_by_engine"][engine] = {"error": str(e)}
-        
-        logger.info(f"[MULTI_SEARCH] Completed search with {len(engines_to_use)} engines")
+        logger.info(
+            f"[MULTI_SEARCH] Completed search with {len(engines_to_use)} engines "
+            f"(latency ms: {fanout['latency_ms']})"
+        )
         return all_results
     
     def extract_urls_from_results(self, multi_results: Dict[str, Any]) -> List[str]:
@@ -925,6 +905,7 @@ def web_research(query: str, depth: str = "standard", session_id: str = None) ->
 tool_registry.register(
     'web_research',
     web_research,
+    max_concurrency=Config.SLOW_TOOL_CONCURRENCY,
     description="Intelligent web research - discovers, crawls, extracts, and synthesizes information about any entity or topic. Includes Firebase caching and progressive depth with async approval."
 )
 
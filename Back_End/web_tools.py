@@ -29,6 +29,8 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
+from Back_End.config import Config
+
 # Buddy's subsystems (read-only imports)
 from Back_End.buddys_vision import BuddysVision
 from Back_End.buddys_vision_core import BuddysVisionCore
@@ -906,18 +908,21 @@ def register_web_tools(tool_registry):
     tool_registry.register(
         'web_inspect',
         web_inspect,
+        max_concurrency=Config.SLOW_TOOL_CONCURRENCY,
         description='Inspect a website and return structured DOM analysis (forms, buttons, inputs, links, structure). Risk: LOW (read-only).'
     )
     
     tool_registry.register(
         'web_screenshot',
         web_screenshot,
+        max_concurrency=Config.SLOW_TOOL_CONCURRENCY,
         description='Capture screenshot of current page with clickable element overlay metadata. Risk: LOW (read-only).'
     )
     
     tool_registry.register(
         'web_extract',
         web_extract,
+        max_concurrency=Config.SLOW_TOOL_CONCURRENCY,
         description='Extract content from page elements by CSS selector (text, HTML, attributes). Risk: LOW (read-only).'
     )
     
@@ -925,6 +930,7 @@ def register_web_tools(tool_registry):
     tool_registry.register(
         'web_navigate',
         web_navigate,
+        max_concurrency=Config.SLOW_TOOL_CONCURRENCY,
         description='Navigate browser to a URL. Risk: LOW (reversible action).'
     )
     
@@ -932,12 +938,14 @@ def register_web_tools(tool_registry):
     tool_registry.register(
         'web_click',
         web_click,
+        max_concurrency=Config.SLOW_TOOL_CONCURRENCY,
         description='Click an element by selector or visible text. Risk: MEDIUM (can trigger actions). Args: selector_or_text, tag (default: button).'
     )
     
     tool_registry.register(
         'web_fill',
         web_fill,
+        max_concurrency=Config.SLOW_TOOL_CONCURRENCY,
         description='Fill a form field by label/placeholder/name/id hint. Risk: MEDIUM (modifies page state). Args: field_hint, value.'
     )
     
@@ -945,6 +953,7 @@ def register_web_tools(tool_registry):
     tool_registry.register(
         'web_submit_form',
         web_submit_form,
+        max_concurrency=Config.SLOW_TOOL_CONCURRENCY,
         description='Submit the first form on the page. Risk: HIGH (permanent action - defaults to dry-run). Requires WEB_TOOLS_ALLOW_HIGH_RISK=true.'
     )
     
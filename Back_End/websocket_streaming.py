@@ -4,29 +4,70 @@ Real-time event stream for mission execution observability
 Observability-only: NO control commands, NO autonomy
 """
 
-from typing import Dict, List, Set
+from typing import Callable, Dict, List, Optional, Set
 import asyncio
 import json
 from fastapi import WebSocket, WebSocketDisconnect, APIRouter
 from contextlib import asynccontextmanager
 
 from Back_End.streaming_events import (
+    EVENT_BUFFER_SIZE,
     StreamingEvent,
     StreamingEventEmitter,
     get_event_emitter,
 )
 
 
+# Serialized events waiting to be sent to one client; a client that falls
+# this far behind is disconnected and can resume with ?after_seq=. Sized
+# from the replay ring, with headroom for events emitted while it
+# reconnects, so the events it missed are usually still buffered.
+CLIENT_SEND_QUEUE_SIZE = EVENT_BUFFER_SIZE // 2
+# WebSocket close code for a dropped slow consumer ("try again later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class _ClientStream:
+    """One connected client: a bounded send queue drained by its own task"""
+    
+    def __init__(self, mission_id: str, websocket: WebSocket, loop: asyncio.AbstractEventLoop):
+        self.mission_id = mission_id
+        self.websocket = websocket
+        self.loop = loop
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue()
+        # Live events allowed to wait; replayed events raise it until they are sent
+        self.limit = CLIENT_SEND_QUEUE_SIZE
+        self.replaying = False
+        self.sender: Optional[asyncio.Task] = None
+        self.callback: Optional[Callable[[StreamingEvent], None]] = None
+        self.last_seq = 0
+        self.dropped = False
+
+
 class WebSocketStreamManager:
-    """Manages WebSocket connections for mission event streaming"""
+    """Manages WebSocket connections for mission event streaming
+    
+    Each event is serialized once (StreamingEvent.serialized) and the same
+    string is queued for every client. Emitters may run on any thread;
+    events are handed to the event loop, and each client's sender task
+    writes its own queue so one slow socket never delays the others.
+    """
     
     def __init__(self):
         """Initialize stream manager"""
         self.active_connections: Dict[str, Set[WebSocket]] = {}
+        self._clients: Dict[WebSocket, _ClientStream] = {}
         self.emitter = get_event_emitter()
+        self.slow_consumers_dropped = 0
     
-    async def connect(self, mission_id: str, websocket: WebSocket) -> None:
-        """Accept and track a WebSocket connection for a mission"""
+    async def connect(self, mission_id: str, websocket: WebSocket, after_seq: Optional[int] = None) -> None:
+        """Accept and track a WebSocket connection for a mission
+        
+        Args:
+            mission_id: Mission to stream
+            websocket: Client connection
+            after_seq: Resume after this sequence_number (replays newer buffered events only)
+        """
         await websocket.accept()
         
         if mission_id not in self.active_connections:
@@ -34,32 +75,79 @@ class WebSocketStreamManager:
         
         self.active_connections[mission_id].add(websocket)
         
-        # Subscribe to events for this mission
-        self.emitter.subscribe(
-            mission_id,
-            lambda event: asyncio.create_task(
-                self._broadcast_to_websocket(websocket, event)
-            ),
-        )
+        client = _ClientStream(mission_id, websocket, asyncio.get_running_loop())
+        client.sender = asyncio.create_task(self._send_loop(client))
+        client.callback = lambda event: self._deliver(client, event)
+        self._clients[websocket] = client
+        
+        # Subscribe to events for this mission (replays the buffer first,
+        # synchronously on this loop, so the replay never counts as lag)
+        client.replaying = True
+        try:
+            self.emitter.subscribe(mission_id, client.callback, after_seq=after_seq)
+        finally:
+            client.replaying = False
     
     async def disconnect(self, mission_id: str, websocket: WebSocket) -> None:
         """Remove a WebSocket connection"""
+        client = self._clients.pop(websocket, None)
+        if client is not None:
+            self.emitter.unsubscribe(client.mission_id, client.callback)
+            if client.sender is not None and client.sender is not asyncio.current_task():
+                client.sender.cancel()
         if mission_id in self.active_connections:
             self.active_connections[mission_id].discard(websocket)
             if not self.active_connections[mission_id]:
                 del self.active_connections[mission_id]
     
-    async def _broadcast_to_websocket(
-        self,
-        websocket: WebSocket,
-        event: StreamingEvent,
-    ) -> None:
-        """Send event to a single WebSocket client"""
+    def _deliver(self, client: _ClientStream, event: StreamingEvent) -> None:
+        """Emitter callback: queue the shared payload from whichever thread emitted"""
+        payload = event.serialized()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is client.loop:
+            self._enqueue(client, event.sequence_number, payload)
+        elif not client.loop.is_closed():
+            client.loop.call_soon_threadsafe(self._enqueue, client, event.sequence_number, payload)
+    
+    def _enqueue(self, client: _ClientStream, sequence_number: int, payload: str) -> None:
+        if client.dropped:
+            return
+        if client.replaying:
+            client.limit += 1
+        elif client.queue.qsize() >= client.limit:
+            # Slow consumer: stop queueing and close; the client can resume
+            # from its last received sequence_number with ?after_seq=
+            client.dropped = True
+            self.slow_consumers_dropped += 1
+            print(f"[WebSocket] Dropping slow client for mission {client.mission_id} after seq {client.last_seq}")
+            asyncio.create_task(self._drop_slow_consumer(client))
+            return
+        client.queue.put_nowait(payload)
+        client.last_seq = sequence_number
+    
+    async def _drop_slow_consumer(self, client: _ClientStream) -> None:
+        await self.disconnect(client.mission_id, client.websocket)
+        try:
+            await client.websocket.close(code=SLOW_CONSUMER_CLOSE_CODE, reason="slow consumer; resume with after_seq")
+        except Exception:
+            pass
+    
+    async def _send_loop(self, client: _ClientStream) -> None:
+        """Write queued payloads to one client until it disconnects"""
         try:
-            print(f"[WebSocket] Sending {event.event_type} event to client")
-            await websocket.send_text(event.to_json())
+            while True:
+                payload = await client.queue.get()
+                await client.websocket.send_text(payload)
+                if client.limit > CLIENT_SEND_QUEUE_SIZE:
+                    client.limit -= 1
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
             print(f"[WebSocket] Error sending event: {type(e).__name__}: {e}")
+            await self.disconnect(client.mission_id, client.websocket)
     
     async def broadcast_to_mission(
         self,
@@ -67,12 +155,11 @@ class WebSocketStreamManager:
         event: StreamingEvent,
     ) -> None:
         """Broadcast event to all WebSocket clients for a mission"""
-        if mission_id in self.active_connections:
-            for websocket in list(self.active_connections[mission_id]):
-                try:
-                    await websocket.send_text(event.to_json())
-                except Exception as e:
-                    print(f"Error broadcasting to mission {mission_id}: {e}")
+        payload = event.serialized()
+        for websocket in list(self.active_connections.get(mission_id, ())):
+            client = self._clients.get(websocket)
+            if client is not None:
+                self._enqueue(client, event.sequence_number, payload)
 
 
 # Global stream manager
@@ -89,11 +176,20 @@ router = APIRouter()
 
 
 @router.websocket("/ws/stream/{mission_id}")
-async def websocket_stream_endpoint(mission_id: str, websocket: WebSocket):
+async def websocket_stream_endpoint(mission_id: str, websocket: WebSocket, after_seq: Optional[int] = None):
     """
     WebSocket endpoint for real-time mission execution events
     
     Connection URL: ws://localhost:8000/ws/stream/{mission_id}
+    Resume URL:     ws://localhost:8000/ws/stream/{mission_id}?after_seq=5
+    (replays only buffered events with sequence_number > 5)
+    
+    A client that falls CLIENT_SEND_QUEUE_SIZE events behind is closed with
+    code 1013 and should reconnect with after_seq set to the last
+    sequence_number it received. If some of the events it missed are no
+    longer buffered, the replay starts with a "stream_gap" event
+    (data: requested_after_seq, oldest_available_seq, reset) and the
+    client should treat its view of the mission as incomplete.
     
     Message Format (server → client):
     ```json
@@ -118,7 +214,7 @@ async def websocket_stream_endpoint(mission_id: str, websocket: WebSocket):
     """
     stream_manager = get_stream_manager()
     print(f"[WebSocket] New connection attempt for mission {mission_id}")
-    await stream_manager.connect(mission_id, websocket)
+    await stream_manager.connect(mission_id, websocket, after_seq=after_seq)
     print(f"[WebSocket] Connection accepted for mission {mission_id}")
     
     try:
@@ -0,0 +1,323 @@
+"""
+Metrics Rollup: hourly and daily pre-aggregates of an append-only JSONL log
+
+Each record is folded once into the hourly and daily bucket it falls in:
+nested counters/sums plus named QuantileSketches (latency, cost, ...).
+A time-range query merges whole days from the daily table and the partial
+days at either edge from the hourly table, so a 90-day window costs about
+140 bucket merges however many records the log holds.
+
+The log is tailed with SignalLogReader, so a restart resumes from the
+saved offset instead of re-reading history. Buckets are persisted one
+file each next to the cursor, and a refresh rewrites only the buckets it
+changed. Each bucket file carries the generation it was written at plus
+its previously committed contents; the cursor commits the generation, so
+a crash between the two writes falls back to the committed version
+rather than double counting.
+
+CONSTRAINTS:
+- READ-ONLY over the source log (tables live in a sidecar directory)
+- Range edges are resolved to whole hours (whole days once hourly buckets expire)
+- A truncated or replaced log is rebuilt from scratch
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import shutil
+import threading
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from Back_End.learning.signal_log_reader import SignalLogReader
+from Back_End.learning.signal_log_store import head_fingerprint
+from Back_End.quantile_sketch import QuantileSketch
+
+
+# Sidecar directory (next to the source log) holding rollup checkpoints
+ROLLUP_CURSOR_DIR_NAME = ".rollup_cursors"
+
+HOURLY_RETENTION_DAYS = 8
+DAILY_RETENTION_DAYS = 400
+
+TABLE_KINDS = ("hourly", "daily")
+
+HOUR_FORMAT = "%Y-%m-%dT%H"
+DAY_FORMAT = "%Y-%m-%d"
+
+# fold(record) -> (timestamp, counter increments, {sketch name: value}) or None to skip
+RollupFold = Callable[[Dict[str, Any]], Optional[Tuple[datetime, Dict[str, Any], Dict[str, float]]]]
+
+
+def add_counters(target: Dict[str, Any], increments: Dict[str, Any]) -> None:
+    """Sum nested numeric dicts: increments are added into target in place."""
+    for key, value in increments.items():
+        if isinstance(value, dict):
+            add_counters(target.setdefault(key, {}), value)
+        else:
+            target[key] = target.get(key, 0) + value
+
+
+@dataclass
+class RollupBucket:
+    counters: Dict[str, Any] = field(default_factory=dict)
+    sketches: Dict[str, QuantileSketch] = field(default_factory=dict)
+
+    def add(self, counters: Dict[str, Any], samples: Dict[str, float]) -> None:
+        add_counters(self.counters, counters)
+        for name, value in samples.items():
+            if value is not None:
+                self.sketches.setdefault(name, QuantileSketch()).add(value)
+
+    def merge(self, other: "RollupBucket") -> None:
+        add_counters(self.counters, other.counters)
+        for name, sketch in other.sketches.items():
+            self.sketches.setdefault(name, QuantileSketch()).merge(sketch)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "counters": self.counters,
+            "sketches": {name: sketch.to_dict() for name, sketch in self.sketches.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RollupBucket":
+        return cls(
+            counters=data.get("counters") or {},
+            sketches={
+                name: QuantileSketch.from_dict(sketch)
+                for name, sketch in (data.get("sketches") or {}).items()
+            },
+        )
+
+
+@dataclass
+class RollupWindow:
+    """Merged result of a range query."""
+    counters: Dict[str, Any]
+    sketches: Dict[str, QuantileSketch]
+    buckets_merged: int
+
+    def sketch(self, name: str) -> QuantileSketch:
+        """Merged sketch `name` (empty if no record in range carried it)."""
+        return self.sketches.get(name) or QuantileSketch()
+
+
+def _as_utc(ts: datetime) -> datetime:
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts.astimezone(timezone.utc)
+
+
+class MetricsRollup:
+    """Hourly/daily rollup tables for one JSONL log."""
+
+    def __init__(
+        self,
+        log_path: Path,
+        consumer: str,
+        fold: RollupFold,
+        hourly_retention_days: int = HOURLY_RETENTION_DAYS,
+        daily_retention_days: int = DAILY_RETENTION_DAYS,
+    ):
+        self.log_path = Path(log_path)
+        self.consumer = consumer
+        self.fold = fold
+        self.hourly_retention_days = hourly_retention_days
+        self.daily_retention_days = daily_retention_days
+
+        self._lock = threading.Lock()
+        cursor_dir = self.log_path.parent / ROLLUP_CURSOR_DIR_NAME
+        self.reader = SignalLogReader(self.log_path, consumer, cursor_dir=cursor_dir)
+        self.tables_root = cursor_dir / f"{consumer}.tables"
+        self._load_tables(self.reader.state)
+        self._fingerprint = (
+            head_fingerprint(self.log_path, self.reader.offset) if self.reader.segment is None else ""
+        )
+
+    # ------------------------------------------------------------------
+    # Table persistence
+    # ------------------------------------------------------------------
+
+    def _load_tables(self, state: Dict[str, Any]) -> None:
+        """Load the tables committed with the cursor state (empty state = fresh tables)."""
+        self.hourly: Dict[str, RollupBucket] = {}
+        self.daily: Dict[str, RollupBucket] = {}
+        # (kind, key) -> committed contents before this refresh touched it (None = new bucket)
+        self._snapshots: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+        self._generation = int(state.get("generation", 0))
+        self._epoch = state.get("tables")
+
+        if self._epoch is None:
+            # Fresh tables, or a checkpoint that carried the tables inline
+            self._epoch = uuid.uuid4().hex[:12]
+            for kind in TABLE_KINDS:
+                for key, value in (state.get(kind) or {}).items():
+                    self._tables(kind)[key] = RollupBucket.from_dict(value)
+                    self._snapshots[(kind, key)] = None
+            return
+
+        for kind in TABLE_KINDS:
+            directory = self.tables_root / self._epoch / kind
+            if not directory.exists():
+                continue
+            for path in directory.glob("*.json"):
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        record = json.load(f)
+                except (OSError, json.JSONDecodeError):
+                    continue
+                if record.get("generation", 0) <= self._generation:
+                    data = record.get("bucket")
+                else:
+                    # Written by a refresh whose cursor commit never landed
+                    data = record.get("previous")
+                if data is not None:
+                    self._tables(kind)[path.stem] = RollupBucket.from_dict(data)
+
+    def _tables(self, kind: str) -> Dict[str, RollupBucket]:
+        return self.hourly if kind == "hourly" else self.daily
+
+    def _bucket_for_update(self, kind: str, key: str) -> RollupBucket:
+        """The bucket `key`, remembering its committed contents the first time a refresh changes it."""
+        table = self._tables(kind)
+        bucket = table.get(key)
+        if (kind, key) not in self._snapshots:
+            self._snapshots[(kind, key)] = copy.deepcopy(bucket.to_dict()) if bucket else None
+        if bucket is None:
+            bucket = table[key] = RollupBucket()
+        return bucket
+
+    def _write_changed_buckets(self) -> None:
+        for (kind, key), previous in self._snapshots.items():
+            bucket = self._tables(kind).get(key)
+            if bucket is None:
+                continue  # pruned in the same refresh
+            directory = self.tables_root / self._epoch / kind
+            directory.mkdir(parents=True, exist_ok=True)
+            path = directory / f"{key}.json"
+            tmp_file = path.with_suffix(".json.tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({"generation": self._generation, "bucket": bucket.to_dict(), "previous": previous}, f)
+            os.replace(tmp_file, path)
+        self._snapshots.clear()
+
+    def _delete_buckets(self, expired: List[Tuple[str, str]]) -> None:
+        for kind, key in expired:
+            try:
+                (self.tables_root / self._epoch / kind / f"{key}.json").unlink()
+            except FileNotFoundError:
+                pass
+
+    def _remove_stale_epochs(self) -> None:
+        """Drop table directories left behind by a rebuild."""
+        if not self.tables_root.exists():
+            return
+        for directory in self.tables_root.iterdir():
+            if directory.is_dir() and directory.name != self._epoch:
+                shutil.rmtree(directory, ignore_errors=True)
+
+    def _commit(self, expired: List[Tuple[str, str]]) -> None:
+        """Write the changed buckets, then commit the cursor at the new generation."""
+        self._generation += 1
+        self._write_changed_buckets()
+        self.reader.commit({"tables": self._epoch, "generation": self._generation})
+        self._delete_buckets(expired)
+        self._remove_stale_epochs()
+
+    def _source_replaced(self) -> bool:
+        """Whether the active file shrank or its head changed since the last refresh."""
+        if self.reader.segment is not None or self.reader.offset == 0:
+            return False
+        if self.reader.position_rotated():
+            return False
+        if not self.log_path.exists() or self.log_path.stat().st_size < self.reader.offset:
+            return True
+        return head_fingerprint(self.log_path, self.reader.offset) != self._fingerprint
+
+    def refresh(self, now: Optional[datetime] = None) -> int:
+        """
+        Fold records appended since the last refresh and commit the changed buckets.
+
+        Returns:
+            Number of new records read
+        """
+        with self._lock:
+            replaced = self._source_replaced()
+            if replaced:
+                self.reader.reset()
+                self._load_tables({})
+
+            new_records = 0
+            for record in self.reader.read_new():
+                new_records += 1
+                folded = self.fold(record)
+                if folded is None:
+                    continue
+                ts, counters, samples = folded
+                ts = _as_utc(ts)
+                self._bucket_for_update("hourly", ts.strftime(HOUR_FORMAT)).add(counters, samples)
+                self._bucket_for_update("daily", ts.strftime(DAY_FORMAT)).add(counters, samples)
+
+            expired = self._prune(now or datetime.now(timezone.utc))
+            if new_records or expired or replaced or self._snapshots:
+                self._commit(expired)
+            if self.reader.segment is None:
+                self._fingerprint = head_fingerprint(self.log_path, self.reader.offset)
+            return new_records
+
+    def _prune(self, now: datetime) -> List[Tuple[str, str]]:
+        """Drop expired buckets from memory; returns their (kind, key) for deletion after commit."""
+        cutoffs = {
+            "hourly": (now - timedelta(days=self.hourly_retention_days)).strftime(HOUR_FORMAT),
+            "daily": (now - timedelta(days=self.daily_retention_days)).strftime(DAY_FORMAT),
+        }
+        expired = []
+        for kind in TABLE_KINDS:
+            table = self._tables(kind)
+            for key in [key for key in table if key < cutoffs[kind]]:
+                del table[key]
+                expired.append((kind, key))
+        return expired
+
+    def query(self, start: datetime, end: datetime, now: Optional[datetime] = None) -> RollupWindow:
+        """
+        Refresh, then merge the buckets covering [start, end].
+
+        Whole days inside the range come from the daily table; partial
+        days at the edges come from the hourly table, or from the daily
+        bucket once their hourly buckets have expired.
+        """
+        now = now or datetime.now(timezone.utc)
+        self.refresh(now)
+
+        start = _as_utc(start).replace(minute=0, second=0, microsecond=0)
+        end = _as_utc(end).replace(minute=0, second=0, microsecond=0)
+        hourly_from = (now - timedelta(days=self.hourly_retention_days)).strftime(HOUR_FORMAT)
+
+        merged = RollupBucket()
+        buckets_merged = 0
+        with self._lock:
+            cursor = start
+            while cursor <= end:
+                day_start = cursor.replace(hour=0)
+                next_day = day_start + timedelta(days=1)
+                whole_day = cursor == day_start and next_day - timedelta(hours=1) <= end
+                if whole_day or cursor.strftime(HOUR_FORMAT) < hourly_from:
+                    bucket = self.daily.get(cursor.strftime(DAY_FORMAT))
+                    cursor = next_day
+                else:
+                    bucket = self.hourly.get(cursor.strftime(HOUR_FORMAT))
+                    cursor += timedelta(hours=1)
+                if bucket is not None:
+                    merged.merge(bucket)
+                    buckets_merged += 1
+
+        return RollupWindow(
+            counters=merged.counters,
+            sketches=merged.sketches,
+            buckets_merged=buckets_merged,
+        )
@@ -0,0 +1,226 @@
+"""
+Mission Projection: incrementally maintained, mission-keyed views of the
+append-only JSONL logs behind the mission whiteboard.
+
+Each source file is tailed from the byte offset reached on the previous
+refresh (following learning signal rotation via SignalLogReader), and new
+records are filed under their keys. A whiteboard request then costs one
+refresh of the appended bytes plus keyed lookups instead of re-parsing
+every log.
+
+CONSTRAINTS:
+- READ-ONLY over the logs
+- A truncated or replaced source is rebuilt from scratch
+- Records are returned in log order, matching a full re-scan
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from Back_End.learning.signal_log_reader import SignalLogReader
+from Back_End.learning.signal_log_store import head_fingerprint
+
+
+# In-memory cursor name; projections never commit a checkpoint to disk
+PROJECTION_CONSUMER = "whiteboard_projection"
+
+# Signal types read by the mission whiteboard; everything else is skipped
+WHITEBOARD_SIGNAL_TYPES = {
+    "mission_progress_update",
+    "intent_action_taken",
+    "selector_outcome",
+    "goal_evaluation",
+    "opportunity_normalized",
+    "mission_ambiguous",
+    "mission_cost_report",
+    "decision_rationale",
+    "expectation_delta",
+    "drift_warning",
+}
+
+KeyFunction = Callable[[Dict[str, Any]], Iterable[str]]
+
+
+class KeyedJsonlView:
+    """Tails one JSONL log and keeps its records grouped under one or more keys."""
+
+    def __init__(self, path: Path, keys: Dict[str, KeyFunction]):
+        self.path = Path(path)
+        self.key_functions = keys
+        self.records_seen = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self.reader = SignalLogReader(self.path, PROJECTION_CONSUMER)
+        self.reader.reset()
+        self.index: Dict[str, Dict[str, List[Dict[str, Any]]]] = {
+            name: defaultdict(list) for name in self.key_functions
+        }
+        self.records_seen = 0
+        self._fingerprint = ""
+
+    def _source_replaced(self) -> bool:
+        """Whether the active file shrank or its head changed since the last refresh."""
+        if self.reader.segment is not None or self.reader.offset == 0:
+            return False
+        if self.reader.position_rotated():
+            # Sealed into a segment; the reader continues from there
+            return False
+        if not self.path.exists() or self.path.stat().st_size < self.reader.offset:
+            return True
+        return head_fingerprint(self.path, self.reader.offset) != self._fingerprint
+
+    def refresh(self) -> int:
+        """
+        File records appended since the last refresh.
+
+        Returns:
+            Number of new records read
+        """
+        if self._source_replaced():
+            self._reset()
+
+        before = self.records_seen
+        for record in self.reader.read_new():
+            self.records_seen += 1
+            for name, key_function in self.key_functions.items():
+                for key in key_function(record):
+                    self.index[name][key].append(record)
+
+        if self.reader.segment is None:
+            self._fingerprint = head_fingerprint(self.path, self.reader.offset)
+        return self.records_seen - before
+
+    def get(self, name: str, key: Optional[str]) -> List[Dict[str, Any]]:
+        """Records filed under `key` for key function `name`, in log order."""
+        if key is None:
+            return []
+        return list(self.index[name].get(key, []))
+
+
+def _mission_record_keys(record: Dict[str, Any]) -> Iterable[str]:
+    if record.get("event_type") == "mission_created":
+        mission_id = (record.get("mission") or {}).get("mission_id")
+    else:
+        mission_id = record.get("mission_id")
+    return [mission_id] if mission_id else []
+
+
+def _signal_mission_keys(signal: Dict[str, Any]) -> Iterable[str]:
+    if signal.get("signal_type") in WHITEBOARD_SIGNAL_TYPES and signal.get("mission_id"):
+        return [signal["mission_id"]]
+    return []
+
+
+def _signal_type_keys(signal: Dict[str, Any]) -> Iterable[str]:
+    return ["drift_warning"] if signal.get("signal_type") == "drift_warning" else []
+
+
+def _build_id_keys(record: Dict[str, Any]) -> Iterable[str]:
+    if record.get("event_type") == "build_created":
+        build_id = (record.get("build") or {}).get("build_id")
+    else:
+        build_id = record.get("build_id")
+    return [build_id] if build_id else []
+
+
+def _build_mission_keys(record: Dict[str, Any]) -> Iterable[str]:
+    if record.get("event_type") != "build_created":
+        return []
+    return list((record.get("build") or {}).get("mission_ids", []))
+
+
+def _field_keys(field: str) -> KeyFunction:
+    def keys(record: Dict[str, Any]) -> Iterable[str]:
+        value = record.get(field)
+        return [value] if value else []
+    return keys
+
+
+class MissionWhiteboardProjection:
+    """
+    Mission-keyed projection over missions, signals, builds, deliverables,
+    build reviews and artifacts.
+    """
+
+    def __init__(
+        self,
+        missions_file: Path,
+        signals_file: Path,
+        builds_file: Path,
+        deliverables_file: Path,
+        build_reviews_file: Path,
+        artifacts_file: Path,
+    ):
+        self.missions = KeyedJsonlView(missions_file, {"mission_id": _mission_record_keys})
+        self.signals = KeyedJsonlView(signals_file, {
+            "mission_id": _signal_mission_keys,
+            "signal_type": _signal_type_keys,
+        })
+        self.builds = KeyedJsonlView(builds_file, {
+            "build_id": _build_id_keys,
+            "mission_id": _build_mission_keys,
+        })
+        self.deliverables = KeyedJsonlView(deliverables_file, {
+            "build_id": _field_keys("build_id"),
+            "mission_id": _field_keys("mission_id"),
+        })
+        self.build_reviews = KeyedJsonlView(build_reviews_file, {"build_id": _field_keys("build_id")})
+        self.artifacts = KeyedJsonlView(artifacts_file, {"mission_id": _field_keys("created_by")})
+
+        self._lock = threading.Lock()
+
+    def refresh(self) -> Dict[str, int]:
+        """Catch every view up with its log; returns new records per source."""
+        with self._lock:
+            return {
+                "missions": self.missions.refresh(),
+                "signals": self.signals.refresh(),
+                "builds": self.builds.refresh(),
+                "deliverables": self.deliverables.refresh(),
+                "build_reviews": self.build_reviews.refresh(),
+                "artifacts": self.artifacts.refresh(),
+            }
+
+    def mission_view(self, mission_id: str) -> Dict[str, Any]:
+        """
+        Refresh, then return the records relevant to one mission.
+
+        Returns:
+            Dict with mission_records, signals, drift_warnings, build_records,
+            deliverables (keyed by build_id), mission_deliverables,
+            build_reviews and artifacts
+        """
+        self.refresh()
+        with self._lock:
+            build_ids: List[str] = []
+            for record in self.builds.get("mission_id", mission_id):
+                build_id = (record.get("build") or {}).get("build_id")
+                if build_id and build_id not in build_ids:
+                    build_ids.append(build_id)
+
+            build_records: List[Dict[str, Any]] = []
+            for build_id in build_ids:
+                build_records.extend(self.builds.get("build_id", build_id))
+
+            return {
+                "mission_records": self.missions.get("mission_id", mission_id),
+                "signals": self.signals.get("mission_id", mission_id),
+                "drift_warnings": self.signals.get("signal_type", "drift_warning"),
+                "build_records": build_records,
+                "deliverables": {
+                    build_id: self.deliverables.get("build_id", build_id)
+                    for build_id in build_ids
+                },
+                "mission_deliverables": self.deliverables.get("mission_id", mission_id),
+                "build_reviews": [
+                    review
+                    for build_id in build_ids
+                    for review in self.build_reviews.get("build_id", build_id)
+                ],
+                "artifacts": self.artifacts.get("mission_id", mission_id),
+            }
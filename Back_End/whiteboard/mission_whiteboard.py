@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from Back_End.learning.negative_knowledge_registry import get_negative_knowledge_for_whiteboard
+from Back_End.learning.signal_log_store import get_signal_log_store
+from Back_End.whiteboard.mission_projection import MissionWhiteboardProjection
 from Back_End.revenue_readiness_gate import RevenueReadinessGate
 
 
@@ -41,6 +43,33 @@ def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
     return records
 
 
+_projection: Optional[MissionWhiteboardProjection] = None
+_projection_sources: Optional[tuple] = None
+
+
+def _get_projection() -> MissionWhiteboardProjection:
+    """Shared mission projection over the current source files."""
+    global _projection, _projection_sources
+    sources = (MISSIONS_FILE, SIGNALS_FILE, BUILDS_FILE, DELIVERABLES_FILE, BUILD_REVIEWS_FILE, ARTIFACTS_FILE)
+    if _projection is None or sources != _projection_sources:
+        _projection = MissionWhiteboardProjection(*sources)
+        _projection_sources = sources
+    return _projection
+
+
+def _read_signals(
+    mission_id: Optional[str] = None,
+    signal_types: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Read learning signals across sealed segments and the active log.
+
+    The segment index is used to open only segments that can contain the
+    requested mission / signal types.
+    """
+    return get_signal_log_store(SIGNALS_FILE).read(signal_types=signal_types, mission_id=mission_id)
+
+
 def _reconstruct_builds(build_records: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
     """Reconstruct latest build state from append-only build records."""
     builds: Dict[str, Dict[str, Any]] = {}
@@ -117,9 +146,10 @@ def _deliverables_for_mission(deliverables: List[Dict[str, Any]], mission_id: st
     return results
 
 
-def _artifacts_summary(mission_id: str) -> Dict[str, Any]:
+def _artifacts_summary(mission_id: str, artifacts: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
     """Summarize artifacts for a mission (ignores artifacts without mission_id)."""
-    artifacts = _read_jsonl(ARTIFACTS_FILE)
+    if artifacts is None:
+        artifacts = _read_jsonl(ARTIFACTS_FILE)
     mission_artifacts = [a for a in artifacts if a.get("created_by") == mission_id]
 
     return {
@@ -381,8 +411,10 @@ def _mission_drift_warning(mission_id: str, signals: List[Dict[str, Any]]) -> Op
 
 
 def get_mission_whiteboard(mission_id: str) -> Dict[str, Any]:
-    mission_records = _read_jsonl(MISSIONS_FILE)
-    signals = _read_jsonl(SIGNALS_FILE)
+    # Keyed lookup into the incrementally maintained projection
+    view = _get_projection().mission_view(mission_id)
+    mission_records = view["mission_records"]
+    signals = view["signals"]
 
     created_record = _find_mission_created(mission_id, mission_records)
     latest_status = _find_latest_status(mission_id, mission_records)
@@ -422,24 +454,17 @@ def get_mission_whiteboard(mission_id: str) -> Dict[str, Any]:
     expectation_delta = _expectation_delta(mission_id, signals)
     expectation_alignment = expectation_delta.get("alignment") if expectation_delta else None
     expectation_misaligned = expectation_alignment == "misaligned"
-    drift_alerts = _drift_alerts(signals)
+    drift_alerts = _drift_alerts(view["drift_warnings"])
     mission_drift_warning = _mission_drift_warning(mission_id, signals)
 
-    build_records = _read_jsonl(BUILDS_FILE)
-    deliverable_records = _read_jsonl(DELIVERABLES_FILE)
-    review_records = _read_jsonl(BUILD_REVIEWS_FILE)
-
-    builds = _reconstruct_builds(build_records)
-    latest_reviews = _latest_build_reviews(review_records)
+    builds = _reconstruct_builds(view["build_records"])
+    latest_reviews = _latest_build_reviews(view["build_reviews"])
 
     mission_builds = []
     for build in builds.values():
         if mission_id in (build.get("mission_ids") or []):
             review = latest_reviews.get(build.get("build_id"))
-            deliverables_for_build = [
-                d for d in deliverable_records
-                if d.get("build_id") == build.get("build_id")
-            ]
+            deliverables_for_build = view["deliverables"].get(build.get("build_id"), [])
             readiness = RevenueReadinessGate.evaluate_from_records(
                 build_record=build,
                 deliverable_records=deliverables_for_build,
@@ -456,13 +481,13 @@ def get_mission_whiteboard(mission_id: str) -> Dict[str, Any]:
                 "revenue_readiness": readiness.to_dict(),
             })
 
-    mission_deliverables = _deliverables_for_mission(deliverable_records, mission_id)
+    mission_deliverables = _deliverables_for_mission(view["mission_deliverables"], mission_id)
 
     return {
         "mission_id": mission_id,
         "status": status,
         "objective": objective.get("description") or "",
-        "artifacts_summary": _artifacts_summary(mission_id),
+        "artifacts_summary": _artifacts_summary(mission_id, view["artifacts"]),
         "drift_alerts": drift_alerts,
         "mission_drift_warning": mission_drift_warning,
         "start_time": start_time,
@@ -499,7 +524,7 @@ def get_goal_whiteboard(goal_id: str) -> Dict[str, Any]:
     goals = _read_jsonl(GOALS_FILE)
     programs = _read_jsonl(PROGRAMS_FILE)
     mission_records = _read_jsonl(MISSIONS_FILE)
-    signals = _read_jsonl(SIGNALS_FILE)
+    signals = _read_signals(signal_types=["opportunity_normalized"])
     
     # Find goal
     goal_data = None
@@ -574,7 +599,7 @@ def get_program_whiteboard(program_id: str) -> Dict[str, Any]:
     """
     programs = _read_jsonl(PROGRAMS_FILE)
     mission_records = _read_jsonl(MISSIONS_FILE)
-    signals = _read_jsonl(SIGNALS_FILE)
+    signals = _read_signals(signal_types=["mission_progress_update", "opportunity_normalized", "goal_evaluation"])
     
     # Find program
     program_data = None
@@ -770,7 +795,7 @@ def get_signals_by_time_context(
     Returns:
         List of economic signals (mission_completed, opportunity_normalized) with matching time context
     """
-    signals = _read_jsonl(SIGNALS_FILE)
+    signals = _read_signals()
     
     # Filter for signals with time_context (mission_completed and opportunity_normalized)
     economic_signals = [
@@ -820,7 +845,7 @@ def get_mission_time_context(mission_id: str) -> Dict[str, Any]:
         - opportunity_normalized: List of time contexts for opportunity normalizations
         - summary: Statistics about mission timing
     """
-    signals = _read_jsonl(SIGNALS_FILE)
+    signals = _read_signals()
     
     mission_completed_time = None
     opportunity_times = []
@@ -881,7 +906,7 @@ def get_chat_observations(session_id: Optional[str] = None) -> List[Dict[str, An
     Returns:
         List of chat observation signals with intent, message, outcome
     """
-    signals = _read_jsonl(SIGNALS_FILE)
+    signals = _read_signals()
     
     chat_observations = [
         s for s in signals
@@ -6,7 +6,8 @@ Aggregates structured data from core logs and stores for the whiteboard UI.
 
 from __future__ import annotations
 
-import json
+import re
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
@@ -15,6 +16,8 @@ from typing import Dict, Any, List, Optional, Tuple
 from Back_End.budget_tracker import get_budget_tracker
 from Back_End.conversation.session_store import get_conversation_store
 from Back_End.mission_store import get_mission_store
+from Back_End.usage_log_sink import get_usage_log_sink
+from Back_End.whiteboard.metrics_rollup import MetricsRollup, RollupFold, RollupWindow
 
 
 API_USAGE_LOG = Path("outputs/phase25/api_usage.jsonl")
@@ -53,53 +56,115 @@ def _parse_timestamp(value: Any) -> Optional[datetime]:
     return None
 
 
-def _load_jsonl(path: Path) -> List[Dict[str, Any]]:
-    if not path.exists():
-        return []
-    records: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                records.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    return records
+def _build_time_range(days: int) -> TimeRange:
+    end = _now_utc()
+    start = end - timedelta(days=max(days, 1))
+    return TimeRange(start=start, end=end)
 
 
-def _filter_by_range(records: List[Dict[str, Any]], key: str, time_range: TimeRange) -> List[Dict[str, Any]]:
-    filtered: List[Dict[str, Any]] = []
-    for record in records:
-        ts = _parse_timestamp(record.get(key))
-        if not ts:
-            continue
-        if time_range.start <= ts <= time_range.end:
-            filtered.append(record)
-    return filtered
+# ---------------------------------------------------------------------------
+# Rollups: one hourly/daily table per log, folded as records are appended
+# ---------------------------------------------------------------------------
 
+_rollups: Dict[Tuple[str, str], MetricsRollup] = {}
+_rollups_lock = threading.Lock()
 
-def _percentile(values: List[float], percentile: float) -> float:
-    if not values:
-        return 0.0
-    ordered = sorted(values)
-    if len(ordered) == 1:
-        return ordered[0]
-    rank = max(0, min(len(ordered) - 1, int(round((percentile / 100) * (len(ordered) - 1)))))
-    return ordered[rank]
+# Path segments that are ids rather than route names: numbers, uuids/hashes, opaque tokens
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{16,}|(?=[A-Za-z_-]*\d)[A-Za-z0-9_-]{12,})$")
 
 
-def _build_time_range(days: int) -> TimeRange:
-    end = _now_utc()
-    start = end - timedelta(days=max(days, 1))
-    return TimeRange(start=start, end=end)
+def _query_rollup(path: Path, consumer: str, fold: RollupFold, days: int) -> RollupWindow:
+    key = (str(path), consumer)
+    with _rollups_lock:
+        rollup = _rollups.get(key)
+        if rollup is None:
+            rollup = _rollups[key] = MetricsRollup(path, consumer, fold)
+    time_range = _build_time_range(days)
+    return rollup.query(time_range.start, time_range.end)
+
+
+def route_template(path: str) -> str:
+    """Collapse id-like path segments (/api/missions/123 -> /api/missions/{id}) to bound endpoint keys."""
+    return "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+def _fold_api_usage(record: Dict[str, Any]):
+    ts = _parse_timestamp(record.get("timestamp"))
+    if not ts:
+        return None
+    path = route_template(record.get("path") or "unknown")
+    method = record.get("method") or "GET"
+    duration = float(record.get("duration_ms") or 0.0)
+    samples = {"latency": duration} if record.get("duration_ms") is not None else {}
+    return ts, {
+        "requests": 1,
+        "duration_ms": duration,
+        "endpoints": {path: {"count": 1, "duration_ms": duration, "methods": {method: 1}}},
+    }, samples
+
+
+def _fold_external_api_usage(record: Dict[str, Any]):
+    ts = _parse_timestamp(record.get("timestamp"))
+    if not ts:
+        return None
+    company = record.get("company") or "Unknown"
+    request_type = record.get("request_type") or "unknown"
+    duration = float(record.get("duration_ms") or 0.0)
+    cost = float(record.get("cost_usd") or 0.0)
+    return ts, {
+        "calls": 1,
+        "duration_ms": duration,
+        "companies": {company: {
+            "calls": 1,
+            "cost": cost,
+            "duration_ms": duration,
+            "request_types": {request_type: {"count": 1, "cost": cost, "duration_ms": duration}},
+        }},
+    }, {"latency": duration, "cost": cost}
+
+
+def _fold_budget_event(record: Dict[str, Any]):
+    ts = _parse_timestamp(record.get("timestamp"))
+    if not ts:
+        return None
+    event_type = record.get("event_type")
+    if event_type == "serpapi_usage":
+        counters = {"serpapi_searches": int(record.get("searches_used", 0) or 0)}
+    elif event_type == "openai_usage":
+        counters = {"openai_cost_usd": float(record.get("cost_usd", 0.0) or 0.0)}
+    elif event_type == "firestore_usage":
+        counters = {"firestore_cost_usd": float(record.get("cost_usd", 0.0) or 0.0)}
+    else:
+        return None
+    return ts, counters, {}
+
+
+def _fold_revenue_signal(record: Dict[str, Any]):
+    ts = _parse_timestamp(record.get("timestamp"))
+    if not ts:
+        return None
+    counters = {"records": 1}
+    signal = (record.get("signal_type") or record.get("event_type") or "").lower()
+    if "gig_recommended" in signal or "opportunity_recommended" in signal:
+        counters["gigs_recommended"] = 1
+    elif "gig_hired" in signal or "opportunity_hired" in signal:
+        counters["gigs_hired"] = 1
+    elif "invoice_received" in signal or "invoice_paid" in signal:
+        counters["invoices_received"] = 1
+    return ts, counters, {}
+
+
+def _fold_artifact(record: Dict[str, Any]):
+    ts = _parse_timestamp(record.get("timestamp"))
+    if not ts:
+        return None
+    artifact_type = record.get("artifact_type") or "unknown"
+    return ts, {"total": 1, "by_type": {artifact_type: 1}}, {}
 
 
 def log_api_usage(record: Dict[str, Any]) -> None:
-    API_USAGE_LOG.parent.mkdir(parents=True, exist_ok=True)
-    with API_USAGE_LOG.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(record) + "\n")
+    """Queue an API usage record; written in batches by the usage log sink."""
+    get_usage_log_sink().submit(API_USAGE_LOG, record)
 
 
 def log_external_api_usage(company: str, request_type: str, duration_ms: float = 0.0, cost_usd: float = 0.0) -> None:
@@ -112,7 +177,6 @@ def log_external_api_usage(company: str, request_type: str, duration_ms: float =
         duration_ms: Request duration in milliseconds
         cost_usd: Cost in USD for the request
     """
-    EXTERNAL_API_LOG.parent.mkdir(parents=True, exist_ok=True)
     record = {
         "timestamp": _now_utc().isoformat(),
         "company": company,
@@ -120,8 +184,7 @@ def log_external_api_usage(company: str, request_type: str, duration_ms: float =
         "duration_ms": duration_ms,
         "cost_usd": cost_usd,
     }
-    with EXTERNAL_API_LOG.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(record) + "\n")
+    get_usage_log_sink().submit(EXTERNAL_API_LOG, record)
 
 
 def _ensure_log_exists():
@@ -135,49 +198,30 @@ _ensure_log_exists()
 
 
 def collect_api_usage(days: int) -> Dict[str, Any]:
-    time_range = _build_time_range(days)
-    records = _filter_by_range(_load_jsonl(API_USAGE_LOG), "timestamp", time_range)
+    counters = _query_rollup(API_USAGE_LOG, "api_usage", _fold_api_usage, days).counters
 
-    total_requests = len(records)
-    by_endpoint: Dict[str, Dict[str, Any]] = {}
-    all_durations = []
-    
-    for record in records:
-        path = record.get("path") or "unknown"
-        method = record.get("method") or "GET"
-        duration = float(record.get("duration_ms") or 0.0)
-        entry = by_endpoint.setdefault(path, {
-            "path": path,
-            "count": 0,
-            "methods": {},
-            "durations": [],
-        })
-        entry["count"] += 1
-        entry["methods"][method] = entry["methods"].get(method, 0) + 1
-        entry["durations"].append(duration)
-        all_durations.append(duration)
-
-    # Calculate overall average latency
-    overall_avg_latency = round(sum(all_durations) / len(all_durations), 2) if all_durations else 0.0
+    total_requests = int(counters.get("requests", 0))
+    overall_avg_latency = round(counters.get("duration_ms", 0.0) / total_requests, 2) if total_requests else 0.0
 
     # Build endpoints array
     endpoints = []
     summary = {}
     
-    for entry in by_endpoint.values():
-        durations = entry["durations"]
-        avg_latency = round(sum(durations) / len(durations), 2) if durations else 0.0
+    for path, entry in counters.get("endpoints", {}).items():
+        count = int(entry.get("count", 0))
+        avg_latency = round(entry.get("duration_ms", 0.0) / count, 2) if count else 0.0
+        methods = {method: int(n) for method, n in entry.get("methods", {}).items()}
         endpoint_info = {
-            "path": entry["path"],
-            "count": entry["count"],
-            "methods": entry["methods"],
+            "path": path,
+            "count": count,
+            "methods": methods,
             "avg_latency_ms": avg_latency,
         }
         endpoints.append(endpoint_info)
-        summary[entry["path"]] = {
-            "count": entry["count"],
+        summary[path] = {
+            "count": count,
             "avg_latency_ms": avg_latency,
-            "methods": entry["methods"],
+            "methods": methods,
         }
 
     # Sort by request count (descending) to show most-slammed endpoints first
@@ -196,69 +240,35 @@ def collect_external_api_usage(days: int) -> Dict[str, Any]:
     Collect usage metrics for external APIs (OpenAI, SerpAPI, GoHighLevel, MSGraph, etc.)
     Groups by company name with request type breakdown
     """
-    time_range = _build_time_range(days)
-    records = _filter_by_range(_load_jsonl(EXTERNAL_API_LOG), "timestamp", time_range)
+    window = _query_rollup(EXTERNAL_API_LOG, "external_api_usage", _fold_external_api_usage, days)
+    counters = window.counters
+    latency = window.sketch("latency")
+    cost = window.sketch("cost")
     
-    total_calls = len(records)
-    by_company: Dict[str, Dict[str, Any]] = {}
-    all_durations = []
-    
-    for record in records:
-        company = record.get("company") or "Unknown"
-        request_type = record.get("request_type") or "unknown"
-        duration = float(record.get("duration_ms") or 0.0)
-        cost = float(record.get("cost_usd") or 0.0)
-        
-        if company not in by_company:
-            by_company[company] = {
-                "company": company,
-                "total_calls": 0,
-                "total_cost": 0.0,
-                "durations": [],
-                "request_types": {},
-            }
-        
-        company_data = by_company[company]
-        company_data["total_calls"] += 1
-        company_data["total_cost"] += cost
-        company_data["durations"].append(duration)
-        all_durations.append(duration)
-        
-        if request_type not in company_data["request_types"]:
-            company_data["request_types"][request_type] = {
-                "type": request_type,
-                "count": 0,
-                "cost": 0.0,
-                "durations": [],
-            }
-        
-        type_data = company_data["request_types"][request_type]
-        type_data["count"] += 1
-        type_data["cost"] += cost
-        type_data["durations"].append(duration)
+    total_calls = int(counters.get("calls", 0))
     
     # Calculate statistics for each company
     companies = []
-    for company_data in by_company.values():
-        durations = company_data["durations"]
-        avg_latency = round(sum(durations) / len(durations), 2) if durations else 0.0
+    for company, company_data in counters.get("companies", {}).items():
+        calls = int(company_data.get("calls", 0))
+        avg_latency = round(company_data.get("duration_ms", 0.0) / calls, 2) if calls else 0.0
         
         # Calculate stats for each request type
         request_types = []
-        for type_data in company_data["request_types"].values():
-            type_durations = type_data["durations"]
-            type_avg_latency = round(sum(type_durations) / len(type_durations), 2) if type_durations else 0.0
+        for request_type, type_data in company_data.get("request_types", {}).items():
+            count = int(type_data.get("count", 0))
+            type_avg_latency = round(type_data.get("duration_ms", 0.0) / count, 2) if count else 0.0
             request_types.append({
-                "type": type_data["type"],
-                "count": type_data["count"],
-                "cost": round(type_data["cost"], 4),
+                "type": request_type,
+                "count": count,
+                "cost": round(type_data.get("cost", 0.0), 4),
                 "avg_latency_ms": type_avg_latency,
             })
         
         companies.append({
-            "company": company_data["company"],
-            "total_calls": company_data["total_calls"],
-            "total_cost": round(company_data["total_cost"], 4),
+            "company": company,
+            "total_calls": calls,
+            "total_cost": round(company_data.get("cost", 0.0), 4),
             "avg_latency_ms": avg_latency,
             "request_types": sorted(request_types, key=lambda x: x["count"], reverse=True),
         })
@@ -266,44 +276,35 @@ def collect_external_api_usage(days: int) -> Dict[str, Any]:
     # Sort by total calls (most used first)
     companies.sort(key=lambda x: x["total_calls"], reverse=True)
     
-    overall_avg_latency = round(sum(all_durations) / len(all_durations), 2) if all_durations else 0.0
+    overall_avg_latency = round(counters.get("duration_ms", 0.0) / total_calls, 2) if total_calls else 0.0
     
     return {
         "total_calls": total_calls,
         "avg_latency_ms": overall_avg_latency,
+        "p95_latency_ms": round(latency.quantile(0.95), 2),
+        "p99_latency_ms": round(latency.quantile(0.99), 2),
+        "p95_cost_per_call_usd": round(cost.quantile(0.95), 6),
         "by_company": companies,
     }
 
 
 def collect_response_times(days: int) -> Dict[str, Any]:
-    time_range = _build_time_range(days)
-    records = _filter_by_range(_load_jsonl(API_USAGE_LOG), "timestamp", time_range)
-    durations = [float(r.get("duration_ms") or 0.0) for r in records if r.get("duration_ms") is not None]
-    avg_ms = round(sum(durations) / len(durations), 2) if durations else 0.0
+    latency = _query_rollup(API_USAGE_LOG, "api_usage", _fold_api_usage, days).sketch("latency")
     return {
-        "avg_ms": avg_ms,
-        "p50_ms": round(_percentile(durations, 50), 2),
-        "p95_ms": round(_percentile(durations, 95), 2),
-        "count": len(durations),
+        "avg_ms": round(latency.mean, 2),
+        "p50_ms": round(latency.quantile(0.50), 2),
+        "p95_ms": round(latency.quantile(0.95), 2),
+        "p99_ms": round(latency.quantile(0.99), 2),
+        "count": int(latency.count),
     }
 
 
 def collect_costing(days: int) -> Dict[str, Any]:
-    time_range = _build_time_range(days)
-    records = _filter_by_range(_load_jsonl(BUDGETS_LOG), "timestamp", time_range)
+    counters = _query_rollup(BUDGETS_LOG, "budgets", _fold_budget_event, days).counters
 
-    serpapi_searches = 0
-    openai_cost = 0.0
-    firestore_cost = 0.0
-
-    for record in records:
-        event_type = record.get("event_type")
-        if event_type == "serpapi_usage":
-            serpapi_searches += int(record.get("searches_used", 0) or 0)
-        elif event_type == "openai_usage":
-            openai_cost += float(record.get("cost_usd", 0.0) or 0.0)
-        elif event_type == "firestore_usage":
-            firestore_cost += float(record.get("cost_usd", 0.0) or 0.0)
+    serpapi_searches = int(counters.get("serpapi_searches", 0))
+    openai_cost = counters.get("openai_cost_usd", 0.0)
+    firestore_cost = counters.get("firestore_cost_usd", 0.0)
 
     budget_tracker = get_budget_tracker()
     serpapi_budget = budget_tracker.get_serpapi_budget()
@@ -335,27 +336,13 @@ def collect_costing(days: int) -> Dict[str, Any]:
 
 
 def collect_income(days: int) -> Dict[str, Any]:
-    time_range = _build_time_range(days)
-    records = _filter_by_range(_load_jsonl(REVENUE_SIGNALS_LOG), "timestamp", time_range)
-
-    gigs_recommended = 0
-    gigs_hired = 0
-    invoices_received = 0
-
-    for record in records:
-        signal = (record.get("signal_type") or record.get("event_type") or "").lower()
-        if "gig_recommended" in signal or "opportunity_recommended" in signal:
-            gigs_recommended += 1
-        elif "gig_hired" in signal or "opportunity_hired" in signal:
-            gigs_hired += 1
-        elif "invoice_received" in signal or "invoice_paid" in signal:
-            invoices_received += 1
+    counters = _query_rollup(REVENUE_SIGNALS_LOG, "revenue_signals", _fold_revenue_signal, days).counters
 
     return {
-        "gigs_recommended": gigs_recommended,
-        "gigs_hired": gigs_hired,
-        "invoices_received": invoices_received,
-        "source": "revenue_signals" if records else "no_records",
+        "gigs_recommended": int(counters.get("gigs_recommended", 0)),
+        "gigs_hired": int(counters.get("gigs_hired", 0)),
+        "invoices_received": int(counters.get("invoices_received", 0)),
+        "source": "revenue_signals" if counters.get("records") else "no_records",
     }
 
 
@@ -404,15 +391,13 @@ def collect_session_stats() -> Dict[str, Any]:
     sessions = store.list_sessions()
     session_rows = []
     for session in sessions:
-        sent = sum(1 for m in session.messages if m.role == "user")
-        received = sum(1 for m in session.messages if m.role == "assistant")
         session_rows.append({
             "session_id": session.session_id,
             "source": session.source,
-            "messages_sent": sent,
-            "messages_received": received,
-            "total_messages": len(session.messages),
-            "last_message_at": session.messages[-1].timestamp if session.messages else None,
+            "messages_sent": session.role_count("user"),
+            "messages_received": session.role_count("assistant"),
+            "total_messages": session.message_count,
+            "last_message_at": session.last_message_at,
             "title": session.title,
             "archived": session.archived,
         })
@@ -423,17 +408,11 @@ def collect_session_stats() -> Dict[str, Any]:
 
 
 def collect_artifacts(days: int) -> Dict[str, Any]:
-    time_range = _build_time_range(days)
-    records = _filter_by_range(_load_jsonl(ARTIFACTS_LOG), "timestamp", time_range)
-
-    counts: Dict[str, int] = {}
-    for record in records:
-        artifact_type = record.get("artifact_type") or "unknown"
-        counts[artifact_type] = counts.get(artifact_type, 0) + 1
+    counters = _query_rollup(ARTIFACTS_LOG, "artifacts", _fold_artifact, days).counters
 
     return {
-        "total": len(records),
-        "by_type": counts,
+        "total": int(counters.get("total", 0)),
+        "by_type": {artifact_type: int(n) for artifact_type, n in counters.get("by_type", {}).items()},
     }
 
 
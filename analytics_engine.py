@@ -4,20 +4,46 @@ Orchestrates metrics collection, storage, aggregation, and learning profile buil
 Integrates with existing budget_tracker, cost_tracker, and human_energy_model systems.
 """
 
+import atexit
 import json
+import queue
 import sqlite3
 import threading
 import time
-from datetime import datetime, timedelta
+import weakref
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass, asdict, field
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Deque, Dict, List, Optional, Tuple, Any
 from enum import Enum
-from collections import defaultdict
+from collections import defaultdict, deque
 import logging
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Tier 1 group commit: rows are committed every METRICS_BATCH_SIZE rows or
+# METRICS_FLUSH_INTERVAL_SECONDS after the first queued row
+METRICS_BATCH_SIZE = 100
+METRICS_FLUSH_INTERVAL_SECONDS = 0.25
+# Rows queued beyond this block record_execution() until the writer catches up
+METRICS_MAX_PENDING = 10000
+# A batch that fails to commit is retried on a fresh connection, backing off
+# METRICS_RETRY_BACKOFF_SECONDS * 2**attempt, before it is dropped
+METRICS_WRITE_ATTEMPTS = 3
+METRICS_RETRY_BACKOFF_SECONDS = 0.1
+# Recent metrics kept in memory (MetricsCollector.metrics_buffer)
+METRICS_BUFFER_SIZE = 1000
+
+_INSERT_TIER1_SQL = """
+    INSERT INTO tier1_raw_metrics
+    (task_id, agent_id, tool_name, duration_seconds, success,
+     cost_actual, human_effort_level, tokens_used, browser_used, timestamp, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Collectors whose queued metrics are committed at interpreter exit
+_live_collectors: "weakref.WeakSet[MetricsCollector]" = weakref.WeakSet()
+
 
 class ConfidenceLevel(Enum):
     """Learning-driven tool confidence levels."""
@@ -97,19 +123,69 @@ class HourlySummary:
     tool_execution_counts: Dict[str, int] = field(default_factory=dict)
 
 
+class _FlushMarker:
+    """
+    Control item on the write queue; the writer sets `done` once everything
+    before it is committed or given up on (`committed` is False if any of it
+    was dropped).
+    """
+
+    def __init__(self, stop: bool = False):
+        self.stop = stop
+        self.committed = True
+        self.done = threading.Event()
+
+
 class MetricsCollector:
-    """Collects execution metrics from task execution pipeline."""
+    """
+    Collects execution metrics from task execution pipeline.
     
-    def __init__(self, db_path: str = "data/analytics.db"):
+    record_execution() only queues the row. One writer thread per collector
+    holds a long-lived WAL-mode connection and group-commits queued rows
+    every `batch_size` rows or `flush_interval` seconds, whichever comes
+    first. Reads flush first, so they always see every recorded metric.
+    A failed commit is retried on a fresh connection; the writer thread
+    survives connection and write errors.
+    `metrics_buffer` keeps the last `buffer_size` metrics in memory.
+    """
+    
+    def __init__(
+        self,
+        db_path: str = "data/analytics.db",
+        batch_size: int = METRICS_BATCH_SIZE,
+        flush_interval: float = METRICS_FLUSH_INTERVAL_SECONDS,
+        buffer_size: int = METRICS_BUFFER_SIZE
+    ):
         self.db_path = db_path
-        self.metrics_buffer = []
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval)
+        self.metrics_buffer: Deque[ExecutionMetrics] = deque(maxlen=buffer_size)
         self.lock = threading.Lock()
+        
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=METRICS_MAX_PENDING)
+        self._writer: Optional[threading.Thread] = None
+        self._reader: Optional[sqlite3.Connection] = None
+        self._reader_path: Optional[str] = None
+        self._closed = False
+        
+        self.rows_written = 0
+        self.commits = 0
+        self.write_errors = 0
+        self.rows_dropped = 0
+        
         self._init_database()
+        _live_collectors.add(self)
+    
+    def _connect(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=check_same_thread)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
     
     def _init_database(self):
         """Initialize Tier 1 raw metrics table."""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -137,40 +213,162 @@ class MetricsCollector:
         conn.close()
     
     def record_execution(self, metrics: ExecutionMetrics) -> None:
-        """Record a single execution metric."""
+        """Record a single execution metric (queued for the next group commit)."""
+        # created_at is stamped here, in CURRENT_TIMESTAMP format, so a row's
+        # age does not depend on when its batch was committed
+        row = (
+            metrics.task_id,
+            metrics.agent_id,
+            metrics.tool_name,
+            metrics.duration_seconds,
+            1 if metrics.success else 0,
+            metrics.cost_actual,
+            metrics.human_effort_level,
+            metrics.tokens_used,
+            1 if metrics.browser_used else 0,
+            metrics.timestamp,
+            datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        )
+        self._ensure_writer()
+        self._queue.put(row)
         with self.lock:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT INTO tier1_raw_metrics 
-                (task_id, agent_id, tool_name, duration_seconds, success, 
-                 cost_actual, human_effort_level, tokens_used, browser_used, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                metrics.task_id,
-                metrics.agent_id,
-                metrics.tool_name,
-                metrics.duration_seconds,
-                1 if metrics.success else 0,
-                metrics.cost_actual,
-                metrics.human_effort_level,
-                metrics.tokens_used,
-                1 if metrics.browser_used else 0,
-                metrics.timestamp
-            ))
+            self.metrics_buffer.append(metrics)
+    
+    def flush(self, timeout: Optional[float] = 10.0) -> bool:
+        """Block until every metric recorded before this call is committed."""
+        writer = self._writer
+        if writer is None or not writer.is_alive():
+            return True
+        marker = _FlushMarker()
+        self._queue.put(marker)
+        return marker.done.wait(timeout) and marker.committed
+    
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """Commit queued metrics and stop the writer thread."""
+        with self.lock:
+            if self._closed:
+                return
+            self._closed = True
+            writer = self._writer
+            reader, self._reader = self._reader, None
+        if reader is not None:
+            reader.close()
+        if writer is not None and writer.is_alive():
+            marker = _FlushMarker(stop=True)
+            self._queue.put(marker)
+            writer.join(timeout)
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "rows_written": self.rows_written,
+            "commits": self.commits,
+            "write_errors": self.write_errors,
+            "rows_dropped": self.rows_dropped,
+            "buffered": len(self.metrics_buffer),
+        }
+    
+    def _ensure_writer(self) -> None:
+        if self._writer is not None and self._writer.is_alive():
+            return
+        with self.lock:
+            if self._writer is not None and self._writer.is_alive():
+                return
+            self._closed = False
+            self._writer = threading.Thread(target=self._run_writer, name="metrics-writer", daemon=True)
+            self._writer.start()
+    
+    def _run_writer(self) -> None:
+        conn: Optional[sqlite3.Connection] = None
+        conn_path: Optional[str] = None
+        committed = True  # everything since the last marker was committed
+        while True:
+            item = self._queue.get()
+            batch: List[Tuple] = []
+            marker: Optional[_FlushMarker] = None
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if isinstance(item, _FlushMarker):
+                    marker = item
+                    break
+                batch.append(item)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= self.batch_size or remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
             
-            conn.commit()
+            try:
+                if batch:
+                    conn, conn_path, written = self._commit_with_retry(conn, conn_path, batch)
+                    committed = committed and written
+            finally:
+                if marker is not None:
+                    marker.committed = committed
+                    committed = True
+                    marker.done.set()
+            if marker is not None and marker.stop:
+                self._close_quietly(conn)
+                return
+    
+    def _commit_with_retry(
+        self, conn: Optional[sqlite3.Connection], conn_path: Optional[str], batch: List[Tuple]
+    ) -> Tuple[Optional[sqlite3.Connection], Optional[str], bool]:
+        """Commit a batch, reconnecting and backing off between attempts; drops it after the last one."""
+        for attempt in range(METRICS_WRITE_ATTEMPTS):
+            try:
+                if conn is None or conn_path != self.db_path:
+                    self._close_quietly(conn)
+                    conn = None
+                    conn, conn_path = self._connect(), self.db_path
+                self._write_batch(conn, batch)
+                return conn, conn_path, True
+            except Exception as e:
+                self.write_errors += 1
+                logger.error(
+                    f"Failed to write {len(batch)} execution metrics "
+                    f"(attempt {attempt + 1}/{METRICS_WRITE_ATTEMPTS}): {e}"
+                )
+                self._close_quietly(conn)
+                conn = None
+                if attempt + 1 < METRICS_WRITE_ATTEMPTS:
+                    time.sleep(METRICS_RETRY_BACKOFF_SECONDS * 2 ** attempt)
+        self.rows_dropped += len(batch)
+        return None, None, False
+    
+    @staticmethod
+    def _close_quietly(conn: Optional[sqlite3.Connection]) -> None:
+        if conn is None:
+            return
+        try:
             conn.close()
-            self.metrics_buffer.append(metrics)
+        except sqlite3.Error:
+            pass
+    
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[Tuple]) -> None:
+        """Insert and commit one batch; raises on failure (nothing is committed)."""
+        conn.executemany(_INSERT_TIER1_SQL, batch)
+        conn.commit()
+        self.rows_written += len(batch)
+        self.commits += 1
+    
+    def _read(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        """Run a query on the long-lived reader connection after flushing queued writes."""
+        self.flush()
+        with self.lock:
+            if self._reader is None or self._reader_path != self.db_path:
+                if self._reader is not None:
+                    self._reader.close()
+                self._reader = self._connect(check_same_thread=False)
+                self._reader_path = self.db_path
+            return self._reader.execute(sql, params).fetchall()
     
     def get_recent_metrics(self, hours: int = 24) -> List[ExecutionMetrics]:
         """Retrieve recent metrics from Tier 1 storage."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         cutoff_time = datetime.now() - timedelta(hours=hours)
-        cursor.execute("""
+        rows = self._read("""
             SELECT task_id, agent_id, tool_name, duration_seconds, success,
                    cost_actual, human_effort_level, tokens_used, browser_used, timestamp
             FROM tier1_raw_metrics
@@ -179,7 +377,7 @@ class MetricsCollector:
         """, (cutoff_time,))
         
         metrics = []
-        for row in cursor.fetchall():
+        for row in rows:
             metrics.append(ExecutionMetrics(
                 task_id=row[0],
                 agent_id=row[1],
@@ -195,12 +393,39 @@ class MetricsCollector:
                 end_time=0
             ))
         
-        conn.close()
         return metrics
     
+    def aggregate_recent(self, hours: int = 1) -> Optional[Dict[str, Any]]:
+        """Totals and per-tool counts for recent metrics, computed in SQL."""
+        cutoff_time = datetime.now() - timedelta(hours=hours)
+        totals = self._read("""
+            SELECT COUNT(*), SUM(success), SUM(cost_actual), SUM(tokens_used), AVG(duration_seconds)
+            FROM tier1_raw_metrics
+            WHERE created_at > ?
+        """, (cutoff_time,))[0]
+        if not totals[0]:
+            return None
+        
+        tool_counts = self._read("""
+            SELECT tool_name, COUNT(*)
+            FROM tier1_raw_metrics
+            WHERE created_at > ?
+            GROUP BY tool_name
+        """, (cutoff_time,))
+        
+        return {
+            "total_tasks": totals[0],
+            "successful_tasks": totals[1] or 0,
+            "total_cost": totals[2] or 0.0,
+            "total_tokens": totals[3] or 0,
+            "avg_task_duration": totals[4] or 0.0,
+            "tool_execution_counts": dict(tool_counts),
+        }
+    
     def cleanup_old_metrics(self, hours: int = 24) -> int:
         """Remove metrics older than specified hours (Tier 1 retention)."""
-        conn = sqlite3.connect(self.db_path)
+        self.flush()
+        conn = self._connect()
         cursor = conn.cursor()
         
         cutoff_time = datetime.now() - timedelta(hours=hours)
@@ -214,6 +439,14 @@ class MetricsCollector:
         return deleted
 
 
+def _close_collectors() -> None:
+    for collector in list(_live_collectors):
+        collector.close()
+
+
+atexit.register(_close_collectors)
+
+
 class StorageManager:
     """Manages three-tier storage: Tier 1 (raw), Tier 2 (summaries), Tier 3 (profiles)."""
     
@@ -564,35 +797,20 @@ class HourlyAggregator:
         hour_start = now.replace(minute=0, second=0, microsecond=0)
         hour_timestamp = hour_start.isoformat()
         
-        # Get metrics from last hour
-        metrics = self.collector.get_recent_metrics(hours=1)
+        totals = self.collector.aggregate_recent(hours=1)
         
-        if not metrics:
+        if not totals:
             return None
         
-        # Calculate aggregations
-        total_tasks = len(metrics)
-        successful = len([m for m in metrics if m.success])
-        failed = total_tasks - successful
-        
-        total_cost = sum(m.cost_actual for m in metrics)
-        total_tokens = sum(m.tokens_used for m in metrics)
-        avg_duration = sum(m.duration_seconds for m in metrics) / total_tasks if total_tasks > 0 else 0.0
-        
-        # Count executions by tool
-        tool_counts = defaultdict(int)
-        for m in metrics:
-            tool_counts[m.tool_name] += 1
-        
         summary = HourlySummary(
             hour_timestamp=hour_timestamp,
-            total_tasks=total_tasks,
-            successful_tasks=successful,
-            failed_tasks=failed,
-            total_cost=total_cost,
-            total_tokens=total_tokens,
-            avg_task_duration=avg_duration,
-            tool_execution_counts=dict(tool_counts)
+            total_tasks=totals["total_tasks"],
+            successful_tasks=totals["successful_tasks"],
+            failed_tasks=totals["total_tasks"] - totals["successful_tasks"],
+            total_cost=totals["total_cost"],
+            total_tokens=totals["total_tokens"],
+            avg_task_duration=totals["avg_task_duration"],
+            tool_execution_counts=totals["tool_execution_counts"]
         )
         
         # Store to Tier 2
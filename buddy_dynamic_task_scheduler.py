@@ -19,6 +19,8 @@ Author: Buddy Phase 6 Architecture Team
 Date: February 5, 2026
 """
 
+import heapq
+import itertools
 import json
 import threading
 import time
@@ -28,7 +30,6 @@ from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Callable, Any, Set
-from queue import PriorityQueue
 import logging
 
 # Configure logging
@@ -157,8 +158,9 @@ class TaskScheduler:
     
     Features:
     - Thread-safe task queue management
-    - Priority-based task selection
-    - Dependency resolution and blocking
+    - Priority-based task selection from a heap of ready tasks
+    - Dependency resolution and blocking (completing a task only
+      touches the tasks that depend on it)
     - Risk-aware execution (respects dry-run mode)
     - Retry logic with exponential backoff
     - Conditional branching based on outcomes
@@ -192,9 +194,17 @@ class TaskScheduler:
         
         # Task storage
         self.tasks: Dict[str, Task] = {}
-        self.task_queue: PriorityQueue = PriorityQueue()
         self.active_tasks: Set[str] = set()
         
+        # Dispatch index: heap of (priority, sequence, task_id) for tasks whose
+        # dependencies are met, unmet dependency ids per waiting task, and
+        # the waiting tasks for each dependency id
+        self._ready: List[tuple] = []
+        self._queued: Set[str] = set()
+        self._sequence = itertools.count()
+        self._waiting: Dict[str, Set[str]] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        
         # Thread safety
         self.lock = threading.RLock()
         self.condition = threading.Condition(self.lock)
@@ -290,8 +300,8 @@ class TaskScheduler:
             # Store task
             self.tasks[task_id] = task
             
-            # Add to queue
-            self.task_queue.put((task.priority.value, time.time(), task_id))
+            # Add to ready queue, or wait on unmet dependencies
+            self._register_dependencies(task)
             
             logger.info(f"Added task: {task_id} - {description} "
                        f"(priority={priority.name}, risk={risk_level.name})")
@@ -332,6 +342,93 @@ class TaskScheduler:
         
         return True
     
+    def _register_dependencies(self, task: Task):
+        """
+        Queue task if its dependencies are met, otherwise record it as waiting
+        on the unmet ones (caller holds the lock)
+        """
+        unmet = set()
+        for dep in task.dependencies:
+            dep_task = self.tasks.get(dep.task_id)
+            if dep_task is None or dep_task.status != dep.required_status:
+                unmet.add(dep.task_id)
+                self._dependents.setdefault(dep.task_id, set()).add(task.id)
+        
+        if unmet:
+            self._waiting[task.id] = unmet
+        else:
+            self._waiting.pop(task.id, None)
+            self._push_ready(task)
+    
+    def _push_ready(self, task: Task):
+        """Add task to the ready heap once (caller holds the lock)"""
+        if task.id not in self._queued:
+            self._queued.add(task.id)
+            heapq.heappush(self._ready, (task.priority.value, next(self._sequence), task.id))
+    
+    def _next_ready_task(self) -> Optional[Task]:
+        """
+        Pop the highest-priority task that should execute now, FIFO within a
+        priority (caller holds the lock)
+        
+        Returns:
+            Task to execute, or None if no task is ready
+        """
+        while self._ready:
+            _, _, task_id = heapq.heappop(self._ready)
+            self._queued.discard(task_id)
+            task = self.tasks.get(task_id)
+            if task is None or task.status != TaskStatus.PENDING or task_id in self.active_tasks:
+                # Removed or already handled since it was queued
+                continue
+            
+            if self._should_execute_task(task):
+                return task
+            
+            if task.status == TaskStatus.PENDING:
+                self._register_dependencies(task)
+            else:
+                # Deferred or out of attempts: settle its dependents
+                self._task_finished(task)
+        
+        return None
+    
+    def _task_finished(self, task: Task):
+        """
+        Update the dispatch index after a task leaves execution (caller holds
+        the lock). Only the task's own dependents are examined.
+        """
+        if task.status == TaskStatus.PENDING:
+            # Retry
+            self._push_ready(task)
+            return
+        
+        for dependent_id in self._dependents.pop(task.id, ()):
+            unmet = self._waiting.get(dependent_id)
+            dependent = self.tasks.get(dependent_id)
+            if unmet is None or dependent is None:
+                continue
+            if any(dep.task_id == task.id and dep.required_status == task.status
+                   for dep in dependent.dependencies):
+                unmet.discard(task.id)
+                if not unmet:
+                    del self._waiting[dependent_id]
+                    self._push_ready(dependent)
+    
+    def _recheck_waiting(self):
+        """
+        Re-evaluate waiting tasks from scratch (caller holds the lock).
+        
+        Only run while idle: covers dependencies whose status was set
+        directly on self.tasks rather than through execution.
+        """
+        for task_id in list(self._waiting):
+            task = self.tasks.get(task_id)
+            if task is None or task.status != TaskStatus.PENDING:
+                del self._waiting[task_id]
+            else:
+                self._register_dependencies(task)
+    
     def _should_execute_task(self, task: Task) -> bool:
         """
         Evaluate if task should be executed now
@@ -440,11 +537,11 @@ class TaskScheduler:
             # Retry logic
             if task.attempt_count < task.max_attempts:
                 logger.info(f"Retrying task {task.id} (attempt {task.attempt_count + 1}/{task.max_attempts})")
-                # Re-queue with exponential backoff
+                # Re-queue with exponential backoff (the executor loop
+                # returns PENDING tasks to the ready heap)
                 backoff_seconds = 2 ** task.attempt_count
                 time.sleep(backoff_seconds)
                 task.status = TaskStatus.PENDING
-                self.task_queue.put((task.priority.value, time.time(), task.id))
                 return False
             
             return False
@@ -476,10 +573,11 @@ class TaskScheduler:
                 # Add next task
                 if branch.next_task_id:
                     # Reference existing task
-                    next_task = self.tasks.get(branch.next_task_id)
-                    if next_task:
-                        self.task_queue.put((next_task.priority.value, time.time(), branch.next_task_id))
-                        logger.info(f"Queued conditional task: {branch.next_task_id}")
+                    with self.lock:
+                        next_task = self.tasks.get(branch.next_task_id)
+                        if next_task and next_task.status == TaskStatus.PENDING:
+                            self._register_dependencies(next_task)
+                            logger.info(f"Queued conditional task: {branch.next_task_id}")
                 
                 elif branch.next_task_template:
                     # Create new task from template
@@ -573,28 +671,14 @@ class TaskScheduler:
                         self.condition.wait(timeout=0.5)
                         continue
                     
-                    # Try to find next executable task (highest priority)
-                    found_task = False
-                    best_task = None
-                    best_priority = TaskPriority.BACKGROUND  # Lowest priority (highest value)
-                    
-                    # Find pending task with highest priority (lowest priority value)
-                    for task_id, task in self.tasks.items():
-                        if task.status == TaskStatus.PENDING and task_id not in self.active_tasks:
-                            if self._check_dependencies(task):
-                                # Task is ready to execute
-                                # Compare priorities (lower value = higher priority)
-                                if task.priority.value < best_priority.value:
-                                    best_task = task
-                                    best_priority = task.priority
-                                    found_task = True
-                    
-                    if found_task and best_task:
-                        task_to_execute = best_task
+                    # Next executable task (highest priority)
+                    task_to_execute = self._next_ready_task()
+                    if task_to_execute:
                         break
                     
                     # No executable tasks - wait for notification
-                    self.condition.wait(timeout=1.0)
+                    if not self.condition.wait(timeout=1.0):
+                        self._recheck_waiting()
                 
                 if not self.running:
                     break
@@ -610,6 +694,7 @@ class TaskScheduler:
                     with self.lock:
                         self.active_tasks.discard(task_to_execute.id)
                         self.total_tasks_executed += 1
+                        self._task_finished(task_to_execute)
                         self.condition.notify_all()
         
         logger.info("Task executor stopped")
@@ -698,6 +783,8 @@ class TaskScheduler:
                     if self.total_tasks_executed > 0 else 0.0
                 ),
                 'active_tasks': len(self.active_tasks),
+                'ready_tasks': len(self._queued),
+                'waiting_on_dependencies': len(self._waiting),
                 'pending_tasks': sum(
                     1 for t in self.tasks.values()
                     if t.status == TaskStatus.PENDING
@@ -3,14 +3,25 @@ Phase 19: Optimization & Adaptive Scheduling - Adaptive Optimizer
 
 Applies optimization algorithms to multi-agent task assignment and scheduling.
 Uses Phase 18 coordination patterns to maximize efficiency and success rates.
+
+Task/agent scores are computed as NumPy matrices (tasks x agents), and the
+success, retry and confidence strategies solve a min-cost assignment under
+per-agent capacity rather than dealing tasks round-robin.
 """
 
 import json
+import math
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Union
+
+import numpy as np
+
+RISK_WEIGHTS = {"LOW": 0.0, "MEDIUM": 0.1, "HIGH": 0.2}
+# Reduced costs within this tolerance count as ties when moving tasks in bulk
+COST_TOLERANCE = 1e-9
 
 
 class OptimizationStrategy(Enum):
@@ -48,6 +59,130 @@ class ScheduleRecommendation:
     confidence: float
 
 
+def min_cost_assignment(cost: np.ndarray, capacity: np.ndarray) -> np.ndarray:
+    """
+    Assign every task (row) to an agent (column) at minimum total cost with
+    at most capacity[a] tasks per agent.
+    
+    Every task starts on its cheapest agent; excess on over-capacity agents
+    is then moved by successive shortest paths over the agent graph, where
+    the weight of edge (u, v) is the cheapest cost of moving one of u's
+    tasks to v. Exact, and O(agents^2) per augmentation instead of the
+    O(tasks^3) of a full Hungarian solve on a tasks x slots matrix.
+    
+    Args:
+        cost: (tasks, agents) cost matrix
+        capacity: (agents,) maximum tasks per agent; must sum to >= tasks
+    
+    Returns:
+        (tasks,) agent index for each task
+    """
+    n_tasks, n_agents = cost.shape
+    capacity = np.asarray(capacity, dtype=np.int64)
+    if capacity.sum() < n_tasks:
+        raise ValueError(f"Agent capacity {capacity.sum()} is less than {n_tasks} tasks")
+
+    assign = np.argmin(cost, axis=1)
+    counts = np.bincount(assign, minlength=n_agents)
+    return _drain_excess(cost, capacity, assign, counts)
+
+
+def rank_one_assignment(task_factor: np.ndarray, agent_factor: np.ndarray, capacity: np.ndarray) -> np.ndarray:
+    """
+    min_cost_assignment for cost[t, a] = task_factor[t] * agent_factor[a]
+    with non-negative task factors, in O(T log T).
+    
+    The cheapest slots are the agents with the smallest factor filled to
+    capacity, and by the rearrangement inequality the largest task factors
+    go to the smallest agent factors.
+    """
+    n_tasks = task_factor.shape[0]
+    capacity = np.asarray(capacity, dtype=np.int64)
+    if capacity.sum() < n_tasks:
+        raise ValueError(f"Agent capacity {capacity.sum()} is less than {n_tasks} tasks")
+
+    agent_order = np.argsort(agent_factor, kind="stable")
+    slots = np.repeat(agent_order, capacity[agent_order])[:n_tasks]
+    assign = np.empty(n_tasks, dtype=np.int64)
+    assign[np.argsort(-task_factor, kind="stable")] = slots
+    return assign
+
+
+def _drain_excess(
+    cost: np.ndarray,
+    capacity: np.ndarray,
+    assign: np.ndarray,
+    counts: np.ndarray
+) -> np.ndarray:
+    """
+    Successive shortest paths: move excess from over-capacity agents along
+    the cheapest chain of reassignments to an agent with room. Starts from
+    every task on its cheapest agent; tasks tied on a chain move together.
+    """
+    n_agents = cost.shape[1]
+    potentials = np.zeros(n_agents)
+
+    def swap_row(agent: int) -> np.ndarray:
+        """Cheapest cost of moving one of agent's tasks to each other agent"""
+        members = np.flatnonzero(assign == agent)
+        if members.size == 0:
+            return np.full(n_agents, np.inf)
+        return (cost[members] - cost[members, agent][:, None]).min(axis=0)
+
+    swap = np.vstack([swap_row(a) for a in range(n_agents)])
+
+    while True:
+        over = np.flatnonzero(counts > capacity)
+        if over.size == 0:
+            return assign
+        source = int(over[0])
+
+        # Dijkstra over agents; reduced weights are non-negative
+        reduced = swap + potentials[:, None] - potentials[None, :]
+        np.fill_diagonal(reduced, np.inf)
+        dist = np.full(n_agents, np.inf)
+        prev = np.full(n_agents, -1)
+        settled = np.zeros(n_agents, dtype=bool)
+        dist[source] = 0.0
+        target = -1
+        for _ in range(n_agents):
+            u = int(np.argmin(np.where(settled, np.inf, dist)))
+            if settled[u] or not np.isfinite(dist[u]):
+                break
+            settled[u] = True
+            if counts[u] < capacity[u]:
+                target = u
+                break
+            alt = dist[u] + reduced[u]
+            better = (alt < dist) & ~settled
+            dist[better] = alt[better]
+            prev[better] = u
+        if target < 0:
+            raise ValueError("No agent with spare capacity is reachable")
+        potentials = potentials + np.minimum(dist, dist[target])
+
+        path = [target]
+        while path[-1] != source:
+            path.append(int(prev[path[-1]]))
+        edges = list(zip(path[:0:-1], path[-2::-1]))  # (from, to), source to target
+
+        # Move as many tied tasks along the chain as it will take
+        units = min(counts[source] - capacity[source], capacity[target] - counts[target])
+        movers = []
+        for u, v in edges:
+            members = np.flatnonzero(assign == u)
+            delta = cost[members, v] - cost[members, u]
+            tied = members[delta <= swap[u, v] + COST_TOLERANCE]
+            movers.append(tied)
+            units = min(units, tied.size)
+        for (u, v), tied in zip(edges, movers):
+            assign[tied[:units]] = v
+        counts[source] -= units
+        counts[target] += units
+        for agent in set(path):
+            swap[agent] = swap_row(agent)
+
+
 class AdaptiveOptimizer:
     """
     Adaptive optimization engine for multi-agent task scheduling.
@@ -104,14 +239,7 @@ class AdaptiveOptimizer:
         return items
 
     def _risk_weight(self, risk_level: str) -> float:
-        risk = (risk_level or "MEDIUM").upper()
-        if risk == "LOW":
-            return 0.0
-        if risk == "MEDIUM":
-            return 0.1
-        if risk == "HIGH":
-            return 0.2
-        return 0.1
+        return RISK_WEIGHTS.get((risk_level or "MEDIUM").upper(), 0.1)
 
     def _agent_success_rate(self, agent_id: str) -> float:
         agent_perf = self.multi_agent_summary.get("agent_performance", {}).get(agent_id, {})
@@ -131,6 +259,58 @@ class AdaptiveOptimizer:
         agent_success = self._agent_success_rate(agent_id)
         predicted = (base_conf * 0.6) + (agent_success * 0.4) - risk_penalty
         return max(0.05, min(0.99, predicted))
+
+    def _task_column(self, tasks: List[Dict[str, Any]], key: str, default: float) -> np.ndarray:
+        return np.fromiter((float(t.get(key, default)) for t in tasks), dtype=float, count=len(tasks))
+
+    def _predicted_success_matrix(self, tasks: List[Dict[str, Any]], agents: List[str]) -> np.ndarray:
+        """_predict_success for every (task, agent) pair, shape (tasks, agents)"""
+        base_conf = self._task_column(tasks, "confidence", 0.7)
+        risk_penalty = np.fromiter(
+            (self._risk_weight(t.get("risk_level", "MEDIUM")) for t in tasks), dtype=float, count=len(tasks)
+        )
+        agent_success = np.fromiter((self._agent_success_rate(a) for a in agents), dtype=float, count=len(agents))
+        predicted = (base_conf * 0.6 - risk_penalty)[:, None] + (agent_success * 0.4)[None, :]
+        return np.clip(predicted, 0.05, 0.99)
+
+    def _agent_capacity(
+        self,
+        n_tasks: int,
+        agents: List[str],
+        agent_capacity: Optional[Union[int, Dict[str, int]]]
+    ) -> np.ndarray:
+        """Per-agent task limit; defaults to an even split of the wave"""
+        even_split = math.ceil(n_tasks / max(len(agents), 1))
+        if agent_capacity is None:
+            return np.full(len(agents), even_split)
+        if isinstance(agent_capacity, int):
+            return np.full(len(agents), agent_capacity)
+        return np.array([agent_capacity.get(a, even_split) for a in agents])
+
+    def _assign(
+        self,
+        tasks: List[Dict[str, Any]],
+        agents: List[str],
+        agent_capacity: Optional[Union[int, Dict[str, int]]],
+        cost: Optional[np.ndarray] = None,
+        factors: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Min-cost assignment mapped back to agent_id -> task_ids (task order
+        preserved). Pass either a full cost matrix or, for costs of the form
+        task_factor[t] * agent_factor[a], the (task_factor, agent_factor) pair.
+        """
+        assignments: Dict[str, List[str]] = {agent: [] for agent in agents}
+        if not tasks or not agents:
+            return assignments
+        capacity = self._agent_capacity(len(tasks), agents, agent_capacity)
+        if factors is not None:
+            choice = rank_one_assignment(factors[0], factors[1], capacity)
+        else:
+            choice = min_cost_assignment(cost, capacity)
+        for idx, (task, agent_idx) in enumerate(zip(tasks, choice.tolist())):
+            assignments[agents[agent_idx]].append(task.get("task_id", f"task_{idx}"))
+        return assignments
     
     def load_phase18_data(self) -> Dict[str, int]:
         """
@@ -169,7 +349,8 @@ class AdaptiveOptimizer:
         self,
         tasks: List[Dict[str, Any]],
         agents: List[str],
-        strategy: OptimizationStrategy = OptimizationStrategy.MAXIMIZE_SUCCESS
+        strategy: OptimizationStrategy = OptimizationStrategy.MAXIMIZE_SUCCESS,
+        agent_capacity: Optional[Union[int, Dict[str, int]]] = None
     ) -> OptimizationResult:
         """
         Calculate optimal task-to-agent assignment using specified strategy.
@@ -178,6 +359,8 @@ class AdaptiveOptimizer:
             tasks: List of tasks to schedule
             agents: List of available agent IDs
             strategy: Optimization strategy to apply
+            agent_capacity: Max tasks per agent (int, or per-agent dict);
+                defaults to an even split of the tasks
         
         Returns:
             OptimizationResult with assignments and expected metrics
@@ -196,29 +379,36 @@ class AdaptiveOptimizer:
             self.optimization_results.append(result)
             return result
 
-        strategy_map = {
-            OptimizationStrategy.MAXIMIZE_SUCCESS: self.optimize_for_success,
-            OptimizationStrategy.MAXIMIZE_THROUGHPUT: self.optimize_for_throughput,
-            OptimizationStrategy.BALANCE_LOAD: self.optimize_for_throughput,
-            OptimizationStrategy.MINIMIZE_RETRIES: self.optimize_for_minimize_retries,
-            OptimizationStrategy.CONFIDENCE_OPTIMIZATION: self.optimize_for_confidence,
-        }
-        assignment_fn = strategy_map.get(strategy, self.optimize_for_success)
-        agent_assignments = assignment_fn(tasks, agents)
+        predicted = self._predicted_success_matrix(tasks, agents)
+        if strategy in (OptimizationStrategy.MAXIMIZE_THROUGHPUT, OptimizationStrategy.BALANCE_LOAD):
+            agent_assignments = self.optimize_for_throughput(tasks, agents)
+        elif strategy == OptimizationStrategy.MINIMIZE_RETRIES:
+            agent_assignments = self.optimize_for_minimize_retries(tasks, agents, agent_capacity)
+        elif strategy == OptimizationStrategy.CONFIDENCE_OPTIMIZATION:
+            agent_assignments = self.optimize_for_confidence(tasks, agents, agent_capacity)
+        else:
+            agent_assignments = self._assign(tasks, agents, agent_capacity, cost=-predicted)
 
         task_priorities: Dict[str, int] = {}
         for priority, task in enumerate(sorted(tasks, key=lambda t: (-float(t.get("confidence", 0.0)), t.get("task_id", ""))), start=1):
             task_priorities[task.get("task_id", f"task_{priority}")] = priority
 
-        predicted_success_rates: List[float] = []
-        for agent_id, task_ids in agent_assignments.items():
-            for task_id in task_ids:
-                task = next((t for t in tasks if t.get("task_id") == task_id), None)
-                if not task:
-                    continue
-                predicted_success_rates.append(self._predict_success(task, agent_id))
-
-        expected_success_rate = sum(predicted_success_rates) / max(len(predicted_success_rates), 1)
+        # First task with each id, as looked up before
+        task_index: Dict[str, int] = {}
+        for idx, task in enumerate(tasks):
+            task_index.setdefault(task.get("task_id"), idx)
+        agent_index = {agent_id: idx for idx, agent_id in enumerate(agents)}
+        pairs = [
+            (task_index[task_id], agent_index[agent_id])
+            for agent_id, task_ids in agent_assignments.items()
+            for task_id in task_ids
+            if task_id in task_index
+        ]
+        if pairs:
+            rows, cols = np.array(pairs).T
+            expected_success_rate = float(predicted[rows, cols].mean())
+        else:
+            expected_success_rate = 0.0
         avg_exec_ms = float(self.multi_agent_summary.get("avg_execution_time_ms", 30.0))
         expected_throughput = (len(tasks) / max(avg_exec_ms, 1.0)) * 1000.0
         expected_confidence_delta = sum(
@@ -241,32 +431,24 @@ class AdaptiveOptimizer:
     def optimize_for_success(
         self,
         tasks: List[Dict[str, Any]],
-        agents: List[str]
+        agents: List[str],
+        agent_capacity: Optional[Union[int, Dict[str, int]]] = None
     ) -> Dict[str, List[str]]:
         """
         Optimize task assignment to maximize success rate.
         
+        Maximizes total predicted success over the assignment, subject to
+        per-agent capacity.
+        
         Args:
             tasks: Tasks to assign
             agents: Available agents
+            agent_capacity: Max tasks per agent (default: even split)
         
         Returns:
             Dictionary mapping agent_id to assigned task_ids
         """
-        agent_ranking = sorted(agents, key=self._agent_success_rate, reverse=True)
-        tasks_sorted = sorted(
-            tasks,
-            key=lambda t: (
-                {"LOW": 0, "MEDIUM": 1, "HIGH": 2}.get((t.get("risk_level") or "MEDIUM").upper(), 1),
-                -float(t.get("confidence", 0.0)),
-            ),
-        )
-
-        assignments: Dict[str, List[str]] = {agent: [] for agent in agents}
-        for idx, task in enumerate(tasks_sorted):
-            agent_id = agent_ranking[idx % max(len(agent_ranking), 1)]
-            assignments[agent_id].append(task.get("task_id", f"task_{idx}"))
-        return assignments
+        return self._assign(tasks, agents, agent_capacity, cost=-self._predicted_success_matrix(tasks, agents))
     
     def optimize_for_throughput(
         self,
@@ -294,41 +476,45 @@ class AdaptiveOptimizer:
     def optimize_for_minimize_retries(
         self,
         tasks: List[Dict[str, Any]],
-        agents: List[str]
+        agents: List[str],
+        agent_capacity: Optional[Union[int, Dict[str, int]]] = None
     ) -> Dict[str, List[str]]:
         """
         Optimize task assignment to minimize retries.
+        
+        Expected retries of a task on an agent are modelled as the agent's
+        retry rate scaled by (1 + the task's retry_count), so tasks that
+        already retried go to the most reliable agents first.
         """
-        agent_ranking = sorted(agents, key=self._agent_retry_rate)
-        tasks_sorted = sorted(tasks, key=lambda t: int(t.get("retry_count", 0)), reverse=True)
-        assignments: Dict[str, List[str]] = {agent: [] for agent in agents}
-        for idx, task in enumerate(tasks_sorted):
-            agent_id = agent_ranking[idx % max(len(agent_ranking), 1)]
-            assignments[agent_id].append(task.get("task_id", f"task_{idx}"))
-        return assignments
+        retry_weight = 1.0 + self._task_column(tasks, "retry_count", 0)
+        agent_retry = np.fromiter((self._agent_retry_rate(a) for a in agents), dtype=float, count=len(agents))
+        return self._assign(tasks, agents, agent_capacity, factors=(retry_weight, agent_retry))
     
     def optimize_for_confidence(
         self,
         tasks: List[Dict[str, Any]],
-        agents: List[str]
+        agents: List[str],
+        agent_capacity: Optional[Union[int, Dict[str, int]]] = None
     ) -> Dict[str, List[str]]:
         """
         Optimize task assignment to maximize confidence improvements.
         
+        Confidence gain of a task on an agent is modelled as the agent's
+        average confidence delta scaled by the task's headroom
+        (1 - confidence), so low-confidence tasks go to the agents that
+        improve confidence most.
+        
         Args:
             tasks: Tasks to assign
             agents: Available agents
+            agent_capacity: Max tasks per agent (default: even split)
         
         Returns:
             Dictionary mapping agent_id to assigned task_ids
         """
-        agent_ranking = sorted(agents, key=self._agent_confidence_delta, reverse=True)
-        tasks_sorted = sorted(tasks, key=lambda t: float(t.get("confidence", 0.0)))
-        assignments: Dict[str, List[str]] = {agent: [] for agent in agents}
-        for idx, task in enumerate(tasks_sorted):
-            agent_id = agent_ranking[idx % max(len(agent_ranking), 1)]
-            assignments[agent_id].append(task.get("task_id", f"task_{idx}"))
-        return assignments
+        headroom = np.clip(1.0 - self._task_column(tasks, "confidence", 0.0), 0.0, None)
+        agent_delta = np.fromiter((self._agent_confidence_delta(a) for a in agents), dtype=float, count=len(agents))
+        return self._assign(tasks, agents, agent_capacity, factors=(headroom, -agent_delta))
     
     def simulate_schedule(
         self,
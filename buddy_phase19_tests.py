@@ -5,13 +5,16 @@ Comprehensive test coverage for Phase 19 modules.
 Validates optimization, scheduling, feedback, monitoring, and orchestration.
 """
 
+import itertools
 import json
+import time
+import numpy as np
 import pytest
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Any
 
-from buddy_phase19_optimizer import AdaptiveOptimizer, OptimizationStrategy
+from buddy_phase19_optimizer import AdaptiveOptimizer, OptimizationStrategy, min_cost_assignment, rank_one_assignment
 from buddy_phase19_scheduler import AdaptiveScheduler, ScheduleStatus
 from buddy_phase19_feedback_loop import OptimizationFeedbackLoop
 from buddy_phase19_monitor import OptimizationMonitor
@@ -150,6 +153,57 @@ class TestAdaptiveOptimizer:
         total_assigned = sum(len(v) for v in assignments.values())
         assert total_assigned == len(sample_tasks)
     
+    def test_min_cost_assignment_matches_brute_force(self):
+        """Test the capacitated assignment is optimal on small instances."""
+        rng = np.random.default_rng(19)
+        for trial in range(150):
+            n_tasks, n_agents = int(rng.integers(1, 7)), int(rng.integers(1, 4))
+            capacity = rng.integers(1, 4, size=n_agents)
+            if capacity.sum() < n_tasks:
+                continue
+            cost = rng.random((n_tasks, n_agents)).round(1)
+            choice = min_cost_assignment(cost, capacity)
+            assert (np.bincount(choice, minlength=n_agents) <= capacity).all()
+            best = min(
+                cost[np.arange(n_tasks), list(p)].sum()
+                for p in itertools.product(range(n_agents), repeat=n_tasks)
+                if (np.bincount(list(p), minlength=n_agents) <= capacity).all()
+            )
+            assert cost[np.arange(n_tasks), choice].sum() == pytest.approx(best)
+
+            task_factor, agent_factor = rng.random(n_tasks), rng.random(n_agents) - 0.5
+            ranked = rank_one_assignment(task_factor, agent_factor, capacity)
+            outer = np.outer(task_factor, agent_factor)
+            expected = outer[np.arange(n_tasks), min_cost_assignment(outer, capacity)].sum()
+            assert outer[np.arange(n_tasks), ranked].sum() == pytest.approx(expected)
+
+    def test_min_cost_assignment_rejects_short_capacity(self):
+        """Test that a wave larger than total capacity is refused."""
+        with pytest.raises(ValueError):
+            min_cost_assignment(np.zeros((3, 2)), np.array([1, 1]))
+
+    def test_calculate_optimal_schedule_large_wave(self):
+        """Test thousands of tasks across dozens of agents respect capacity quickly."""
+        optimizer = AdaptiveOptimizer(Path("outputs/phase18"), Path("outputs/phase19"))
+        optimizer.multi_agent_summary = {"agent_performance": {
+            f"agent_{i}": {"success_rate": 0.6 + 0.01 * i, "retry_rate": 0.3 - 0.005 * i, "avg_confidence_delta": 0.01 * i}
+            for i in range(40)
+        }}
+        agents = [f"agent_{i}" for i in range(40)]
+        tasks = [
+            {"task_id": f"task_{i}", "confidence": (i * 37 % 100) / 100, "risk_level": ["LOW", "MEDIUM", "HIGH"][i % 3], "retry_count": i % 4}
+            for i in range(4000)
+        ]
+        for strategy in OptimizationStrategy:
+            started = time.perf_counter()
+            result = optimizer.calculate_optimal_schedule(tasks, agents, strategy)
+            assert time.perf_counter() - started < 5.0
+            assert sum(len(v) for v in result.agent_assignments.values()) == len(tasks)
+            assert max(len(v) for v in result.agent_assignments.values()) <= 100
+        capped = optimizer.calculate_optimal_schedule(tasks, agents, OptimizationStrategy.MAXIMIZE_SUCCESS, agent_capacity={"agent_0": 200, "agent_39": 10})
+        assert len(capped.agent_assignments["agent_39"]) == 10
+        assert len(capped.agent_assignments["agent_0"]) <= 200
+    
     def test_simulate_schedule(self, sample_optimization_result):
         """Test schedule simulation."""
         optimizer = AdaptiveOptimizer(Path("outputs/phase18"), Path("outputs/phase19"))
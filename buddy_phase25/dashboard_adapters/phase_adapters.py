@@ -9,6 +9,7 @@ import json
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone
+from Back_End.quantile_sketch import QuantileSketch
 from .dashboard_state_models import (
     LearningSignal, ToolExecution, SafetyDecision, ActiveAgent,
     SystemHealthMetrics, ConfidenceTrajectory, MetricPoint,
@@ -124,6 +125,7 @@ class LearningDashboardAdapter(PhaseOutputAdapter):
     def build_tool_metrics(self) -> Dict[str, Dict[str, float]]:
         """Build tool performance metrics from Phase 24"""
         metrics = {}
+        latency_sketches: Dict[str, QuantileSketch] = {}
         
         orchestration_output = self.read_phase_output(24, "orchestration_summary.json")
         if orchestration_output:
@@ -131,12 +133,23 @@ class LearningDashboardAdapter(PhaseOutputAdapter):
             for result in orchestration_output.get("orchestration_results", []):
                 for tool_result in result.get("tool_results", []):
                     tool_name = tool_result.get("tool_name", "unknown")
+                    duration_ms = tool_result.get("result", {}).get("duration_ms", 0)
+                    latency_sketches.setdefault(tool_name, QuantileSketch()).add(duration_ms or 0)
                     metrics[tool_name] = {
-                        "execution_time_ms": tool_result.get("result", {}).get("duration_ms", 0),
+                        "execution_time_ms": duration_ms,
                         "confidence_score": tool_result.get("result", {}).get("confidence", 0.5),
                         "success": tool_result.get("status") == "executed"
                     }
         
+        # Tail latency across every run of the tool, not just the latest
+        for tool_name, sketch in latency_sketches.items():
+            metrics[tool_name].update({
+                "executions": int(sketch.count),
+                "p50_execution_time_ms": round(sketch.quantile(0.50), 2),
+                "p95_execution_time_ms": round(sketch.quantile(0.95), 2),
+                "p99_execution_time_ms": round(sketch.quantile(0.99), 2),
+            })
+        
         return metrics
     
     def build_failure_to_insight_chains(self) -> List[Dict[str, Any]]:
@@ -219,6 +232,16 @@ class OperationsDashboardAdapter(PhaseOutputAdapter):
         # Read Phase 24 execution log
         executions = self.read_jsonl_stream(24, "tool_execution_log.jsonl")
         
+        # Latency percentiles over the whole log, overall and per tool
+        self.latency_sketches: Dict[str, QuantileSketch] = {"_all": QuantileSketch()}
+        for exec_data in executions:
+            duration_ms = exec_data.get("duration_ms")
+            if duration_ms is None:
+                continue
+            tool_name = exec_data.get("tool_name", "unknown")
+            self.latency_sketches["_all"].add(duration_ms)
+            self.latency_sketches.setdefault(tool_name, QuantileSketch()).add(duration_ms)
+        
         for exec_data in executions[-50:]:  # Last 50
             tool_exec = ToolExecution(
                 execution_id=exec_data.get("execution_id", f"exec_{len(recent)}"),
@@ -303,7 +326,16 @@ class OperationsDashboardAdapter(PhaseOutputAdapter):
             "total_executions": len(recent_execs),
             "active_executions": len(active_execs),
             "success_rate": sum(1 for e in recent_execs if e.status == "succeeded") / max(1, len(recent_execs)),
-            "environment": environment.value
+            "environment": environment.value,
+            "latency_ms": {
+                name: {
+                    "count": int(sketch.count),
+                    "p50": round(sketch.quantile(0.50), 2),
+                    "p95": round(sketch.quantile(0.95), 2),
+                    "p99": round(sketch.quantile(0.99), 2),
+                }
+                for name, sketch in self.latency_sketches.items()
+            }
         }
         
         return state
@@ -10,11 +10,13 @@ Key Guarantee: All adapters are purely observational. Zero side effects.
 
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
 from enum import Enum
 
+from Back_End.jsonl_tail import iter_jsonl_reverse
+
 
 class ExecutionMode(Enum):
     """Phase 24 execution mode"""
@@ -140,6 +142,16 @@ class Phase24Adapter:
 
         return records
 
+    def _read_jsonl_reverse(self, filename: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate JSONL records newest first, reading backwards from EOF.
+        Yields nothing if file not found.
+        """
+        try:
+            yield from iter_jsonl_reverse(self.phase24_path / filename)
+        except Exception:
+            return
+
     def _read_json(self, filename: str) -> Dict[str, Any]:
         """
         Read JSON file safely.
@@ -164,10 +176,12 @@ class ExecutionLogAdapter(Phase24Adapter):
 
     def get_recent_executions(self, limit: int = 50) -> List[ToolExecution]:
         """Get most recent tool executions"""
-        records = self._read_jsonl("tool_execution_log.jsonl")
-
         executions = []
-        for record in records:
+        if limit <= 0:
+            return executions
+
+        # Most recent first (reverse chronological); stop after `limit`
+        for record in self._read_jsonl_reverse("tool_execution_log.jsonl"):
             try:
                 execution = ToolExecution(
                     execution_id=record.get("execution_id", ""),
@@ -186,9 +200,10 @@ class ExecutionLogAdapter(Phase24Adapter):
                 executions.append(execution)
             except Exception:
                 continue
+            if len(executions) >= limit:
+                break
 
-        # Return most recent (reverse chronological)
-        return list(reversed(executions))[:limit]
+        return executions
 
     def get_executions_by_status(self, status: str) -> List[ToolExecution]:
         """Get all executions with given status (success, failed, blocked, etc)"""
@@ -11,6 +11,7 @@ Validates that drift detection works correctly:
 import json
 import os
 import sys
+import shutil
 import tempfile
 from pathlib import Path
 from datetime import datetime, timezone
@@ -370,10 +371,8 @@ def validate_drift_detection():
             return 1
     
     finally:
-        # Cleanup
-        if test_file.exists():
-            test_file.unlink()
-        Path(temp_dir).rmdir()
+        # Cleanup (includes the .signal_cursors sidecar)
+        shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 if __name__ == "__main__":
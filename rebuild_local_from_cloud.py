@@ -20,7 +20,7 @@ import logging
 import shutil
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 # Setup logging
 logging.basicConfig(
@@ -85,6 +85,19 @@ def backup_existing_database():
         return None
 
 
+def event_from_doc(mission_id: str, event_doc) -> Dict[str, Any]:
+    """Local event for a Firestore event document.
+    
+    The document id is kept as the event_id, so the event keeps its cloud
+    identity and events written after the rebuild get fresh ids instead of
+    reusing the new database's row ids.
+    """
+    event_data = event_doc.to_dict()
+    event_data['mission_id'] = mission_id  # Ensure mission_id is set
+    event_data['event_id'] = event_doc.id
+    return event_data
+
+
 def download_missions_from_firebase() -> List[Dict[str, Any]]:
     """Download all mission events from Firebase.
     
@@ -117,9 +130,7 @@ def download_missions_from_firebase() -> List[Dict[str, Any]]:
             
             event_count = 0
             for event_doc in event_docs:
-                event_data = event_doc.to_dict()
-                event_data['mission_id'] = mission_id  # Ensure mission_id is set
-                all_events.append(event_data)
+                all_events.append(event_from_doc(mission_id, event_doc))
                 event_count += 1
             
             print(f"  Downloaded {event_count} events")
@@ -135,6 +146,32 @@ def download_missions_from_firebase() -> List[Dict[str, Any]]:
         raise
 
 
+# Events per rebuild transaction; a failing chunk is retried one event at a time
+REBUILD_CHUNK_SIZE = 500
+
+
+def write_events_skipping_bad_rows(local_store, events: List[Dict[str, Any]]) -> Tuple[int, List[Dict[str, Any]]]:
+    """Write events as synced in chunked transactions, isolating rows that fail on their own.
+    
+    Returns:
+        (number of events written, events that could not be written)
+    """
+    written = 0
+    failed: List[Dict[str, Any]] = []
+    for start in range(0, len(events), REBUILD_CHUNK_SIZE):
+        chunk = events[start:start + REBUILD_CHUNK_SIZE]
+        count = local_store.write_mission_events(chunk, synced=True)
+        if count:
+            written += count
+            continue
+        for event in chunk:
+            if local_store.write_mission_events([event], synced=True):
+                written += 1
+            else:
+                failed.append(event)
+    return written, failed
+
+
 def rebuild_local_database(events: List[Dict[str, Any]]):
     """Rebuild local SQLite database from downloaded events.
     
@@ -147,7 +184,8 @@ def rebuild_local_database(events: List[Dict[str, Any]]):
     
     local_store = get_local_mission_store()
     
-    # Delete existing database
+    # Delete existing database (closing pooled connections first)
+    local_store.close()
     if local_store.db_path.exists():
         local_store.db_path.unlink()
         logger.info(f"Deleted existing database: {local_store.db_path}")
@@ -155,35 +193,17 @@ def rebuild_local_database(events: List[Dict[str, Any]]):
     # Re-initialize database (creates fresh schema)
     local_store._init_database()
     
-    # Write all events to local store
-    success_count = 0
-    failed_count = 0
-    
-    for i, event_data in enumerate(events, 1):
-        try:
-            # Write to local store, mark as synced since it came from Firebase
-            local_store.write_mission_event(event_data)
-            
-            # Mark as synced (get the row ID and mark it)
-            # Since we just wrote it, it's the last row
-            with local_store._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("UPDATE missions SET synced = 1 WHERE id = (SELECT MAX(id) FROM missions)")
-                conn.commit()
-            
-            success_count += 1
-            
-            if i % 10 == 0:
-                print(f"  Progress: {i}/{len(events)} events...")
-                
-        except Exception as e:
-            logger.error(f"Failed to write event {i}: {e}")
-            failed_count += 1
+    # Marked as synced since they came from Firebase; bad rows are skipped, not fatal
+    success_count, failed_events = write_events_skipping_bad_rows(local_store, events)
     
     print("\n" + "="*60)
     print(f"✅ Database rebuilt:")
     print(f"   Success: {success_count} events")
-    print(f"   Failed: {failed_count} events")
+    print(f"   Failed: {len(failed_events)} events")
+    for event in failed_events[:10]:
+        print(f"     - {event.get('mission_id')} → {event.get('event_type')}")
+    if len(failed_events) > 10:
+        print(f"     ... and {len(failed_events) - 10} more")
     print(f"   Location: {local_store.db_path}")
     print("="*60 + "\n")
 
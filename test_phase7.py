@@ -69,6 +69,7 @@ class TestMetricsCollector(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test database."""
+        self.collector.close()
         shutil.rmtree(self.temp_dir)
     
     def test_database_initialization(self):
@@ -89,6 +90,7 @@ class TestMetricsCollector(unittest.TestCase):
         )
         
         self.collector.record_execution(metrics)
+        self.assertTrue(self.collector.flush())
         
         # Verify in database
         conn = sqlite3.connect(self.db_path)
@@ -112,6 +114,7 @@ class TestMetricsCollector(unittest.TestCase):
                 success=i % 2 == 0  # Alternate success/failure
             )
             self.collector.record_execution(metrics)
+        self.collector.flush()
         
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
@@ -121,6 +124,92 @@ class TestMetricsCollector(unittest.TestCase):
         
         self.assertEqual(count, 5)
     
+    def test_group_commit_batches_rows(self):
+        """Test rows are committed in batches on one connection."""
+        collector = MetricsCollector(str(self.db_path), batch_size=50, flush_interval=5.0)
+        for i in range(120):
+            collector.record_execution(ExecutionMetrics(
+                task_id=f"task_{i}",
+                agent_id="agent_1",
+                tool_name="api_call",
+                start_time=100,
+                end_time=101,
+                duration_seconds=1.0,
+                success=True
+            ))
+        
+        self.assertEqual(len(collector.get_recent_metrics(hours=24)), 120)
+        stats = collector.stats()
+        collector.close()
+        self.assertEqual(stats["rows_written"], 120)
+        self.assertEqual(stats["commits"], 3)  # 50 + 50 + the 20 flushed by the read
+        
+        conn = sqlite3.connect(self.db_path)
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+        self.assertEqual(journal_mode, "wal")
+    
+    def test_writer_survives_connection_and_write_errors(self):
+        """Test a failed commit is retried and the writer keeps running."""
+        import analytics_engine
+        collector = MetricsCollector(str(self.db_path), flush_interval=0.0)
+        connect = collector._connect
+        failures = {"connect": 1}
+        
+        def flaky_connect(check_same_thread=True):
+            if failures["connect"]:
+                failures["connect"] -= 1
+                raise sqlite3.OperationalError("unable to open database file")
+            return connect(check_same_thread)
+        
+        metric = ExecutionMetrics(
+            task_id="task_1", agent_id="agent_1", tool_name="api_call",
+            start_time=100, end_time=101, duration_seconds=1.0, success=True
+        )
+        collector._connect = flaky_connect
+        collector.record_execution(metric)
+        self.assertTrue(collector.flush())
+        self.assertEqual(collector.stats()["rows_written"], 1)
+        self.assertEqual(collector.stats()["write_errors"], 1)
+        
+        # A batch that keeps failing is dropped, the flush reports it and
+        # later rows still get written
+        original_attempts = analytics_engine.METRICS_WRITE_ATTEMPTS
+        analytics_engine.METRICS_WRITE_ATTEMPTS = 2
+        try:
+            failures["connect"] = 2
+            collector._reader = None
+            collector.db_path = str(self.db_path) + "-moved"
+            collector.record_execution(metric)
+            self.assertFalse(collector.flush())
+        finally:
+            analytics_engine.METRICS_WRITE_ATTEMPTS = original_attempts
+        self.assertEqual(collector.stats()["rows_dropped"], 1)
+        
+        collector.db_path = str(self.db_path)
+        collector.record_execution(metric)
+        self.assertTrue(collector.flush())
+        self.assertTrue(collector._writer.is_alive())
+        self.assertEqual(collector.stats()["rows_written"], 2)
+        collector.close()
+    
+    def test_metrics_buffer_is_bounded(self):
+        """Test the in-memory buffer keeps only the most recent metrics."""
+        collector = MetricsCollector(str(self.db_path), buffer_size=3)
+        for i in range(5):
+            collector.record_execution(ExecutionMetrics(
+                task_id=f"task_{i}",
+                agent_id="agent_1",
+                tool_name="api_call",
+                start_time=100,
+                end_time=101,
+                duration_seconds=1.0,
+                success=True
+            ))
+        collector.close()
+        
+        self.assertEqual([m.task_id for m in collector.metrics_buffer], ["task_2", "task_3", "task_4"])
+    
     def test_get_recent_metrics(self):
         """Test retrieving recent metrics."""
         metrics = ExecutionMetrics(
@@ -388,6 +477,7 @@ class TestHourlyAggregator(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test aggregator."""
+        self.collector.close()
         shutil.rmtree(self.temp_dir)
     
     def test_aggregate_empty(self):
@@ -417,6 +507,9 @@ class TestHourlyAggregator(unittest.TestCase):
         self.assertEqual(summary.total_tasks, 5)
         self.assertEqual(summary.successful_tasks, 4)
         self.assertEqual(summary.failed_tasks, 1)
+        self.assertAlmostEqual(summary.total_cost, 0.50)
+        self.assertEqual(summary.avg_task_duration, 5.0)
+        self.assertEqual(summary.tool_execution_counts, {"api": 3, "browser": 2})
 
 
 class TestAnalyticsEngine(unittest.TestCase):